@@ -158,7 +158,7 @@ from .volume import (
     RGB_colourspace_volume_MonteCarlo,
     RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
     is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
-from .graph import describe_conversion_path, convert
+from .graph import describe_conversion_path, compile_conversion, convert
 
 from colour.utilities import is_matplotlib_installed
 
@@ -306,7 +306,7 @@ __all__ += [
     'is_within_mesh_volume', 'is_within_pointer_gamut',
     'is_within_visible_spectrum'
 ]
-__all__ += ['describe_conversion_path', 'convert']
+__all__ += ['describe_conversion_path', 'compile_conversion', 'convert']
 
 __application_name__ = 'Colour'
 
@@ -73,6 +73,9 @@ class Extrapolator(object):
     Notes
     -----
     -   The interpolator must define *x* and *y* attributes.
+    -   If the interpolator *y* attribute is 2-dimensional, i.e. holds multiple
+        columns sharing the same *x* attribute, the columns are extrapolated
+        at once and the last axis of the returned array indexes them.
 
     References
     ----------
@@ -299,12 +302,14 @@ class Extrapolator(object):
         xi = self._interpolator.x
         yi = self._interpolator.y
 
-        y = np.empty_like(x)
+        y = np.empty(x.shape + np.shape(yi)[1:], dtype=x.dtype)
 
         if self._method == 'linear':
-            y[x < xi[0]] = (yi[0] + (x[x < xi[0]] - xi[0]) * (yi[1] - yi[0]) /
-                            (xi[1] - xi[0]))
-            y[x > xi[-1]] = (yi[-1] + (x[x > xi[-1]] - xi[-1]) *
+            # Broadcasting the distances against the *y* variable columns.
+            axes = (Ellipsis, ) + (np.newaxis, ) * (np.ndim(yi) - 1)
+            y[x < xi[0]] = (yi[0] + (x[x < xi[0]] - xi[0])[axes] *
+                            (yi[1] - yi[0]) / (xi[1] - xi[0]))
+            y[x > xi[-1]] = (yi[-1] + (x[x > xi[-1]] - xi[-1])[axes] *
                              (yi[-1] - yi[-2]) / (xi[-1] - xi[-2]))
         elif self._method == 'constant':
             y[x < xi[0]] = yi[0]
@@ -63,6 +63,7 @@ from __future__ import division, unicode_literals
 import itertools
 import numpy as np
 import scipy.interpolate
+import scipy.sparse
 from six.moves import reduce
 from collections import OrderedDict
 try:  # pragma: no cover
@@ -71,9 +72,10 @@ except ImportError:  # pragma: no cover
     from collections.abc import Mapping
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
-                              closest_indexes, interval, is_integer,
-                              is_numeric, runtime_warning, tsplit)
+from colour.utilities import (CACHE_REGISTRY, CaseInsensitiveMapping,
+                              as_float_array, as_float, closest_indexes,
+                              interval, is_integer, is_numeric,
+                              runtime_warning, tsplit)
 from colour.utilities.deprecation import ObjectRenamed
 
 __author__ = 'Colour Developers'
@@ -94,6 +96,35 @@ __all__ = [
     'table_interpolation'
 ]
 
+_CACHE_KERNEL_INTERPOLATOR_WEIGHTS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_KERNEL_INTERPOLATOR_WEIGHTS'.format(__name__),
+    maximum_size=64,
+    maximum_bytes=32 * 1024 ** 2)
+
+_CACHE_SPRAGUE_INTERPOLATOR_WEIGHTS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_SPRAGUE_INTERPOLATOR_WEIGHTS'.format(__name__),
+    maximum_size=64,
+    maximum_bytes=32 * 1024 ** 2)
+
+_INTERPOLATOR_WEIGHTS_CACHING_MAXIMUM_POINTS = 16384
+"""
+Maximum number of points for which the weights sparse matrices of
+:class:`colour.KernelInterpolator` and :class:`colour.SpragueInterpolator`
+classes are cached, larger arrays of points, e.g. images, are neither
+serialised to build a cache key nor stored.
+
+_INTERPOLATOR_WEIGHTS_CACHING_MAXIMUM_POINTS : int
+"""
+
+_TABLE_INTERPOLATION_CHUNK_SIZE = 65536
+"""
+Count of :math:`V_{xyz}` values interpolated at once by
+:func:`colour.algebra.table_interpolation_tetrahedral` definition, it bounds
+the size of the intermediate arrays so that they remain cache-sized.
+
+_TABLE_INTERPOLATION_CHUNK_SIZE : int
+"""
+
 
 def kernel_nearest_neighbour(x):
     """
@@ -315,6 +346,14 @@ class KernelInterpolator(object):
     -------
     __call__
 
+    Notes
+    -----
+    -   The :math:`y` variable can be 2-dimensional, i.e. (samples, channels),
+        in which case all the channels are interpolated at once.
+    -   The kernel weights for given points are computed as a sparse matrix
+        that is cached, for a bounded number of points, and re-used with any
+        :math:`y` variable sharing the same :math:`x` variable.
+
     References
     ----------
     :cite:`Burger2009b`, :cite:`Wikipedia2005b`
@@ -351,6 +390,13 @@ class KernelInterpolator(object):
     ...     kernel_kwargs={'a': 16})
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 5.3961792...,  5.6521093...])
+
+    Interpolating multiple dependent variables at once:
+
+    >>> f = KernelInterpolator(x, np.transpose([y, y * 2]))
+    >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
+    array([[  6.1806208...,  12.3612416...],
+           [  8.0823848...,  16.1647697...]])
     """
 
     def __init__(self,
@@ -368,6 +414,7 @@ class KernelInterpolator(object):
         self._y_p = None
 
         self._x = None
+        self._x_interval = None
         self._y = None
         self._window = None
         self._padding_kwargs = {
@@ -425,6 +472,7 @@ class KernelInterpolator(object):
                                  'unpredictable results may occur!'))
 
             self._x = value
+            self._x_interval = value_interval[0]
 
             if self._window is not None:
                 self._x_p = np.pad(
@@ -463,13 +511,19 @@ class KernelInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             self._y = value
 
             if self._window is not None:
-                self._y_p = np.pad(self._y, **self._padding_kwargs)
+                padding_kwargs = dict(self._padding_kwargs)
+                if value.ndim == 2:
+                    padding_kwargs['pad_width'] = (tuple(
+                        np.resize(np.ravel(padding_kwargs['pad_width']),
+                                  2)), (0, 0))
+
+                self._y_p = np.pad(self._y, **padding_kwargs)
 
     @property
     def window(self):
@@ -623,11 +677,12 @@ class KernelInterpolator(object):
             Interpolated value(s).
         """
 
-        x = np.atleast_1d(x).astype(self._dtype)
+        x = as_float_array(x, self._dtype)
 
-        xi = as_float(self._evaluate(x))
+        xi = np.reshape(
+            self._evaluate(np.ravel(x)), x.shape + self._y_p.shape[1:])
 
-        return xi
+        return as_float(xi)
 
     def _evaluate(self, x):
         """
@@ -647,21 +702,64 @@ class KernelInterpolator(object):
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
-        x_interval = interval(self._x)[0]
+        return self._weights(x).dot(self._y_p)
+
+    def _weights(self, x):
+        """
+        Returns the sparse matrix of kernel weights mapping the padded
+        :math:`y` variable values to the interpolated values at given points.
+
+        The matrix only depends on the independent :math:`x` variable, the
+        window, the kernel and the given points, it is thus cached and shared
+        by all the interpolators evaluated on the same domains, unless there
+        are too many points, e.g. the pixels of an image.
+
+        Parameters
+        ----------
+        x : ndarray
+            1-dimensional array of points to evaluate the interpolant at.
+
+        Returns
+        -------
+        csr_matrix
+            Weights sparse matrix of shape (len(x), len(self._y_p)).
+        """
+
+        hash_key = None
+        if x.size <= _INTERPOLATOR_WEIGHTS_CACHING_MAXIMUM_POINTS:
+            hash_key = (self._x_p.dtype.str, self._x_p.tobytes(),
+                        x.dtype.str, x.tobytes(), self._window, self._kernel,
+                        repr(sorted(self._kernel_kwargs.items())),
+                        len(self._y_p))
+            W = _CACHE_KERNEL_INTERPOLATOR_WEIGHTS.get(hash_key)
+
+            if W is not None:
+                return W
+
+        x_interval = self._x_interval
         x_f = np.floor(x / x_interval)
 
         windows = (x_f[:, np.newaxis] + np.arange(-self._window + 1,
                                                   self._window + 1))
-        clip_l = min(self._x_p) / x_interval
-        clip_h = max(self._x_p) / x_interval
+        clip_l = np.min(self._x_p) / x_interval
+        clip_h = np.max(self._x_p) / x_interval
         windows = np.clip(windows, clip_l, clip_h) - clip_l
         windows = np.around(windows).astype(DEFAULT_INT_DTYPE)
 
-        return np.sum(
-            self._y_p[windows] * self._kernel(
-                x[:, np.newaxis] / x_interval - windows -
-                min(self._x_p) / x_interval, **self._kernel_kwargs),
-            axis=-1)
+        weights = self._kernel(
+            x[:, np.newaxis] / x_interval - windows - clip_l,
+            **self._kernel_kwargs)
+
+        # Duplicate indexes from the clipped windows are summed.
+        W = scipy.sparse.csr_matrix(
+            (np.ravel(weights), np.ravel(windows),
+             np.arange(0, windows.size + 1, windows.shape[-1])),
+            shape=(len(x), len(self._y_p)))
+
+        if hash_key is not None:
+            _CACHE_KERNEL_INTERPOLATOR_WEIGHTS[hash_key] = W
+
+        return W
 
     def _validate_dimensions(self):
         """
@@ -986,6 +1084,11 @@ class SpragueInterpolator(object):
     -----
     -   The minimum number :math:`k` of data points required along the
         interpolation axis is :math:`k=6`.
+    -   The :math:`y` variable can be 2-dimensional, i.e. (samples, channels),
+        in which case all the channels are interpolated at once.
+    -   The polynomial weights for given points are computed as a sparse
+        matrix that is cached, for a bounded number of points, and re-used
+        with any :math:`y` variable sharing the same :math:`x` variable.
 
     References
     ----------
@@ -1006,6 +1109,13 @@ class SpragueInterpolator(object):
 
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 6.7295161...,  7.8140625...])
+
+    Interpolating multiple dependent variables at once:
+
+    >>> f = SpragueInterpolator(x, np.transpose([y, y * 2]))
+    >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
+    array([[  6.7295161...,  13.4590322...],
+           [  7.8140625...,  15.6281250...]])
     """
 
     SPRAGUE_C_COEFFICIENTS = np.array([
@@ -1025,6 +1135,26 @@ class SpragueInterpolator(object):
     :cite:`CIETC1-382005h`
     """
 
+    SPRAGUE_POLYNOMIAL_COEFFICIENTS = np.array([
+        [0, 0, 24, 0, 0, 0],
+        [2, -16, 0, 16, -2, 0],
+        [-1, 16, -30, 16, -1, 0],
+        [-9, 39, -70, 66, -33, 7],
+        [13, -64, 126, -124, 61, -12],
+        [-5, 25, -50, 50, -25, 5],
+    ])
+    """
+    Defines the coefficients, multiplied by 24, of the fifth-order
+    polynomial: each row gives the weights of the :math:`r_{i-2}` to
+    :math:`r_{i+3}` values for the :math:`X^0` to :math:`X^5` powers.
+
+    SPRAGUE_POLYNOMIAL_COEFFICIENTS : array_like, (6, 6)
+
+    References
+    ----------
+    :cite:`CIETC1-382005f`
+    """
+
     def __init__(self, x, y, dtype=None):
         if dtype is None:
             dtype = DEFAULT_FLOAT_DTYPE
@@ -1111,27 +1241,22 @@ class SpragueInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             assert len(value) >= 6, (
                 '"y" dependent variable values count must be normalised to'
                 'domain [6:]!')
 
-            yp1 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[0],
-                        np.array(value[0:6]).reshape([6, 1]))) / 209)[0]
-            yp2 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[1],
-                        np.array(value[0:6]).reshape([6, 1]))) / 209)[0]
-            yp3 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[2],
-                        np.array(value[-6:]).reshape([6, 1]))) / 209)[0]
-            yp4 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[3],
-                        np.array(value[-6:]).reshape([6, 1]))) / 209)[0]
-
-            self._yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
+            C = self.SPRAGUE_C_COEFFICIENTS
+
+            yp1 = np.dot(C[0], value[0:6]) / 209
+            yp2 = np.dot(C[1], value[0:6]) / 209
+            yp3 = np.dot(C[2], value[-6:]) / 209
+            yp4 = np.dot(C[3], value[-6:]) / 209
+
+            self._yp = np.concatenate(
+                ([yp1, yp2], value, [yp3, yp4])).astype(self._dtype)
 
         self._y = value
 
@@ -1172,27 +1297,59 @@ class SpragueInterpolator(object):
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
-        i = np.searchsorted(self._xp, x) - 1
-        X = (x - self._xp[i]) / (self._xp[i + 1] - self._xp[i])
+        W = self._weights(np.ravel(x))
+
+        y = np.reshape(W.dot(self._yp), x.shape + self._yp.shape[1:])
+
+        return as_float(y)
+
+    def _weights(self, x):
+        """
+        Returns the sparse matrix of weights mapping the padded :math:`y`
+        variable values to the interpolated values at given points.
+
+        The matrix only depends on the independent :math:`x` variable and the
+        given points, it is thus cached and shared by all the interpolators
+        evaluated on the same domains, unless there are too many points, e.g.
+        the pixels of an image.
+
+        Parameters
+        ----------
+        x : ndarray
+            1-dimensional array of points to evaluate the interpolant at.
+
+        Returns
+        -------
+        csr_matrix
+            Weights sparse matrix of shape (len(x), len(self._xp)).
+        """
 
-        r = self._yp
+        hash_key = None
+        if x.size <= _INTERPOLATOR_WEIGHTS_CACHING_MAXIMUM_POINTS:
+            hash_key = (self._xp.dtype.str, self._xp.tobytes(), x.dtype.str,
+                        x.tobytes())
+            W = _CACHE_SPRAGUE_INTERPOLATOR_WEIGHTS.get(hash_key)
 
-        a0p = r[i]
-        a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] -
-                2 * r[i + 2]) / 24)  # yapf: disable
-        a2p = ((-r[i - 2] + 16 * r[i - 1] - 30 * r[i] + 16 * r[i + 1] -
-                r[i + 2]) / 24)  # yapf: disable
-        a3p = ((-9 * r[i - 2] + 39 * r[i - 1] - 70 * r[i] + 66 * r[i + 1] -
-                33 * r[i + 2] + 7 * r[i + 3]) / 24)
-        a4p = ((13 * r[i - 2] - 64 * r[i - 1] + 126 * r[i] - 124 * r[i + 1] +
-                61 * r[i + 2] - 12 * r[i + 3]) / 24)
-        a5p = ((-5 * r[i - 2] + 25 * r[i - 1] - 50 * r[i] + 50 * r[i + 1] -
-                25 * r[i + 2] + 5 * r[i + 3]) / 24)
+            if W is not None:
+                return W
 
-        y = (a0p + a1p * X + a2p * X ** 2 + a3p * X ** 3 + a4p * X ** 4 +
-             a5p * X ** 5)
+        xp = self._xp
+        i = np.searchsorted(xp, x) - 1
+        X = (x - xp[i]) / (xp[i + 1] - xp[i])
 
-        return y
+        weights = np.dot(X[:, np.newaxis] ** np.arange(6),
+                         self.SPRAGUE_POLYNOMIAL_COEFFICIENTS) / 24
+        columns = np.mod(i[:, np.newaxis] + np.arange(-2, 4), len(xp))
+
+        W = scipy.sparse.csr_matrix(
+            (np.ravel(weights), np.ravel(columns),
+             np.arange(0, weights.size + 1, 6)),
+            shape=(len(x), len(xp)))
+
+        if hash_key is not None:
+            _CACHE_SPRAGUE_INTERPOLATOR_WEIGHTS[hash_key] = W
+
+        return W
 
     def _validate_dimensions(self):
         """
@@ -1227,9 +1384,14 @@ class CubicSplineInterpolator(scipy.interpolate.interp1d):
     Notes
     -----
     -   This class is a wrapper around *scipy.interpolate.interp1d* class.
+    -   A 2-dimensional :math:`y` variable is interpolated along its first
+        axis, i.e. each column is interpolated, unless an ``axis`` keyword
+        argument is given.
     """
 
     def __init__(self, *args, **kwargs):
+        kwargs['axis'] = kwargs.get('axis', 0)
+
         super(CubicSplineInterpolator, self).__init__(
             kind='cubic', *args, **kwargs)
 
@@ -1822,28 +1984,51 @@ def table_interpolation_tetrahedral(V_xyz, table):
     """
 
     V_xyz = as_float_array(V_xyz)
+    table = as_float_array(table)
 
-    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
-
-    vertices = np.moveaxis(vertices, 0, -1)
-    V000, V001, V010, V011, V100, V101, V110, V111 = tsplit(vertices)
-    x, y, z = [r[:, np.newaxis] for r in tsplit(V_xyzr)]
-
-    xyz_o = np.select([
-        np.logical_and(x > y, y > z),
-        np.logical_and(x > y, x > z),
-        np.logical_and(x > y, np.logical_and(y <= z, x <= z)),
-        np.logical_and(x <= y, z > y),
-        np.logical_and(x <= y, z > x),
-        np.logical_and(x <= y, np.logical_and(z <= y, z <= x)),
-    ], [
-        (1 - x) * V000 + (x - y) * V100 + (y - z) * V110 + z * V111,
-        (1 - x) * V000 + (x - z) * V100 + (z - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - x) * V001 + (x - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - y) * V001 + (y - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - z) * V010 + (z - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - x) * V010 + (x - z) * V110 + z * V111,
-    ])
+    # The table is flattened so that a vertex is gathered with a single index
+    # computed from the per-axis ``strides``.
+    i_m = np.array(table.shape[0:-1]) - 1
+    strides = np.array(
+        [table.shape[1] * table.shape[2], table.shape[2], 1],
+        dtype=DEFAULT_INT_DTYPE)
+    table = np.reshape(table, (-1, table.shape[-1]))
+
+    V_xyz_f = np.reshape(V_xyz, (-1, 3))
+    xyz_o = np.empty((V_xyz_f.shape[0], table.shape[-1]), table.dtype)
+
+    for i in range(0, V_xyz_f.shape[0], _TABLE_INTERPOLATION_CHUNK_SIZE):
+        V_xyzc = V_xyz_f[i:i + _TABLE_INTERPOLATION_CHUNK_SIZE]
+        V_xyzc = np.clip(V_xyzc, 0, 1) * i_m
+
+        i_f = np.floor(V_xyzc).astype(DEFAULT_INT_DTYPE)
+        V_xyzr = V_xyzc - i_f
+
+        # Offsets of the vertices adjacent along each axis, they are null on
+        # the table upper boundary, i.e. where ``i_f`` equals ``i_m``.
+        offsets = np.where(i_f < i_m, strides, 0)
+        index_f = np.dot(i_f, strides)
+
+        # The tetrahedron enclosing a given V_xyz value is the one walking
+        # from vertex ``V000`` to vertex ``V111`` along the axes sorted by
+        # decreasing relative coordinates, ties are broken so that the
+        # ``a_max`` and ``a_min`` axes are always distinct.
+        a = np.arange(V_xyzr.shape[0])
+        a_max = np.argmax(V_xyzr, axis=-1)
+        a_min = 2 - np.argmin(V_xyzr[..., ::-1], axis=-1)
+        a_mid = 3 - a_max - a_min
+
+        r_max = V_xyzr[a, a_max][..., np.newaxis]
+        r_mid = V_xyzr[a, a_mid][..., np.newaxis]
+        r_min = V_xyzr[a, a_min][..., np.newaxis]
+
+        index_c = index_f + np.sum(offsets, axis=-1)
+
+        xyz_o[i:i + _TABLE_INTERPOLATION_CHUNK_SIZE] = (
+            (1 - r_max) * table[index_f] +
+            (r_max - r_mid) * table[index_f + offsets[a, a_max]] +
+            (r_mid - r_min) * table[index_c - offsets[a, a_min]] +
+            r_min * table[index_c])
 
     xyz_o = np.reshape(xyz_o, V_xyz.shape)
 
@@ -143,6 +143,22 @@ class TestExtrapolator(unittest.TestCase):
             extrapolator((0.1, 0.2, 8.0, 9.0)), (-1.9, -1.8, 6.0, 7.0))
         self.assertEqual(extrapolator(9), 7.)
 
+        extrapolator = Extrapolator(
+            PchipInterpolator(
+                np.array([3, 4, 5]), np.array([[1, 3], [2, 2], [3, 1]])))
+        np.testing.assert_almost_equal(
+            extrapolator((0.1, 4.5, 9.0)),
+            np.array([[-1.9, 5.9], [2.5, 1.5], [7.0, -3.0]]))
+
+        extrapolator = Extrapolator(
+            PchipInterpolator(
+                np.array([3, 4, 5]), np.array([[1, 3], [2, 2], [3, 1]])),
+            method='Constant',
+            left=0)
+        np.testing.assert_almost_equal(
+            extrapolator((0.1, 4.5, 9.0)),
+            np.array([[0, 0], [2.5, 1.5], [3, 1]]))
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -16,7 +16,10 @@ import os
 import unittest
 from itertools import permutations
 
-from colour.algebra.interpolation import vertices_and_relative_coordinates
+from colour.algebra.interpolation import (
+    _CACHE_SPRAGUE_INTERPOLATOR_WEIGHTS,
+    _INTERPOLATOR_WEIGHTS_CACHING_MAXIMUM_POINTS,
+    vertices_and_relative_coordinates)
 from colour.algebra import (
     kernel_nearest_neighbour, kernel_linear, kernel_sinc, kernel_lanczos,
     kernel_cardinal_spline, KernelInterpolator, NearestNeighbourInterpolator,
@@ -25,7 +28,7 @@ from colour.algebra import (
     table_interpolation_trilinear, table_interpolation_tetrahedral)
 from colour.algebra import random_triplet_generator
 from colour.io import read_LUT
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -510,6 +513,25 @@ padding_kwargs` property.
             KernelInterpolator(x_3, y)(x_i / 10),
             decimal=7)
 
+        y = tstack([DATA_POINTS_A, np.asarray(DATA_POINTS_A) * 2])
+        x = np.arange(len(DATA_POINTS_A))
+        x_i = np.linspace(0, len(DATA_POINTS_A) - 1, 41)
+        kernel_interpolator = KernelInterpolator(x, y)
+        np.testing.assert_almost_equal(
+            kernel_interpolator(x_i),
+            tstack([
+                KernelInterpolator(x, DATA_POINTS_A)(x_i),
+                KernelInterpolator(x, y[..., 1])(x_i),
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            kernel_interpolator(np.reshape(x_i[:40], (2, 4, 5))),
+            np.reshape(kernel_interpolator(x_i[:40]), (2, 4, 5, 2)),
+            decimal=7)
+
+        self.assertEqual(kernel_interpolator(0.5).shape, (2, ))
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.KernelInterpolator.__call__`
@@ -726,6 +748,52 @@ class TestSpragueInterpolator(unittest.TestCase):
                           len(DATA_POINTS_A) - 1 + interval, interval)),
             DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES)
 
+        y = tstack([DATA_POINTS_A, np.asarray(DATA_POINTS_A) * 2])
+        x_i = np.arange(0, len(DATA_POINTS_A) - 1 + interval, interval)
+        sprague_interpolator = SpragueInterpolator(x, y)
+        np.testing.assert_almost_equal(
+            sprague_interpolator(x_i),
+            tstack([
+                DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES,
+                np.asarray(DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES) * 2,
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            sprague_interpolator(np.reshape(x_i[:70], (2, 5, 7))),
+            np.reshape(sprague_interpolator(x_i[:70]), (2, 5, 7, 2)),
+            decimal=7)
+
+        sprague_interpolator.y = y[..., 0]
+        np.testing.assert_almost_equal(
+            sprague_interpolator(x_i),
+            DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES,
+            decimal=7)
+
+    def test_weights_caching(self):
+        """
+        Tests :func:`colour.algebra.interpolation.SpragueInterpolator` class
+        weights caching.
+        """
+
+        cache = _CACHE_SPRAGUE_INTERPOLATOR_WEIGHTS
+        cache.clear()
+
+        x = np.arange(len(DATA_POINTS_A))
+        sprague_interpolator = SpragueInterpolator(x, DATA_POINTS_A)
+
+        sprague_interpolator(np.linspace(0, len(x) - 1, 100))
+        self.assertEqual(len(cache), 1)
+        W = sprague_interpolator._weights(np.linspace(0, len(x) - 1, 100))
+        self.assertEqual(cache.nbytes,
+                         W.data.nbytes + W.indices.nbytes + W.indptr.nbytes)
+
+        sprague_interpolator(
+            np.linspace(0,
+                        len(x) - 1,
+                        _INTERPOLATOR_WEIGHTS_CACHING_MAXIMUM_POINTS + 1))
+        self.assertEqual(len(cache), 1)
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.SpragueInterpolator.__call__`
@@ -781,6 +849,14 @@ CubicSplineInterpolator.__call__` method.
                                            len(DATA_POINTS_A) * 2)),
             DATA_POINTS_A_CUBIC_SPLINE_INTERPOLATED_X2_SAMPLES)
 
+        np.testing.assert_almost_equal(
+            CubicSplineInterpolator(
+                np.linspace(0, 1, len(DATA_POINTS_A)),
+                tstack([DATA_POINTS_A] * 3))(np.linspace(
+                    0, 1,
+                    len(DATA_POINTS_A) * 2)),
+            tstack([DATA_POINTS_A_CUBIC_SPLINE_INTERPOLATED_X2_SAMPLES] * 3))
+
 
 class TestPchipInterpolator(unittest.TestCase):
     """
@@ -1129,6 +1205,50 @@ table_interpolation_tetrahedral` definition.
                 [0.61272658, 0.92799297, 0.29650424],
             ]))
 
+    def test_interpolation_tetrahedral_linear_table(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition with a linear non-cubic table,
+        ties and table boundaries.
+        """
+
+        table = np.stack(
+            np.meshgrid(
+                np.linspace(0, 1, 9),
+                np.linspace(0, 1, 5),
+                np.linspace(0, 1, 3),
+                indexing='ij'),
+            axis=-1)
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = np.vstack([
+            random_triplet_generator(16, random_state=prng),
+            np.array([
+                [0.0, 0.0, 0.0],
+                [1.0, 1.0, 1.0],
+                [0.5, 0.5, 0.5],
+                [0.3, 0.3, 0.1],
+                [0.1, 0.3, 0.3],
+                [1.0, 0.2, 0.0],
+            ])
+        ])
+
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, table), V_xyz, decimal=7)
+
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(
+                np.reshape(V_xyz[:18], (3, 6, 3)), table),
+            np.reshape(V_xyz[:18], (3, 6, 3)),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(np.array([-0.5, 0.25, 1.5]),
+                                            table),
+            np.array([0.0, 0.25, 1.0]),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
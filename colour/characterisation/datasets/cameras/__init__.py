@@ -10,11 +10,14 @@ References
 
 from __future__ import absolute_import
 
+from functools import partial
+
 from .dslr import MSDS_CAMERA_SENSITIVITIES_DSLR
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
-MSDS_CAMERA_SENSITIVITIES = CaseInsensitiveMapping(
-    MSDS_CAMERA_SENSITIVITIES_DSLR)
+MSDS_CAMERA_SENSITIVITIES = LazyCaseInsensitiveMapping(
+    (key, partial(MSDS_CAMERA_SENSITIVITIES_DSLR.__getitem__, key))
+    for key in MSDS_CAMERA_SENSITIVITIES_DSLR)
 MSDS_CAMERA_SENSITIVITIES.__doc__ = """
 Multi-spectral distributions of camera sensitivities.
 
@@ -22,7 +25,7 @@ References
 ----------
 :cite:`Darrodi2015a`
 
-MSDS_CAMERA_SENSITIVITIES : CaseInsensitiveMapping
+MSDS_CAMERA_SENSITIVITIES : LazyCaseInsensitiveMapping
     **{Nikon 5100 (NPL), Sigma SDMerill (NPL)}**
 """
 
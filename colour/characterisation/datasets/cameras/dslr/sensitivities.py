@@ -27,8 +27,9 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
 from colour.characterisation import RGB_CameraSensitivities
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -487,13 +488,15 @@ DATA_CAMERA_SENSITIVITIES_DSLR = {
     }
 }  # yapf: disable
 
-MSDS_CAMERA_SENSITIVITIES_DSLR = CaseInsensitiveMapping({
+MSDS_CAMERA_SENSITIVITIES_DSLR = LazyCaseInsensitiveMapping({
     'Nikon 5100 (NPL)':
-        RGB_CameraSensitivities(
+        partial(
+            RGB_CameraSensitivities,
             DATA_CAMERA_SENSITIVITIES_DSLR['Nikon 5100 (NPL)'],
             name='Nikon 5100 (NPL)'),
     'Sigma SDMerill (NPL)':
-        RGB_CameraSensitivities(
+        partial(
+            RGB_CameraSensitivities,
             DATA_CAMERA_SENSITIVITIES_DSLR['Sigma SDMerill (NPL)'],
             name='Sigma SDMerill (NPL)')
 })
@@ -504,6 +507,6 @@ References
 ----------
 :cite:`Darrodi2015a`
 
-MSDS_CAMERA_SENSITIVITIES_DSLR : CaseInsensitiveMapping
+MSDS_CAMERA_SENSITIVITIES_DSLR : LazyCaseInsensitiveMapping
     **{Nikon 5100 (NPL), Sigma SDMerill (NPL)}**
 """
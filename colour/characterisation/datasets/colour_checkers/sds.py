@@ -35,8 +35,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import CaseInsensitiveMapping, LazyCaseInsensitiveMapping
 
 from collections import OrderedDict
 
@@ -2051,13 +2053,13 @@ DATA_COLORCHECKER_N_OHTA = OrderedDict((
     }),
 ))
 
-SDS_COLORCHECKER_N_OHTA = OrderedDict(
-    (key, SpectralDistribution(value, name=key))
+SDS_COLORCHECKER_N_OHTA = LazyCaseInsensitiveMapping(
+    (key, partial(SpectralDistribution, value, name=key))
     for key, value in DATA_COLORCHECKER_N_OHTA.items())
 """
 *ColorChecker Classic* data Measured by *Ohta (1997)*.
 
-SDS_COLORCHECKER_N_OHTA : dict
+SDS_COLORCHECKER_N_OHTA : LazyCaseInsensitiveMapping
 """
 
 DATA_BABELCOLOR_AVERAGE = OrderedDict((
@@ -2975,13 +2977,13 @@ DATA_BABELCOLOR_AVERAGE = OrderedDict((
     }),
 ))
 
-SDS_BABELCOLOR_AVERAGE = OrderedDict(
-    (key, SpectralDistribution(value, name=key))
+SDS_BABELCOLOR_AVERAGE = LazyCaseInsensitiveMapping(
+    (key, partial(SpectralDistribution, value, name=key))
     for key, value in DATA_BABELCOLOR_AVERAGE.items())
 """
 Average data derived from measurements of 30 *ColorChecker Classic* charts.
 
-SDS_BABELCOLOR_AVERAGE : dict
+SDS_BABELCOLOR_AVERAGE : LazyCaseInsensitiveMapping
 """
 
 SDS_COLOURCHECKERS = CaseInsensitiveMapping({
@@ -30,8 +30,9 @@ context=article
 
 from __future__ import division, unicode_literals
 
+from functools import partial
 from colour.characterisation import RGB_DisplayPrimaries
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -128,9 +129,10 @@ DATA_DISPLAY_PRIMARIES_LCD = {
     }
 }
 
-MSDS_DISPLAY_PRIMARIES_LCD = CaseInsensitiveMapping({
+MSDS_DISPLAY_PRIMARIES_LCD = LazyCaseInsensitiveMapping({
     'Apple Studio Display':
-        RGB_DisplayPrimaries(
+        partial(
+            RGB_DisplayPrimaries,
             DATA_DISPLAY_PRIMARIES_LCD['Apple Studio Display'],
             name='Apple Studio Display')
 })
@@ -141,6 +143,6 @@ References
 ----------
 :cite:`Fairchild1998b`, :cite:`Machado2010a`
 
-MSDS_DISPLAY_PRIMARIES_LCD : CaseInsensitiveMapping
+MSDS_DISPLAY_PRIMARIES_LCD : LazyCaseInsensitiveMapping
     **{'Apple Studio Display'}**
 """
@@ -23,8 +23,9 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -62,9 +63,10 @@ DATA_FILTERS_ISO = {
     }
 }
 
-SDS_FILTERS_ISO = CaseInsensitiveMapping({
+SDS_FILTERS_ISO = LazyCaseInsensitiveMapping({
     'ISO 7589 Diffuser':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_FILTERS_ISO['ISO 7589 Diffuser'], name='ISO 7589 Diffuser'),
 })
 SDS_FILTERS_ISO.__doc__ = """
@@ -74,10 +76,12 @@ References
 ----------
 :cite:`ISO2002`
 
-SDS_FILTERS_ISO : CaseInsensitiveMapping
+SDS_FILTERS_ISO : LazyCaseInsensitiveMapping
 """
 
-SDS_FILTERS = CaseInsensitiveMapping(SDS_FILTERS_ISO)
+SDS_FILTERS = LazyCaseInsensitiveMapping(
+    (key, partial(SDS_FILTERS_ISO.__getitem__, key))
+    for key in SDS_FILTERS_ISO)
 SDS_FILTERS.__doc__ = """
 Spectral distributions of filters.
 
@@ -85,5 +89,5 @@ References
 ----------
 :cite:`ISO2002`
 
-SDS_FILTERS : CaseInsensitiveMapping
+SDS_FILTERS : LazyCaseInsensitiveMapping
 """
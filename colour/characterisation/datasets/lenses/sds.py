@@ -23,8 +23,9 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -75,9 +76,10 @@ DATA_LENSES_ISO = {
     }
 }
 
-SDS_LENSES_ISO = CaseInsensitiveMapping({
+SDS_LENSES_ISO = LazyCaseInsensitiveMapping({
     'ISO Standard Lens':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LENSES_ISO['ISO Standard Lens'], name='ISO Standard Lens'),
 })
 SDS_LENSES_ISO.__doc__ = """
@@ -87,10 +89,12 @@ References
 ----------
 :cite:`ISO2002`
 
-SDS_LENSES_ISO : CaseInsensitiveMapping
+SDS_LENSES_ISO : LazyCaseInsensitiveMapping
 """
 
-SDS_LENSES = CaseInsensitiveMapping(SDS_LENSES_ISO)
+SDS_LENSES = LazyCaseInsensitiveMapping(
+    (key, partial(SDS_LENSES_ISO.__getitem__, key))
+    for key in SDS_LENSES_ISO)
 SDS_LENSES.__doc__ = """
 Spectral distributions of lenses.
 
@@ -98,5 +102,5 @@ References
 ----------
 :cite:`ISO2002`
 
-SDS_LENSES : CaseInsensitiveMapping
+SDS_LENSES : LazyCaseInsensitiveMapping
 """
@@ -20,8 +20,9 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -362,10 +363,13 @@ DATA_ILLUMINANTS_D_SERIES = {
     }
 }
 
-SDS_ILLUMINANTS_D_SERIES = CaseInsensitiveMapping({
-    'S0': SpectralDistribution(DATA_ILLUMINANTS_D_SERIES['S0'], name='S0'),
-    'S1': SpectralDistribution(DATA_ILLUMINANTS_D_SERIES['S1'], name='S1'),
-    'S2': SpectralDistribution(DATA_ILLUMINANTS_D_SERIES['S2'], name='S2')
+SDS_ILLUMINANTS_D_SERIES = LazyCaseInsensitiveMapping({
+    'S0': partial(SpectralDistribution, DATA_ILLUMINANTS_D_SERIES['S0'],
+                  name='S0'),
+    'S1': partial(SpectralDistribution, DATA_ILLUMINANTS_D_SERIES['S1'],
+                  name='S1'),
+    'S2': partial(SpectralDistribution, DATA_ILLUMINANTS_D_SERIES['S2'],
+                  name='S2')
 })
 SDS_ILLUMINANTS_D_SERIES.__doc__ = """
 *CIE Illuminant D Series* :math:`S_n(\\lambda)` spectral distributions.
@@ -374,6 +378,6 @@ References
 ----------
 :cite:`Lindbloom2007a`, :cite:`Wyszecki2000z`
 
-SDS_ILLUMINANTS_D_SERIES : CaseInsensitiveMapping
+SDS_ILLUMINANTS_D_SERIES : LazyCaseInsensitiveMapping
    **{'S0', 'S1', 'S1'}**
 """
@@ -44,8 +44,11 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import (CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -2340,35 +2343,41 @@ DATA_LEFS_PHOTOPIC = {
     }
 }
 
-SDS_LEFS_PHOTOPIC = CaseInsensitiveMapping({
+SDS_LEFS_PHOTOPIC = LazyCaseInsensitiveMapping({
     'CIE 1924 Photopic Standard Observer':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LEFS_PHOTOPIC['CIE 1924 Photopic Standard Observer'],
             name='CIE 1924 Photopic Standard Observer'),
     'Judd Modified CIE 1951 Photopic Standard Observer':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LEFS_PHOTOPIC[
                 'Judd Modified CIE 1951 Photopic Standard Observer'],
             name='Judd Modified CIE 1951 Photopic Standard Observer'),
     'Judd-Vos Modified CIE 1978 Photopic Standard Observer':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LEFS_PHOTOPIC[
                 'Judd-Vos Modified CIE 1978 Photopic Standard Observer'],
             name='Judd-Vos Modified CIE 1978 Photopic Standard Observer'),
     'CIE 1964 Photopic 10 Degree Standard Observer':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LEFS_PHOTOPIC[
                 'CIE 1964 Photopic 10 Degree Standard Observer'],
             name='CIE 1964 Photopic 10 Degree Standard Observer',
             strict_name='CIE 1964 Photopic 10$^\\circ$ Standard Observer'),
     'CIE 2008 2 Degree Physiologically Relevant LEF':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LEFS_PHOTOPIC[
                 'CIE 2008 2 Degree Physiologically Relevant LEF'],
             name='CIE 2008 2 Degree Physiologically Relevant LEF',
             strict_name='CIE 2008 2$^\\circ$ Physiologically Relevant LEF'),
     'CIE 2008 10 Degree Physiologically Relevant LEF':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LEFS_PHOTOPIC[
                 'CIE 2008 10 Degree Physiologically Relevant LEF'],
             name='CIE 2008 10 Degree Physiologically Relevant LEF',
@@ -2381,7 +2390,7 @@ References
 ----------
 :cite:`CVRLq`, :cite:`CVRLs`
 
-SDS_LEFS_PHOTOPIC : CaseInsensitiveMapping
+SDS_LEFS_PHOTOPIC : LazyCaseInsensitiveMapping
     **{'CIE 1924 Photopic Standard Observer',
     'Judd Modified CIE 1951 Photopic Standard Observer',
     'Judd-Vos Modified CIE 1978 Photopic Standard Observer',
@@ -2394,10 +2403,11 @@ Aliases:
 -   'cie_2_1924': 'CIE 1931 2 Degree Standard Observer'
 -   'cie_10_1964': 'CIE 1964 Photopic 10 Degree Standard Observer'
 """
-SDS_LEFS_PHOTOPIC['cie_2_1924'] = (
-    SDS_LEFS_PHOTOPIC['CIE 1924 Photopic Standard Observer'])
-SDS_LEFS_PHOTOPIC['cie_10_1964'] = (
-    SDS_LEFS_PHOTOPIC['CIE 1964 Photopic 10 Degree Standard Observer'])
+SDS_LEFS_PHOTOPIC['cie_2_1924'] = partial(
+    SDS_LEFS_PHOTOPIC.__getitem__, 'CIE 1924 Photopic Standard Observer')
+SDS_LEFS_PHOTOPIC['cie_10_1964'] = partial(
+    SDS_LEFS_PHOTOPIC.__getitem__,
+    'CIE 1964 Photopic 10 Degree Standard Observer')
 
 DATA_LEFS_SCOTOPIC = {
     'CIE 1951 Scotopic Standard Observer': {
@@ -2805,9 +2815,10 @@ DATA_LEFS_SCOTOPIC = {
     }
 }
 
-SDS_LEFS_SCOTOPIC = CaseInsensitiveMapping({
+SDS_LEFS_SCOTOPIC = LazyCaseInsensitiveMapping({
     'CIE 1951 Scotopic Standard Observer':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LEFS_SCOTOPIC['CIE 1951 Scotopic Standard Observer'],
             name='CIE 1951 Scotopic Standard Observer')
 })
@@ -2818,17 +2829,20 @@ References
 ----------
 :cite:`CVRLs`
 
-SDS_LEFS_SCOTOPIC : CaseInsensitiveMapping
+SDS_LEFS_SCOTOPIC : LazyCaseInsensitiveMapping
     **{'CIE 1951 Scotopic Standard Observer', }**
 
 Aliases:
 
 -   'cie_1951': 'CIE 1951 Scotopic Standard Observer'
 """
-SDS_LEFS_SCOTOPIC['cie_1951'] = (
-    SDS_LEFS_SCOTOPIC['CIE 1951 Scotopic Standard Observer'])
+SDS_LEFS_SCOTOPIC['cie_1951'] = partial(
+    SDS_LEFS_SCOTOPIC.__getitem__, 'CIE 1951 Scotopic Standard Observer')
 
-SDS_LEFS = CaseInsensitiveMapping(SDS_LEFS_PHOTOPIC)
+SDS_LEFS = LazyCaseInsensitiveMapping(
+    (key, partial(mapping.__getitem__, key))
+    for mapping in (SDS_LEFS_PHOTOPIC, SDS_LEFS_SCOTOPIC)
+    for key in mapping)
 SDS_LEFS.__doc__ = """
 Spectral distributions of the luminous efficiency functions.
 
@@ -2836,7 +2850,7 @@ References
 ----------
 :cite:`CVRLq`, :cite:`CVRLs`, :cite:`Wikipedia2005d`
 
-SDS_LEFS : CaseInsensitiveMapping
+SDS_LEFS : LazyCaseInsensitiveMapping
     **{'CIE 1924 Photopic Standard Observer',
     'Judd Modified CIE 1951 Photopic Standard Observer',
     'Judd-Vos Modified CIE 1978 Photopic Standard Observer',
@@ -2845,7 +2859,6 @@ SDS_LEFS : CaseInsensitiveMapping
     'CIE 2008 10 Degree Physiologically Relevant LEF',
     'CIE 1951 Scotopic Standard Observer'}**
 """
-SDS_LEFS.update(SDS_LEFS_SCOTOPIC)
 
 DATA_MESOPIC_X = {
     0.01:
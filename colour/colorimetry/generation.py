@@ -317,7 +317,7 @@ def sd_gaussian_normal(mu, sigma, shape=SPECTRAL_SHAPE_DEFAULT):
     >>> sd.shape
     SpectralShape(360.0, 780.0, 1.0)
     >>> sd[555]  # doctest: +ELLIPSIS
-    1.0000000...
+    1.0...
     >>> sd[530]  # doctest: +ELLIPSIS
     0.6065306...
     """
@@ -429,7 +429,7 @@ def sd_gaussian(mu_peak_wavelength,
     >>> sd.shape
     SpectralShape(360.0, 780.0, 1.0)
     >>> sd[555]  # doctest: +ELLIPSIS
-    1.0000000...
+    1.0...
     >>> sd[530]  # doctest: +ELLIPSIS
     0.6065306...
     >>> sd = sd_gaussian(555, 25, method='FWHM')
@@ -482,7 +482,7 @@ def sd_single_led_Ohno2005(peak_wavelength, fwhm,
     >>> sd.shape
     SpectralShape(360.0, 780.0, 1.0)
     >>> sd[555]  # doctest: +ELLIPSIS
-    1.0000000...
+    1.0...
     """
 
     sd = sd_gaussian_fwhm(peak_wavelength, fwhm, shape)
@@ -549,7 +549,7 @@ def sd_single_led(peak_wavelength,
     >>> sd.shape
     SpectralShape(360.0, 780.0, 1.0)
     >>> sd[555]  # doctest: +ELLIPSIS
-    1.0000000...
+    1.0...
     """
 
     return SD_SINGLE_LED_METHODS[method](peak_wavelength, fwhm, shape)
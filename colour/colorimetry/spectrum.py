@@ -33,7 +33,7 @@ from colour.algebra import (Extrapolator, CubicSplineInterpolator,
                             SpragueInterpolator)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import Signal, MultiSignals
-from colour.utilities import (as_float, as_int, first_item, is_iterable,
+from colour.utilities import (as_float, as_int, is_iterable,
                               is_numeric, is_string, is_uniform, interval,
                               runtime_warning, tstack, usage_warning)
 from colour.utilities.deprecation import (ObjectRemoved, ObjectRenamed,
@@ -1737,16 +1737,8 @@ MultiSpectralDistributions or array_like or dict_like, optional
     """
 
     def __init__(self, data=None, domain=None, labels=None, **kwargs):
-        signals = self.multi_signals_unpack_data(data, domain, labels)
-
-        domain = signals[list(signals.keys())[0]].domain if signals else None
-        uniform = is_uniform(domain) if domain is not None else True
-
         # Initialising with *CIE 15:2004* and *CIE 167:2005* recommendations
         # defaults.
-        kwargs['interpolator'] = kwargs.get(
-            'interpolator', SpragueInterpolator
-            if uniform else CubicSplineInterpolator)
         kwargs['interpolator_kwargs'] = kwargs.get('interpolator_kwargs', {})
 
         kwargs['extrapolator'] = kwargs.get('extrapolator', Extrapolator)
@@ -1757,7 +1749,14 @@ MultiSpectralDistributions or array_like or dict_like, optional
         })
 
         super(MultiSpectralDistributions, self).__init__(
-            signals, domain, signal_type=SpectralDistribution, **kwargs)
+            data, domain, labels, signal_type=SpectralDistribution, **kwargs)
+
+        if 'interpolator' not in kwargs:
+            domain = self.domain
+            uniform = is_uniform(domain) if domain is not None else True
+
+            self.interpolator = (SpragueInterpolator
+                                 if uniform else CubicSplineInterpolator)
 
         self._strict_name = None
         self.strict_name = kwargs.get('strict_name')
@@ -1938,8 +1937,16 @@ MultiSpectralDistributions or array_like or dict_like, optional
         SpectralShape(500.0, 560.0, 1.0)
         """
 
-        if self.signals:
-            return first_item(self._signals.values()).shape
+        if self.labels:
+            wavelengths_interval = interval(self.wavelengths)
+            if wavelengths_interval.size != 1:
+                runtime_warning(
+                    ('"{0}" multi-spectral distributions is not uniform, '
+                     'using minimum interval!'.format(self.name)))
+
+            return SpectralShape(
+                min(self.wavelengths), max(self.wavelengths),
+                as_float(min(wavelengths_interval)))
 
     def interpolate(self,
                     shape,
@@ -2164,8 +2171,48 @@ MultiSpectralDistributions or array_like or dict_like, optional
             'ArgumentRenamed': [['interpolator_args', 'interpolator_kwargs']],
         }, **kwargs).get('interpolator_kwargs', interpolator_kwargs)
 
-        for signal in self.signals.values():
-            signal.interpolate(shape, interpolator, interpolator_kwargs)
+        self_shape = self.shape
+        s_e_i = zip((shape.start, shape.end, shape.interval),
+                    (self_shape.start, self_shape.end, self_shape.interval))
+        shape = SpectralShape(
+            *[x[0] if x[0] is not None else x[1] for x in s_e_i])
+
+        # Defining proper interpolation bounds.
+        # TODO: Provide support for fractional interval like 0.1, etc...
+        if (round(self_shape.start) != self_shape.start or
+                round(self_shape.end) != self_shape.end):
+            runtime_warning(
+                'Fractional bound encountered, rounding will occur!')
+
+        shape.start = max(shape.start, np.ceil(self_shape.start))
+        shape.end = min(shape.end, np.floor(self_shape.end))
+
+        if interpolator is None:
+            # User has specifically chosen the interpolator thus it is used
+            # instead of those from *CIE 167:2005* recommendation.
+            if self.interpolator not in (SpragueInterpolator,
+                                         CubicSplineInterpolator):
+                interpolator = self.interpolator
+            elif self.is_uniform():
+                interpolator = SpragueInterpolator
+            else:
+                interpolator = CubicSplineInterpolator
+
+        if interpolator_kwargs is None:
+            # User has specifically chosen the interpolator thus its keyword
+            # arguments are used.
+            if self.interpolator not in (SpragueInterpolator,
+                                         CubicSplineInterpolator):
+                interpolator_kwargs = self.interpolator_kwargs
+            else:
+                interpolator_kwargs = {}
+
+        # All the spectral distributions are interpolated at once.
+        interpolator = self._create_interpolator(interpolator,
+                                                 interpolator_kwargs)
+
+        self.domain = shape.range()
+        self.range = interpolator(self.domain)
 
         return self
 
@@ -2256,8 +2303,35 @@ MultiSpectralDistributions or array_like or dict_like, optional
             'ArgumentRenamed': [['extrapolator_args', 'extrapolator_kwargs']],
         }, **kwargs).get('extrapolator_kwargs', extrapolator_kwargs)
 
-        for signal in self.signals.values():
-            signal.extrapolate(shape, extrapolator, extrapolator_kwargs)
+        self_shape = self.shape
+        wavelengths = np.hstack([
+            np.arange(shape.start, self_shape.start, self_shape.interval),
+            np.arange(self_shape.end + self_shape.interval,
+                      shape.end + self_shape.interval, self_shape.interval)
+        ])
+
+        if extrapolator is None:
+            extrapolator = Extrapolator
+
+        if extrapolator_kwargs is None:
+            extrapolator_kwargs = {
+                'method': 'Constant',
+                'left': None,
+                'right': None
+            }
+
+        self_extrapolator = self.extrapolator
+        self_extrapolator_kwargs = self.extrapolator_kwargs
+
+        self.extrapolator = extrapolator
+        self.extrapolator_kwargs = extrapolator_kwargs
+
+        # The following self-assignment is written as intended and triggers the
+        # extrapolation.
+        self[wavelengths] = self[wavelengths]
+
+        self.extrapolator = self_extrapolator
+        self.extrapolator_kwargs = self_extrapolator_kwargs
 
         return self
 
@@ -2410,9 +2484,8 @@ MultiSpectralDistributions or array_like or dict_like, optional
             'ArgumentRenamed': [['extrapolator_args', 'extrapolator_kwargs']],
         }, **kwargs).get('extrapolator_kwargs', extrapolator_kwargs)
 
-        for signal in self.signals.values():
-            signal.align(shape, interpolator, interpolator_kwargs,
-                         extrapolator, extrapolator_kwargs)
+        self.interpolate(shape, interpolator, interpolator_kwargs)
+        self.extrapolate(shape, extrapolator, extrapolator_kwargs)
 
         return self
 
@@ -2490,8 +2563,17 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 560.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.trim(shape)
+        start = max(shape.start, self.shape.start)
+        end = min(shape.end, self.shape.end)
+
+        indexes = np.where(
+            np.logical_and(self.domain >= start, self.domain <= end))
+
+        wavelengths = self.wavelengths[indexes]
+        values = self.values[indexes]
+
+        self.wavelengths = wavelengths
+        self.values = values
 
         return self
 
@@ -2539,8 +2621,7 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 560.            1.       ...    1.       ...    0.0143382...]]
         """
 
-        for signal in self.signals.values():
-            signal.normalise(factor)
+        self *= (1 / np.max(self.values, axis=0) * factor)[np.newaxis, ...]
 
         return self
 
@@ -2595,11 +2676,11 @@ MultiSpectralDistributions or array_like or dict_like, optional
         """
 
         sds = []
-        for i, signal in enumerate(self.signals.values()):
-            signal = signal.copy()
-            signal.name = '{0} - {1}'.format(self.labels[i], signal.name)
+        for i, signal in enumerate(
+                self._create_signals(write_back=False).values()):
+            signal.name = '{0} - {1}'.format(self.labels[i], self.name)
             signal.strict_name = '{0} - {1}'.format(self.strict_labels[i],
-                                                    signal.strict_name)
+                                                    self.strict_name)
 
             sds.append(signal)
 
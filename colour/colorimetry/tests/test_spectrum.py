@@ -1761,6 +1761,11 @@ MultiSpectralDistributions.to_sds` method.
                     self._strict_labels[i],
                     self._non_uniform_sample_msds.strict_name))
 
+        range_ = self._non_uniform_sample_msds.range
+        sds[0][sds[0].wavelengths] = 0
+        np.testing.assert_array_equal(self._non_uniform_sample_msds.range,
+                                      range_)
+
 
 class TestSdsAndMdsToSds(unittest.TestCase):
     """
@@ -22,7 +22,8 @@ from colour.colorimetry import (
     lagrange_coefficients_ASTME2022, tristimulus_weighting_factors_ASTME2022,
     adjust_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_integration,
     sd_to_XYZ_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_ASTME308,
-    msds_to_XYZ_integration, msds_to_XYZ_ASTME308, wavelength_to_XYZ)
+    msds_to_XYZ_integration, msds_to_XYZ_ASTME308, msds_to_XYZ,
+    TristimulusIntegrator, wavelength_to_XYZ)
 from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
@@ -43,6 +44,7 @@ __all__ = [
     'TestAdjustTristimulusWeightingFactorsASTME308',
     'TestSd_to_XYZ_integration', 'TestSd_to_XYZ_ASTME308',
     'TestMsds_to_XYZ_integration', 'TestMsds_to_XYZ_ASTME308',
+    'TestTristimulusIntegrator',
     'TestWavelength_to_XYZ'
 ]
 
@@ -1044,6 +1046,16 @@ class TestMsds_to_XYZ_ASTME308(unittest.TestCase):
             TVS_D65_ASTME308_K1_MSDS,
             decimal=7)
 
+        for interval in (1, 5, 10, 20):
+            msds = MSDS_TWO.copy().align(SpectralShape(400, 700, interval))
+            np.testing.assert_almost_equal(
+                msds_to_XYZ_ASTME308(msds, cmfs, SDS_ILLUMINANTS['D65']),
+                [
+                    sd_to_XYZ_ASTME308(sd, cmfs, SDS_ILLUMINANTS['D65'])
+                    for sd in msds.to_sds()
+                ],
+                decimal=7)
+
     def test_domain_range_scale_msds_to_XYZ_ASTME308(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_ASTME308`
@@ -1070,6 +1082,113 @@ class TestMsds_to_XYZ_ASTME308(unittest.TestCase):
         self.assertRaises(ValueError, msds_to_XYZ_ASTME308, DATA_TWO)
 
 
+class TestTristimulusIntegrator(unittest.TestCase):
+    """
+    Defines :class:`colour.colorimetry.tristimulus.TristimulusIntegrator`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('shape', 'method', 'weights')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(TristimulusIntegrator))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(TristimulusIntegrator))
+
+    def test__call__(self):
+        """
+        Tests :meth:`colour.colorimetry.tristimulus.TristimulusIntegrator.\
+__call__` method.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        for method in ('ASTM E308', 'Integration'):
+            for interval in (1, 5, 10, 20):
+                shape = SpectralShape(400, 700, interval)
+                msds = MSDS_TWO.copy().align(shape)
+                integrator = TristimulusIntegrator(
+                    shape, cmfs, SDS_ILLUMINANTS['D65'], method=method)
+
+                np.testing.assert_almost_equal(
+                    integrator(np.transpose(msds.values)),
+                    msds_to_XYZ(
+                        msds, cmfs, SDS_ILLUMINANTS['D65'], method=method),
+                    decimal=7)
+
+        shape = SpectralShape(400, 700, 20)
+        integrator = TristimulusIntegrator(
+            shape, cmfs, SDS_ILLUMINANTS['D65'], k=1)
+        np.testing.assert_almost_equal(
+            integrator(np.transpose(MSDS_TWO.copy().align(shape).values)),
+            TVS_D65_ASTME308_K1_MSDS,
+            decimal=7)
+
+    def test_n_dimensional_TristimulusIntegrator(self):
+        """
+        Tests :meth:`colour.colorimetry.tristimulus.TristimulusIntegrator.\
+__call__` method n-dimensional arrays support.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(400, 700, 20)
+        integrator = TristimulusIntegrator(shape, cmfs,
+                                           SDS_ILLUMINANTS['D65'])
+
+        spectra = np.transpose(MSDS_TWO.copy().align(shape).values)
+        XYZ = integrator(spectra)
+
+        spectra = np.reshape(spectra, (2, 6, 16))
+        XYZ = np.reshape(XYZ, (2, 6, 3))
+        np.testing.assert_almost_equal(integrator(spectra), XYZ, decimal=7)
+
+        XYZ_f = integrator(spectra.astype(np.float32))
+        self.assertEqual(XYZ_f.dtype, np.float32)
+        np.testing.assert_allclose(XYZ_f, XYZ, rtol=1e-5)
+
+    def test_domain_range_scale_TristimulusIntegrator(self):
+        """
+        Tests :meth:`colour.colorimetry.tristimulus.TristimulusIntegrator.\
+__call__` method domain and range scale support.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(400, 700, 20)
+        integrator = TristimulusIntegrator(shape, cmfs,
+                                           SDS_ILLUMINANTS['D65'])
+
+        spectra = np.transpose(MSDS_TWO.copy().align(shape).values)
+        d_r = (('reference', 1), (1, 0.01), (100, 1))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    integrator(spectra),
+                    TVS_D65_ASTME308_MSDS * factor,
+                    decimal=7)
+
+    def test_raise_exception_TristimulusIntegrator(self):
+        """
+        Tests :meth:`colour.colorimetry.tristimulus.TristimulusIntegrator.\
+__call__` method raise exception.
+        """
+
+        integrator = TristimulusIntegrator(SpectralShape(400, 700, 20))
+
+        self.assertRaises(AssertionError, integrator, np.ones(15))
+
+
 class TestWavelength_to_XYZ(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.tristimulus.wavelength_to_XYZ` definition
@@ -16,6 +16,7 @@ sd_to_XYZ_tristimulus_weighting_factors_ASTME308`
 -   :func:`colour.colorimetry.msds_to_XYZ_ASTME308`
 -   :attr:`colour.MSDS_TO_XYZ_METHODS`
 -   :func:`colour.msds_to_XYZ`
+-   :class:`colour.colorimetry.TristimulusIntegrator`
 -   :func:`colour.wavelength_to_XYZ`
 
 The default implementation is based on practise *ASTM E308-15* method.
@@ -42,7 +43,8 @@ from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
                                 MultiSpectralDistributions, SpectralShape,
                                 MSDS_CMFS_STANDARD_OBSERVER, sd_ones)
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+from colour.utilities import (CACHE_REGISTRY, CaseInsensitiveMapping,
+                              as_float_array, domain_range_scale,
                               filter_kwargs, from_range_100,
                               get_domain_range_scale, runtime_warning, tsplit)
 
@@ -60,7 +62,7 @@ __all__ = [
     'sd_to_XYZ_tristimulus_weighting_factors_ASTME308', 'sd_to_XYZ_ASTME308',
     'SD_TO_XYZ_METHODS', 'sd_to_XYZ', 'msds_to_XYZ_integration',
     'msds_to_XYZ_ASTME308', 'MSDS_TO_XYZ_METHODS', 'msds_to_XYZ',
-    'wavelength_to_XYZ'
+    'TristimulusIntegrator', 'wavelength_to_XYZ'
 ]
 
 SPECTRAL_SHAPE_ASTME308 = SPECTRAL_SHAPE_DEFAULT
@@ -74,11 +76,16 @@ References
 SPECTRAL_SHAPE_ASTME308 : SpectralShape
 """
 
-_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = None
+_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS'.format(__name__),
+    maximum_size=64)
 
-_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = None
+_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TRISTIMULUS_WEIGHTING_FACTORS'.format(__name__),
+    maximum_size=128)
 
-_CACHE_SD_TO_XYZ = None
+_CACHE_SD_TO_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_SD_TO_XYZ'.format(__name__), maximum_size=8192)
 
 
 def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
@@ -130,13 +137,10 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
            [ 0.05...,  0.99..., -0.04...]])
     """
 
-    global _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS
-    if _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS is None:
-        _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = {}
-
     hash_key = tuple([hash(arg) for arg in (interval, interval_type)])
-    if hash_key in _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS:
-        return _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS[hash_key]
+    lica = _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS.get(hash_key)
+    if lica is not None:
+        return lica
 
     r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
     d = 3
@@ -251,16 +255,13 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _CACHE_TRISTIMULUS_WEIGHTING_FACTORS
-    if _CACHE_TRISTIMULUS_WEIGHTING_FACTORS is None:
-        _CACHE_TRISTIMULUS_WEIGHTING_FACTORS = {}
-
     hash_key = tuple([
         hash(arg) for arg in (cmfs, illuminant, shape, k,
                               get_domain_range_scale())
     ])
-    if hash_key in _CACHE_TRISTIMULUS_WEIGHTING_FACTORS:
-        return _CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key]
+    W = _CACHE_TRISTIMULUS_WEIGHTING_FACTORS.get(hash_key)
+    if W is not None:
+        return W
 
     Y = cmfs.values
     S = illuminant.values
@@ -406,8 +407,8 @@ def sd_to_XYZ_integration(
 
     Parameters
     ----------
-    sd : SpectralDistribution
-        Spectral distribution.
+    sd : SpectralDistribution or MultiSpectralDistributions
+        Spectral distribution or multi-spectral distributions.
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
@@ -430,7 +431,7 @@ def sd_to_XYZ_integration(
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (n, 3)
         *CIE XYZ* tristimulus values.
 
     Notes
@@ -496,11 +497,8 @@ def sd_to_XYZ_integration(
 
     k = 100 / (np.sum(y_bar * S) * dw) if k is None else k
 
-    X_p = R * x_bar * S * dw
-    Y_p = R * y_bar * S * dw
-    Z_p = R * z_bar * S * dw
-
-    XYZ = k * np.sum(np.array([X_p, Y_p, Z_p]), axis=-1)
+    # Multi-spectral distributions values are integrated at once.
+    XYZ = k * np.dot(np.transpose(R), cmfs.values * S[..., np.newaxis] * dw)
 
     return from_range_100(XYZ)
 
@@ -518,8 +516,8 @@ def sd_to_XYZ_tristimulus_weighting_factors_ASTME308(
 
     Parameters
     ----------
-    sd : SpectralDistribution
-        Spectral distribution.
+    sd : SpectralDistribution or MultiSpectralDistributions
+        Spectral distribution or multi-spectral distributions.
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
@@ -542,7 +540,7 @@ def sd_to_XYZ_tristimulus_weighting_factors_ASTME308(
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (n, 3)
         *CIE XYZ* tristimulus values.
 
     Notes
@@ -614,7 +612,7 @@ def sd_to_XYZ_tristimulus_weighting_factors_ASTME308(
         W, SpectralShape(start_w, end_w, sd.shape.interval), sd.shape)
     R = sd.values
 
-    XYZ = np.sum(W * R[..., np.newaxis], axis=0)
+    XYZ = np.dot(np.transpose(R), W)
 
     return from_range_100(XYZ)
 
@@ -635,8 +633,8 @@ def sd_to_XYZ_ASTME308(
 
     Parameters
     ----------
-    sd : SpectralDistribution
-        Spectral distribution.
+    sd : SpectralDistribution or MultiSpectralDistributions
+        Spectral distribution or multi-spectral distributions.
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
@@ -671,7 +669,7 @@ def sd_to_XYZ_ASTME308(
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (n, 3)
         *CIE XYZ* tristimulus values.
 
     Notes
@@ -744,21 +742,15 @@ def sd_to_XYZ_ASTME308(
 
         # Extrapolation of additional 20nm padding intervals.
         sd.align(SpectralShape(sd.shape.start - 20, sd.shape.end + 20, 10))
-        for i in range(2):
-            sd[sd.wavelengths[i]] = (
-                    3 * sd.values[i + 2] -
-                    3 * sd.values[i + 4] + sd.values[i + 6])  # yapf: disable
-            i_e = len(sd.domain) - 1 - i
-            sd[sd.wavelengths[i_e]] = (
-                sd.values[i_e - 6] - 3 * sd.values[i_e - 4] +
-                3 * sd.values[i_e - 2])
+        values = sd.values
+        values[0:2] = 3 * values[2:4] - 3 * values[4:6] + values[6:8]
+        values[-2:] = values[-8:-6] - 3 * values[-6:-4] + 3 * values[-4:-2]
 
         # Interpolating every odd numbered values.
-        # TODO: Investigate code vectorisation.
-        for i in range(3, len(sd.domain) - 3, 2):
-            sd[sd.wavelengths[i]] = (
-                -0.0625 * sd.values[i - 3] + 0.5625 * sd.values[i - 1] +
-                0.5625 * sd.values[i + 1] - 0.0625 * sd.values[i + 3])
+        i = np.arange(3, len(values) - 3, 2)
+        values[i] = (-0.0625 * values[i - 3] + 0.5625 * values[i - 1] +
+                     0.5625 * values[i + 1] - 0.0625 * values[i + 3])
+        sd.range = values
 
         # Discarding the additional 20nm padding intervals.
         sd.trim(SpectralShape(sd.shape.start + 20, sd.shape.end - 20, 10))
@@ -903,16 +895,13 @@ def sd_to_XYZ(
     array([ 10.8404805...,   9.6838697...,   6.2115722...])
     """
 
-    global _CACHE_SD_TO_XYZ
-    if _CACHE_SD_TO_XYZ is None:
-        _CACHE_SD_TO_XYZ = {}
-
     hash_key = tuple([
         hash(arg) for arg in (sd, cmfs, illuminant, k, method,
                               tuple(kwargs.items()), get_domain_range_scale())
     ])
-    if hash_key in _CACHE_SD_TO_XYZ:
-        return _CACHE_SD_TO_XYZ[hash_key]
+    XYZ = _CACHE_SD_TO_XYZ.get(hash_key)
+    if XYZ is not None:
+        return XYZ
 
     function = SD_TO_XYZ_METHODS[method]
 
@@ -1062,10 +1051,7 @@ def msds_to_XYZ_integration(
     """
 
     if isinstance(msds, MultiSpectralDistributions):
-        return as_float_array([
-            sd_to_XYZ_integration(sd, cmfs, illuminant, k)
-            for sd in msds.to_sds()
-        ])
+        return sd_to_XYZ_integration(msds, cmfs, illuminant, k)
     else:
         msds = as_float_array(msds)
 
@@ -1217,12 +1203,9 @@ def msds_to_XYZ_ASTME308(
     """
 
     if isinstance(msds, MultiSpectralDistributions):
-        return as_float_array([
-            sd_to_XYZ_ASTME308(sd, cmfs, illuminant, use_practice_range,
-                               mi_5nm_omission_method,
-                               mi_20nm_interpolation_method, k)
-            for sd in msds.to_sds()
-        ])
+        return sd_to_XYZ_ASTME308(msds, cmfs, illuminant, use_practice_range,
+                                  mi_5nm_omission_method,
+                                  mi_20nm_interpolation_method, k)
     else:
         raise ValueError('"ASTM E308-15" method does not support "array_like" '
                          'multi-spectral distributions!')
@@ -1414,8 +1397,204 @@ def msds_to_XYZ(
 
     function = MSDS_TO_XYZ_METHODS[method]
 
-    return function(msds, cmfs, illuminant, k,
-                    **filter_kwargs(function, **kwargs))
+    return function(
+        msds, cmfs, illuminant, k=k, **filter_kwargs(function, **kwargs))
+
+
+class TristimulusIntegrator(object):
+    """
+    Defines a tristimulus integrator converting spectral data sampled
+    according to given spectral shape to *CIE XYZ* tristimulus values using
+    a precomputed table of integration weights.
+
+    For given spectral shape, colour matching functions, illuminant,
+    normalisation constant :math:`k` and method, the conversion performed by
+    :func:`colour.msds_to_XYZ` definition is linear, the integration weights
+    are thus computed once by converting the canonical basis of the spectral
+    data space and the conversion reduces to a matrix product.
+
+    Parameters
+    ----------
+    shape : SpectralShape, optional
+        Spectral shape of the spectral data to convert.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    k : numeric, optional
+        Normalisation constant :math:`k`, see :func:`colour.sd_to_XYZ`
+        definition for more information.
+    method : unicode, optional
+        **{'ASTM E308', 'Integration'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    use_practice_range : bool, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        5 nm measurement intervals multi-spectral distributions conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        20 nm measurement intervals multi-spectral distributions conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Attributes
+    ----------
+    shape
+    method
+    weights
+
+    Methods
+    -------
+    __call__
+
+    Notes
+    -----
+    -   The integration weights are computed in the *Colour* **'Reference'**
+        domain-range scale, the range scale is applied when calling the
+        tristimulus integrator.
+
+    Examples
+    --------
+    >>> from colour import MSDS_CMFS, SDS_ILLUMINANTS, SpectralShape
+    >>> cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> illuminant = SDS_ILLUMINANTS['D65']
+    >>> shape = SpectralShape(400, 700, 20)
+    >>> integrator = TristimulusIntegrator(shape, cmfs, illuminant)
+    >>> integrator.weights.shape
+    (16, 3)
+    >>> integrator(np.full((2, 2, 16), 0.5))  # doctest: +ELLIPSIS
+    array([[[ 47.5234286...,  50.        ,  54.4414867...],
+            [ 47.5234286...,  50.        ,  54.4414867...]],
+    <BLANKLINE>
+           [[ 47.5234286...,  50.        ,  54.4414867...],
+            [ 47.5234286...,  50.        ,  54.4414867...]]])
+    """
+
+    def __init__(self,
+                 shape=SPECTRAL_SHAPE_DEFAULT,
+                 cmfs=MSDS_CMFS_STANDARD_OBSERVER[
+                     'CIE 1931 2 Degree Standard Observer']
+                 .copy().trim(SPECTRAL_SHAPE_DEFAULT),
+                 illuminant=sd_ones(),
+                 k=None,
+                 method='ASTM E308',
+                 **kwargs):
+        self._shape = shape
+        self._method = method
+
+        wavelengths = shape.range()
+        basis = MultiSpectralDistributions(
+            np.identity(len(wavelengths)), wavelengths)
+
+        with domain_range_scale('Reference'):
+            self._weights = msds_to_XYZ(basis, cmfs, illuminant, k, method,
+                                        **kwargs)
+        self._weights.setflags(write=False)
+
+    @property
+    def shape(self):
+        """
+        Getter property for the spectral shape of the spectral data to
+        convert.
+
+        Returns
+        -------
+        SpectralShape
+            Spectral shape.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._shape
+
+    @property
+    def method(self):
+        """
+        Getter property for the computation method.
+
+        Returns
+        -------
+        unicode
+            Computation method.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._method
+
+    @property
+    def weights(self):
+        """
+        Getter property for the integration weights, i.e. a table with one row
+        of :math:`X`, :math:`Y` and :math:`Z` weights per wavelength of the
+        spectral shape.
+
+        Returns
+        -------
+        ndarray, (n, 3)
+            Integration weights.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._weights
+
+    def __call__(self, spectra):
+        """
+        Converts given spectral data to *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        spectra : array_like
+            Spectral data with the wavelengths on the last axis, e.g. a
+            hyperspectral image of shape (height, width, bands). Floating point
+            arrays are not copied nor converted: *float32* arrays are
+            converted using *float32* weights and memory-mapped arrays are
+            read directly.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values, for a 512x384 hyperspectral image
+            with 77 bands, the output shape will be (384, 512, 3).
+
+        Notes
+        -----
+
+        +-----------+-----------------------+---------------+
+        | **Range** | **Scale - Reference** | **Scale - 1** |
+        +===========+=======================+===============+
+        | ``XYZ``   | [0, 100]              | [0, 1]        |
+        +-----------+-----------------------+---------------+
+        """
+
+        spectra = np.asarray(spectra)
+
+        assert spectra.shape[-1] == self._weights.shape[0], (
+            'Spectral data with {0} wavelengths is not compatible with '
+            'spectral shape with {1} wavelengths!'.format(
+                spectra.shape[-1], self._weights.shape[0]))
+
+        weights = self._weights
+        if spectra.dtype.kind == 'f':
+            weights = weights.astype(spectra.dtype)
+
+        return from_range_100(np.dot(spectra, weights))
 
 
 def wavelength_to_XYZ(wavelength,
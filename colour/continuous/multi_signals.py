@@ -10,7 +10,9 @@ Defines the class implementing support for multi-continuous signals:
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
+from operator import add, mul, pow, sub, iadd, imul, ipow, isub
 
 # Python 3 compatibility.
 try:
@@ -26,9 +28,11 @@ try:  # pragma: no cover
 except ImportError:  # pragma: no cover
     from collections.abc import Iterator, Mapping, Sequence
 
+from colour.algebra import Extrapolator, KernelInterpolator
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import AbstractContinuousFunction, Signal
-from colour.utilities import (as_float_array, first_item, is_pandas_installed,
+from colour.utilities import (as_float_array, fill_nan, first_item, full,
+                              is_pandas_installed, runtime_warning,
                               usage_warning, tsplit, tstack)
 from colour.utilities.deprecation import ObjectRenamed
 
@@ -42,11 +46,215 @@ __status__ = 'Production'
 __all__ = ['MultiSignals']
 
 
+class _ColumnsInterpolator(object):
+    """
+    Interpolates each column of given 2-dimensional :math:`y` variable with a
+    dedicated instance of given interpolator class type, allowing
+    interpolators only supporting a 1-dimensional :math:`y` variable to be
+    used by the multi-continuous signals.
+
+    Parameters
+    ----------
+    interpolator : object
+        Interpolator class type.
+    x : ndarray
+        Independent :math:`x` variable values corresponding with :math:`y`
+        variable.
+    y : ndarray
+        Dependent and already known :math:`y` variable values to
+        interpolate.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Arguments to use when instantiating the interpolators.
+
+    Attributes
+    ----------
+    x
+    y
+
+    Methods
+    -------
+    __call__
+    """
+
+    def __init__(self, interpolator, x, y, **kwargs):
+        self._interpolator = interpolator
+        self._interpolator_kwargs = kwargs
+        self._x = x
+        self._y = y
+        self._interpolators = [
+            interpolator(x, y_c, **kwargs) for y_c in tsplit(y)
+        ]
+
+    @property
+    def x(self):
+        """
+        Getter property for the independent :math:`x` variable.
+
+        Returns
+        -------
+        ndarray
+            Independent :math:`x` variable.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._x
+
+    @property
+    def y(self):
+        """
+        Getter and setter property for the dependent and already known
+        :math:`y` variable.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the dependent and already known :math:`y` variable
+            with.
+
+        Returns
+        -------
+        ndarray
+            Dependent and already known :math:`y` variable.
+
+        Notes
+        -----
+        -   The interpolators defining a settable ``y`` property are updated
+            in place, the others are created again.
+        """
+
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        """
+        Setter for the **self.y** property.
+        """
+
+        y = getattr(self._interpolator, 'y', None)
+        if isinstance(y, property) and y.fset is not None:
+            for interpolator, y_c in zip(self._interpolators, tsplit(value)):
+                interpolator.y = y_c
+        else:
+            self._interpolators = [
+                self._interpolator(self._x, y_c, **self._interpolator_kwargs)
+                for y_c in tsplit(value)
+            ]
+
+        self._y = value
+
+    def __call__(self, x):
+        """
+        Evaluates the interpolators at given point(s).
+
+        Parameters
+        ----------
+        x : numeric or array_like
+            Point(s) to evaluate the interpolators at.
+
+        Returns
+        -------
+        ndarray
+            Interpolated value(s), the last axis indexes the columns.
+        """
+
+        return tstack(
+            [interpolator(x) for interpolator in self._interpolators])
+
+
+class _SignalWriteBack(object):
+    """
+    Writes the corresponding range :math:`y` variable of a
+    :class:`colour.continuous.Signal` sub-class instance returned by the
+    :attr:`colour.continuous.MultiSignals.signals` property back to the column
+    of the multi-continuous signals it was created from whenever it is
+    mutated.
+
+    Parameters
+    ----------
+    multi_signals : MultiSignals
+        Multi-continuous signals to write the range :math:`y` variable to.
+    label : unicode
+        Label of the column to write the range :math:`y` variable to.
+
+    Methods
+    -------
+    __call__
+
+    Notes
+    -----
+    -   The write back is not copied along with the
+        :class:`colour.continuous.Signal` sub-class instance, i.e. its copies
+        are independent from the multi-continuous signals.
+    """
+
+    def __init__(self, multi_signals, label):
+        self._multi_signals = multi_signals
+        self._label = label
+
+    def __deepcopy__(self, memo):
+        return None
+
+    def __call__(self, signal, range_only=False):
+        """
+        Writes given :class:`colour.continuous.Signal` sub-class instance
+        range :math:`y` variable back to the multi-continuous signals.
+
+        Parameters
+        ----------
+        signal : Signal
+            Mutated :class:`colour.continuous.Signal` sub-class instance.
+        range_only : bool, optional
+            Whether only the signal range :math:`y` variable values changed.
+        """
+
+        multi_signals = self._multi_signals
+
+        if self._label not in multi_signals.labels:
+            return
+
+        if not range_only and any(
+                getattr(signal, attribute) is not getattr(
+                    multi_signals, attribute)
+                for attribute in ('interpolator', 'interpolator_kwargs',
+                                  'extrapolator', 'extrapolator_kwargs')):
+            usage_warning(
+                '"{0}" signal interpolation settings are not written back to '
+                '"{1}" multi-continuous signals, they are shared by all its '
+                'signals and must be set on it!'.format(
+                    self._label, multi_signals.name))
+
+        if (signal._domain is None or signal._range is None or
+                not np.array_equal(signal._domain, multi_signals._domain)):
+            usage_warning(
+                '"{0}" signal "domain" variable differs from "{1}" '
+                'multi-continuous signals "domain" variable, its "range" '
+                'variable is not written back!'.format(
+                    self._label, multi_signals.name))
+            return
+
+        multi_signals._range[:, multi_signals.labels.index(
+            self._label)] = signal._range
+        multi_signals._invalidate_function(range_only=True)
+
+
 class MultiSignals(AbstractContinuousFunction):
     """
     Defines the base class for multi-continuous signals, a container for
     multiple :class:`colour.continuous.Signal` sub-class instances.
 
+    The multi-continuous signals are stored as a shared independent domain
+    :math:`x` variable and a 2-dimensional corresponding range :math:`y`
+    variable whose columns are the signals, they are interpolated and
+    extrapolated at once. The :class:`colour.continuous.Signal` sub-class
+    instances are only created on demand by the
+    :attr:`colour.continuous.MultiSignals.signals` attribute.
+
     Parameters
     ----------
     data : Series or Dataframe or Signal or MultiSignals or array_like or \
@@ -98,6 +306,7 @@ dict_like, optional
     signals
     labels
     signal_type
+    digest
 
     Methods
     -------
@@ -268,8 +477,32 @@ dict_like, optional
 
         self._signal_type = kwargs.get('signal_type', Signal)
 
-        self._signals = self.multi_signals_unpack_data(data, domain, labels,
-                                                       **kwargs)
+        self._dtype = None
+        self._domain = None
+        self._range = None
+        self._labels = []
+        self._digest = None
+        self._function = None
+        self._function_range_outdated = False
+        self._interpolator = KernelInterpolator
+        self._interpolator_kwargs = {}
+        self._extrapolator = Extrapolator
+        self._extrapolator_kwargs = {
+            'method': 'Constant',
+            'left': np.nan,
+            'right': np.nan
+        }
+
+        self.dtype = kwargs.get('dtype', DEFAULT_FLOAT_DTYPE)
+
+        domain, range_, self._labels = self._multi_signals_unpack_arrays(
+            data, domain, labels)
+        self.domain, self.range = domain, range_
+
+        self.interpolator = kwargs.get('interpolator')
+        self.interpolator_kwargs = kwargs.get('interpolator_kwargs')
+        self.extrapolator = kwargs.get('extrapolator')
+        self.extrapolator_kwargs = kwargs.get('extrapolator_kwargs')
 
     @property
     def dtype(self):
@@ -287,8 +520,7 @@ dict_like, optional
             Continuous signal dtype.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).dtype
+        return self._dtype
 
     @dtype.setter
     def dtype(self, value):
@@ -297,8 +529,16 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.dtype = value
+            assert value in np.sctypes['float'], (
+                '"dtype" must be one of the following types: {0}'.format(
+                    np.sctypes['float']))
+
+            self._dtype = value
+
+            # The following self-assignments are written as intended and
+            # triggers the rebuild of the underlying function.
+            self.domain = self.domain
+            self.range = self.range
 
     @property
     def domain(self):
@@ -319,8 +559,8 @@ dict_like, optional
             domain :math:`x` variable.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).domain
+        if self._domain is not None:
+            return np.copy(self._domain)
 
     @domain.setter
     def domain(self, value):
@@ -329,8 +569,28 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.domain = value
+            if not np.all(np.isfinite(value)):
+                runtime_warning(
+                    '"{0}" new "domain" variable is not finite: {1}, '
+                    'unpredictable results may occur!'.format(
+                        self.name, value))
+
+            value = np.copy(value).astype(self.dtype)
+
+            if self._range is not None:
+                if value.size != self._range.shape[0]:
+                    runtime_warning(
+                        '"{0}" new "domain" and current "range" variables '
+                        'have different size, "range" variable will be '
+                        'resized to "domain" variable shape!'.format(
+                            self.name))
+                    # Resizing each column as :func:`np.resize` definition
+                    # would, i.e. by repeating its values.
+                    self._range = self._range[np.arange(value.size) %
+                                              self._range.shape[0]]
+
+            self._domain = value
+            self._invalidate_function()
 
     @property
     def range(self):
@@ -351,8 +611,8 @@ dict_like, optional
             range :math:`y` variable.
         """
 
-        if self._signals:
-            return tstack([signal.range for signal in self._signals.values()])
+        if self._range is not None:
+            return np.copy(self._range)
 
     @range.setter
     def range(self, value):
@@ -361,18 +621,28 @@ dict_like, optional
         """
 
         if value is not None:
-            value = as_float_array(value)
+            value = as_float_array(value, self.dtype)
 
             if value.ndim in (0, 1):
-                for signal in self._signals.values():
-                    signal.range = value
+                value = np.tile(
+                    np.reshape(value, (-1, 1)), (1, len(self._labels)))
             else:
-                assert value.shape[-1] == len(self._signals), (
+                assert value.shape[-1] == len(self._labels), (
                     'Corresponding "y" variable columns must have '
                     'same count than underlying "Signal" components!')
 
-                for signal, y in zip(self._signals.values(), tsplit(value)):
-                    signal.range = y
+            if not np.all(np.isfinite(value)):
+                runtime_warning(
+                    '"{0}" new "range" variable is not finite: {1}, '
+                    'unpredictable results may occur!'.format(
+                        self.name, value))
+
+            if self._domain is not None:
+                assert value.shape[0] == self._domain.size, (
+                    '"domain" and "range" variables must have same size!')
+
+            self._range = np.copy(value)
+            self._invalidate_function(range_only=True)
 
     @property
     def interpolator(self):
@@ -393,8 +663,7 @@ dict_like, optional
             type.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).interpolator
+        return self._interpolator
 
     @interpolator.setter
     def interpolator(self, value):
@@ -403,8 +672,9 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.interpolator = value
+            # TODO: Check for interpolator capabilities.
+            self._interpolator = value
+            self._invalidate_function()
 
     @property
     def interpolator_kwargs(self):
@@ -425,8 +695,7 @@ dict_like, optional
             instantiation time arguments.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).interpolator_kwargs
+        return self._interpolator_kwargs
 
     @interpolator_kwargs.setter
     def interpolator_kwargs(self, value):
@@ -435,8 +704,12 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.interpolator_kwargs = value
+            assert isinstance(value, (dict, OrderedDict)), (
+                '"{0}" attribute: "{1}" type is not "dict" or "OrderedDict"!'
+            ).format('interpolator_kwargs', value)
+
+            self._interpolator_kwargs = value
+            self._invalidate_function()
 
     @property
     def extrapolator(self):
@@ -457,8 +730,7 @@ dict_like, optional
             type.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).extrapolator
+        return self._extrapolator
 
     @extrapolator.setter
     def extrapolator(self, value):
@@ -467,8 +739,9 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.extrapolator = value
+            # TODO: Check for extrapolator capabilities.
+            self._extrapolator = value
+            self._invalidate_function()
 
     @property
     def extrapolator_kwargs(self):
@@ -489,8 +762,7 @@ dict_like, optional
             instantiation time arguments.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).extrapolator_kwargs
+        return self._extrapolator_kwargs
 
     @extrapolator_kwargs.setter
     def extrapolator_kwargs(self, value):
@@ -499,14 +771,17 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.extrapolator_kwargs = value
+            assert isinstance(value, (dict, OrderedDict)), (
+                '"{0}" attribute: "{1}" type is not "dict" or "OrderedDict"!'.
+                format('extrapolator_kwargs', value))
+
+            self._extrapolator_kwargs = value
+            self._invalidate_function()
 
     @property
     def function(self):
         """
-        Getter and setter property for the :class:`colour.continuous.Signal`
-        sub-class instances callable.
+        Getter and setter property for the multi-continuous signals callable.
 
         Parameters
         ----------
@@ -516,15 +791,24 @@ dict_like, optional
         Returns
         -------
         callable
-            :class:`colour.continuous.Signal` sub-class instances callable.
+            Multi-continuous signals callable, the last axis of its output
+            indexes the :class:`colour.continuous.Signal` sub-class instances.
 
         Notes
         -----
         -   This property is read only.
+        -   The callable is created lazily on first access and invalidated
+            when the multi-continuous signals are mutated. If only the
+            corresponding range :math:`y` variable changed, the existing
+            interpolator is updated in place when it supports it.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).function
+        if self._function is None:
+            self._create_function()
+        elif self._function_range_outdated:
+            self._update_function_range()
+
+        return self._function
 
     @property
     def signals(self):
@@ -542,9 +826,18 @@ or dict_like
         -------
         OrderedDict
             :class:`colour.continuous.Signal` sub-class instances.
+
+        Notes
+        -----
+        -   The :class:`colour.continuous.Signal` sub-class instances are
+            created on demand from the multi-continuous signals data. Mutating
+            their range :math:`y` variable writes it back to the
+            multi-continuous signals, their interpolation settings are
+            however shared by all the multi-continuous signals and must be
+            set on the multi-continuous signals.
         """
 
-        return self._signals
+        return self._create_signals()
 
     @signals.setter
     def signals(self, value):
@@ -553,8 +846,10 @@ or dict_like
         """
 
         if value is not None:
-            self._signals = self.multi_signals_unpack_data(
-                value, signal_type=self._signal_type)
+            domain, range_, labels = self._multi_signals_unpack_arrays(value)
+
+            self._domain, self._range, self._labels = None, None, labels
+            self.domain, self.range = domain, range_
 
     @property
     def labels(self):
@@ -570,12 +865,11 @@ or dict_like
 
         Returns
         -------
-        dict
+        list
             :class:`colour.continuous.Signal` sub-class instance name.
         """
 
-        if self._signals:
-            return list(self._signals.keys())
+        return list(self._labels)
 
     @labels.setter
     def labels(self, value):
@@ -584,11 +878,10 @@ or dict_like
         """
 
         if value is not None:
-            assert len(value) == len(self._signals), (
+            assert len(value) == len(self._labels), (
                 '"labels" length does not match "signals" length!')
-            self._signals = OrderedDict(
-                [(value[i], signal)
-                 for i, (_key, signal) in enumerate(self._signals.items())])
+
+            self._labels = list(value)
 
     @property
     def signal_type(self):
@@ -608,6 +901,54 @@ or dict_like
 
         return self._signal_type
 
+    @property
+    def digest(self):
+        """
+        Getter property for the multi-continuous signals digest, i.e. a
+        *SHA-256* hexadecimal digest of the multi-continuous signals
+        independent domain :math:`x` variable, corresponding range :math:`y`
+        variable, interpolator and extrapolator.
+
+        Returns
+        -------
+        unicode
+            Multi-continuous signals digest.
+
+        Notes
+        -----
+        -   This property is read only.
+        -   The digest is computed lazily and cached until the
+            multi-continuous signals are mutated.
+        -   Contrary to :meth:`colour.continuous.MultiSignals.__hash__` method,
+            the digest is stable across processes and can be used as a
+            persistent cache key.
+
+        Examples
+        --------
+        >>> domain = np.arange(0, 10, 1)
+        >>> range_ = tstack([np.linspace(10, 100, 10)] * 3)
+        >>> multi_signals = MultiSignals(range_, domain)
+        >>> digest = multi_signals.digest
+        >>> multi_signals[0] = 20
+        >>> multi_signals.digest == digest
+        False
+        """
+
+        if self._digest is None:
+            digest = hashlib.sha256()
+            for variable in (self._domain, self._range):
+                if variable is not None:
+                    digest.update(np.ascontiguousarray(variable).tobytes())
+
+            digest.update('{0}{1}{2}{3}'.format(
+                self._interpolator.__name__, repr(self._interpolator_kwargs),
+                self._extrapolator.__name__,
+                repr(self._extrapolator_kwargs)).encode('utf-8'))
+
+            self._digest = digest.hexdigest()
+
+        return self._digest
+
     def __str__(self):
         """
         Returns a formatted string representation of the multi-continuous
@@ -711,16 +1052,14 @@ or dict_like
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is derived from the
+            :attr:`colour.continuous.MultiSignals.digest` attribute value.
         """
 
-        return hash((
-            self.domain.tostring(),
-            self.range.tostring(),
-            self.interpolator.__name__,
-            repr(self.interpolator_kwargs),
-            self.extrapolator.__name__,
-            repr(self.extrapolator_kwargs),
-        ))
+        return hash(self.digest)
 
     def __getitem__(self, x):
         """
@@ -771,11 +1110,15 @@ or dict_like
                [ 60.       ...,  70.       ...,  80.       ...]])
         """
 
-        if self._signals:
-            return tstack([signal[x] for signal in self._signals.values()])
-        else:
+        if not self._labels:
             raise RuntimeError('No underlying "Signal" defined!')
 
+        if isinstance(x, slice):
+            return np.copy(self._range[x])
+        else:
+            return np.reshape(
+                self.function(x), np.shape(x) + (len(self._labels), ))
+
     def __setitem__(self, x, y):
         """
         Sets the corresponding range :math:`y` variable for independent domain
@@ -873,16 +1216,41 @@ or dict_like
             'or 2-dimensional array!')
 
         if y.ndim == 0:
-            y = np.tile(y, len(self._signals))
-        elif y.ndim == 1:
+            y = np.tile(y, len(self._labels))
+
+        if y.ndim == 1:
             y = y[np.newaxis, :]
 
-        assert y.shape[-1] == len(self._signals), (
+        assert y.shape[-1] == len(self._labels), (
             'Corresponding "y" variable columns must have same count than '
             'underlying "Signal" components!')
 
-        for signal, y in zip(self._signals.values(), tsplit(y)):
-            signal[x] = y
+        if isinstance(x, slice):
+            self._range[x] = y
+            self._invalidate_function(range_only=True)
+        else:
+            x = np.atleast_1d(x).astype(self.dtype)
+            # Resizing each column as :func:`np.resize` definition would, i.e.
+            # by repeating its values.
+            y = y[np.arange(x.size) % y.shape[0]]
+
+            # Matching domain, updating existing `self._range` values.
+            mask = np.in1d(x, self._domain)
+            x_m = x[mask]
+            indexes = np.searchsorted(self._domain, x_m)
+            self._range[indexes] = y[mask]
+
+            # Non matching domain, inserting into existing `self.domain`
+            # and `self.range`.
+            x_nm = x[~mask]
+            indexes = np.searchsorted(self._domain, x_nm)
+            if indexes.size != 0:
+                self._domain = np.insert(self._domain, indexes, x_nm)
+                self._range = np.insert(
+                    self._range, indexes, y[~mask], axis=0)
+                self._invalidate_function()
+            else:
+                self._invalidate_function(range_only=True)
 
     def __contains__(self, x):
         """
@@ -911,11 +1279,17 @@ or dict_like
         False
         """
 
-        if self._signals:
-            return x in first_item(self._signals.values())
-        else:
+        if not self._labels:
             raise RuntimeError('No underlying "Signal" defined!')
 
+        return np.all(
+            np.where(
+                np.logical_and(x >= np.min(self._domain),
+                               x <= np.max(self._domain)),
+                True,
+                False,
+            ))
+
     def __eq__(self, other):
         """
         Returns whether the multi-continuous signals is equal to given other
@@ -1002,6 +1376,150 @@ or dict_like
 
         return not (self == other)
 
+    def _invalidate_function(self, range_only=False):
+        """
+        Invalidates the multi-continuous signals underlying function and the
+        cached digest, the function is created again on next evaluation.
+
+        Parameters
+        ----------
+        range_only : bool, optional
+            Whether only the corresponding range :math:`y` variable values
+            changed, in which case the existing function is updated rather
+            than created again if its interpolator supports it.
+        """
+
+        self._digest = None
+
+        if range_only and self._function is not None:
+            self._function_range_outdated = True
+        else:
+            self._function = None
+            self._function_range_outdated = False
+
+    def _update_function_range(self):
+        """
+        Updates the multi-continuous signals underlying function interpolator
+        with the corresponding range :math:`y` variable or creates the function
+        again if the interpolator does not support it, i.e. if it does not
+        define a settable ``y`` property.
+        """
+
+        interpolator = getattr(self._function, 'interpolator', None)
+        y = getattr(type(interpolator), 'y', None)
+
+        if isinstance(y, property) and y.fset is not None:
+            interpolator.y = self.range
+            self._function_range_outdated = False
+        else:
+            self._create_function()
+
+    def _create_signals(self, write_back=True):
+        """
+        Creates the :class:`colour.continuous.Signal` sub-class instances from
+        the multi-continuous signals data.
+
+        Parameters
+        ----------
+        write_back : bool, optional
+            Whether mutating the :class:`colour.continuous.Signal` sub-class
+            instances range :math:`y` variable writes it back to the
+            multi-continuous signals.
+
+        Returns
+        -------
+        OrderedDict
+            :class:`colour.continuous.Signal` sub-class instances.
+        """
+
+        signals = OrderedDict()
+        for i, label in enumerate(self._labels):
+            signal = self._signal_type(
+                self._range[:, i],
+                self._domain,
+                name=self.name,
+                dtype=self._dtype,
+                interpolator=self._interpolator,
+                interpolator_kwargs=self._interpolator_kwargs,
+                extrapolator=self._extrapolator,
+                extrapolator_kwargs=self._extrapolator_kwargs)
+
+            if write_back:
+                signal._write_back = _SignalWriteBack(self, label)
+
+            signals[label] = signal
+
+        return signals
+
+    def _create_interpolator(self, interpolator, interpolator_kwargs):
+        """
+        Creates an interpolator instance of given type for the
+        multi-continuous signals.
+
+        Parameters
+        ----------
+        interpolator : object
+            Interpolator class type.
+        interpolator_kwargs : dict_like
+            Arguments to use when instantiating the interpolator.
+
+        Returns
+        -------
+        object
+            Interpolator instance interpolating all the
+            :class:`colour.continuous.Signal` sub-class instances at once.
+
+        Notes
+        -----
+        -   Interpolators not supporting a 2-dimensional :math:`y` variable,
+            i.e. rejecting it at instantiation time, are instantiated for each
+            :class:`colour.continuous.Signal` sub-class instance.
+        """
+
+        try:
+            return interpolator(self.domain, self.range,
+                                **interpolator_kwargs)
+        except (AssertionError, ValueError):
+            return _ColumnsInterpolator(interpolator, self.domain,
+                                        self.range, **interpolator_kwargs)
+
+    def _create_function(self):
+        """
+        Creates the multi-continuous signals underlying function.
+        """
+
+        self._function_range_outdated = False
+
+        if self._domain is not None and self._range is not None:
+            self._function = self._extrapolator(
+                self._create_interpolator(self._interpolator,
+                                          self._interpolator_kwargs),
+                **self._extrapolator_kwargs)
+        else:
+
+            def _undefined_function(*args, **kwargs):
+                """
+                Raises a :class:`RuntimeError` exception.
+
+                Other Parameters
+                ----------------
+                \\*args : list, optional
+                    Arguments.
+                \\**kwargs : dict, optional
+                    Keywords arguments.
+
+                Raises
+                ------
+                RuntimeError
+                """
+
+                raise RuntimeError(
+                    'Underlying signal interpolator function does not exists, '
+                    'please ensure you defined both '
+                    '"domain" and "range" variables!')
+
+            self._function = _undefined_function
+
     def arithmetical_operation(self, a, operation, in_place=False):
         """
         Performs given arithmetical operation with :math:`a` operand, the
@@ -1110,15 +1628,26 @@ or dict_like
          [   9.  347.  378.  409.]]
         """
 
+        operation, ioperator = {
+            '+': (add, iadd),
+            '-': (sub, isub),
+            '*': (mul, imul),
+            '/': (div, idiv),
+            '**': (pow, ipow)
+        }[operation]
+
         multi_signals = self if in_place else self.copy()
 
         if isinstance(a, MultiSignals):
-            assert len(self.signals) == len(a.signals), (
+            assert len(self._labels) == len(a.labels), (
                 '"MultiSignals" operands must have same count than '
                 'underlying "Signal" components!')
-            for signal_a, signal_b in zip(multi_signals.signals.values(),
-                                          a.signals.values()):
-                signal_a.arithmetical_operation(signal_b, operation, True)
+
+            domain = multi_signals.domain
+            multi_signals[domain] = operation(multi_signals.range, a[domain])
+            exclusive_or = np.setxor1d(domain, a.domain)
+            multi_signals[exclusive_or] = full(
+                exclusive_or.shape + (len(self._labels), ), np.nan)
         else:
             a = as_float_array(a)
 
@@ -1126,17 +1655,14 @@ or dict_like
                 'Operand "a" variable must be a numeric or a 1-dimensional or '
                 '2-dimensional array!')
 
-            if a.ndim in (0, 1):
-                for signal in multi_signals.signals.values():
-                    signal.arithmetical_operation(a, operation, True)
-            else:
-                assert a.shape[-1] == len(multi_signals.signals), (
+            if a.ndim == 1:
+                a = a[:, np.newaxis]
+            elif a.ndim == 2:
+                assert a.shape[-1] == len(self._labels), (
                     'Operand "a" variable columns must have same count than '
                     'underlying "Signal" components!')
 
-                for signal, y in zip(multi_signals.signals.values(),
-                                     tsplit(a)):
-                    signal.arithmetical_operation(y, operation, True)
+            multi_signals.range = ioperator(multi_signals.range, a)
 
         return multi_signals
 
@@ -1322,14 +1848,58 @@ dict_like, optional
          [ 1000.   120.]]
         """
 
+        domain_u, range_u, labels_u = (
+            MultiSignals._multi_signals_unpack_arrays(data, domain, labels,
+                                                      dtype))
+
+        signals = OrderedDict()
+        if range_u is not None:
+            for label, range_c in zip(labels_u, tsplit(range_u)):
+                signals[label] = signal_type(range_c, domain_u, **kwargs)
+
+        return signals
+
+    @staticmethod
+    def _multi_signals_unpack_arrays(data=None,
+                                     domain=None,
+                                     labels=None,
+                                     dtype=None):
+        """
+        Unpack given data for multi-continuous signals instantiation into a
+        shared independent domain :math:`x` variable, a 2-dimensional
+        corresponding range :math:`y` variable and labels.
+
+        Parameters
+        ----------
+        data : Series or Dataframe or Signal or MultiSignals or array_like or \
+dict_like, optional
+            Data to unpack for multi-continuous signals instantiation.
+        domain : array_like, optional
+            Values to use as independent domain :math:`x` variable. If both
+            ``data`` and ``domain`` arguments are defined, the latter will be
+            used.
+        labels : array_like, optional
+            Labels to use for the :class:`colour.continuous.Signal` sub-class
+            instances. If both ``data`` and ``labels`` arguments are defined,
+            the latter will be used.
+        dtype : type, optional
+            **{np.float16, np.float32, np.float64, np.float128}**,
+            Floating point data type.
+
+        Returns
+        -------
+        tuple
+            Independent domain :math:`x` variable, corresponding range
+            :math:`y` variable and labels.
+        """
+
         if dtype is None:
             dtype = DEFAULT_FLOAT_DTYPE
 
-        domain_u, range_u, signals = None, None, None
-        signals = OrderedDict()
+        domain_u, range_u, labels_u = None, None, []
         # TODO: Implement support for Signal class passing.
         if isinstance(data, MultiSignals):
-            signals = data.signals
+            domain_u, range_u, labels_u = data.domain, data.range, data.labels
         elif (issubclass(type(data), Sequence) or
               isinstance(data, (tuple, list, np.ndarray, Iterator))):
             data = tsplit(list(data) if isinstance(data, Iterator) else data)
@@ -1337,8 +1907,9 @@ dict_like, optional
                 'User "data" must be 1-dimensional or 2-dimensional!')
             if data.ndim == 1:
                 data = data[np.newaxis, :]
-            for i, range_u in enumerate(data):
-                signals[i] = signal_type(range_u, domain, **kwargs)
+            domain_u = np.arange(0, data.shape[-1], dtype=dtype)
+            range_u = tstack(data)
+            labels_u = list(range(data.shape[0]))
         elif (issubclass(type(data), Mapping) or
               isinstance(data, (dict, OrderedDict))):
 
@@ -1350,42 +1921,39 @@ dict_like, optional
                 for i in data.values()
             ])
 
-            if is_signal:
-                for label, signal in data.items():
-                    signals[label] = signal_type(signal.range, signal.domain,
-                                                 **kwargs)
-            else:
+            if data and is_signal:
+                domain_u = first_item(data.values()).domain
+                range_u = tstack([signal.range for signal in data.values()])
+                labels_u = list(data.keys())
+            elif data:
                 domain_u, range_u = zip(*sorted(data.items()))
-                for i, range_u in enumerate(tsplit(range_u)):
-                    signals[i] = signal_type(range_u, domain_u, **kwargs)
+                range_u = as_float_array(range_u, dtype)
+                if range_u.ndim == 1:
+                    range_u = range_u[:, np.newaxis]
+                labels_u = list(range(range_u.shape[-1]))
         elif is_pandas_installed():
             from pandas import DataFrame, Series
 
             if isinstance(data, Series):
-                signals[0] = signal_type(data, **kwargs)
+                domain_u = data.index.values
+                range_u = data.values[:, np.newaxis]
+                labels_u = [0]
             elif isinstance(data, DataFrame):
                 domain_u = data.index.values
-                signals = OrderedDict(((label,
-                                        signal_type(
-                                            data[label],
-                                            domain_u,
-                                            name=label,
-                                            **kwargs)) for label in data))
-
-        if domain is not None and signals is not None:
-            for signal in signals.values():
-                assert len(domain) == len(signal.domain), (
-                    'User "domain" is not compatible with unpacked signals!')
-                signal.domain = domain
-
-        if labels is not None and signals is not None:
-            assert len(labels) == len(signals), (
+                range_u = data.values
+                labels_u = list(data.columns)
+
+        if domain is not None and range_u is not None:
+            assert len(domain) == len(range_u), (
+                'User "domain" is not compatible with unpacked signals!')
+            domain_u = domain
+
+        if labels is not None and range_u is not None:
+            assert len(labels) == len(labels_u), (
                 'User "labels" is not compatible with unpacked signals!')
-            signals = OrderedDict(
-                [(labels[i], signal)
-                 for i, (_key, signal) in enumerate(signals.items())])
+            labels_u = list(labels)
 
-        return signals
+        return domain_u, range_u, labels_u
 
     def fill_nan(self, method='Interpolation', default=0):
         """
@@ -1447,8 +2015,10 @@ dict_like, optional
          [   9.  100.  110.  120.]]
         """
 
-        for signal in self._signals.values():
-            signal.fill_nan(method, default)
+        self._domain = fill_nan(self._domain, method, default)
+        self._range = tstack(
+            [fill_nan(y, method, default) for y in tsplit(self._range)])
+        self._invalidate_function()
 
         return self
 
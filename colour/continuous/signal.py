@@ -10,6 +10,7 @@ Defines the class implementing support for continuous signal:
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
 from operator import add, mul, pow, sub, iadd, imul, ipow, isub
 
@@ -93,6 +94,7 @@ class Signal(AbstractContinuousFunction):
     extrapolator
     extrapolator_kwargs
     function
+    digest
 
     Methods
     -------
@@ -205,6 +207,10 @@ class Signal(AbstractContinuousFunction):
         self._dtype = None
         self._domain = None
         self._range = None
+        self._digest = None
+        self._function = None
+        self._function_range_outdated = False
+        self._write_back = None
         self._interpolator = KernelInterpolator
         self._interpolator_kwargs = {}
         self._extrapolator = Extrapolator
@@ -223,8 +229,6 @@ class Signal(AbstractContinuousFunction):
         self.extrapolator = kwargs.get('extrapolator')
         self.extrapolator_kwargs = kwargs.get('extrapolator_kwargs')
 
-        self._create_function()
-
     @property
     def dtype(self):
         """
@@ -308,7 +312,7 @@ class Signal(AbstractContinuousFunction):
                         self._range = np.resize(self._range, value.shape)
 
                 self._domain = value
-                self._create_function()
+                self._invalidate_function()
 
     @property
     def range(self):
@@ -351,7 +355,7 @@ class Signal(AbstractContinuousFunction):
                         '"domain" and "range" variables must have same size!')
 
                 self._range = value
-                self._create_function()
+                self._invalidate_function(range_only=True)
 
     @property
     def interpolator(self):
@@ -381,7 +385,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for interpolator capabilities.
             self._interpolator = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def interpolator_kwargs(self):
@@ -416,7 +420,7 @@ class Signal(AbstractContinuousFunction):
             ).format('interpolator_kwargs', value)
 
             self._interpolator_kwargs = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def extrapolator(self):
@@ -446,7 +450,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for extrapolator capabilities.
             self._extrapolator = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def extrapolator_kwargs(self):
@@ -481,7 +485,7 @@ class Signal(AbstractContinuousFunction):
                 format('extrapolator_kwargs', value))
 
             self._extrapolator_kwargs = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def function(self):
@@ -501,10 +505,68 @@ class Signal(AbstractContinuousFunction):
         Notes
         -----
         -   This property is read only.
+        -   The callable is created lazily on first access and invalidated
+            when the continuous signal is mutated. If only the corresponding
+            range :math:`y` variable changed, the existing interpolator is
+            updated in place when it supports it.
         """
 
+        if self._function is None:
+            self._create_function()
+        elif self._function_range_outdated:
+            self._update_function_range()
+
         return self._function
 
+    @property
+    def digest(self):
+        """
+        Getter property for the continuous signal digest, i.e. a *SHA-256*
+        hexadecimal digest of the continuous signal independent domain
+        :math:`x` variable, corresponding range :math:`y` variable,
+        interpolator and extrapolator.
+
+        Returns
+        -------
+        unicode
+            Continuous signal digest.
+
+        Notes
+        -----
+        -   This property is read only.
+        -   The digest is computed lazily and cached until the continuous
+            signal is mutated.
+        -   Contrary to :meth:`colour.continuous.Signal.__hash__` method, the
+            digest is stable across processes and can be used as a persistent
+            cache key.
+
+        Examples
+        --------
+        >>> range_ = np.linspace(10, 100, 10)
+        >>> signal = Signal(range_)
+        >>> signal.digest == Signal(range_).digest
+        True
+        >>> digest = signal.digest
+        >>> signal[0] = 20
+        >>> signal.digest == digest
+        False
+        """
+
+        if self._digest is None:
+            digest = hashlib.sha256()
+            for variable in (self._domain, self._range):
+                if variable is not None:
+                    digest.update(np.ascontiguousarray(variable).tobytes())
+
+            digest.update('{0}{1}{2}{3}'.format(
+                self._interpolator.__name__, repr(self._interpolator_kwargs),
+                self._extrapolator.__name__,
+                repr(self._extrapolator_kwargs)).encode('utf-8'))
+
+            self._digest = digest.hexdigest()
+
+        return self._digest
+
     def __str__(self):
         """
         Returns a formatted string representation of the continuous signal.
@@ -595,16 +657,14 @@ class Signal(AbstractContinuousFunction):
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is derived from the cached
+            :attr:`colour.continuous.Signal.digest` attribute value.
         """
 
-        return hash((
-            self.domain.tostring(),
-            self.range.tostring(),
-            self.interpolator.__name__,
-            repr(self.interpolator_kwargs),
-            self.extrapolator.__name__,
-            repr(self.extrapolator_kwargs),
-        ))
+        return hash(self.digest)
 
     def __getitem__(self, x):
         """
@@ -650,7 +710,7 @@ class Signal(AbstractContinuousFunction):
         if isinstance(x, slice):
             return self._range[x]
         else:
-            return self._function(x)
+            return self.function(x)
 
     def __setitem__(self, x, y):
         """
@@ -722,6 +782,7 @@ class Signal(AbstractContinuousFunction):
 
         if isinstance(x, slice):
             self._range[x] = y
+            self._invalidate_function(range_only=True)
         else:
             x = np.atleast_1d(x).astype(self.dtype)
             y = np.resize(y, x.shape)
@@ -739,8 +800,9 @@ class Signal(AbstractContinuousFunction):
             if indexes.size != 0:
                 self._domain = np.insert(self._domain, indexes, x_nm)
                 self._range = np.insert(self._range, indexes, y[~mask])
-
-        self._create_function()
+                self._invalidate_function()
+            else:
+                self._invalidate_function(range_only=True)
 
     def __contains__(self, x):
         """
@@ -859,11 +921,59 @@ class Signal(AbstractContinuousFunction):
 
         return not (self == other)
 
+    def _invalidate_function(self, range_only=False):
+        """
+        Invalidates the continuous signal underlying function and the cached
+        digest, the function is created again on next evaluation.
+
+        Parameters
+        ----------
+        range_only : bool, optional
+            Whether only the corresponding range :math:`y` variable values
+            changed, in which case the existing function is updated rather
+            than created again if its interpolator supports it.
+
+        Notes
+        -----
+        -   The continuous signal is written back to the multi-continuous
+            signals it was created from, if any.
+        """
+
+        self._digest = None
+
+        if range_only and self._function is not None:
+            self._function_range_outdated = True
+        else:
+            self._function = None
+            self._function_range_outdated = False
+
+        if self._write_back is not None:
+            self._write_back(self, range_only)
+
+    def _update_function_range(self):
+        """
+        Updates the continuous signal underlying function interpolator with
+        the corresponding range :math:`y` variable or creates the function
+        again if the interpolator does not support it, i.e. if it does not
+        define a settable ``y`` property.
+        """
+
+        interpolator = getattr(self._function, 'interpolator', None)
+        y = getattr(type(interpolator), 'y', None)
+
+        if isinstance(y, property) and y.fset is not None:
+            interpolator.y = self.range
+            self._function_range_outdated = False
+        else:
+            self._create_function()
+
     def _create_function(self):
         """
         Creates the continuous signal underlying function.
         """
 
+        self._function_range_outdated = False
+
         if self._domain is not None and self._range is not None:
             self._function = self._extrapolator(
                 self._interpolator(self.domain, self.range,
@@ -915,7 +1025,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._domain = fill_nan(self._domain, method, default)
-        self._create_function()
+        self._invalidate_function()
 
     def _fill_range_nan(self, method='Interpolation', default=0):
         """
@@ -938,7 +1048,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._range = fill_nan(self._range, method, default)
-        self._create_function()
+        self._invalidate_function(range_only=True)
 
     def arithmetical_operation(self, a, operation, in_place=False):
         """
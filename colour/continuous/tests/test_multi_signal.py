@@ -54,7 +54,7 @@ class TestMultiSignals(unittest.TestCase):
         required_attributes = ('dtype', 'domain', 'range', 'interpolator',
                                'interpolator_kwargs', 'extrapolator',
                                'extrapolator_kwargs', 'function', 'signals',
-                               'labels', 'signal_type')
+                               'labels', 'signal_type', 'digest')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(MultiSignals))
@@ -247,6 +247,26 @@ extrapolator_kwargs` property.
 
         assert hasattr(self._multi_signals.function, '__call__')
 
+        multi_signals = self._multi_signals.copy()
+        np.testing.assert_almost_equal(
+            multi_signals.function(np.array([0, 1])),
+            np.array([[10.0, 20.0, 30.0], [20.0, 30.0, 40.0]]),
+            decimal=7)
+
+        function = multi_signals.function
+        multi_signals[:] = self._range_2 * 2
+        self.assertIs(multi_signals.function, function)
+        np.testing.assert_almost_equal(
+            multi_signals[np.array([0, 1])],
+            np.array([[20.0, 40.0, 60.0], [40.0, 60.0, 80.0]]),
+            decimal=7)
+
+        multi_signals.interpolator = CubicSplineInterpolator
+        np.testing.assert_almost_equal(
+            multi_signals.function(np.array([0.5, 1.5])),
+            np.array([[30.0, 50.0, 70.0], [50.0, 70.0, 90.0]]),
+            decimal=7)
+
     def test_raise_exception_function(self):
         """
         Tests :func:`colour.continuous.signal.multi_signals.MultiSignals`
@@ -264,6 +284,35 @@ extrapolator_kwargs` property.
 
         multi_signals = self._multi_signals.copy()
 
+        signals = multi_signals.signals
+        self.assertListEqual(list(signals.keys()), [0, 1, 2])
+        for i, signal in enumerate(signals.values()):
+            self.assertIsInstance(signal, Signal)
+            np.testing.assert_array_equal(signal.domain, self._domain_1)
+            np.testing.assert_array_equal(signal.range, self._range_2[:, i])
+            self.assertIs(signal.interpolator, multi_signals.interpolator)
+
+        multi_signals[0.5]
+        signals[1][0] = 0
+        np.testing.assert_array_equal(multi_signals.range[0], [10, 0, 30])
+        np.testing.assert_almost_equal(
+            multi_signals[0.5], [13.18526336, 10.96970682, 33.07123434],
+            decimal=7)
+
+        signals[2].range = self._range_1
+        np.testing.assert_array_equal(multi_signals.range[:, 2],
+                                      self._range_1)
+
+        signals[0].copy()[0] = 0
+        np.testing.assert_array_equal(multi_signals.range[0], [10, 0, 10])
+
+        # TODO: Use "assertWarns" when dropping Python 2.7.
+        signals[0].interpolator = CubicSplineInterpolator
+        self.assertIsNot(multi_signals.interpolator, CubicSplineInterpolator)
+
+        signals[0][10] = 0
+        np.testing.assert_array_equal(multi_signals.domain, self._domain_1)
+
         multi_signals.signals = self._range_1
         np.testing.assert_array_equal(multi_signals.domain, self._domain_1)
         np.testing.assert_array_equal(multi_signals.range,
@@ -293,6 +342,24 @@ extrapolator_kwargs` property.
 
         self.assertEqual(multi_signals.signal_type, Signal)
 
+    def test_digest(self):
+        """
+        Tests :func:`colour.continuous.multi_signals.MultiSignals.digest`
+        property.
+        """
+
+        multi_signals = self._multi_signals.copy()
+        digest = multi_signals.digest
+
+        self.assertEqual(digest, self._multi_signals.copy().digest)
+
+        multi_signals[0] = 20
+        self.assertNotEqual(multi_signals.digest, digest)
+
+        multi_signals = self._multi_signals.copy()
+        multi_signals.range = multi_signals.range * 2
+        self.assertNotEqual(multi_signals.digest, digest)
+
     def test__init__(self):
         """
         Tests :func:`colour.continuous.multi_signals.MultiSignals.__init__`
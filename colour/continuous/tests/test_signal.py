@@ -49,7 +49,7 @@ class TestSignal(unittest.TestCase):
 
         required_attributes = ('dtype', 'domain', 'range', 'interpolator',
                                'interpolator_kwargs', 'extrapolator',
-                               'extrapolator_kwargs', 'function')
+                               'extrapolator_kwargs', 'function', 'digest')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(Signal))
@@ -203,6 +203,39 @@ class TestSignal(unittest.TestCase):
 
         assert hasattr(self._signal.function, '__call__')
 
+        signal = self._signal.copy()
+        function = signal.function
+        self.assertIs(signal.function, function)
+
+        signal[:] = self._range * 2
+        self.assertIs(signal.function, function)
+        np.testing.assert_almost_equal(
+            signal[np.linspace(0, 9, 19)],
+            Signal(self._range * 2)[np.linspace(0, 9, 19)],
+            decimal=7)
+
+        signal.range = self._range * 3
+        signal[0] = 60
+        self.assertIs(signal.function, function)
+        self.assertEqual(signal[0.0], 60)
+        self.assertEqual(signal[1.0], 60)
+
+        signal[0.5] = 10
+        self.assertIsNot(signal.function, function)
+        self.assertAlmostEqual(signal[0.5], 10, places=7)
+
+        signal = Signal(self._range, interpolator=CubicSplineInterpolator)
+        function = signal.function
+
+        signal[:] = self._range * 2
+        self.assertIsNot(signal.function, function)
+        np.testing.assert_almost_equal(
+            signal[np.linspace(0, 9, 19)],
+            Signal(self._range * 2,
+                   interpolator=CubicSplineInterpolator)[np.linspace(
+                       0, 9, 19)],
+            decimal=7)
+
     def test_raise_exception_function(self):
         """
         Tests :func:`colour.continuous.signal.Signal.function` property raised
@@ -211,6 +244,32 @@ class TestSignal(unittest.TestCase):
 
         self.assertRaises(RuntimeError, Signal().function, 0)
 
+    def test_digest(self):
+        """
+        Tests :func:`colour.continuous.signal.Signal.digest` property.
+        """
+
+        signal = self._signal.copy()
+        digest = signal.digest
+
+        self.assertEqual(digest, Signal(self._range).digest)
+        self.assertIs(signal.digest, digest)
+
+        signal[0] = 20
+        self.assertNotEqual(signal.digest, digest)
+
+        signal = self._signal.copy()
+        signal.range = self._range * 2
+        self.assertNotEqual(signal.digest, digest)
+
+        signal = self._signal.copy()
+        signal.domain = self._domain
+        self.assertNotEqual(signal.digest, digest)
+
+        signal = self._signal.copy()
+        signal.interpolator = CubicSplineInterpolator
+        self.assertNotEqual(signal.digest, digest)
+
     def test__init__(self):
         """
         Tests :func:`colour.continuous.signal.Signal.__init__` method.
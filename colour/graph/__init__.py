@@ -3,9 +3,10 @@
 from __future__ import absolute_import
 
 from .conversion import (CONVERSION_GRAPH, CONVERSION_GRAPH_NODE_LABELS,
-                         describe_conversion_path, convert)
+                         Conversion_Plan, describe_conversion_path,
+                         compile_conversion, convert)
 
 __all__ = [
-    'CONVERSION_GRAPH', 'CONVERSION_GRAPH_NODE_LABELS',
-    'describe_conversion_path', 'convert'
+    'CONVERSION_GRAPH', 'CONVERSION_GRAPH_NODE_LABELS', 'Conversion_Plan',
+    'describe_conversion_path', 'compile_conversion', 'convert'
 ]
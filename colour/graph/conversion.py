@@ -5,7 +5,9 @@ Automatic Colour Conversion Graph
 
 Defines the automatic colour conversion graph objects:
 
+-   :class:`colour.graph.Conversion_Plan`
 -   :func:`colour.describe_conversion_path`
+-   :func:`colour.compile_conversion`
 -   :func:`colour.convert`
 """
 
@@ -13,10 +15,18 @@ from __future__ import division, print_function, unicode_literals
 
 import inspect
 import numpy as np
+import six
 import textwrap
+import types
+try:  # pragma: no cover
+    from collections import Mapping
+except ImportError:  # pragma: no cover
+    from collections.abc import Mapping
+
 from collections import namedtuple
 from copy import copy
 from functools import partial
+from numbers import Number
 from pprint import pformat
 
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
@@ -26,6 +36,7 @@ from colour.colorimetry import (colorimetric_purity, complementary_wavelength,
                                 lightness, luminance, luminous_efficacy,
                                 luminous_efficiency, luminous_flux, sd_to_XYZ,
                                 whiteness, yellowness, wavelength_to_XYZ)
+from colour.continuous import MultiSignals, Signal
 from colour.recovery import XYZ_to_sd
 from colour.models import RGB_COLOURSPACE_sRGB
 from colour.models import (
@@ -55,9 +66,9 @@ from colour.appearance import (
     CIECAM02_to_XYZ, XYZ_to_ATD95, XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt,
     XYZ_to_LLAB, XYZ_to_Nayatani95, XYZ_to_RLAB)
 from colour.temperature import CCT_to_uv, CCT_to_xy, uv_to_CCT, xy_to_CCT
-from colour.utilities import (domain_range_scale, filter_kwargs,
-                              is_networkx_installed, message_box, tsplit,
-                              tstack, usage_warning)
+from colour.utilities import (CACHE_REGISTRY, domain_range_scale, dot_vector,
+                              filter_kwargs, is_networkx_installed,
+                              message_box, tsplit, tstack, usage_warning)
 
 if is_networkx_installed():  # pragma: no cover
     import networkx as nx
@@ -74,8 +85,8 @@ __all__ = [
     'JMh_CIECAM02_to_CIECAM02', 'CAM16_to_JMh_CAM16', 'JMh_CAM16_to_CAM16',
     'XYZ_to_luminance', 'RGB_luminance_to_RGB',
     'CONVERSION_SPECIFICATIONS_DATA', 'CONVERSION_GRAPH_NODE_LABELS',
-    'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH',
-    'describe_conversion_path', 'convert'
+    'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH', 'Conversion_Plan',
+    'describe_conversion_path', 'compile_conversion', 'convert'
 ]
 
 
@@ -584,6 +595,16 @@ CONVERSION_GRAPH : DiGraph
 """
 
 
+_CONVERSION_PATHS_CACHE = CACHE_REGISTRY.register_cache(
+    '{0}._CONVERSION_PATHS_CACHE'.format(__name__), maximum_size=1024)
+"""
+Cache for the conversion paths from source nodes to target nodes in the
+automatic colour conversion graph.
+
+_CONVERSION_PATHS_CACHE : Cache
+"""
+
+
 def _conversion_path(source, target):
     """
     Returns the conversion path from the source node to the target node in the
@@ -609,13 +630,19 @@ def _conversion_path(source, target):
     [<function Lab_to_XYZ at 0x...>, <function XYZ_to_xy at 0x...>, \
 <function xy_to_CCT at 0x...>]
     """
+
     if is_networkx_installed(raise_exception=True):  # pragma: no cover
-        path = nx.shortest_path(CONVERSION_GRAPH, source, target)
+        conversion_path = _CONVERSION_PATHS_CACHE.get((source, target))
 
-        return [
-            CONVERSION_GRAPH.get_edge_data(a, b)['conversion_function']
-            for a, b in zip(path[:-1], path[1:])
-        ]
+        if conversion_path is None:
+            path = nx.shortest_path(CONVERSION_GRAPH, source, target)
+
+            conversion_path = _CONVERSION_PATHS_CACHE[(source, target)] = [
+                CONVERSION_GRAPH.get_edge_data(a, b)['conversion_function']
+                for a, b in zip(path[:-1], path[1:])
+            ]
+
+        return list(conversion_path)
 
 
 def _lower_order_function(callable_):
@@ -638,6 +665,455 @@ def _lower_order_function(callable_):
     return callable_.func if isinstance(callable_, partial) else callable_
 
 
+def _freeze(a):
+    """
+    Returns a hashable representation of the content of given object so that
+    it can be used as a key in the conversion plans cache.
+
+    Parameters
+    ----------
+    a : object
+        Object to return the hashable representation of.
+
+    Returns
+    -------
+    object
+        Hashable representation of given object.
+
+    Raises
+    ------
+    TypeError
+        If the object cannot be represented as a hashable object.
+
+    Notes
+    -----
+    -   Arrays are represented by their content, continuous signals by their
+        digest and other objects, e.g. :class:`colour.RGB_Colourspace` class
+        instances, by the representation of their attributes so that an
+        object mutated in-place yields a different representation.
+    -   Functions, classes and modules are represented by their identity.
+
+    Examples
+    --------
+    >>> _freeze({'b': [1, 2], 'a': 3})  # doctest: +SKIP
+    (('a', (<class 'int'>, 3)), ('b', ((<class 'int'>, 1), \
+(<class 'int'>, 2))))
+    """
+
+    if isinstance(a, np.ndarray):
+        return (a.dtype.str, a.shape, a.tobytes())
+    elif a is None or isinstance(a, (six.string_types, bytes, bool, int,
+                                     float)):
+        return (type(a), a)
+    elif isinstance(a, Mapping):
+        return tuple((key, _freeze(a[key])) for key in sorted(a))
+    elif isinstance(a, (list, tuple)):
+        return tuple(_freeze(element) for element in a)
+    elif isinstance(a, partial):
+        return (partial, _freeze(a.func), _freeze(a.args),
+                _freeze(a.keywords or {}))
+    elif isinstance(a, (Signal, MultiSignals)):
+        return (type(a), a.digest)
+    elif (hasattr(a, '__dict__') and
+          not isinstance(a, (type, types.FunctionType, types.MethodType,
+                             types.BuiltinFunctionType, types.ModuleType))):
+        return (type(a), _freeze(vars(a)))
+    else:
+        hash(a)
+
+        return (type(a), a)
+
+
+def _is_same(a, b):
+    """
+    Returns whether given objects are the same, i.e. whether the containers
+    hold the same objects or equal immutable values.
+
+    Parameters
+    ----------
+    a : object
+        Object :math:`a`.
+    b : object
+        Object :math:`b`.
+
+    Returns
+    -------
+    bool
+        Whether given objects are the same.
+
+    Examples
+    --------
+    >>> a = np.array([1, 2])
+    >>> _is_same({'a': a, 'b': 1}, {'a': a, 'b': 1})
+    True
+    >>> _is_same({'a': a}, {'a': np.array([1, 2])})
+    False
+    """
+
+    if a is b:
+        return True
+    elif isinstance(a, Mapping) and isinstance(b, Mapping):
+        return (len(a) == len(b) and
+                all(key in b and _is_same(a[key], b[key]) for key in a))
+    elif isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return (type(a) is type(b) and len(a) == len(b) and
+                all(_is_same(i, j) for i, j in zip(a, b)))
+    elif isinstance(a, (Number, six.string_types, bytes)):
+        return type(a) is type(b) and a == b
+    else:
+        return False
+
+
+class Conversion_Plan(
+        namedtuple('Conversion_Plan', ('source', 'target', 'conversion_path',
+                                       'conversion_kwargs'))):
+    """
+    Defines a compiled conversion plan from source colour representation to
+    target colour representation in the automatic colour conversion graph.
+
+    The conversion path is resolved once and the keyword arguments of each
+    conversion function are filtered and bound in advance so that the plan
+    can be called repeatedly at the cost of the conversion functions only.
+    The plan only holds module level callables and keyword arguments and is
+    thus picklable.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+    conversion_path : tuple
+        Conversion functions callables.
+    conversion_kwargs : tuple
+        Keyword arguments of each conversion function callable.
+
+    Methods
+    -------
+    __call__
+
+    Examples
+    --------
+    >>> plan = compile_conversion('CIE XYZ', 'CIE xyY')
+    >>> plan.source, plan.target
+    ('cie xyz', 'cie xyy')
+    >>> plan(np.array([0.20654008, 0.12197225, 0.05136952]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.5436955...,  0.3210794...,  0.1219722...])
+    """
+
+    def __call__(self, a):
+        """
+        Converts given object :math:`a` from the source colour representation
+        to the target colour representation of the conversion plan.
+
+        Parameters
+        ----------
+        a : array_like or numeric or SpectralDistribution
+            Object :math:`a` to convert.
+
+        Returns
+        -------
+        ndarray or numeric or SpectralDistribution
+            Converted object :math:`a`.
+        """
+
+        with domain_range_scale('1'):
+            for conversion_function, kwargs in zip(self.conversion_path,
+                                                   self.conversion_kwargs):
+                a = conversion_function(a, **kwargs)
+
+        return a
+
+
+_CONVERSION_PLANS_CACHE = CACHE_REGISTRY.register_cache(
+    '{0}._CONVERSION_PLANS_CACHE'.format(__name__), maximum_size=256)
+"""
+Least recently used cache of the compiled conversion plans, along with the
+keyword arguments they were compiled with, keyed by source node, target node
+and frozen keyword arguments.
+
+_CONVERSION_PLANS_CACHE : Cache
+"""
+
+
+_LINEAR_CONVERSION_FUNCTIONS = {
+    XYZ_to_RGB: ('illuminant_XYZ', 'illuminant_RGB', 'XYZ_to_RGB_matrix',
+                 'chromatic_adaptation_transform'),
+    RGB_to_XYZ: ('illuminant_RGB', 'illuminant_XYZ', 'RGB_to_XYZ_matrix',
+                 'chromatic_adaptation_transform'),
+    RGB_to_RGB: ('input_colourspace', 'output_colourspace',
+                 'chromatic_adaptation_transform'),
+    XYZ_to_UCS: (),
+    UCS_to_XYZ: (),
+}
+"""
+Conversion functions that are linear, i.e. reducible to a single 3x3 matrix,
+and the keyword arguments they accept while remaining linear. Any other
+keyword argument, e.g. a decoding or encoding colour component transfer
+function, prevents the conversion function from being considered linear
+unless it is *None* or *False*.
+
+_LINEAR_CONVERSION_FUNCTIONS : dict
+"""
+
+
+def _is_linear_conversion(conversion_function, kwargs):
+    """
+    Returns whether given conversion function is linear when called with given
+    keyword arguments.
+
+    Parameters
+    ----------
+    conversion_function : callable
+        Conversion function callable.
+    kwargs : dict
+        Keyword arguments of the conversion function callable.
+
+    Returns
+    -------
+    bool
+        Whether the conversion function is linear.
+
+    Examples
+    --------
+    >>> _is_linear_conversion(XYZ_to_UCS, {})
+    True
+    >>> _is_linear_conversion(XYZ_to_Lab, {})
+    False
+    """
+
+    function = _lower_order_function(conversion_function)
+
+    if function not in _LINEAR_CONVERSION_FUNCTIONS:
+        return False
+
+    if isinstance(conversion_function, partial):
+        kwargs = dict(conversion_function.keywords, **kwargs)
+
+    for key, value in kwargs.items():
+        if key in _LINEAR_CONVERSION_FUNCTIONS[function]:
+            continue
+
+        if value is not None and value is not False:
+            return False
+
+    return True
+
+
+def _linear_conversion(a, matrix):
+    """
+    Converts given object :math:`a` with given matrix, it is used to perform
+    a run of linear conversion functions in a single pass.
+
+    Parameters
+    ----------
+    a : array_like
+        Object :math:`a` to convert.
+    matrix : array_like
+        :math:`3x3` matrix resulting from the product of the matrices of the
+        fused linear conversion functions.
+
+    Returns
+    -------
+    ndarray
+        Converted object :math:`a`.
+
+    Examples
+    --------
+    >>> _linear_conversion(np.array([0.5, 0.25, 0.125]), np.identity(3) * 2)
+    array([ 1.  ,  0.5 ,  0.25])
+    """
+
+    return dot_vector(matrix, a)
+
+
+def _fuse_linear_conversions(conversion_path, conversion_kwargs):
+    """
+    Fuses the runs of consecutive linear conversion functions of given
+    conversion path into single :math:`3x3` matrix conversions.
+
+    The matrix of a run is computed by converting the identity matrix rows
+    with the conversion functions of the run.
+
+    Parameters
+    ----------
+    conversion_path : array_like
+        Conversion functions callables.
+    conversion_kwargs : array_like
+        Keyword arguments of each conversion function callable.
+
+    Returns
+    -------
+    tuple
+        Fused conversion functions callables and their keyword arguments.
+    """
+
+    fused_path, fused_kwargs, run = [], [], []
+
+    def fuse_run():
+        """
+        Fuses the current run of linear conversion functions.
+        """
+
+        if len(run) > 1:
+            M = np.identity(3)
+            with domain_range_scale('1'):
+                for conversion_function, kwargs in run:
+                    M = conversion_function(M, **kwargs)
+
+            fused_path.append(_linear_conversion)
+            fused_kwargs.append({'matrix': np.transpose(M)})
+        else:
+            for conversion_function, kwargs in run:
+                fused_path.append(conversion_function)
+                fused_kwargs.append(kwargs)
+
+        del run[:]
+
+    for conversion_function, kwargs in zip(conversion_path,
+                                           conversion_kwargs):
+        if _is_linear_conversion(conversion_function, kwargs):
+            run.append((conversion_function, kwargs))
+        else:
+            fuse_run()
+
+            fused_path.append(conversion_function)
+            fused_kwargs.append(kwargs)
+
+    fuse_run()
+
+    return fused_path, fused_kwargs
+
+
+def _compile_conversion(source, target, kwargs, fuse_linear_conversions=True):
+    """
+    Compiles the conversion plan from given source node to given target node,
+    without any caching.
+
+    Parameters
+    ----------
+    source : unicode
+        Source node.
+    target : unicode
+        Target node.
+    kwargs : dict
+        Keyword arguments, please refer to the documentation of the
+        :func:`colour.convert` definition.
+    fuse_linear_conversions : bool, optional
+        Whether to fuse the runs of consecutive linear conversion functions
+        into single :math:`3x3` matrix conversions.
+
+    Returns
+    -------
+    Conversion_Plan
+        Conversion plan.
+    """
+
+    conversion_path = _conversion_path(source, target)
+
+    conversion_kwargs = []
+    for conversion_function in conversion_path:
+        conversion_function_name = _lower_order_function(
+            conversion_function).__name__
+
+        # Filtering compatible keyword arguments passed directly and
+        # irrespective of any conversion function name.
+        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
+
+        # Filtering keyword arguments passed as dictionary with the
+        # conversion function name.
+        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+
+        conversion_kwargs.append(filtered_kwargs)
+
+    if fuse_linear_conversions:
+        conversion_path, conversion_kwargs = _fuse_linear_conversions(
+            conversion_path, conversion_kwargs)
+
+    return Conversion_Plan(source, target, tuple(conversion_path),
+                           tuple(conversion_kwargs))
+
+
+def compile_conversion(source, target, **kwargs):
+    """
+    Compiles a reusable conversion plan from source colour representation to
+    target colour representation using the automatic colour conversion graph.
+
+    The conversion path and the filtered keyword arguments of the conversion
+    functions are computed once, the resulting plan is stored in a bounded
+    least recently used cache keyed by the source and target colour
+    representations and the keyword arguments.
+
+    Runs of consecutive linear conversion functions, e.g. *CIE XYZ* tristimulus
+    values to *RGB* colourspace array followed by *RGB* colourspace to *RGB*
+    colourspace conversion without decoding or encoding colour component
+    transfer functions, are fused into a single :math:`3x3` matrix so that the
+    data is processed in a single pass.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    Conversion_Plan
+        Conversion plan.
+
+    Notes
+    -----
+    -   The cache is keyed by the content of the keyword arguments, e.g. the
+        arrays values or the attributes of a :class:`colour.RGB_Colourspace`
+        class instance, keyword arguments whose content cannot be represented,
+        prevent the plan from being cached, it is then compiled on each call.
+    -   The keyword arguments are not copied, a cached plan is only re-used
+        if the keyword arguments it was compiled with have not been mutated
+        since, it is otherwise compiled again.
+
+    Examples
+    --------
+    >>> from colour import SDS_COLOURCHECKERS
+    >>> sd = SDS_COLOURCHECKERS['ColorChecker N Ohta']['dark skin']
+    >>> plan = compile_conversion('Spectral Distribution', 'sRGB')
+    >>> plan(sd)  # doctest: +ELLIPSIS
+    array([ 0.4567579...,  0.3098698...,  0.2486192...])
+    """
+
+    source, target = source.lower(), target.lower()
+
+    try:
+        key = (source, target, _freeze(kwargs))
+    except (TypeError, RuntimeError):
+        return _compile_conversion(source, target, kwargs)
+
+    # The plan holds the keyword arguments it was compiled with, e.g. the fused
+    # matrices are computed from them, it is stale if they have been mutated.
+    # Given keyword arguments holding the same objects implies that they were
+    # not, otherwise their content is compared with the key.
+    entry = _CONVERSION_PLANS_CACHE.get(key)
+    if entry is not None and (_is_same(entry[0], kwargs) or
+                              (source, target, _freeze(entry[0])) == key):
+        return entry[1]
+
+    plan = _compile_conversion(source, target, kwargs)
+    _CONVERSION_PLANS_CACHE[key] = (kwargs, plan)
+
+    return plan
+
+
 def describe_conversion_path(source,
                              target,
                              mode='Short',
@@ -745,7 +1221,6 @@ def describe_conversion_path(source,
             message_box(message, width, padding, print_callable)
 
 
-@domain_range_scale('1')
 def convert(a, source, target, **kwargs):
     """
     Converts given object :math:`a` from source colour representation to target
@@ -753,6 +1228,9 @@ def convert(a, source, target, **kwargs):
 
     The conversion is performed by finding the shortest path in a
     `NetworkX <https://networkx.github.io/>`__ :class:`DiGraph` class instance.
+    The conversion path and the keyword arguments of the conversion functions
+    are compiled into a :class:`colour.graph.Conversion_Plan` class instance
+    which is cached, see :func:`colour.compile_conversion` definition.
 
     The conversion path adopts the **'1'** domain-range scale and the object
     :math:`a` is expected to be *soft* normalised accordingly. For example,
@@ -952,30 +1430,30 @@ verbose={'mode': 'Long'})
 
     source, target = source.lower(), target.lower()
 
-    conversion_path = _conversion_path(source, target)
-
     verbose_kwargs = copy(kwargs)
-    for conversion_function in conversion_path:
-        conversion_function_name = _lower_order_function(
-            conversion_function).__name__
+    verbose = kwargs.pop('verbose', None)
 
-        # Filtering compatible keyword arguments passed directly and
-        # irrespective of any conversion function name.
-        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
+    if verbose is None:
+        return compile_conversion(source, target, **kwargs)(a)
 
-        # Filtering keyword arguments passed as dictionary with the
-        # conversion function name.
-        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+    # The intermediate values of all the conversion functions are required
+    # for the verbose description, the linear conversions are thus not fused.
+    plan = _compile_conversion(source, target, kwargs, False)
 
-        a = conversion_function(a, **filtered_kwargs)
+    with domain_range_scale('1'):
+        for conversion_function, filtered_kwargs in zip(
+                plan.conversion_path, plan.conversion_kwargs):
+            conversion_function_name = _lower_order_function(
+                conversion_function).__name__
 
-        if conversion_function_name in verbose_kwargs:
-            verbose_kwargs[conversion_function_name]['return'] = a
-        else:
-            verbose_kwargs[conversion_function_name] = {'return': a}
+            a = conversion_function(a, **filtered_kwargs)
+
+            verbose_kwargs[conversion_function_name] = dict(
+                verbose_kwargs.get(conversion_function_name, {}), **{
+                    'return': a
+                })
 
-    if 'verbose' in verbose_kwargs:
-        verbose_kwargs.update(verbose_kwargs.pop('verbose'))
-        describe_conversion_path(source, target, **verbose_kwargs)
+    verbose_kwargs.update(verbose_kwargs.pop('verbose'))
+    describe_conversion_path(source, target, **verbose_kwargs)
 
     return a
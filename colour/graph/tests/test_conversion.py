@@ -6,13 +6,16 @@ Defines unit tests for :mod:`colour.graph.conversion` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import pickle
 import six
 import unittest
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import CCS_ILLUMINANTS, SDS_ILLUMINANTS
-from colour.models import RGB_COLOURSPACE_ACES2065_1
-from colour.graph import describe_conversion_path, convert
+from colour.models import (RGB_COLOURSPACE_ACES2065_1, RGB_COLOURSPACE_sRGB,
+                           RGB_to_RGB, XYZ_to_RGB)
+from colour.graph import (Conversion_Plan, describe_conversion_path,
+                          compile_conversion, convert)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -21,7 +24,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestDescribeConversionPath', 'TestConvert']
+__all__ = [
+    'TestDescribeConversionPath', 'TestCompileConversion', 'TestConvert'
+]
 
 
 class TestDescribeConversionPath(unittest.TestCase):
@@ -50,6 +55,160 @@ class TestDescribeConversionPath(unittest.TestCase):
             })
 
 
+class TestCompileConversion(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.compile_conversion` definition unit
+    tests methods.
+    """
+
+    def test_compile_conversion(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition.
+        """
+
+        sd = SDS_COLOURCHECKERS['ColorChecker N Ohta']['dark skin']
+
+        plan = compile_conversion('Spectral Distribution', 'sRGB')
+        self.assertIsInstance(plan, Conversion_Plan)
+        self.assertEqual(plan.source, 'spectral distribution')
+        self.assertEqual(plan.target, 'srgb')
+        np.testing.assert_almost_equal(
+            plan(sd), np.array([0.45675795, 0.30986982, 0.24861924]),
+            decimal=7)
+
+        self.assertIs(
+            compile_conversion('Spectral Distribution', 'sRGB'), plan)
+
+        illuminant = SDS_ILLUMINANTS['FL2']
+        plan = compile_conversion(
+            'Spectral Distribution',
+            'sRGB',
+            sd_to_XYZ={'illuminant': illuminant})
+        np.testing.assert_almost_equal(
+            plan(sd), np.array([0.47924575, 0.31676968, 0.17362725]),
+            decimal=7)
+
+        XYZ_to_xyY_kwargs = {
+            'illuminant':
+                np.array(CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']
+                         ['D50'])
+        }
+        plan = compile_conversion(
+            'CIE XYZ', 'CIE xyY', XYZ_to_xyY=XYZ_to_xyY_kwargs)
+        self.assertIs(
+            compile_conversion(
+                'CIE XYZ', 'CIE xyY', XYZ_to_xyY=XYZ_to_xyY_kwargs), plan)
+
+        XYZ_to_xyY_kwargs['illuminant'][0] = 0.5
+        plan_m = compile_conversion(
+            'CIE XYZ', 'CIE xyY', XYZ_to_xyY=XYZ_to_xyY_kwargs)
+        self.assertIsNot(plan_m, plan)
+        self.assertEqual(plan_m.conversion_kwargs[0]['illuminant'][0], 0.5)
+
+        # The first plan was compiled with the now mutated array, it must not
+        # be returned for a new array with the original content.
+        XYZ_to_xyY_kwargs = {
+            'illuminant':
+                np.array(CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']
+                         ['D50'])
+        }
+        plan_o = compile_conversion(
+            'CIE XYZ', 'CIE xyY', XYZ_to_xyY=XYZ_to_xyY_kwargs)
+        self.assertIsNot(plan_o, plan)
+        self.assertIs(plan_o.conversion_kwargs[0]['illuminant'],
+                      XYZ_to_xyY_kwargs['illuminant'])
+
+    def test_compile_conversion_linear_fusion(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition
+        fusion of the linear conversion functions.
+        """
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+        RGB_to_RGB_kwargs = {'output_colourspace': RGB_COLOURSPACE_ACES2065_1}
+
+        plan = compile_conversion(
+            'CIE XYZ', 'Scene-Referred RGB', RGB_to_RGB=RGB_to_RGB_kwargs)
+        self.assertEqual(len(plan.conversion_path), 1)
+
+        np.testing.assert_almost_equal(
+            plan(XYZ),
+            RGB_to_RGB(
+                XYZ_to_RGB(XYZ, RGB_COLOURSPACE_sRGB.whitepoint,
+                           RGB_COLOURSPACE_sRGB.whitepoint,
+                           RGB_COLOURSPACE_sRGB.XYZ_to_RGB_matrix),
+                RGB_COLOURSPACE_sRGB, RGB_COLOURSPACE_ACES2065_1),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            plan(np.tile(XYZ, (4, 3, 1))),
+            np.tile(plan(XYZ), (4, 3, 1)),
+            decimal=7)
+
+        plan = compile_conversion(
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB=dict(RGB_to_RGB_kwargs, apply_cctf_encoding=True))
+        self.assertEqual(len(plan.conversion_path), 2)
+
+    def test_compile_conversion_mutated_colourspace(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition
+        with a colourspace mutated in-place between two conversions.
+        """
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+        colourspace = RGB_COLOURSPACE_ACES2065_1.copy()
+
+        RGB = convert(
+            XYZ,
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': colourspace})
+
+        colourspace.XYZ_to_RGB_matrix = np.identity(3)
+        colourspace.use_derived_XYZ_to_RGB_matrix = False
+
+        RGB_m = convert(
+            XYZ,
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': colourspace})
+
+        self.assertFalse(np.allclose(RGB, RGB_m))
+        np.testing.assert_almost_equal(
+            RGB_m,
+            RGB_to_RGB(
+                XYZ_to_RGB(XYZ, RGB_COLOURSPACE_sRGB.whitepoint,
+                           RGB_COLOURSPACE_sRGB.whitepoint,
+                           RGB_COLOURSPACE_sRGB.XYZ_to_RGB_matrix),
+                RGB_COLOURSPACE_sRGB, colourspace),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            convert(
+                XYZ,
+                'CIE XYZ',
+                'Scene-Referred RGB',
+                RGB_to_RGB={
+                    'output_colourspace': RGB_COLOURSPACE_ACES2065_1.copy()
+                }),
+            RGB,
+            decimal=7)
+
+    def test_pickle_conversion_plan(self):
+        """
+        Tests :class:`colour.graph.conversion.Conversion_Plan` class
+        pickling.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+        plan = compile_conversion('CIE XYZ', 'CAM16UCS')
+
+        np.testing.assert_almost_equal(
+            pickle.loads(pickle.dumps(plan))(a), plan(a), decimal=7)
+
+
 class TestConvert(unittest.TestCase):
     """
     Defines :func:`colour.graph.conversion.convert` definition unit tests
@@ -13,6 +13,8 @@ from .image import read_image, write_image
 from .tabular import (read_spectral_data_from_csv_file, read_sds_from_csv_file,
                       write_sds_to_csv_file)
 from .xrite import read_sds_from_xrite_file
+from .hyperspectral import (read_hyperspectral_cube, hyperspectral_cube_to_XYZ,
+                            hyperspectral_cube_to_RGB)
 
 __all__ = ['SpectralDistribution_IESTM2714']
 __all__ += luts.__all__
@@ -26,3 +28,7 @@ __all__ += [
     'write_sds_to_csv_file'
 ]
 __all__ += ['read_sds_from_xrite_file']
+__all__ += [
+    'read_hyperspectral_cube', 'hyperspectral_cube_to_XYZ',
+    'hyperspectral_cube_to_RGB'
+]
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""
+Hyperspectral Images Input / Output Utilities
+=============================================
+
+Defines the hyperspectral images input / output and streaming conversion
+objects:
+
+-   :func:`colour.io.read_hyperspectral_cube`
+-   :func:`colour.io.hyperspectral_cube_to_XYZ`
+-   :func:`colour.io.hyperspectral_cube_to_RGB`
+
+The conversions process the hyperspectral cubes per tiles so that the peak
+memory usage is bounded by the tile size rather than by the cube size, the
+cubes are typically memory-mapped and the output is written incrementally.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+from six import string_types
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.models import XYZ_to_RGB
+from colour.utilities import domain_range_scale
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'read_hyperspectral_cube', 'hyperspectral_cube_to_XYZ',
+    'hyperspectral_cube_to_RGB'
+]
+
+
+def read_hyperspectral_cube(path, shape=None, dtype=np.float32, offset=0):
+    """
+    Reads given hyperspectral cube file as a read-only memory-mapped array.
+
+    Parameters
+    ----------
+    path : unicode
+        Hyperspectral cube file path, either a *.npy* file or a raw file
+        storing the bands of each pixel contiguously, i.e. band interleaved by
+        pixel.
+    shape : array_like, optional
+        Shape of the hyperspectral cube raw file, i.e. (height, width, bands),
+        required for raw files.
+    dtype : object, optional
+        Data type of the hyperspectral cube raw file.
+    offset : int, optional
+        Offset in bytes of the data in the hyperspectral cube raw file, e.g.
+        to skip a header.
+
+    Returns
+    -------
+    memmap
+        Memory-mapped hyperspectral cube.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'cube.npy')
+    >>> np.save(path, np.zeros((4, 4, 16)))
+    >>> read_hyperspectral_cube(path).shape
+    (4, 4, 16)
+    """
+
+    if os.path.splitext(path)[-1].lower() == '.npy':
+        return np.load(path, mmap_mode='r')
+    else:
+        assert shape is not None, (
+            '"shape" must be given to read a raw hyperspectral cube file!')
+
+        return np.memmap(
+            path, dtype=dtype, mode='r', offset=offset, shape=tuple(shape))
+
+
+def _process_hyperspectral_cube(cube, process_tile, output, tile_size, dtype):
+    """
+    Processes given hyperspectral cube per tiles with given tile processing
+    definition and writes the result incrementally into given output.
+
+    Parameters
+    ----------
+    cube : array_like or unicode
+        Hyperspectral cube of shape (height, width, bands) or hyperspectral
+        cube file path.
+    process_tile : callable
+        Tile processing definition returning an array of shape
+        (tile height, tile width, 3) for a tile of the hyperspectral cube.
+    output : ndarray or unicode
+        Output array of shape (height, width, 3), output *.npy* file path or
+        *None* to allocate an array.
+    tile_size : int or array_like
+        Tile size, either a single integer for square tiles or
+        (tile height, tile width).
+    dtype : object
+        Data type of the output array when it is allocated, defaults to the
+        hyperspectral cube data type if it is a floating point type.
+
+    Returns
+    -------
+    ndarray
+        Output array.
+    """
+
+    if isinstance(cube, string_types):
+        cube = read_hyperspectral_cube(cube)
+
+    assert cube.ndim == 3, (
+        'Hyperspectral cube must be a 3-dimensional array of shape '
+        '(height, width, bands)!')
+
+    height, width = cube.shape[0], cube.shape[1]
+
+    if dtype is None:
+        dtype = (cube.dtype
+                 if cube.dtype.kind == 'f' else DEFAULT_FLOAT_DTYPE)
+
+    if output is None:
+        output = np.empty((height, width, 3), dtype)
+    elif isinstance(output, string_types):
+        output = np.lib.format.open_memmap(
+            output, mode='w+', dtype=dtype, shape=(height, width, 3))
+
+    assert output.shape == (height, width, 3), (
+        'Output array shape must be {0}!'.format((height, width, 3)))
+
+    tile_height, tile_width = np.resize(tile_size, 2)
+
+    for i in range(0, height, tile_height):
+        for j in range(0, width, tile_width):
+            output[i:i + tile_height, j:j + tile_width] = process_tile(
+                cube[i:i + tile_height, j:j + tile_width])
+
+        if isinstance(output, np.memmap):
+            output.flush()
+
+    return output
+
+
+def hyperspectral_cube_to_XYZ(cube,
+                              integrator,
+                              output=None,
+                              tile_size=256,
+                              dtype=None):
+    """
+    Converts given hyperspectral cube to *CIE XYZ* tristimulus values per tiles
+    using given tristimulus integrator.
+
+    Parameters
+    ----------
+    cube : array_like or unicode
+        Hyperspectral cube of shape (height, width, bands), typically
+        memory-mapped, or hyperspectral cube *.npy* file path.
+    integrator : TristimulusIntegrator
+        Tristimulus integrator whose spectral shape matches the hyperspectral
+        cube bands.
+    output : ndarray or unicode, optional
+        Output array of shape (height, width, 3), e.g. a memory-mapped array,
+        or output *.npy* file path written incrementally. An array is
+        allocated if not given.
+    tile_size : int or array_like, optional
+        Tile size, either a single integer for square tiles or
+        (tile height, tile width).
+    dtype : object, optional
+        Data type of the output array when it is allocated, defaults to the
+        hyperspectral cube data type if it is a floating point type.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values.
+
+    Notes
+    -----
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The peak memory usage is bounded by the tile size, the hyperspectral
+        cube is read and the output is written one tile at a time.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> from colour.colorimetry import TristimulusIntegrator
+    >>> integrator = TristimulusIntegrator(SpectralShape(400, 700, 20))
+    >>> cube = np.full((4, 4, 16), 0.5)
+    >>> hyperspectral_cube_to_XYZ(cube, integrator, tile_size=2)[0, 0]
+    ... # doctest: +ELLIPSIS
+    array([ 50.0038...,  50.        ,  50.0166...])
+    """
+
+    return _process_hyperspectral_cube(cube, integrator, output, tile_size,
+                                       dtype)
+
+
+def hyperspectral_cube_to_RGB(cube,
+                              integrator,
+                              colourspace,
+                              illuminant=None,
+                              chromatic_adaptation_transform='CAT02',
+                              apply_cctf_encoding=False,
+                              output=None,
+                              tile_size=256,
+                              dtype=None):
+    """
+    Converts given hyperspectral cube to given *RGB* colourspace array per
+    tiles using given tristimulus integrator.
+
+    Parameters
+    ----------
+    cube : array_like or unicode
+        Hyperspectral cube of shape (height, width, bands), typically
+        memory-mapped, or hyperspectral cube *.npy* file path.
+    integrator : TristimulusIntegrator
+        Tristimulus integrator whose spectral shape matches the hyperspectral
+        cube bands.
+    colourspace : RGB_Colourspace
+        Output *RGB* colourspace.
+    illuminant : array_like, optional
+        *CIE xy* chromaticity coordinates of the illuminant of the
+        *CIE XYZ* tristimulus values, defaults to the *RGB* colourspace
+        whitepoint, i.e. no chromatic adaptation.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC', None}**,
+        *Chromatic adaptation* transform, if *None* no chromatic adaptation is
+        performed.
+    apply_cctf_encoding : bool, optional
+        Apply *RGB* colourspace encoding colour component transfer function.
+    output : ndarray or unicode, optional
+        Output array of shape (height, width, 3), e.g. a memory-mapped array,
+        or output *.npy* file path written incrementally. An array is
+        allocated if not given.
+    tile_size : int or array_like, optional
+        Tile size, either a single integer for square tiles or
+        (tile height, tile width).
+    dtype : object, optional
+        Data type of the output array when it is allocated, defaults to the
+        hyperspectral cube data type if it is a floating point type.
+
+    Returns
+    -------
+    ndarray
+        *RGB* colourspace array.
+
+    Notes
+    -----
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``RGB``   | [0, 1]                | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The peak memory usage is bounded by the tile size, the hyperspectral
+        cube is read and the output is written one tile at a time.
+
+    Examples
+    --------
+    >>> from colour import RGB_COLOURSPACES, SDS_ILLUMINANTS, SpectralShape
+    >>> from colour.colorimetry import TristimulusIntegrator
+    >>> shape = SpectralShape(400, 700, 20)
+    >>> integrator = TristimulusIntegrator(
+    ...     shape, illuminant=SDS_ILLUMINANTS['D65'])
+    >>> cube = np.full((4, 4, 16), 0.5)
+    >>> hyperspectral_cube_to_RGB(
+    ...     cube, integrator, RGB_COLOURSPACES['sRGB'], tile_size=2)[0, 0]
+    ... # doctest: +ELLIPSIS
+    array([ 0.4999...,  0.5000...,  0.4999...])
+    """
+
+    if illuminant is None:
+        illuminant = colourspace.whitepoint
+
+    cctf_encoding = colourspace.cctf_encoding if apply_cctf_encoding else None
+
+    def process_tile(tile):
+        """
+        Converts given hyperspectral cube tile to *RGB* colourspace array.
+        """
+
+        with domain_range_scale('1'):
+            return XYZ_to_RGB(
+                integrator(tile), illuminant, colourspace.whitepoint,
+                colourspace.XYZ_to_RGB_matrix, chromatic_adaptation_transform,
+                cctf_encoding)
+
+    return _process_hyperspectral_cube(cube, process_tile, output, tile_size,
+                                       dtype)
@@ -953,7 +953,7 @@ class SpectralDistribution_IESTM2714(SpectralDistribution):
         'Rare earth fluorescent lamp'
         >>> # Doctests ellipsis for Python 2.x compatibility.
         >>> sd[400]  # doctest: +ELLIPSIS
-        0.0339999...
+        0.034...
         """
 
         formatter = './{{{0}}}{1}/{{{0}}}{2}'
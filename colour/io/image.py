@@ -151,14 +151,24 @@ def convert_bit_depth(a, bit_depth='float32'):
             return a
         elif bit_depth == 'uint16':
             return (a * 257).astype(target_dtype)
-        elif bit_depth in ('float16', 'float32', 'float64', 'float128'):
+        elif bit_depth in ('float32', 'float64'):
+            a = a.astype(target_dtype)
+            a /= 255
+
+            return a
+        elif bit_depth in ('float16', 'float128'):
             return (a / 255).astype(target_dtype)
     elif source_dtype == 'uint16':
         if bit_depth == 'uint8':
             return (a / 257).astype(target_dtype)
         elif bit_depth == 'uint16':
             return a
-        elif bit_depth in ('float16', 'float32', 'float64', 'float128'):
+        elif bit_depth in ('float32', 'float64'):
+            a = a.astype(target_dtype)
+            a /= 65535
+
+            return a
+        elif bit_depth in ('float16', 'float128'):
             return (a / 65535).astype(target_dtype)
     elif source_dtype in ('float16', 'float32', 'float64', 'float128'):
         if bit_depth == 'uint8':
@@ -14,9 +14,13 @@ References
 
 from __future__ import absolute_import
 
+import hashlib
+import json
 import os
+import tempfile
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
+                              usage_warning)
 from .lut import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
                   LUTSequence, LUT_to_LUT)
 from .iridas_cube import read_LUT_IridasCube, write_LUT_IridasCube
@@ -24,6 +28,7 @@ from .resolve_cube import read_LUT_ResolveCube, write_LUT_ResolveCube
 from .sony_spi1d import read_LUT_SonySPI1D, write_LUT_SonySPI1D
 from .sony_spi3d import read_LUT_SonySPI3D, write_LUT_SonySPI3D
 from .cinespace_csp import read_LUT_Cinespace, write_LUT_Cinespace
+from .colour_binary import read_LUT_ColourBinary, write_LUT_ColourBinary
 
 __all__ = [
     'AbstractLUTSequenceOperator', 'LUT1D', 'LUT3x1D', 'LUT3D', 'LUTSequence',
@@ -34,22 +39,25 @@ __all__ += ['read_LUT_ResolveCube', 'write_LUT_ResolveCube']
 __all__ += ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
 __all__ += ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
 __all__ += ['read_LUT_Cinespace', 'write_LUT_Cinespace']
+__all__ += ['read_LUT_ColourBinary', 'write_LUT_ColourBinary']
 
 EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
     '.cube': 'Iridas Cube',
     '.spi1d': 'Sony SPI1D',
     '.spi3d': 'Sony SPI3D',
-    '.csp': 'Cinespace'
+    '.csp': 'Cinespace',
+    '.clut': 'Colour Binary'
 })
 """
 Extension to *LUT* format.
 
 EXTENSION_TO_LUT_FORMAT_MAPPING : CaseInsensitiveMapping
-    **{'.cube', '.spi1d'}**
+    **{'.cube', '.spi1d', '.spi3d', '.csp', '.clut'}**
 """
 
 LUT_READ_METHODS = CaseInsensitiveMapping({
     'Cinespace': read_LUT_Cinespace,
+    'Colour Binary': read_LUT_ColourBinary,
     'Iridas Cube': read_LUT_IridasCube,
     'Resolve Cube': read_LUT_ResolveCube,
     'Sony SPI1D': read_LUT_SonySPI1D,
@@ -63,12 +71,168 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_READ_METHODS : CaseInsensitiveMapping
-    **{'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-    'Sony SPI3D'}**
+    **{'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+    'Sony SPI1D', 'Sony SPI3D'}**
 """
 
 
-def read_LUT(path, method=None, **kwargs):
+def _file_digest(path):
+    """
+    Returns the *SHA-256* digest of given file content.
+
+    Parameters
+    ----------
+    path : unicode
+        File path.
+
+    Returns
+    -------
+    unicode
+        *SHA-256* hexadecimal digest.
+    """
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source_file:
+        for chunk in iter(lambda: source_file.read(1 << 20), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _write_LUT_cache(LUT, cache_path, source):
+    """
+    Writes given *LUT* to given *Colour* binary *.clut* *LUT* sidecar cache
+    file path with given *LUT* file source metadata.
+
+    The cache file is written to a temporary file first and then renamed so
+    that concurrent readers never see a partially written cache file, a usage
+    warning is raised if it cannot be written.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D or LUTSequence
+        :class:`LUT1D` or :class:`LUT3x1D` or :class:`LUT3D` or
+        :class:`LUTSequence` class instance to write.
+    cache_path : unicode
+        Cache file path.
+    source : dict
+        *LUT* file source metadata.
+    """
+
+    try:
+        descriptor, temporary_path = tempfile.mkstemp(
+            '.clut', dir=os.path.dirname(cache_path))
+        os.close(descriptor)
+
+        try:
+            write_LUT_ColourBinary(
+                LUT, temporary_path, metadata={'source': source})
+
+            # Python 2.7 does not define "os.replace".
+            getattr(os, 'replace', os.rename)(temporary_path, cache_path)
+        except Exception:
+            os.remove(temporary_path)
+            raise
+    except (IOError, OSError, ValueError) as error:
+        usage_warning('"{0}" LUT cache file could not be written: {1}'.format(
+            cache_path, error))
+
+
+def _read_LUT_cached(path, reader, directory=None, arguments=None):
+    """
+    Reads given *LUT* file with given reading definition through a *Colour*
+    binary *.clut* *LUT* sidecar cache file.
+
+    The cache file is keyed by the *LUT* file absolute path, modification time
+    and content *SHA-256* digest and by the reading definition arguments: it
+    is used if the *LUT* file path, size and reading definition arguments
+    match and either its modification time or its content digest is
+    unchanged, otherwise the *LUT* file is read and the cache file written.
+    The cache file modification time is updated when only the content digest
+    matches, and damaged cache files are rebuilt.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    reader : callable
+        Reading definition called with the *LUT* path on cache miss.
+    directory : unicode, optional
+        Directory storing the cache files, they are stored next to the *LUT*
+        files if not given.
+    arguments : dict, optional
+        *JSON* serialisable arguments the reading definition reads the *LUT*
+        file with, e.g. the reading method and its keyword arguments. The
+        cache file is bypassed if they are not *JSON* serialisable.
+
+    Returns
+    -------
+    LUT1D or LUT3x1D or LUT3D or LUTSequence
+        :class:`LUT1D` or :class:`LUT3x1D` or :class:`LUT3D` or
+        :class:`LUTSequence` class instance.
+    """
+
+    try:
+        # Round-tripping the arguments so that they compare equal to the ones
+        # read from the cache file header, e.g. *tuple* become *list*.
+        arguments = json.loads(json.dumps(arguments))
+    except (TypeError, ValueError) as error:
+        usage_warning(
+            '"{0}" LUT reading arguments are not JSON serialisable, the '
+            'cache file is bypassed: {1}'.format(path, error))
+
+        return reader(path)
+
+    path = os.path.abspath(path)
+    if directory is None:
+        cache_path = '{0}.clut'.format(path)
+    else:
+        cache_path = os.path.join(
+            directory, '{0}.{1}.clut'.format(
+                os.path.basename(path),
+                hashlib.sha256(path.encode('utf-8')).hexdigest()[:16]))
+
+    stat = os.stat(path)
+    source = {
+        'path': path,
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'sha256': None,
+        'arguments': arguments,
+    }
+
+    if os.path.exists(cache_path):
+        try:
+            LUT, metadata = read_LUT_ColourBinary(cache_path, True)
+            source_c = metadata.get('source', {})
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            source_c = {}
+
+        if (source_c.get('path') == path
+                and source_c.get('size') == stat.st_size
+                and source_c.get('arguments') == arguments):
+            if source_c.get('mtime') == stat.st_mtime:
+                return LUT
+
+            source['sha256'] = _file_digest(path)
+            if source_c.get('sha256') == source['sha256']:
+                # The modification time is updated so that subsequent reads
+                # do not compute the content digest again.
+                _write_LUT_cache(LUT, cache_path, source)
+
+                return LUT
+
+    LUT = reader(path)
+
+    if source['sha256'] is None:
+        source['sha256'] = _file_digest(path)
+
+    _write_LUT_cache(LUT, cache_path, source)
+
+    return LUT
+
+
+def read_LUT(path, method=None, cache=False, **kwargs):
     """
     Reads given *LUT* file using given method.
 
@@ -77,9 +241,16 @@ def read_LUT(path, method=None, **kwargs):
     path : unicode
         *LUT* path.
     method : unicode, optional
-        **{None, 'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-        'Sony SPI3D'}**, Reading method, if *None*, the method will be
-        auto-detected according to extension.
+        **{None, 'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+        'Sony SPI1D', 'Sony SPI3D'}**, Reading method, if *None*, the method
+        will be auto-detected according to extension.
+    cache : bool or unicode, optional
+        Whether to read the *LUT* through a *Colour* binary *.clut* *LUT*
+        sidecar cache file keyed by the *LUT* file path, modification time,
+        content digest, reading method and keyword arguments, so that
+        subsequent reads memory-map the cache file instead of parsing the
+        *LUT* file. The cache file is stored next to the *LUT* file or in
+        given cache directory.
 
     Returns
     -------
@@ -141,6 +312,14 @@ def read_LUT(path, method=None, **kwargs):
     if method is None:
         method = EXTENSION_TO_LUT_FORMAT_MAPPING[os.path.splitext(path)[-1]]
 
+    if cache:
+        return _read_LUT_cached(
+            path, lambda path: read_LUT(path, method, **kwargs),
+            None if cache is True else cache, {
+                'method': method,
+                'kwargs': kwargs
+            })
+
     function = LUT_READ_METHODS[method]
 
     try:
@@ -156,6 +335,7 @@ def read_LUT(path, method=None, **kwargs):
 
 
 LUT_WRITE_METHODS = CaseInsensitiveMapping({
+    'Colour Binary': write_LUT_ColourBinary,
     'Iridas Cube': write_LUT_IridasCube,
     'Resolve Cube': write_LUT_ResolveCube,
     'Sony SPI1D': write_LUT_SonySPI1D,
@@ -170,8 +350,8 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_WRITE_METHODS : CaseInsensitiveMapping
-    **{'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-    'Sony SPI3D'}**
+    **{'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+    'Sony SPI1D', 'Sony SPI3D'}**
 """
 
 
@@ -189,9 +369,9 @@ def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
     decimals : int, optional
         Formatting decimals.
     method : unicode, optional
-        **{None, 'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-        'Sony SPI3D'}**, Writing method, if *None*, the method will be
-        auto-detected according to extension.
+        **{None, 'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+        'Sony SPI1D', 'Sony SPI3D'}**, Writing method, if *None*, the method
+        will be auto-detected according to extension.
 
     Returns
     -------
@@ -21,6 +21,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
+from colour.io.luts.common import parse_array, write_array
 from colour.utilities import tsplit, tstack, as_float_array, as_int_array
 
 __author__ = 'Colour Developers'
@@ -123,7 +124,11 @@ def read_LUT_Cinespace(path):
         """
 
         size = as_int_array(lines[0].split())
-        table = as_float_array([line.split() for line in lines[1:]])
+        table = parse_array(lines[1:], np.product(size) * 3)
+        if table is not None:
+            table = table.reshape([-1, 3])
+        else:
+            table = as_float_array([line.split() for line in lines[1:]])
 
         return size, table
 
@@ -402,10 +407,8 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
                 csp_file.write('\n{0} {1} {2}\n'.format(
                     LUT[1].table.shape[0], LUT[1].table.shape[1],
                     LUT[1].table.shape[2]))
-                table = LUT[1].table.reshape([-1, 3], order='F')
-
-                for row in table:
-                    csp_file.write('{0}\n'.format(_format_array(row)))
+                write_array(csp_file, LUT[1].table.reshape([-1, 3], order='F'),
+                            '%0.{0}f %0.{0}f %0.{0}f'.format(decimals))
 
         else:
             for i in range(3):
@@ -414,9 +417,7 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
                     _format_tuple([LUT[0].domain[0][i], LUT[0].domain[1][i]])))
                 csp_file.write('0.0 1.0\n')
             csp_file.write('\n{0}\n'.format(LUT[0].size))
-            table = LUT[0].table
-
-            for row in table:
-                csp_file.write('{0}\n'.format(_format_array(row)))
+            write_array(csp_file, LUT[0].table,
+                        '%0.{0}f %0.{0}f %0.{0}f'.format(decimals))
 
     return True
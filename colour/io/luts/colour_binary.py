@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Binary LUT Format Input / Output Utilities
+=================================================
+
+Defines *Colour* binary *.clut* *LUT* Format related input / output utilities
+objects:
+
+-   :func:`colour.io.read_LUT_ColourBinary`
+-   :func:`colour.io.write_LUT_ColourBinary`
+
+The *Colour* binary *.clut* *LUT* format stores the tables and domains of a
+:class:`colour.LUT1D`, :class:`colour.LUT3x1D`, :class:`colour.LUT3D` or
+:class:`colour.LUTSequence` class instance as raw arrays preceded by a *JSON*
+header describing them, the *LUT* names and comments. The arrays are aligned
+so that they are memory-mapped when read, i.e. without copy nor parsing.
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+import struct
+
+from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
+from colour.utilities import CaseInsensitiveMapping
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['read_LUT_ColourBinary', 'write_LUT_ColourBinary']
+
+_MAGIC_STRING_COLOUR_BINARY = b'\x93CLUT\x01'
+"""
+*Colour* binary *.clut* *LUT* format magic string, the last byte is the format
+version.
+
+_MAGIC_STRING_COLOUR_BINARY : bytes
+"""
+
+_ALIGNMENT_COLOUR_BINARY = 64
+"""
+Alignment in bytes of the header and arrays of the *Colour* binary *.clut*
+*LUT* format.
+
+_ALIGNMENT_COLOUR_BINARY : int
+"""
+
+_LUT_CLASSES_COLOUR_BINARY = CaseInsensitiveMapping({
+    'LUT1D': LUT1D,
+    'LUT3x1D': LUT3x1D,
+    'LUT3D': LUT3D,
+})
+"""
+*LUT* classes supported by the *Colour* binary *.clut* *LUT* format.
+
+_LUT_CLASSES_COLOUR_BINARY : CaseInsensitiveMapping
+"""
+
+
+def _aligned(size):
+    """
+    Returns given size rounded up to the *Colour* binary *.clut* *LUT* format
+    alignment.
+
+    Parameters
+    ----------
+    size : int
+        Size in bytes.
+
+    Returns
+    -------
+    int
+        Aligned size in bytes.
+    """
+
+    return -(-size // _ALIGNMENT_COLOUR_BINARY) * _ALIGNMENT_COLOUR_BINARY
+
+
+def _read_header_ColourBinary(path):
+    """
+    Reads the header of given *Colour* binary *.clut* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    tuple
+        Header and offset in bytes of the arrays.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a *Colour* binary *.clut* *LUT* file or if its
+        header is truncated.
+    """
+
+    with open(path, 'rb') as clut_file:
+        magic_string = clut_file.read(len(_MAGIC_STRING_COLOUR_BINARY))
+        if magic_string != _MAGIC_STRING_COLOUR_BINARY:
+            raise ValueError(
+                '"{0}" is not a "Colour Binary" LUT file!'.format(path))
+
+        header_length = clut_file.read(4)
+        if len(header_length) != 4:
+            raise ValueError(
+                '"{0}" "Colour Binary" LUT file header is truncated!'.format(
+                    path))
+
+        header_length = struct.unpack('<I', header_length)[0]
+        header = clut_file.read(header_length)
+        if len(header) != header_length:
+            raise ValueError(
+                '"{0}" "Colour Binary" LUT file header is truncated!'.format(
+                    path))
+
+        header = json.loads(header.decode('utf-8'))
+
+    return header, _aligned(len(_MAGIC_STRING_COLOUR_BINARY) + 4 +
+                            header_length)
+
+
+def read_LUT_ColourBinary(path, additional_data=False):
+    """
+    Reads given *Colour* binary *.clut* *LUT* file.
+
+    The tables and domains are memory-mapped in copy-on-write mode, i.e. they
+    are read lazily from the file and are only copied in memory if modified.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    additional_data : bool, optional
+        Whether to output the metadata written in the header.
+
+    Returns
+    -------
+    LUT1D or LUT3x1D or LUT3D or LUTSequence or tuple
+        :class:`LUT1D` or :class:`LUT3x1D` or :class:`LUT3D` or
+        :class:`LUTSequence` class instance or class instance and metadata.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a *Colour* binary *.clut* *LUT* file or if it is
+        truncated.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'LUT.clut')
+    >>> LUT = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'My LUT')
+    >>> write_LUT_ColourBinary(LUT, path)
+    True
+    >>> print(read_LUT_ColourBinary(path))
+    LUT3D - My LUT
+    --------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.  0.  0.]
+                  [ 1.  1.  1.]]
+    Size       : (16, 16, 16, 3)
+    """
+
+    header, offset = _read_header_ColourBinary(path)
+
+    buffer = np.memmap(path, np.uint8, 'c')
+
+    def _array(specification):
+        """
+        Returns the memory-mapped array with given specification.
+        """
+
+        dtype = np.dtype(str(specification['dtype']))
+        start = offset + specification['offset']
+        end = start + dtype.itemsize * int(np.prod(specification['shape']))
+        if start < 0 or end > buffer.size:
+            raise ValueError(
+                '"{0}" "Colour Binary" LUT file is truncated!'.format(path))
+
+        return np.ndarray(specification['shape'], dtype, buffer, start)
+
+    LUTs = [
+        _LUT_CLASSES_COLOUR_BINARY[specification['class']](
+            _array(specification['table']),
+            specification['name'],
+            _array(specification['domain']),
+            comments=specification['comments'])
+        for specification in header['LUTs']
+    ]
+
+    LUT = LUTSequence(*LUTs) if header['sequence'] else LUTs[0]
+
+    return (LUT, header['metadata']) if additional_data else LUT
+
+
+def write_LUT_ColourBinary(LUT, path, decimals=None, metadata=None):
+    """
+    Writes given *LUT* to given *Colour* binary *.clut* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT3x1D`, :class:`LUT3D` or
+        :class:`LUTSequence` class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Unused, the tables and domains are written with full precision.
+    metadata : dict, optional
+        *JSON* serialisable metadata written in the header.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the *LUT* sequence contains
+        :class:`colour.io.AbstractLUTSequenceOperator` class instances.
+
+    Examples
+    --------
+    >>> LUT = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'My LUT')
+    >>> write_LUT_ColourBinary(LUT, 'My_LUT.clut')  # doctest: +SKIP
+    """
+
+    is_sequence = isinstance(LUT, LUTSequence)
+    LUTs = LUT.sequence if is_sequence else [LUT]
+
+    for LUT_i in LUTs:
+        if not isinstance(LUT_i, (LUT1D, LUT3x1D, LUT3D)):
+            raise ValueError(
+                '"Colour Binary" LUT format only supports "LUT1D", "LUT3x1D" '
+                'and "LUT3D" class instances, "{0}" was given!'.format(
+                    LUT_i.__class__.__name__))
+
+    arrays = []
+    specifications = []
+    offset = 0
+    for LUT_i in LUTs:
+        specification = {
+            'class': LUT_i.__class__.__name__,
+            'name': LUT_i.name,
+            'comments': list(LUT_i.comments),
+        }
+
+        for key, array in (('table', LUT_i.table), ('domain', LUT_i.domain)):
+            array = np.ascontiguousarray(array)
+            specification[key] = {
+                'dtype': array.dtype.str,
+                'shape': list(array.shape),
+                'offset': offset,
+            }
+            arrays.append((offset, array))
+            offset = _aligned(offset + array.nbytes)
+
+        specifications.append(specification)
+
+    header = json.dumps({
+        'sequence': is_sequence,
+        'LUTs': specifications,
+        'metadata': metadata if metadata is not None else {},
+    }).encode('utf-8')
+
+    preamble = _MAGIC_STRING_COLOUR_BINARY + struct.pack('<I', len(header))
+    data_offset = _aligned(len(preamble) + len(header))
+
+    with open(path, 'wb') as clut_file:
+        clut_file.write(preamble)
+        clut_file.write(header)
+        for offset, array in arrays:
+            clut_file.seek(data_offset + offset)
+            clut_file.write(array.tobytes())
+
+    return True
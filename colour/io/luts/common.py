@@ -9,8 +9,12 @@ category.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import os
 import re
+import warnings
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -19,7 +23,15 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['path_to_title']
+__all__ = ['path_to_title', 'parse_array', 'write_array']
+
+_WRITE_ARRAY_CHUNK_SIZE = 65536
+"""
+Count of rows formatted at once by
+:func:`colour.io.luts.common.write_array` definition.
+
+_WRITE_ARRAY_CHUNK_SIZE : int
+"""
 
 
 def path_to_title(path):
@@ -46,3 +58,68 @@ def path_to_title(path):
     """
 
     return re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
+
+
+def parse_array(lines, size):
+    """
+    Parses given lines of whitespace separated numeric values at once.
+
+    Parameters
+    ----------
+    lines : array_like
+        Lines of whitespace separated numeric values, i.e. a *LUT* file body.
+    size : int
+        Expected count of numeric values.
+
+    Returns
+    -------
+    ndarray or None
+        Parsed numeric values or *None* if given lines do not contain exactly
+        the expected count of numeric values, e.g. because of interleaved
+        comments or keywords, in which case they should be parsed line by
+        line.
+
+    Examples
+    --------
+    >>> parse_array(['0.0 0.5 1.0', '', '1.0 0.5 0.0'], 6)
+    array([ 0. ,  0.5,  1. ,  1. ,  0.5,  0. ])
+    >>> print(parse_array(['0.0 0.5 1.0', '# Comment', '1.0 0.5 0.0'], 6))
+    None
+    """
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+
+        array = np.fromstring(' '.join(lines), DEFAULT_FLOAT_DTYPE, sep=' ')
+
+    return array if array.size == size else None
+
+
+def write_array(file, array, row_format):
+    """
+    Writes given 2-dimensional array to given file, one row per line formatted
+    with given *printf-style* format.
+
+    Parameters
+    ----------
+    file : file
+        File to write the array to.
+    array : array_like
+        2-dimensional array to write.
+    row_format : unicode
+        *printf-style* format of a row.
+
+    Examples
+    --------
+    >>> import sys
+    >>> write_array(sys.stdout, np.array([[0, 0.5, 1]]), '%0.3f %0.3f %0.3f')
+    0.000 0.500 1.000
+    """
+
+    array = np.asarray(array)
+    row_format = '{0}\n'.format(row_format)
+
+    for i in range(0, array.shape[0], _WRITE_ARRAY_CHUNK_SIZE):
+        rows = array[i:i + _WRITE_ARRAY_CHUNK_SIZE]
+
+        file.write(row_format * rows.shape[0] % tuple(rows.ravel().tolist()))
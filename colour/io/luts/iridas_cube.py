@@ -20,7 +20,7 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import parse_array, path_to_title, write_array
 from colour.utilities import as_float_array, usage_warning
 
 __author__ = 'Colour Developers'
@@ -107,7 +107,7 @@ def read_LUT_IridasCube(path):
 
     with open(path) as cube_file:
         lines = cube_file.readlines()
-        for line in lines:
+        for i, line in enumerate(lines):
             line = line.strip()
 
             if len(line) == 0:
@@ -131,6 +131,18 @@ def read_LUT_IridasCube(path):
                 dimensions = 3
                 size = DEFAULT_INT_DTYPE(tokens[1])
             else:
+                # The table data is parsed at once if it is the remainder of
+                # the file, otherwise it is parsed line by line.
+                if len(table) == 0:
+                    table = parse_array(
+                        lines[i:],
+                        (size ** 3 if dimensions == 3 else size) * 3)
+                    if table is not None:
+                        table = table.reshape([-1, 3])
+                        break
+
+                    table = []
+
                 table.append(tokens)
 
     table = as_float_array(table)
@@ -256,7 +268,7 @@ def write_LUT_IridasCube(LUT, path, decimals=7):
         else:
             table = LUT.table
 
-        for row in table:
-            cube_file.write('{0}\n'.format(_format_array(row)))
+        write_array(cube_file, table,
+                    '%0.{0}f %0.{0}f %0.{0}f'.format(decimals))
 
     return True
@@ -14,6 +14,7 @@ Defines the classes and definitions handling *LUT* processing:
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
 import numpy as np
 import re
 from abc import ABCMeta, abstractmethod
@@ -22,6 +23,8 @@ try:
 except ImportError:
     from collections.abc import MutableSequence
 from copy import deepcopy
+from functools import partial
+from multiprocessing.pool import ThreadPool
 # pylint: disable=W0622
 from operator import add, mul, pow, sub, iadd, imul, ipow, isub
 
@@ -35,7 +38,8 @@ except ImportError:
     idiv = itruediv
 from six import add_metaclass
 
-from colour.algebra import LinearInterpolator, table_interpolation_trilinear
+from colour.algebra import (LinearInterpolator, random_triplet_generator,
+                            table_interpolation_trilinear)
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.utilities import (as_float_array, is_numeric, is_iterable,
                               is_string, full, linear_conversion,
@@ -55,6 +59,159 @@ __all__ = [
 ]
 
 
+def _apply_per_chunks(definition, RGB, out=None, chunk_size=None, workers=1):
+    """
+    Applies given definition to given *RGB* colourspace array per chunks of
+    rows, optionally on a thread pool, and writes the result into given output
+    array.
+
+    Parameters
+    ----------
+    definition : callable
+        Definition to apply to the chunks of the *RGB* colourspace array.
+    RGB : array_like
+        *RGB* colourspace array.
+    out : ndarray, optional
+        Output array with the same shape than the *RGB* colourspace array, it
+        can be the *RGB* colourspace array itself. An array is allocated if
+        not given.
+    chunk_size : int, optional
+        Count of rows, i.e. count of elements along the first axis, of the
+        *RGB* colourspace array processed at once. If not given, the *RGB*
+        colourspace array is evenly split among the workers.
+    workers : int, optional
+        Count of threads processing the chunks, if *None*, the count of CPUs
+        is used.
+
+    Returns
+    -------
+    ndarray
+        Processed *RGB* colourspace array.
+
+    Notes
+    -----
+    -   *Numpy* releases the *GIL* during most array operations, thus the
+        chunks are effectively processed concurrently.
+    """
+
+    RGB = as_float_array(RGB)
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    if out is None and chunk_size is None and workers == 1:
+        return definition(RGB)
+
+    if out is None:
+        out = np.empty(RGB.shape, RGB.dtype)
+
+    assert out.shape == RGB.shape, (
+        '"out" array shape must be {0}!'.format(RGB.shape))
+
+    if RGB.ndim < 2:
+        out[...] = definition(RGB)
+
+        return out
+
+    rows = RGB.shape[0]
+    if chunk_size is None:
+        chunk_size = int(np.ceil(rows / workers))
+    chunk_size = max(int(chunk_size), 1)
+
+    chunks = [slice(i, i + chunk_size) for i in range(0, rows, chunk_size)]
+
+    def process_chunk(chunk):
+        """
+        Processes given chunk of the *RGB* colourspace array.
+        """
+
+        out[chunk] = definition(RGB[chunk])
+
+    if workers == 1 or len(chunks) == 1:
+        for chunk in chunks:
+            process_chunk(chunk)
+    else:
+        pool = ThreadPool(min(workers, len(chunks)))
+        try:
+            pool.map(process_chunk, chunks)
+        finally:
+            pool.terminate()
+
+    return out
+
+
+def _table_interpolation_uniform_linear(V_x, domain, table):
+    """
+    Performs linear interpolation of given :math:`V_x` values using given 1D
+    table uniformly sampling given domain, the indexes of the samples are
+    computed arithmetically instead of searched.
+
+    Parameters
+    ----------
+    V_x : array_like
+        :math:`V_x` values to interpolate, the last axis is matched against
+        the table columns if the table is 2D.
+    domain : array_like
+        Domain minimum and maximum, i.e. first and last samples of the table.
+    table : array_like
+        1D table, or 2D table with a column per channel.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_x` values.
+
+    Raises
+    ------
+    ValueError
+        If the :math:`V_x` values are outside the domain, as
+        :class:`colour.LinearInterpolator` class does.
+    """
+
+    V_x = as_float_array(V_x)
+
+    if np.any(V_x < domain[0]):
+        raise ValueError('"{0}" is below interpolation range.'.format(V_x))
+    if np.any(V_x > domain[1]):
+        raise ValueError('"{0}" is above interpolation range.'.format(V_x))
+
+    size = table.shape[0]
+    x = (V_x - domain[0]) * ((size - 1) / (domain[1] - domain[0]))
+
+    i_f = np.clip(np.floor(x), 0, size - 2)
+    r = x - i_f
+    i_f = np.where(np.isnan(i_f), 0, i_f).astype(DEFAULT_INT_DTYPE)
+
+    columns = () if table.ndim == 1 else (np.arange(table.shape[-1]), )
+
+    return ((1 - r) * table[(i_f, ) + columns] +
+            r * table[(i_f + 1, ) + columns])
+
+
+def _interpolation_per_channel(interpolators, RGB):
+    """
+    Interpolates each channel of given *RGB* colourspace array with given
+    interpolators.
+
+    Parameters
+    ----------
+    interpolators : array_like
+        Interpolator of each channel.
+    RGB : array_like
+        *RGB* colourspace array.
+
+    Returns
+    -------
+    ndarray
+        Interpolated *RGB* colourspace array.
+    """
+
+    return tstack([
+        interpolator(a)
+        for interpolator, a in zip(interpolators, tsplit(RGB))
+    ])
+
+
 @add_metaclass(ABCMeta)
 class AbstractLUT:
     """
@@ -128,6 +285,9 @@ class AbstractLUT:
 
         self._dimensions = dimensions
 
+        self._interpolators = {}
+        self._interpolators_state = None
+
         # TODO: Re-enable when dropping Python 2.7.
         # pylint: disable=E1121
         self._table = self.linear_table(size, domain)
@@ -164,6 +324,7 @@ class AbstractLUT:
         if value is not None:
             # pylint: disable=E1121
             self._table = self._validate_table(value)
+            self._interpolators = {}
 
     @property
     def name(self):
@@ -223,6 +384,7 @@ class AbstractLUT:
         if value is not None:
             # pylint: disable=E1121
             self._domain = self._validate_domain(value)
+            self._interpolators = {}
 
     @property
     def dimensions(self):
@@ -692,6 +854,50 @@ class AbstractLUT:
 
         pass
 
+    def _interpolator(self, interpolator, interpolator_kwargs):
+        """
+        Returns the interpolating function of the *LUT* built with given
+        interpolator class type and arguments by the sub-class
+        :meth:`_build_interpolator` method.
+
+        The interpolating function is cached until the *LUT* table or domain
+        are set or mutated in-place, the content of both being compared with
+        the one the cached interpolating functions were built with.
+
+        Parameters
+        ----------
+        interpolator : object
+            Interpolator class type.
+        interpolator_kwargs : dict_like
+            Arguments to use when instantiating the interpolator.
+
+        Returns
+        -------
+        callable
+            Interpolating function.
+        """
+
+        try:
+            key = (interpolator, tuple(sorted(interpolator_kwargs.items())))
+            hash(key)
+        except TypeError:
+            return self._build_interpolator(interpolator, interpolator_kwargs)
+
+        state = (self._table.dtype.str, self._table.shape,
+                 self._table.tobytes(), self._domain.dtype.str,
+                 self._domain.shape, self._domain.tobytes())
+        if state != self._interpolators_state:
+            self._interpolators = {}
+            self._interpolators_state = state
+
+        RGB_interpolator = self._interpolators.get(key)
+        if RGB_interpolator is None:
+            RGB_interpolator = self._build_interpolator(
+                interpolator, interpolator_kwargs)
+            self._interpolators[key] = RGB_interpolator
+
+        return RGB_interpolator
+
     @abstractmethod
     def apply(self, RGB, interpolator, interpolator_kwargs):
         """
@@ -953,7 +1159,7 @@ class LUT1D(AbstractLUT):
         else:
             assert is_numeric(size), 'Linear table size must be a numeric!'
 
-            return np.linspace(domain[0], domain[1], size)
+            return np.linspace(domain[0], domain[1], size, dtype=domain.dtype)
 
     def apply(self,
               RGB,
@@ -997,17 +1203,40 @@ class LUT1D(AbstractLUT):
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
+        return self._interpolator(interpolator, interpolator_kwargs)(RGB)
+
+    def _build_interpolator(self, interpolator, interpolator_kwargs):
+        """
+        Builds the interpolating function of the *LUT* with given interpolator
+        class type and arguments.
+
+        Parameters
+        ----------
+        interpolator : object
+            Interpolator class type.
+        interpolator_kwargs : dict_like
+            Arguments to use when instantiating the interpolator.
+
+        Returns
+        -------
+        callable
+            Interpolating function.
+        """
+
         if self.is_domain_explicit():
             samples = self.domain
         else:
             domain_min, domain_max = self.domain
 
-            samples = np.linspace(domain_min, domain_max, self._table.size)
+            if (interpolator is LinearInterpolator and
+                    not interpolator_kwargs and domain_max > domain_min):
+                return partial(_table_interpolation_uniform_linear,
+                               domain=self.domain,
+                               table=self._table)
 
-        RGB_interpolator = interpolator(samples, self._table,
-                                        **interpolator_kwargs)
+            samples = np.linspace(domain_min, domain_max, self._table.size)
 
-        return RGB_interpolator(RGB)
+        return interpolator(samples, self._table, **interpolator_kwargs)
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -1385,35 +1614,57 @@ class LUT3x1D(AbstractLUT):
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
-        R, G, B = tsplit(RGB)
+        return self._interpolator(interpolator, interpolator_kwargs)(RGB)
+
+    def _build_interpolator(self, interpolator, interpolator_kwargs):
+        """
+        Builds the interpolating function of the *LUT* with given interpolator
+        class type and arguments.
+
+        Parameters
+        ----------
+        interpolator : object
+            Interpolator class type.
+        interpolator_kwargs : dict_like
+            Arguments to use when instantiating the interpolator of each
+            channel.
+
+        Returns
+        -------
+        callable
+            Interpolating function.
+        """
 
         if self.is_domain_explicit():
             samples = [
                 axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
                 for axes in np.transpose(self.domain)
             ]
-            R_t, G_t, B_t = [
+            tables = [
                 axes[:len(samples[i])]
                 for i, axes in enumerate(np.transpose(self._table))
             ]
         else:
             domain_min, domain_max = self.domain
+
+            if (interpolator is LinearInterpolator and
+                    not interpolator_kwargs and
+                    np.all(domain_max > domain_min)):
+                return partial(_table_interpolation_uniform_linear,
+                               domain=self.domain,
+                               table=self._table)
+
             size = DEFAULT_INT_DTYPE(self._table.size / 3)
             samples = [
                 np.linspace(domain_min[i], domain_max[i], size)
                 for i in range(3)
             ]
+            tables = tsplit(self._table)
 
-            R_t, G_t, B_t = tsplit(self._table)
-
-        s_R, s_G, s_B = samples
-
-        RGB_i = [
-            interpolator(a[0], a[1], **interpolator_kwargs)(a[2])
-            for a in zip((s_R, s_G, s_B), (R_t, G_t, B_t), (R, G, B))
-        ]
-
-        return tstack(RGB_i)
+        return partial(_interpolation_per_channel, [
+            interpolator(samples_c, table_c, **interpolator_kwargs)
+            for samples_c, table_c in zip(samples, tables)
+        ])
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -1794,7 +2045,7 @@ class LUT3D(AbstractLUT):
 
             size = np.flip(size, -1)
             samples = [
-                np.linspace(a[0], a[1], size[i])
+                np.linspace(a[0], a[1], size[i], dtype=domain.dtype)
                 for i, a in enumerate([B, G, R])
             ]
 
@@ -1808,6 +2059,9 @@ class LUT3D(AbstractLUT):
               RGB,
               interpolator=table_interpolation_trilinear,
               interpolator_kwargs=None,
+              out=None,
+              chunk_size=None,
+              workers=1,
               **kwargs):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
@@ -1820,6 +2074,17 @@ class LUT3D(AbstractLUT):
             Interpolator object to use as interpolating function.
         interpolator_kwargs : dict_like, optional
             Arguments to use when calling the interpolating function.
+        out : ndarray, optional
+            Output array with the same shape than the *RGB* colourspace array,
+            it can be the *RGB* colourspace array itself for in-place
+            processing. An array is allocated if not given.
+        chunk_size : int, optional
+            Count of rows, i.e. count of elements along the first axis, of the
+            *RGB* colourspace array processed at once, it bounds the size of
+            the intermediate arrays.
+        workers : int, optional
+            Count of threads processing the chunks concurrently, if *None*,
+            the count of CPUs is used.
 
         Other Parameters
         ----------------
@@ -1848,6 +2113,11 @@ class LUT3D(AbstractLUT):
         >>> RGB = np.array([0.18, 0.18, 0.18])
         >>> LUT.apply(RGB)  # doctest: +ELLIPSIS
         array([ 0.2996370..., -0.0901332..., -0.3949770...])
+        >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
+        >>> RGB = np.full((4, 4, 3), 0.18)
+        >>> LUT.apply(RGB, chunk_size=1, workers=2)[0, 0]
+        ... # doctest: +ELLIPSIS
+        array([ 0.4583277...,  0.4583277...,  0.4583277...])
         """
 
         interpolator_kwargs = handle_arguments_deprecation({
@@ -1857,8 +2127,6 @@ class LUT3D(AbstractLUT):
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
-        R, G, B = tsplit(RGB)
-
         if self.is_domain_explicit():
             domain_min = self.domain[0, ...]
             domain_max = [
@@ -1873,12 +2141,20 @@ class LUT3D(AbstractLUT):
         else:
             domain_min, domain_max = self.domain
 
-        RGB_l = [
-            linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
-            for i, j in enumerate((R, G, B))
-        ]
+        def apply_chunk(RGB):
+            """
+            Applies the *LUT* to given chunk of the *RGB* colourspace array.
+            """
+
+            RGB_l = [
+                linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
+                for i, j in enumerate(tsplit(RGB))
+            ]
 
-        return interpolator(tstack(RGB_l), self._table, **interpolator_kwargs)
+            return interpolator(
+                tstack(RGB_l), self._table, **interpolator_kwargs)
+
+        return _apply_per_chunks(apply_chunk, RGB, out, chunk_size, workers)
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -1947,6 +2223,53 @@ class LUT3D(AbstractLUT):
         return LUT_to_LUT(self, cls, force_conversion, **kwargs)
 
 
+def _shaper_samples_and_tables(shaper):
+    """
+    Returns the samples and table of each channel of given 1D shaper *LUT*.
+
+    Parameters
+    ----------
+    shaper : LUT1D or LUT3x1D
+        1D shaper *LUT*.
+
+    Returns
+    -------
+    tuple
+        Samples and table of each channel.
+    """
+
+    if isinstance(shaper, LUT1D):
+        if shaper.is_domain_explicit():
+            samples = shaper.domain
+        else:
+            samples = np.linspace(shaper.domain[0], shaper.domain[1],
+                                  shaper.table.size)
+
+        samples, tables = [samples] * 3, [shaper.table] * 3
+    else:
+        if shaper.is_domain_explicit():
+            samples = [
+                axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
+                for axes in np.transpose(shaper.domain)
+            ]
+            tables = [
+                axes[:len(samples[i])]
+                for i, axes in enumerate(np.transpose(shaper.table))
+            ]
+        else:
+            samples = [
+                np.linspace(shaper.domain[0][i], shaper.domain[1][i],
+                            shaper.table.shape[0]) for i in range(3)
+            ]
+            tables = list(np.transpose(shaper.table))
+
+    for table in tables:
+        assert np.all(np.diff(table) > 0), (
+            '"shaper" table must be strictly increasing!')
+
+    return samples, tables
+
+
 def LUT_to_LUT(LUT, cls, force_conversion=False, **kwargs):
     """
     Converts given *LUT* to given ``cls`` class instance.
@@ -2391,6 +2714,9 @@ class LUTSequence(MutableSequence):
               interpolator_1D_kwargs=None,
               interpolator_3D=table_interpolation_trilinear,
               interpolator_3D_kwargs=None,
+              out=None,
+              chunk_size=None,
+              workers=1,
               **kwargs):
         """
         Applies the *LUT* sequence sequentially to given *RGB* colourspace
@@ -2415,6 +2741,17 @@ class LUTSequence(MutableSequence):
         interpolator_3D_kwargs : dict_like, optional
             Arguments to use when calling the interpolating function for
             :class:`colour.LUT3D` class instances.
+        out : ndarray, optional
+            Output array with the same shape than the *RGB* colourspace array,
+            it can be the *RGB* colourspace array itself for in-place
+            processing. An array is allocated if not given.
+        chunk_size : int, optional
+            Count of rows, i.e. count of elements along the first axis, of the
+            *RGB* colourspace array processed at once by the whole *LUT*
+            sequence, it bounds the size of the intermediate arrays.
+        workers : int, optional
+            Count of threads processing the chunks concurrently, if *None*,
+            the count of CPUs is used.
 
         Other Parameters
         ----------------
@@ -2454,17 +2791,158 @@ class LUTSequence(MutableSequence):
             ]],
         }, **kwargs).get('interpolator_3D_kwargs', interpolator_3D_kwargs)
 
-        for operation in self:
-            if isinstance(operation, (LUT1D, LUT3x1D)):
-                RGB = operation.apply(RGB, interpolator_1D,
-                                      interpolator_1D_kwargs)
-            elif isinstance(operation, LUT3D):
-                RGB = operation.apply(RGB, interpolator_3D,
+        def apply_chunk(RGB):
+            """
+            Applies the *LUT* sequence sequentially to given chunk of the *RGB*
+            colourspace array.
+            """
+
+            for operation in self:
+                if isinstance(operation, (LUT1D, LUT3x1D)):
+                    RGB = operation.apply(RGB, interpolator_1D,
+                                          interpolator_1D_kwargs)
+                elif isinstance(operation, LUT3D):
+                    RGB = operation.apply(RGB, interpolator_3D,
+                                          interpolator_3D_kwargs)
+                else:
+                    RGB = operation.apply(RGB)
+
+            return RGB
+
+        return _apply_per_chunks(apply_chunk, RGB, out, chunk_size, workers)
+
+    def bake(self,
+             size=33,
+             cls=LUT3D,
+             shaper=None,
+             domain=np.array([[0, 0, 0], [1, 1, 1]]),
+             interpolator_1D=LinearInterpolator,
+             interpolator_1D_kwargs=None,
+             interpolator_3D=table_interpolation_trilinear,
+             interpolator_3D_kwargs=None,
+             samples=4096,
+             additional_data=False):
+        """
+        Bakes the *LUT* sequence into a single *LUT* by sampling it on a
+        lattice, optionally preceded by given 1D shaper *LUT*.
+
+        Parameters
+        ----------
+        size : int, optional
+            Size of the baked *LUT*.
+        cls : LUT3x1D or LUT3D, optional
+            Baked *LUT* class type, a :class:`colour.LUT3x1D` class instance
+            can only represent a *LUT* sequence whose channels are processed
+            independently.
+        shaper : LUT1D or LUT3x1D, optional
+            1D shaper *LUT* mapping the input domain, e.g. logarithmic or high
+            dynamic range values, to the baked *LUT* domain. Its table must be
+            strictly increasing so that it can be inverted to sample the *LUT*
+            sequence.
+        domain : array_like, optional
+            Domain of the baked *LUT*, ignored if a shaper *LUT* is given, the
+            baked *LUT* domain is then the shaper *LUT* range.
+        interpolator_1D : object, optional
+            Interpolator object to use as interpolating function for
+            :class:`colour.LUT1D` (and :class:`colour.LUT3x1D`) class
+            instances.
+        interpolator_1D_kwargs : dict_like, optional
+            Arguments to use when calling the interpolating function for
+            :class:`colour.LUT1D` (and :class:`colour.LUT3x1D`) class
+            instances.
+        interpolator_3D : object, optional
+            Interpolator object to use as interpolating function for
+            :class:`colour.LUT3D` class instances.
+        interpolator_3D_kwargs : dict_like, optional
+            Arguments to use when calling the interpolating function for
+            :class:`colour.LUT3D` class instances.
+        samples : int, optional
+            Count of random samples in the input domain used to compute the
+            baking error.
+        additional_data : bool, optional
+            Whether to output the baking error.
+
+        Returns
+        -------
+        LUT3x1D or LUT3D or LUTSequence or tuple
+            Baked *LUT*, preceded by the shaper *LUT* in a *LUT* sequence if
+            given, or baked *LUT* and baking error, i.e. a *dict* with the
+            *mean*, *rms* and *maximum* absolute differences between the
+            baked *LUT* and the *LUT* sequence.
+
+        Examples
+        --------
+        >>> LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125)
+        >>> LUT_2 = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2))
+        >>> LUT_3 = LUT3x1D(LUT3x1D.linear_table(16) * 0.750)
+        >>> LUT_sequence = LUTSequence(LUT_1, LUT_2, LUT_3)
+        >>> LUT, error = LUT_sequence.bake(size=17, additional_data=True)
+        >>> print(LUT.size)
+        17
+        >>> LUT.apply(np.array([0.5, 0.5, 0.5]))  # doctest: +ELLIPSIS
+        array([ 0.6055328...,  0.6055328...,  0.6055328...])
+        >>> error['maximum']  # doctest: +ELLIPSIS
+        0.0022066...
+        """
+
+        assert cls in (LUT3x1D, LUT3D), (
+            '"cls" must be "LUT3x1D" or "LUT3D"!')
+
+        if shaper is not None:
+            assert isinstance(shaper, (LUT1D, LUT3x1D)), (
+                '"shaper" must be an instance of "LUT1D" or "LUT3x1D"!')
+
+            samples_s, tables_s = _shaper_samples_and_tables(shaper)
+            domain_l = np.transpose(
+                [[np.min(table), np.max(table)] for table in tables_s])
+        else:
+            domain_l = as_float_array(domain)
+
+        def to_input_domain(RGB):
+            """
+            Converts given baked *LUT* domain values to the *LUT* sequence
+            input domain by inverting the shaper *LUT*.
+            """
+
+            if shaper is None:
+                return RGB
+
+            return tstack([
+                np.interp(RGB[..., i], tables_s[i], samples_s[i])
+                for i in range(3)
+            ])
+
+        def apply(LUT_sequence, RGB):
+            """
+            Applies given *LUT* sequence to given *RGB* colourspace array.
+            """
+
+            return LUT_sequence.apply(RGB, interpolator_1D,
+                                      interpolator_1D_kwargs, interpolator_3D,
                                       interpolator_3D_kwargs)
-            else:
-                RGB = operation.apply(RGB)
 
-        return RGB
+        LUT = cls(
+            apply(self, to_input_domain(cls.linear_table(size, domain_l))),
+            domain=domain_l)
+
+        LUT_s = LUTSequence(LUT) if shaper is None else LUTSequence(
+            shaper, LUT)
+
+        if not additional_data:
+            return LUT if shaper is None else LUT_s
+
+        limits = np.transpose(domain_l)
+        RGB = to_input_domain(
+            random_triplet_generator(
+                samples, limits, random_state=np.random.RandomState(4)))
+
+        delta = np.abs(apply(LUT_s, RGB) - apply(self, RGB))
+
+        return LUT if shaper is None else LUT_s, {
+            'mean': np.mean(delta),
+            'rms': np.sqrt(np.mean(delta ** 2)),
+            'maximum': np.max(delta),
+        }
 
     def copy(self):
         """
@@ -21,7 +21,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import parse_array, path_to_title, write_array
 from colour.utilities import as_float_array, tstack
 
 __author__ = 'Colour Developers'
@@ -144,7 +144,7 @@ def read_LUT_ResolveCube(path):
     with open(path) as cube_file:
         lines = cube_file.readlines()
         LUT = LUTSequence(LUT3x1D(), LUT3D())
-        for line in lines:
+        for i, line in enumerate(lines):
             line = line.strip()
 
             if len(line) == 0:
@@ -170,6 +170,18 @@ def read_LUT_ResolveCube(path):
                 has_3D = True
                 size_3D = np.int_(tokens[1])
             else:
+                # The table data is parsed at once if it is the remainder of
+                # the file, otherwise it is parsed line by line.
+                if len(table) == 0:
+                    table = parse_array(
+                        lines[i:], (size_3x1D * 3 if has_3x1D else 0) +
+                        (size_3D ** 3 * 3 if has_3D else 0))
+                    if table is not None:
+                        table = table.reshape([-1, 3])
+                        break
+
+                    table = []
+
                 table.append(tokens)
 
     table = as_float_array(table)
@@ -313,13 +325,6 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
     if has_3D:
         assert 2 <= LUT[1].size <= 256, 'Cube size must be in domain [2, 256]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Resolve* *.cube* data row.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f} {3:0.{0}f}'.format(decimals, *array)
-
     def _format_tuple(array):
         """
         Formats given array as 2 space separated values to *decimals*
@@ -355,15 +360,14 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
                 cube_file.write('LUT_3D_INPUT_RANGE {0}\n'.format(
                     _format_tuple([LUT[1].domain[0][0], LUT[1].domain[1][0]])))
 
+        row_format = '%0.{0}f %0.{0}f %0.{0}f'.format(decimals)
+
         if has_3x1D:
-            table = LUT[0].table
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            write_array(cube_file, LUT[0].table, row_format)
             cube_file.write('\n')
 
         if has_3D:
-            table = LUT[1].table.reshape([-1, 3], order='F')
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            write_array(cube_file, LUT[1].table.reshape([-1, 3], order='F'),
+                        row_format)
 
     return True
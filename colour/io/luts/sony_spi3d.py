@@ -15,7 +15,7 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import parse_array, path_to_title, write_array
 from colour.utilities import as_int_array, usage_warning, as_float_array
 
 __author__ = 'Colour Developers'
@@ -81,8 +81,13 @@ def read_LUT_SonySPI3D(path):
     comments = []
 
     with open(path) as spi3d_file:
-        lines = filter(None, (line.strip() for line in spi3d_file.readlines()))
-        for line in lines:
+        lines = spi3d_file.readlines()
+        for i, line in enumerate(lines):
+            line = line.strip()
+
+            if len(line) == 0:
+                continue
+
             if line.startswith('#'):
                 comments.append(line[1:].strip())
                 continue
@@ -94,6 +99,23 @@ def read_LUT_SonySPI3D(path):
 
                 size = DEFAULT_INT_DTYPE(tokens[0])
             if len(tokens) == 6:
+                # The table data is parsed at once if it is only followed by
+                # comments, otherwise it is parsed line by line.
+                if len(table) == 0:
+                    j = len(lines)
+                    while j > i and lines[j - 1].strip()[:1] in ('', '#'):
+                        j -= 1
+
+                    array = parse_array(lines[i:j], size ** 3 * 6)
+                    if array is not None:
+                        array = array.reshape([-1, 6])
+                        indexes, table = array[:, :3], array[:, 3:]
+                        comments.extend([
+                            comment.strip()[1:].strip()
+                            for comment in lines[j:] if comment.strip()
+                        ])
+                        break
+
                 indexes.append(as_int_array(tokens[:3]))
                 table.append(as_float_array(tokens[3:]))
 
@@ -164,14 +186,6 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
         [1, 1, 1],
     ])), '"LUT" domain must be [[0, 0, 0], [1, 1, 1]]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Sony* *.spi3d* data row.
-        """
-
-        return '{1:d} {2:d} {3:d} {4:0.{0}f} {5:0.{0}f} {6:0.{0}f}'.format(
-            decimals, *array)
-
     with open(path, 'w') as spi3d_file:
         spi3d_file.write('SPILUT 1.0\n')
 
@@ -184,9 +198,9 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
                 [-1, 3])
         table = LUT.table.reshape([-1, 3])
 
-        for i, row in enumerate(indexes):
-            spi3d_file.write('{0}\n'.format(
-                _format_array(list(row) + list(table[i]))))
+        write_array(
+            spi3d_file, np.hstack([indexes, table]),
+            '%d %d %d %0.{0}f %0.{0}f %0.{0}f'.format(decimals))
 
         if LUT.comments:
             for comment in LUT.comments:
@@ -11,7 +11,8 @@ import shutil
 import tempfile
 import unittest
 
-from colour.io import LUTSequence, read_LUT, write_LUT
+from colour.io import (LUTSequence, read_LUT, read_LUT_ColourBinary,
+                       write_LUT)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -20,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['LUTS_DIRECTORY', 'TestReadLUT', 'TestWriteLUT']
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUT', 'TestReadLUTCache', 'TestWriteLUT']
 
 LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
 
@@ -93,6 +94,91 @@ class TestReadLUT(unittest.TestCase):
                          'Exception_Raising.spi1d'))
 
 
+class TestReadLUTCache(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.__init__.read_LUT` definition unit tests
+    methods with sidecar cache.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUT_cache(self):
+        """
+        Tests :func:`colour.io.luts.__init__.read_LUT` definition with sidecar
+        cache.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LogC_Video.cube')
+        shutil.copyfile(
+            os.path.join(LUTS_DIRECTORY, 'resolve_cube', 'LogC_Video.cube'),
+            path)
+
+        LUT_r = read_LUT(path)
+
+        LUT_t = read_LUT(path, cache=True)
+        self.assertEqual(LUT_r, LUT_t)
+        self.assertTrue(os.path.exists('{0}.clut'.format(path)))
+
+        LUT_t = read_LUT(path, cache=True)
+        self.assertEqual(LUT_r, LUT_t)
+        self.assertIsInstance(LUT_t[1].table.base, np.memmap)
+
+        # Modification time change with unchanged content.
+        os.utime(path, (0, 0))
+        LUT_t = read_LUT(path, cache=True)
+        self.assertIsInstance(LUT_t[1].table.base, np.memmap)
+        self.assertEqual(
+            read_LUT_ColourBinary('{0}.clut'.format(path),
+                                  True)[1]['source']['mtime'],
+            os.stat(path).st_mtime)
+
+        # Damaged cache file.
+        with open('{0}.clut'.format(path), 'rb') as clut_file:
+            data = clut_file.read()
+
+        for size in (8, len(data) // 2):
+            with open('{0}.clut'.format(path), 'wb') as clut_file:
+                clut_file.write(data[:size])
+
+            self.assertEqual(read_LUT(path, cache=True), LUT_r)
+            LUT_t = read_LUT(path, cache=True)
+            self.assertIsInstance(LUT_t[1].table.base, np.memmap)
+
+        # Content change.
+        LUT_r[1].table = LUT_r[1].table * 0.5
+        write_LUT(LUT_r, path)
+        LUT_r = read_LUT(path)
+        LUT_t = read_LUT(path, cache=True)
+        self.assertEqual(LUT_r, LUT_t)
+        self.assertNotIsInstance(LUT_t[1].table.base, np.memmap)
+        self.assertEqual(read_LUT(path, cache=True), LUT_r)
+
+        # Reading method change.
+        LUT_t = read_LUT(path, 'Resolve Cube', cache=True)
+        self.assertNotIsInstance(LUT_t[1].table.base, np.memmap)
+        LUT_t = read_LUT(path, 'Resolve Cube', cache=True)
+        self.assertIsInstance(LUT_t[1].table.base, np.memmap)
+        LUT_t = read_LUT(path, 'Iridas Cube', cache=True)
+        self.assertNotIsInstance(LUT_t[1].table.base, np.memmap)
+
+        cache_directory = os.path.join(self._temporary_directory, 'cache')
+        os.makedirs(cache_directory)
+        self.assertEqual(read_LUT(path, cache=cache_directory), LUT_r)
+        self.assertEqual(len(os.listdir(cache_directory)), 1)
+
+
 class TestWriteLUT(unittest.TestCase):
     """
     Defines :func:`colour.io.luts.__init__.write_LUT` definition unit tests
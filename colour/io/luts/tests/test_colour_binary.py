@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.colour_binary` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
+                       LUTSequence, read_LUT_ColourBinary,
+                       read_LUT_ResolveCube, write_LUT_ColourBinary)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'LUTS_DIRECTORY', 'TestReadLUTColourBinary', 'TestWriteLUTColourBinary'
+]
+
+LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.clut')
+        LUT_r = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY, 'resolve_cube',
+                         'Three_Dimensional_Table_With_Shaper.cube'))
+        write_LUT_ColourBinary(LUT_r, path, metadata={'a': 1})
+
+        LUT_t, metadata = read_LUT_ColourBinary(path, additional_data=True)
+        self.assertEqual(LUT_r, LUT_t)
+        self.assertDictEqual(metadata, {'a': 1})
+        self.assertListEqual(LUT_r[1].comments, LUT_t[1].comments)
+
+        # Tables are memory-mapped in copy-on-write mode.
+        self.assertIsInstance(LUT_t[1].table.base, np.memmap)
+        LUT_t[1].table += 1
+        self.assertEqual(read_LUT_ColourBinary(path), LUT_r)
+
+    def test_raise_exception_read_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError, read_LUT_ColourBinary,
+            os.path.join(LUTS_DIRECTORY, 'resolve_cube',
+                         'Colour_Correct.cube'))
+
+        path = os.path.join(self._temporary_directory, 'LUT.clut')
+        write_LUT_ColourBinary(
+            read_LUT_ResolveCube(
+                os.path.join(LUTS_DIRECTORY, 'resolve_cube',
+                             'Three_Dimensional_Table_With_Shaper.cube')),
+            path)
+        with open(path, 'rb') as clut_file:
+            data = clut_file.read()
+
+        for size in (8, 12, 200, len(data) - 1):
+            with open(path, 'wb') as clut_file:
+                clut_file.write(data[:size])
+
+            self.assertRaises(ValueError, read_LUT_ColourBinary, path)
+
+
+class TestWriteLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.clut')
+
+        for LUT_r in (LUT1D(
+                LUT1D.linear_table(16) ** (1 / 2.2),
+                'Nemo 1D',
+                comments=['A comment.']),
+                      LUT3x1D(
+                          domain=np.array([[0, 0, 0], [1, 2, 3]]),
+                          name='Nemo 3x1D'),
+                      LUT3D(
+                          LUT3D.linear_table(np.array([2, 3, 4])),
+                          'Nemo 3D'),
+                      LUT1D(
+                          np.linspace(0, 1, 5) ** 2,
+                          'Nemo 1D Explicit',
+                          domain=np.linspace(0, 1, 5)),
+                      LUTSequence(LUT1D(), LUT3D(), LUT3x1D())):
+            self.assertTrue(write_LUT_ColourBinary(LUT_r, path))
+
+            LUT_t = read_LUT_ColourBinary(path)
+            self.assertEqual(LUT_r, LUT_t)
+            self.assertEqual(str(LUT_r), str(LUT_t))
+
+    def test_raise_exception_write_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+        definition raised exception.
+        """
+
+        class GammaOperator(AbstractLUTSequenceOperator):
+            """
+            Gamma operator for unit tests.
+            """
+
+            def apply(self, RGB, *args):
+                """
+                Applies the *LUT* sequence operator to given *RGB* colourspace
+                array.
+                """
+
+                return RGB ** 2.2
+
+        self.assertRaises(
+            ValueError, write_LUT_ColourBinary,
+            LUTSequence(LUT3D(), GammaOperator()),
+            os.path.join(self._temporary_directory, 'LUT.clut'))
+
+
+if __name__ == '__main__':
+    unittest.main()
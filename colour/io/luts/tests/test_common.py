@@ -5,9 +5,11 @@ Defines unit tests for :mod:`colour.io.luts.common` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
+from six import StringIO
 
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import parse_array, path_to_title, write_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -16,7 +18,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestPathToTitle']
+__all__ = ['TestPathToTitle', 'TestParseArray', 'TestWriteArray']
 
 
 class TestPathToTitle(unittest.TestCase):
@@ -36,5 +38,48 @@ class TestPathToTitle(unittest.TestCase):
             'RGB 1 0 5 0 25')
 
 
+class TestParseArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.parse_array` definition unit tests
+    methods.
+    """
+
+    def test_parse_array(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_array` definition.
+        """
+
+        lines = ['0.0 0.5 1.0\n', '\n', '\t1e-3 -2 nan  \n']
+
+        np.testing.assert_equal(
+            parse_array(lines, 6), np.array([0, 0.5, 1, 0.001, -2, np.nan]))
+
+        self.assertIsNone(parse_array(lines, 9))
+        self.assertIsNone(parse_array(lines[:1] + ['# Comment'] + lines, 12))
+        self.assertIsNone(parse_array(lines + ['LUT_3D_SIZE 2'], 8))
+
+
+class TestWriteArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.write_array` definition unit tests
+    methods.
+    """
+
+    def test_write_array(self):
+        """
+        Tests :func:`colour.io.luts.common.write_array` definition.
+        """
+
+        array = np.array([[0, 1, 0.123456789], [1, 2, -0.5]])
+
+        file = StringIO()
+        write_array(file, array, '%d %d %0.7f')
+        self.assertEqual(file.getvalue(), '0 1 0.1234568\n1 2 -0.5000000\n')
+
+        file = StringIO()
+        write_array(file, array[:0], '%d %d %0.7f')
+        self.assertEqual(file.getvalue(), '')
+
+
 if __name__ == '__main__':
     unittest.main()
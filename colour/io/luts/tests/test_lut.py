@@ -15,7 +15,7 @@ from colour.io.luts.lut import AbstractLUT
 from colour.io.luts import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
                             LUTSequence, LUT_to_LUT)
 from colour.models import gamma_function
-from colour.utilities import tsplit, tstack
+from colour.utilities import float_precision, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -490,6 +490,77 @@ class TestLUT(unittest.TestCase):
         np.testing.assert_almost_equal(
             LUT_3.apply(RANDOM_TRIPLETS), self._applied_3, decimal=7)
 
+    def test_apply_interpolator_cache(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.apply` and
+        :class:`colour.io.luts.lut.LUT3x1D.apply` methods interpolators
+        caching.
+        """
+
+        if self._LUT_factory not in (LUT1D, LUT3x1D):
+            return
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(self._table_2, domain=self._domain_2)
+        RGB = self._domain_2[0] + RANDOM_TRIPLETS * (
+            self._domain_2[1] - self._domain_2[0])
+
+        # Uniform grid fast path against the searching interpolator.
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB),
+            LUT.apply(RGB, interpolator_kwargs={'dtype': np.float64}),
+            decimal=7)
+        self.assertEqual(len(LUT._interpolators), 2)
+
+        RGB_o = LUT.apply(RGB)
+        LUT.table = LUT.table * 2
+        self.assertEqual(len(LUT._interpolators), 0)
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB), RGB_o * 2, decimal=7)
+
+        LUT.domain = self._domain_1
+        self.assertEqual(len(LUT._interpolators), 0)
+
+        self.assertRaises(ValueError, LUT.apply, RGB + 10)
+
+        # In-place mutation of the table.
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(self._table_2, domain=self._domain_2)
+        interpolator_kwargs = {'dtype': np.float64}
+        RGB_o = LUT.apply(RGB, interpolator_kwargs=interpolator_kwargs)
+        LUT.table[...] *= 0.5
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB, interpolator_kwargs=interpolator_kwargs),
+            RGB_o * 0.5,
+            decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB, interpolator_kwargs=interpolator_kwargs),
+            LUT.apply(RGB),
+            decimal=7)
+
+    def test_apply_float_precision(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.apply`,
+        :class:`colour.io.luts.lut.LUT3x1D.apply` and
+        :class:`colour.io.luts.lut.LUT3D.apply` methods single float
+        precision support.
+        """
+
+        if self._LUT_factory is None:
+            return
+
+        # pylint: disable=E1102
+        RGB = self._LUT_factory(self._table_1).apply(RANDOM_TRIPLETS)
+
+        with float_precision(np.float32):
+            # pylint: disable=E1102
+            LUT = self._LUT_factory(self._table_1)
+            RGB_f = LUT.apply(RANDOM_TRIPLETS.astype(np.float32))
+
+        self.assertEqual(LUT.table.dtype, np.float32)
+        self.assertEqual(RGB_f.dtype, np.float32)
+        np.testing.assert_allclose(RGB_f, RGB, rtol=1e-5, atol=1e-6)
+
     def test_copy(self):
         """
         Tests :class:`colour.io.luts.lut.LUT1D.copy`,
@@ -775,6 +846,35 @@ class TestLUT3D(TestLUT):
              [0.02408419, 0.81991814, 0.94597809]],
         ])
 
+    def test_apply_chunks(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT3D.apply` method with chunks,
+        workers and output array.
+        """
+
+        LUT = LUT3D(self._table_2)
+
+        for chunk_size, workers in ((1, 1), (3, 1), (1, 4), (None, 3),
+                                    (None, None)):
+            np.testing.assert_almost_equal(
+                LUT.apply(
+                    RANDOM_TRIPLETS, chunk_size=chunk_size, workers=workers),
+                self._applied_1,
+                decimal=7)
+
+        out = np.zeros(RANDOM_TRIPLETS.shape)
+        self.assertIs(LUT.apply(RANDOM_TRIPLETS, out=out, workers=2), out)
+        np.testing.assert_almost_equal(out, self._applied_1, decimal=7)
+
+        RGB = np.copy(RANDOM_TRIPLETS)
+        LUT.apply(RGB, out=RGB, chunk_size=1)
+        np.testing.assert_almost_equal(RGB, self._applied_1, decimal=7)
+
+        np.testing.assert_almost_equal(
+            LUT.apply(RANDOM_TRIPLETS[0, 0], chunk_size=1),
+            self._applied_1[0, 0],
+            decimal=7)
+
 
 class TestAbstractLUTSequenceOperator(unittest.TestCase):
     """
@@ -829,7 +929,7 @@ class TestLUTSequence(unittest.TestCase):
 
         required_methods = ('__getitem__', '__setitem__', '__delitem__',
                             '__len__', '__str__', '__repr__', '__eq__',
-                            '__ne__', 'insert', 'apply', 'copy')
+                            '__ne__', 'insert', 'apply', 'bake', 'copy')
 
         for method in required_methods:
             self.assertIn(method, dir(LUTSequence))
@@ -1223,6 +1323,52 @@ class TestLUTSequence(unittest.TestCase):
                 [0.75000000, 0.75000000, 0.75000000],
             ]))
 
+        np.testing.assert_almost_equal(
+            LUT_sequence.apply(RGB, chunk_size=2, workers=2),
+            LUT_sequence.apply(RGB),
+            decimal=7)
+
+        out = np.zeros(RGB.shape)
+        self.assertIs(LUT_sequence.apply(RGB, out=out, chunk_size=1), out)
+        np.testing.assert_almost_equal(
+            out, LUT_sequence.apply(RGB), decimal=7)
+
+    def test_bake(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.bake` method.
+        """
+
+        LUT = self._LUT_sequence.bake(16)
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertEqual(LUT.size, 16)
+
+        RGB = LUT3D.linear_table(16)
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB), self._LUT_sequence.apply(RGB), decimal=7)
+
+        LUT, error = self._LUT_sequence.bake(
+            33, cls=LUT3x1D, additional_data=True)
+        self.assertIsInstance(LUT, LUT3x1D)
+        self.assertListEqual(
+            sorted(error.keys()), ['maximum', 'mean', 'rms'])
+        self.assertLess(error['maximum'], 0.005)
+        self.assertLessEqual(error['mean'], error['rms'])
+        self.assertLessEqual(error['rms'], error['maximum'])
+
+        samples = 2 ** np.linspace(-8, 4, 64)
+        shaper = LUT1D((np.log2(samples) + 8) / 12, domain=samples)
+        LUT_sequence = LUTSequence(
+            LUT3x1D(
+                LUT3x1D.linear_table(256, np.array([[0, 0, 0], [16, 16, 16]]))
+                / 16,
+                domain=np.array([[0, 0, 0], [16, 16, 16]])), self._LUT_2)
+
+        LUT, error = LUT_sequence.bake(33, shaper=shaper, additional_data=True)
+        self.assertIsInstance(LUT, LUTSequence)
+        self.assertIs(LUT[0], shaper)
+        self.assertIsInstance(LUT[1], LUT3D)
+        self.assertLess(error['maximum'], 0.01)
+
 
 class TestLUT_to_LUT(unittest.TestCase):
     """
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.hyperspectral` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.colorimetry import (SDS_ILLUMINANTS, SpectralShape,
+                                TristimulusIntegrator)
+from colour.io import (read_hyperspectral_cube, hyperspectral_cube_to_XYZ,
+                       hyperspectral_cube_to_RGB)
+from colour.models import RGB_COLOURSPACES, XYZ_to_RGB
+from colour.utilities import domain_range_scale
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'CUBE', 'TestReadHyperspectralCube', 'TestHyperspectralCubeToXYZ',
+    'TestHyperspectralCubeToRGB'
+]
+
+CUBE = np.random.RandomState(4).random_sample((7, 5, 16))
+
+INTEGRATOR = TristimulusIntegrator(
+    SpectralShape(400, 700, 20), illuminant=SDS_ILLUMINANTS['D65'])
+
+
+class TestReadHyperspectralCube(unittest.TestCase):
+    """
+    Defines :func:`colour.io.hyperspectral.read_hyperspectral_cube`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_hyperspectral_cube(self):
+        """
+        Tests :func:`colour.io.hyperspectral.read_hyperspectral_cube`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'cube.npy')
+        np.save(path, CUBE)
+        cube = read_hyperspectral_cube(path)
+        self.assertIsInstance(cube, np.memmap)
+        np.testing.assert_equal(cube, CUBE)
+
+        path = os.path.join(self._temporary_directory, 'cube.raw')
+        with open(path, 'wb') as raw_file:
+            raw_file.write(b'\x00' * 8)
+            raw_file.write(CUBE.astype(np.float32).tobytes())
+
+        cube = read_hyperspectral_cube(path, CUBE.shape, offset=8)
+        self.assertIsInstance(cube, np.memmap)
+        np.testing.assert_equal(cube, CUBE.astype(np.float32))
+
+
+class TestHyperspectralCubeToXYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.io.hyperspectral.hyperspectral_cube_to_XYZ`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_hyperspectral_cube_to_XYZ(self):
+        """
+        Tests :func:`colour.io.hyperspectral.hyperspectral_cube_to_XYZ`
+        definition.
+        """
+
+        XYZ = INTEGRATOR(CUBE)
+
+        for tile_size in (1, 2, 3, (4, 2), 256):
+            np.testing.assert_almost_equal(
+                hyperspectral_cube_to_XYZ(
+                    CUBE, INTEGRATOR, tile_size=tile_size),
+                XYZ,
+                decimal=7)
+
+        output = np.zeros(XYZ.shape)
+        self.assertIs(
+            hyperspectral_cube_to_XYZ(
+                CUBE, INTEGRATOR, output=output, tile_size=3), output)
+        np.testing.assert_almost_equal(output, XYZ, decimal=7)
+
+        self.assertEqual(
+            hyperspectral_cube_to_XYZ(CUBE.astype(np.float32),
+                                      INTEGRATOR).dtype, np.float32)
+
+    def test_hyperspectral_cube_to_XYZ_memmap(self):
+        """
+        Tests :func:`colour.io.hyperspectral.hyperspectral_cube_to_XYZ`
+        definition with memory-mapped input and output.
+        """
+
+        cube_path = os.path.join(self._temporary_directory, 'cube.npy')
+        XYZ_path = os.path.join(self._temporary_directory, 'XYZ.npy')
+        np.save(cube_path, CUBE)
+
+        hyperspectral_cube_to_XYZ(
+            cube_path, INTEGRATOR, output=XYZ_path, tile_size=2)
+
+        np.testing.assert_almost_equal(
+            np.load(XYZ_path), INTEGRATOR(CUBE), decimal=7)
+
+
+class TestHyperspectralCubeToRGB(unittest.TestCase):
+    """
+    Defines :func:`colour.io.hyperspectral.hyperspectral_cube_to_RGB`
+    definition unit tests methods.
+    """
+
+    def test_hyperspectral_cube_to_RGB(self):
+        """
+        Tests :func:`colour.io.hyperspectral.hyperspectral_cube_to_RGB`
+        definition.
+        """
+
+        colourspace = RGB_COLOURSPACES['ACEScg']
+        illuminant = RGB_COLOURSPACES['sRGB'].whitepoint
+
+        with domain_range_scale('1'):
+            RGB = XYZ_to_RGB(
+                INTEGRATOR(CUBE), illuminant, colourspace.whitepoint,
+                colourspace.XYZ_to_RGB_matrix, 'Bradford')
+
+        np.testing.assert_almost_equal(
+            hyperspectral_cube_to_RGB(
+                CUBE,
+                INTEGRATOR,
+                colourspace,
+                illuminant,
+                'Bradford',
+                tile_size=(3, 2)),
+            RGB,
+            decimal=7)
+
+        colourspace = RGB_COLOURSPACES['sRGB']
+        with domain_range_scale('1'):
+            RGB = XYZ_to_RGB(
+                INTEGRATOR(CUBE), colourspace.whitepoint,
+                colourspace.whitepoint, colourspace.XYZ_to_RGB_matrix,
+                cctf_encoding=colourspace.cctf_encoding)
+
+        np.testing.assert_almost_equal(
+            hyperspectral_cube_to_RGB(
+                CUBE,
+                INTEGRATOR,
+                colourspace,
+                apply_cctf_encoding=True,
+                tile_size=4),
+            RGB,
+            decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -38,7 +38,8 @@ __all__ = ['XYZ_to_Lab', 'Lab_to_XYZ', 'Lab_to_LCHab', 'LCHab_to_Lab']
 
 def XYZ_to_Lab(XYZ,
                illuminant=CCS_ILLUMINANTS[
-                   'CIE 1931 2 Degree Standard Observer']['D65']):
+                   'CIE 1931 2 Degree Standard Observer']['D65'],
+               out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE L\\*a\\*b\\**
     colourspace.
@@ -50,6 +51,10 @@ def XYZ_to_Lab(XYZ,
     illuminant : array_like, optional
         Reference *illuminant* *CIE xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Output array with the same shape than the *CIE XYZ* tristimulus values
+        array, it can be the *CIE XYZ* tristimulus values array itself for
+        in-place processing. An array is allocated if not given.
 
     Returns
     -------
@@ -101,14 +106,15 @@ def XYZ_to_Lab(XYZ,
     a = 500 * (f_X_X_n - f_Y_Y_n)
     b = 200 * (f_Y_Y_n - f_Z_Z_n)
 
-    Lab = tstack([L, a, b])
+    Lab = tstack([L, a, b], out=out)
 
     return from_range_100(Lab)
 
 
 def Lab_to_XYZ(Lab,
                illuminant=CCS_ILLUMINANTS[
-                   'CIE 1931 2 Degree Standard Observer']['D65']):
+                   'CIE 1931 2 Degree Standard Observer']['D65'],
+               out=None):
     """
     Converts from *CIE L\\*a\\*b\\** colourspace to *CIE XYZ* tristimulus
     values.
@@ -120,6 +126,11 @@ def Lab_to_XYZ(Lab,
     illuminant : array_like, optional
         Reference *illuminant* *CIE xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Output array with the same shape than the *CIE L\\*a\\*b\\**
+        colourspace array, it can be the *CIE L\\*a\\*b\\** colourspace
+        array itself for in-place processing. An array is allocated if not
+        given.
 
     Returns
     -------
@@ -171,7 +182,7 @@ def Lab_to_XYZ(Lab,
     Y = intermediate_luminance_function_CIE1976(f_Y_Y_n, Y_n)
     Z = intermediate_luminance_function_CIE1976(f_Z_Z_n, Z_n)
 
-    XYZ = tstack([X, Y, Z])
+    XYZ = tstack([X, Y, Z], out=out)
 
     return from_range_1(XYZ)
 
@@ -33,9 +33,11 @@ from colour.models import xy_to_XYZ, xy_to_xyY, xyY_to_XYZ
 from colour.models.rgb import (chromatically_adapted_primaries,
                                normalised_primary_matrix)
 from colour.adaptation import chromatic_adaptation_matrix_VonKries
-from colour.utilities import (as_float_array, domain_range_scale, dot_matrix,
-                              dot_vector, filter_kwargs, from_range_1,
-                              to_domain_1, is_string, usage_warning)
+from colour.utilities import (CACHE_REGISTRY, as_float_array,
+                              domain_range_scale, dot_matrix, dot_vector,
+                              filter_kwargs, from_range_1,
+                              get_domain_range_scale, to_domain_1, is_string,
+                              usage_warning)
 from colour.utilities.deprecation import (ObjectRenamed,
                                           handle_arguments_deprecation)
 
@@ -51,6 +53,142 @@ __all__ = [
     'RGB_to_RGB'
 ]
 
+_CACHE_MATRIX_XYZ_TO_RGB = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MATRIX_XYZ_TO_RGB'.format(__name__), maximum_size=256)
+
+_CACHE_MATRIX_RGB_TO_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MATRIX_RGB_TO_XYZ'.format(__name__), maximum_size=256)
+
+_CACHE_MATRIX_RGB_TO_RGB = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MATRIX_RGB_TO_RGB'.format(__name__), maximum_size=256)
+
+
+def _matrix_hash_key(*args):
+    """
+    Returns a hash key for given matrices, whitepoints and chromatic adaptation
+    transform used to retrieve the cached conversion matrices.
+
+    The arrays are keyed on their content so that modifying a
+    :class:`colour.RGB_Colourspace` class instance in-place does not return
+    stale matrices.
+
+    Other Parameters
+    ----------------
+    \\*args : list, optional
+        Arguments to key.
+
+    Returns
+    -------
+    tuple
+        Hash key.
+    """
+
+    hash_key = [get_domain_range_scale()]
+    for arg in args:
+        if is_string(arg) or arg is None:
+            hash_key.append(arg)
+        else:
+            arg = as_float_array(arg)
+            hash_key.append((arg.dtype.str, arg.shape, arg.tobytes()))
+
+    return tuple(hash_key)
+
+
+def _XYZ_to_RGB_matrix(illuminant_XYZ, illuminant_RGB, XYZ_to_RGB_matrix,
+                       chromatic_adaptation_transform):
+    """
+    Computes the matrix converting from *CIE XYZ* tristimulus values to *RGB*
+    colourspace array, i.e. the product of given *Normalised primary matrix*
+    and of the chromatic adaptation matrix if required.
+
+    Parameters
+    ----------
+    illuminant_XYZ : array_like
+        *CIE xy* chromaticity coordinates or *CIE xyY* colourspace array of the
+        *illuminant* for the input *CIE XYZ* tristimulus values.
+    illuminant_RGB : array_like
+        *CIE xy* chromaticity coordinates or *CIE xyY* colourspace array of the
+        *illuminant* for the output *RGB* colourspace array.
+    XYZ_to_RGB_matrix : array_like
+        *Normalised primary matrix*.
+    chromatic_adaptation_transform : unicode
+        *Chromatic adaptation* transform, if *None* no chromatic adaptation is
+        performed.
+
+    Returns
+    -------
+    ndarray
+        Conversion matrix, it is cached and must not be modified.
+    """
+
+    M = as_float_array(XYZ_to_RGB_matrix)
+
+    if chromatic_adaptation_transform is None:
+        return M
+
+    hash_key = _matrix_hash_key(illuminant_XYZ, illuminant_RGB, M,
+                                chromatic_adaptation_transform)
+    M_c = _CACHE_MATRIX_XYZ_TO_RGB.get(hash_key)
+    if M_c is not None:
+        return M_c
+
+    M_CAT = chromatic_adaptation_matrix_VonKries(
+        xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
+        xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
+        transform=chromatic_adaptation_transform)
+
+    M = _CACHE_MATRIX_XYZ_TO_RGB[hash_key] = dot_matrix(M, M_CAT)
+
+    return M
+
+
+def _RGB_to_XYZ_matrix(illuminant_RGB, illuminant_XYZ, RGB_to_XYZ_matrix,
+                       chromatic_adaptation_transform):
+    """
+    Computes the matrix converting from *RGB* colourspace array to *CIE XYZ*
+    tristimulus values, i.e. the product of the chromatic adaptation matrix if
+    required and of given *Normalised primary matrix*.
+
+    Parameters
+    ----------
+    illuminant_RGB : array_like
+        *CIE xy* chromaticity coordinates or *CIE xyY* colourspace array of the
+        *illuminant* for the input *RGB* colourspace array.
+    illuminant_XYZ : array_like
+        *CIE xy* chromaticity coordinates or *CIE xyY* colourspace array of the
+        *illuminant* for the output *CIE XYZ* tristimulus values.
+    RGB_to_XYZ_matrix : array_like
+        *Normalised primary matrix*.
+    chromatic_adaptation_transform : unicode
+        *Chromatic adaptation* transform, if *None* no chromatic adaptation is
+        performed.
+
+    Returns
+    -------
+    ndarray
+        Conversion matrix, it is cached and must not be modified.
+    """
+
+    M = as_float_array(RGB_to_XYZ_matrix)
+
+    if chromatic_adaptation_transform is None:
+        return M
+
+    hash_key = _matrix_hash_key(illuminant_RGB, illuminant_XYZ, M,
+                                chromatic_adaptation_transform)
+    M_c = _CACHE_MATRIX_RGB_TO_XYZ.get(hash_key)
+    if M_c is not None:
+        return M_c
+
+    M_CAT = chromatic_adaptation_matrix_VonKries(
+        xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
+        xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
+        transform=chromatic_adaptation_transform)
+
+    M = _CACHE_MATRIX_RGB_TO_XYZ[hash_key] = dot_matrix(M_CAT, M)
+
+    return M
+
 
 class RGB_Colourspace(object):
     """
@@ -906,6 +1044,7 @@ def XYZ_to_RGB(XYZ,
                XYZ_to_RGB_matrix,
                chromatic_adaptation_transform='CAT02',
                cctf_encoding=None,
+               out=None,
                **kwargs):
     """
     Converts from *CIE XYZ* tristimulus values to *RGB* colourspace array.
@@ -931,6 +1070,10 @@ def XYZ_to_RGB(XYZ,
     cctf_encoding : object, optional
         Encoding colour component transfer function (Encoding CCTF) or
         opto-electronic transfer function (OETF / OECF).
+    out : ndarray, optional
+        Output array with the same shape than the *CIE XYZ* tristimulus values
+        array, it can be the *CIE XYZ* tristimulus values array itself for
+        in-place processing. An array is allocated if not given.
 
     Other Parameters
     ----------------
@@ -983,20 +1126,19 @@ def XYZ_to_RGB(XYZ,
 
     XYZ = to_domain_1(XYZ)
 
-    if chromatic_adaptation_transform is not None:
-        M_CAT = chromatic_adaptation_matrix_VonKries(
-            xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
-            xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
-            transform=chromatic_adaptation_transform)
-
-        XYZ = dot_vector(M_CAT, XYZ)
+    M = _XYZ_to_RGB_matrix(illuminant_XYZ, illuminant_RGB, XYZ_to_RGB_matrix,
+                           chromatic_adaptation_transform)
 
-    RGB = dot_vector(XYZ_to_RGB_matrix, XYZ)
+    RGB = dot_vector(M, XYZ, out)
 
     if cctf_encoding is not None:
         with domain_range_scale('ignore'):
             RGB = cctf_encoding(RGB)
 
+        if out is not None:
+            out[...] = RGB
+            RGB = out
+
     return from_range_1(RGB)
 
 
@@ -1006,6 +1148,7 @@ def RGB_to_XYZ(RGB,
                RGB_to_XYZ_matrix,
                chromatic_adaptation_transform='CAT02',
                cctf_decoding=None,
+               out=None,
                **kwargs):
     """
     Converts given *RGB* colourspace array to *CIE XYZ* tristimulus values.
@@ -1031,6 +1174,10 @@ def RGB_to_XYZ(RGB,
     cctf_decoding : object, optional
         Decoding colour component transfer function (Decoding CCTF) or
         electro-optical transfer function (EOTF / EOCF).
+    out : ndarray, optional
+        Output array with the same shape than the *RGB* colourspace array, it
+        can be the *RGB* colourspace array itself for in-place processing. An
+        array is allocated if not given.
 
     Other Parameters
     ----------------
@@ -1087,15 +1234,10 @@ def RGB_to_XYZ(RGB,
         with domain_range_scale('ignore'):
             RGB = cctf_decoding(RGB)
 
-    XYZ = dot_vector(RGB_to_XYZ_matrix, RGB)
-
-    if chromatic_adaptation_transform is not None:
-        M_CAT = chromatic_adaptation_matrix_VonKries(
-            xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
-            xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
-            transform=chromatic_adaptation_transform)
+    M = _RGB_to_XYZ_matrix(illuminant_RGB, illuminant_XYZ, RGB_to_XYZ_matrix,
+                           chromatic_adaptation_transform)
 
-        XYZ = dot_vector(M_CAT, XYZ)
+    XYZ = dot_vector(M, RGB, out)
 
     return from_range_1(XYZ)
 
@@ -1137,6 +1279,43 @@ def RGB_to_RGB_matrix(input_colourspace,
            [ 0.0163599...,  0.1066124...,  0.8772485...]])
     """
 
+    return np.copy(
+        _RGB_to_RGB_matrix(input_colourspace, output_colourspace,
+                           chromatic_adaptation_transform))
+
+
+def _RGB_to_RGB_matrix(input_colourspace,
+                       output_colourspace,
+                       chromatic_adaptation_transform='CAT02'):
+    """
+    Computes the matrix :math:`M` converting from given input *RGB*
+    colourspace to output *RGB* colourspace using given *chromatic
+    adaptation* method, the matrix is cached and must not be modified.
+
+    Parameters
+    ----------
+    input_colourspace : RGB_Colourspace
+        *RGB* input colourspace.
+    output_colourspace : RGB_Colourspace
+        *RGB* output colourspace.
+    chromatic_adaptation_transform : unicode, optional
+        *Chromatic adaptation* transform, if *None* no chromatic adaptation is
+        performed.
+
+    Returns
+    -------
+    ndarray
+        Conversion matrix :math:`M`.
+    """
+
+    hash_key = _matrix_hash_key(
+        input_colourspace.whitepoint, input_colourspace.RGB_to_XYZ_matrix,
+        output_colourspace.whitepoint, output_colourspace.XYZ_to_RGB_matrix,
+        chromatic_adaptation_transform)
+    M = _CACHE_MATRIX_RGB_TO_RGB.get(hash_key)
+    if M is not None:
+        return M
+
     M = input_colourspace.RGB_to_XYZ_matrix
 
     if chromatic_adaptation_transform is not None:
@@ -1149,6 +1328,8 @@ def RGB_to_RGB_matrix(input_colourspace,
 
     M = dot_matrix(output_colourspace.XYZ_to_RGB_matrix, M)
 
+    _CACHE_MATRIX_RGB_TO_RGB[hash_key] = M
+
     return M
 
 
@@ -1235,8 +1416,8 @@ def RGB_to_RGB(RGB,
                 RGB, **filter_kwargs(input_colourspace.cctf_decoding,
                                      **kwargs))
 
-    M = RGB_to_RGB_matrix(input_colourspace, output_colourspace,
-                          chromatic_adaptation_transform)
+    M = _RGB_to_RGB_matrix(input_colourspace, output_colourspace,
+                           chromatic_adaptation_transform)
 
     RGB = dot_vector(M, RGB)
 
@@ -18,7 +18,8 @@ from colour.models import (
     RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB, RGB_to_XYZ,
     RGB_to_RGB_matrix, RGB_to_RGB, chromatically_adapted_primaries,
     normalised_primary_matrix, eotf_inverse_sRGB, eotf_sRGB)
-from colour.utilities import as_int, domain_range_scale, ignore_numpy_errors
+from colour.utilities import (as_int, caching_enable, domain_range_scale,
+                              float_precision, ignore_numpy_errors)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -500,6 +501,80 @@ class TestXYZ_to_RGB(unittest.TestCase):
                     RGB * factor,
                     decimal=7)
 
+    def test_out_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        output array support.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((16, 16, 3))
+        colourspace = RGB_COLOURSPACES['sRGB']
+        W_R = np.array([0.34570, 0.35850])
+
+        for cctf_encoding in (None, colourspace.cctf_encoding):
+            RGB = XYZ_to_RGB(XYZ, W_R, colourspace.whitepoint,
+                             colourspace.XYZ_to_RGB_matrix, 'Bradford',
+                             cctf_encoding)
+
+            out = np.copy(XYZ)
+            self.assertIs(
+                XYZ_to_RGB(out, W_R, colourspace.whitepoint,
+                           colourspace.XYZ_to_RGB_matrix, 'Bradford',
+                           cctf_encoding, out), out)
+            np.testing.assert_almost_equal(out, RGB, decimal=7)
+
+    def test_cache_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        caching.
+        """
+
+        XYZ = np.array([0.21638819, 0.12570000, 0.03847493])
+        W_R = np.array([0.34570, 0.35850])
+        W_T = np.array([0.31270, 0.32900])
+        M = np.array([
+            [3.24062548, -1.53720797, -0.49862860],
+            [-0.96893071, 1.87575606, 0.04151752],
+            [0.05571012, -0.20402105, 1.05699594],
+        ])
+
+        for W in (W_T, np.array([0.32168, 0.33767])):
+            with caching_enable(False):
+                RGB = XYZ_to_RGB(XYZ, W_R, W, M)
+
+            np.testing.assert_almost_equal(
+                XYZ_to_RGB(XYZ, W_R, W, M), RGB, decimal=7)
+
+        M_c = np.copy(M)
+        XYZ_to_RGB(XYZ, W_R, W_T, M_c)
+        M_c *= 2
+        np.testing.assert_almost_equal(
+            XYZ_to_RGB(XYZ, W_R, W_T, M_c),
+            XYZ_to_RGB(XYZ, W_R, W_T, M) * 2,
+            decimal=7)
+
+    def test_float_precision_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        single float precision support.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((16, 16, 3))
+        colourspace = RGB_COLOURSPACES['sRGB']
+        W_R = np.array([0.34570, 0.35850])
+        RGB = XYZ_to_RGB(XYZ, W_R, colourspace.whitepoint,
+                         colourspace.XYZ_to_RGB_matrix, 'Bradford',
+                         colourspace.cctf_encoding)
+
+        with float_precision(np.float32):
+            RGB_f = XYZ_to_RGB(
+                XYZ.astype(np.float32), W_R, colourspace.whitepoint,
+                colourspace.XYZ_to_RGB_matrix, 'Bradford',
+                colourspace.cctf_encoding)
+
+        self.assertEqual(RGB_f.dtype, np.float32)
+        np.testing.assert_allclose(RGB_f, RGB, rtol=1e-5, atol=1e-5)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_RGB(self):
         """
@@ -640,6 +715,50 @@ class TestRGB_to_XYZ(unittest.TestCase):
                     XYZ * factor,
                     decimal=7)
 
+    def test_out_RGB_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
+        output array support.
+        """
+
+        RGB = np.random.RandomState(4).random_sample((16, 16, 3))
+        colourspace = RGB_COLOURSPACES['sRGB']
+        W_T = np.array([0.34570, 0.35850])
+
+        for cctf_decoding in (None, colourspace.cctf_decoding):
+            XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, W_T,
+                             colourspace.RGB_to_XYZ_matrix, 'Bradford',
+                             cctf_decoding)
+
+            out = np.copy(RGB)
+            self.assertIs(
+                RGB_to_XYZ(out, colourspace.whitepoint, W_T,
+                           colourspace.RGB_to_XYZ_matrix, 'Bradford',
+                           cctf_decoding, out), out)
+            np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+    def test_float_precision_RGB_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
+        single float precision support.
+        """
+
+        RGB = np.random.RandomState(4).random_sample((16, 16, 3))
+        colourspace = RGB_COLOURSPACES['sRGB']
+        W_T = np.array([0.34570, 0.35850])
+        XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, W_T,
+                         colourspace.RGB_to_XYZ_matrix, 'Bradford',
+                         colourspace.cctf_decoding)
+
+        with float_precision(np.float32):
+            XYZ_f = RGB_to_XYZ(
+                RGB.astype(np.float32), colourspace.whitepoint, W_T,
+                colourspace.RGB_to_XYZ_matrix, 'Bradford',
+                colourspace.cctf_decoding)
+
+        self.assertEqual(XYZ_f.dtype, np.float32)
+        np.testing.assert_allclose(XYZ_f, XYZ, rtol=1e-5, atol=1e-5)
+
     @ignore_numpy_errors
     def test_nan_RGB_to_XYZ(self):
         """
@@ -720,6 +839,35 @@ class TestRGB_to_RGB_matrix(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_cache_RGB_to_RGB_matrix(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_matrix`
+        definition caching.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        sRGB_colourspace = deepcopy(RGB_COLOURSPACES['sRGB'])
+
+        M = RGB_to_RGB_matrix(aces_2065_1_colourspace, sRGB_colourspace)
+        M[...] = 0
+        np.testing.assert_almost_equal(
+            RGB_to_RGB_matrix(aces_2065_1_colourspace, sRGB_colourspace),
+            np.array([
+                [2.52164943, -1.13688855, -0.38491759],
+                [-0.27521355, 1.36970515, -0.09439245],
+                [-0.01592501, -0.14780637, 1.16380582],
+            ]),
+            decimal=7)
+
+        sRGB_colourspace.whitepoint = np.array([0.34570, 0.35850])
+        with caching_enable(False):
+            M = RGB_to_RGB_matrix(aces_2065_1_colourspace, sRGB_colourspace)
+
+        np.testing.assert_almost_equal(
+            RGB_to_RGB_matrix(aces_2065_1_colourspace, sRGB_colourspace),
+            M,
+            decimal=7)
+
 
 class TestRGB_to_RGB(unittest.TestCase):
     """
@@ -13,7 +13,7 @@ from colour.models.rgb.transfer_functions import (
     CCTF_DECODINGS, CCTF_ENCODINGS, EOTFS, EOTF_INVERSES, LOG_DECODINGS,
     LOG_ENCODINGS, OETFS, OETF_INVERSES, OOTFS, OOTF_INVERSES, cctf_encoding,
     cctf_decoding)
-from colour.utilities import as_int
+from colour.utilities import as_int, float_precision
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -98,6 +98,36 @@ class TestTransferFunctions(unittest.TestCase):
                 np.testing.assert_almost_equal(
                     samples, decoded_s, decimal=decimals.get(name, 7))
 
+    def test_transfer_functions_float_precision(self):
+        """
+        Tests transfer functions single float precision support.
+        """
+
+        # The "ITU-R BT.709" piecewise function segments do not join exactly,
+        # samples close to the break point might be evaluated with the other
+        # segment in single float precision.
+        tolerances = {
+            'ITU-R BT.601': 1e-4,
+            'ITU-R BT.709': 1e-4,
+            'ITU-R BT.2020': 1e-4
+        }
+
+        samples = np.linspace(0, 1, 1025)
+
+        for mapping in (CCTF_ENCODINGS, CCTF_DECODINGS):
+            for name in mapping:
+                values = mapping[name](samples)
+
+                with float_precision(np.float32):
+                    values_f = mapping[name](samples.astype(np.float32))
+
+                self.assertEqual(values_f.dtype, np.float32)
+                np.testing.assert_allclose(
+                    values_f,
+                    values,
+                    rtol=1e-4,
+                    atol=tolerances.get(name, 1e-6))
+
 
 if __name__ == '__main__':
     unittest.main()
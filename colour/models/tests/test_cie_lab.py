@@ -114,6 +114,19 @@ class TestXYZ_to_Lab(unittest.TestCase):
                     Lab * factor_b,
                     decimal=7)
 
+    def test_out_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition output
+        array support.
+        """
+
+        XYZ = np.tile(np.array([0.20654008, 0.12197225, 0.05136952]), (6, 1))
+        illuminant = np.array([0.31270, 0.32900])
+        Lab = XYZ_to_Lab(XYZ, illuminant)
+
+        self.assertIs(XYZ_to_Lab(XYZ, illuminant, XYZ), XYZ)
+        np.testing.assert_almost_equal(XYZ, Lab, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Lab(self):
         """
@@ -218,6 +231,20 @@ class TestLab_to_XYZ(unittest.TestCase):
                     XYZ * factor_b,
                     decimal=7)
 
+    def test_out_Lab_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_lab.Lab_to_XYZ` definition output
+        array support.
+        """
+
+        Lab = np.tile(np.array([41.52787529, 52.63858304, 26.92317922]),
+                      (6, 1))
+        illuminant = np.array([0.31270, 0.32900])
+        XYZ = Lab_to_XYZ(Lab, illuminant)
+
+        self.assertIs(Lab_to_XYZ(Lab, illuminant, Lab), Lab)
+        np.testing.assert_almost_equal(Lab, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_Lab_to_XYZ(self):
         """
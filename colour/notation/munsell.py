@@ -121,7 +121,7 @@ import re
 from collections import OrderedDict
 
 from colour.algebra import (Extrapolator, LinearInterpolator,
-                            cartesian_to_cylindrical, euclidean_distance,
+                            cartesian_to_cylindrical, cartesian_to_polar,
                             polar_to_cartesian, spow)
 from colour.colorimetry import CCS_ILLUMINANTS, luminance_ASTMD1535
 from colour.constants import (DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE,
@@ -130,10 +130,10 @@ from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
 from colour.volume import is_within_macadam_limits
 from colour.notation import MUNSELL_COLOURS_ALL
 from colour.utilities import (
-    CaseInsensitiveMapping, Lookup, as_float_array, as_float, as_int,
-    as_numeric, domain_range_scale, from_range_1, from_range_10,
+    CACHE_REGISTRY, CaseInsensitiveMapping, Lookup, as_float_array, as_float,
+    as_int, as_numeric, domain_range_scale, from_range_1, from_range_10,
     get_domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
-    is_integer, is_numeric, tsplit, usage_warning)
+    is_integer, is_numeric, tsplit, tstack, usage_warning)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -196,9 +196,26 @@ ILLUMINANT_NAME_MUNSELL = 'C'
 CCS_ILLUMINANT_MUNSELL = (CCS_ILLUMINANTS[
     'CIE 1931 2 Degree Standard Observer'][ILLUMINANT_NAME_MUNSELL])
 
-_MUNSELL_SPECIFICATIONS_CACHE = None
-_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
-_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_MUNSELL_SPECIFICATIONS_CACHE = CACHE_REGISTRY.register_cache(
+    '{0}._MUNSELL_SPECIFICATIONS_CACHE'.format(__name__), maximum_size=4)
+
+_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = (
+    CACHE_REGISTRY.register_cache(
+        '{0}._MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE'.format(
+            __name__),
+        maximum_size=4))
+
+_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = (
+    CACHE_REGISTRY.register_cache(
+        '{0}._MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE'.format(__name__),
+        maximum_size=4))
+
+_MUNSELL_RENOTATION_TABLES_CACHE = CACHE_REGISTRY.register_cache(
+    '{0}._MUNSELL_RENOTATION_TABLES_CACHE'.format(__name__), maximum_size=4)
+"""
+*Munsell Renotation System* caches, keyed by the float precision they were
+built with, see :func:`colour.utilities.set_float_precision` definition.
+"""
 
 
 def _munsell_specifications():
@@ -226,15 +243,16 @@ def _munsell_specifications():
         *Munsell Renotation System* specifications.
     """
 
-    global _MUNSELL_SPECIFICATIONS_CACHE
+    specifications = _MUNSELL_SPECIFICATIONS_CACHE.get(DEFAULT_FLOAT_DTYPE)
+    if specifications is None:
+        specifications = _MUNSELL_SPECIFICATIONS_CACHE[
+            DEFAULT_FLOAT_DTYPE] = np.array([
+                munsell_colour_to_munsell_specification(
+                    MUNSELL_COLOUR_FORMAT.format(*colour[0]))
+                for colour in MUNSELL_COLOURS_ALL
+            ])
 
-    if _MUNSELL_SPECIFICATIONS_CACHE is None:
-        _MUNSELL_SPECIFICATIONS_CACHE = np.array([
-            munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*colour[0]))
-            for colour in MUNSELL_COLOURS_ALL
-        ])
-    return _MUNSELL_SPECIFICATIONS_CACHE
+    return specifications
 
 
 def _munsell_value_ASTMD1535_interpolator():
@@ -248,15 +266,16 @@ def _munsell_value_ASTMD1535_interpolator():
         *Munsell* value interpolator for *ASTM D1535-08e1* method.
     """
 
-    global _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    interpolator = _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE.get(
+        DEFAULT_FLOAT_DTYPE)
+    if interpolator is None:
+        munsell_values = np.arange(0, 10, 0.001)
+        interpolator = _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE[
+            DEFAULT_FLOAT_DTYPE] = Extrapolator(
+                LinearInterpolator(
+                    luminance_ASTMD1535(munsell_values), munsell_values))
 
-    munsell_values = np.arange(0, 10, 0.001)
-    if _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE is None:
-        _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = Extrapolator(
-            LinearInterpolator(
-                luminance_ASTMD1535(munsell_values), munsell_values))
-
-    return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    return interpolator
 
 
 def _munsell_maximum_chromas_from_renotation():
@@ -270,9 +289,9 @@ def _munsell_maximum_chromas_from_renotation():
         Maximum *Munsell* chromas.
     """
 
-    global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
-
-    if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
+    maximum_chromas = _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE.get(
+        DEFAULT_FLOAT_DTYPE)
+    if maximum_chromas is None:
         chromas = OrderedDict()
         for munsell_colour in MUNSELL_COLOURS_ALL:
             hue, value, chroma, code = munsell_colour_to_munsell_specification(
@@ -283,9 +302,123 @@ def _munsell_maximum_chromas_from_renotation():
 
             chromas[index] = chroma
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
-    return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+        maximum_chromas = _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE[
+            DEFAULT_FLOAT_DTYPE] = tuple(zip(chromas.keys(), chromas.values()))
+
+    return maximum_chromas
+
+
+def _munsell_renotation_tables():
+    """
+    Returns the *Munsell Renotation System* data as dense arrays indexed by
+    specification and caches them if not existing.
+
+    The *CIE xyY* colourspace arrays table is indexed by hue, value, chroma and
+    code indexes, the maximum chromas table by hue, value and code indexes,
+    and the interpolation methods table by value, chroma and *ASTM* hue
+    interval indexes, see
+    :func:`colour.notation.munsell._renotation_table_indexes` definition.
+    Only the integer values of the *Munsell Renotation System* data are
+    tabulated, missing specifications are stored as *nan*.
+
+    Returns
+    -------
+    tuple
+        *CIE xyY* colourspace arrays, maximum chromas and interpolation
+        methods tables.
+    """
+
+    tables = _MUNSELL_RENOTATION_TABLES_CACHE.get(DEFAULT_FLOAT_DTYPE)
+    if tables is None:
+        xyY_table = np.full((4, 11, 26, 11, 3), np.nan)
+        for specification, munsell_colour in zip(_munsell_specifications(),
+                                                 MUNSELL_COLOURS_ALL):
+            hue, value, chroma, code = specification
+            if is_integer(value):
+                xyY_table[_renotation_table_indexes(
+                    hue, value, chroma, code)] = munsell_colour[1]
+
+        chromas_table = np.full((4, 11, 11), np.nan)
+        for (hue, value, code), chroma in (
+                _munsell_maximum_chromas_from_renotation()):
+            if is_integer(value):
+                chromas_table[_renotation_table_indexes(
+                    hue, value, None, code)] = chroma
+
+        # The interpolation method only varies between the *ASTM* hues
+        # multiple of 2.5, it is sampled at the middle of the intervals.
+        interpolation_methods = {None: 0, 'Linear': 1, 'Radial': 2}
+        methods_table = np.zeros((10, 26, 40), DEFAULT_INT_DTYPE)
+        for value in range(1, 10):
+            for chroma in range(2, 52, 2):
+                for i in range(40):
+                    ASTM_hue = 2.5 * i + 1.25
+                    hue = ASTM_hue % 10
+                    code = (7 - ASTM_hue // 10) % 10
+                    methods_table[value, chroma // 2, i] = (
+                        interpolation_methods[
+                            interpolation_method_from_renotation_ovoid(
+                                (hue, value, chroma,
+                                 10 if code == 0 else code))])
+
+        tables = _MUNSELL_RENOTATION_TABLES_CACHE[DEFAULT_FLOAT_DTYPE] = (
+            xyY_table, chromas_table, methods_table)
+
+    return tables
+
+
+def _renotation_table_indexes(hue, value, chroma, code):
+    """
+    Returns the indexes of given *Munsell* *Colorlab* specifications in the
+    *Munsell Renotation System* data tables.
+
+    Parameters
+    ----------
+    hue : numeric or array_like
+        *Munsell* *Colorlab* specification hue.
+    value : numeric or array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : numeric or array_like
+        *Munsell* *Colorlab* specification chroma, if *None* the chroma index
+        is omitted.
+    code : numeric or array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    tuple
+        Tables indexes.
+
+    Raises
+    ------
+    ValueError
+        If the given specifications do not exist in
+        *Munsell Renotation System* data.
+    """
+
+    hue, value, code = (as_float_array(hue), as_float_array(value),
+                        as_float_array(code))
+
+    specifications_exist = (np.isin(hue, (2.5, 5, 7.5, 10)) &
+                            np.isin(value, np.arange(11)) &
+                            np.isin(code, np.arange(1, 11)))
+    if chroma is not None:
+        chroma = as_float_array(chroma)
+        specifications_exist &= np.isin(chroma, np.arange(2, 52, 2))
+
+    if not np.all(specifications_exist):
+        raise ValueError('Specifications do not exist in '
+                         '"Munsell Renotation System" data!')
+
+    hue_index = np.around(hue / 2.5).astype(DEFAULT_INT_DTYPE) - 1
+    value_index = value.astype(DEFAULT_INT_DTYPE)
+    code_index = code.astype(DEFAULT_INT_DTYPE)
+
+    if chroma is None:
+        return hue_index, value_index, code_index
+    else:
+        return (hue_index, value_index, (chroma / 2).astype(DEFAULT_INT_DTYPE),
+                code_index)
 
 
 def munsell_value_Priest1920(Y):
@@ -908,18 +1041,377 @@ def munsell_colour_to_xyY(munsell_colour):
             specification.reshape(shape + [4]), _domain_range_scale_factor()))
 
 
+def _interpolate_linear(x, x_0, x_1, y_0, y_1):
+    """
+    Linearly interpolates given values between given two points, the values
+    outside the points domain are clamped as with :func:`np.interp`
+    definition.
+
+    Parameters
+    ----------
+    x : array_like
+        Values to interpolate.
+    x_0 : array_like
+        First points :math:`x` values.
+    x_1 : array_like
+        Second points :math:`x` values.
+    y_0 : array_like
+        First points :math:`y` values.
+    y_1 : array_like
+        Second points :math:`y` values.
+
+    Returns
+    -------
+    ndarray
+        Interpolated values.
+    """
+
+    x_d = x_1 - x_0
+    x_d_safe = np.where(x_d == 0, 1, x_d)
+
+    t = np.clip(np.where(x_d == 0, 0, (x - x_0) / x_d_safe), 0, 1)
+
+    return y_0 + t * (y_1 - y_0)
+
+
+def _xy_from_renotation_ovoid(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *CIE xy* chromaticity
+    coordinates on *Munsell Renotation System* ovoid.
+
+    This definition is the array counterpart of
+    :func:`colour.notation.munsell.xy_from_renotation_ovoid` definition for
+    chromatic specifications.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    tuple
+        *CIE xy* chromaticity coordinates.
+    """
+
+    xyY_table, _chromas_table, methods_table = _munsell_renotation_tables()
+
+    code = np.where(hue == 0, (code + 1) % 10, code)
+    hue = np.where(hue == 0, 10, hue)
+
+    assert np.all(np.logical_and(1 <= value, value <= 9)), (
+        'Specifications value must be normalised to domain [1, 9]!')
+    assert np.all(is_integer(value)), (
+        'Specifications value must be an integer!')
+
+    value = np.around(value)
+
+    assert np.all(np.logical_and(2 <= chroma, chroma <= 50)), (
+        'Specifications chroma must be normalised to domain [2, 50]!')
+    assert np.all(np.abs(2 * (chroma / 2 - np.around(chroma / 2))) <=
+                  INTEGER_THRESHOLD), (
+                      'Specifications chroma must be an integer and '
+                      'multiple of 2!')
+
+    chroma = 2 * np.around(chroma / 2)
+
+    # Checking if renotation data is available without interpolation using
+    # given threshold.
+    threshold = 1e-7
+    hue_standard = 2.5 * np.around(hue / 2.5)
+    standard = np.abs(hue - hue_standard) < threshold
+    code_standard = np.where(hue_standard == 0, (code + 1) % 10, code)
+    hue_standard = np.where(hue_standard == 0, 10, hue_standard)
+
+    hue_minus, code_minus, hue_plus, code_plus = (
+        _bounding_hues_from_renotation(hue, code))
+    hue_minus = np.where(standard, hue_standard, hue_minus)
+    code_minus = np.where(standard, code_standard, code_minus)
+    hue_plus = np.where(standard, hue_standard, hue_plus)
+    code_plus = np.where(standard, code_standard, code_plus)
+
+    x_grey, y_grey = CCS_ILLUMINANT_MUNSELL
+
+    x_minus, y_minus, _Y_minus = tsplit(xyY_table[_renotation_table_indexes(
+        hue_minus, value, chroma, code_minus)])
+    x_plus, y_plus, _Y_plus = tsplit(xyY_table[_renotation_table_indexes(
+        hue_plus, value, chroma, code_plus)])
+
+    if np.any(np.isnan([x_minus, x_plus])):
+        raise ValueError('Specifications do not exist in '
+                         '"Munsell Renotation System" data!')
+
+    rho_minus, phi_minus = tsplit(
+        cartesian_to_polar(tstack([x_minus - x_grey, y_minus - y_grey])))
+    phi_minus = np.degrees(phi_minus)
+    rho_plus, phi_plus = tsplit(
+        cartesian_to_polar(tstack([x_plus - x_grey, y_plus - y_grey])))
+    phi_plus = np.degrees(phi_plus)
+
+    lower_hue_angle = hue_to_hue_angle(hue_minus, code_minus)
+    hue_angle = hue_to_hue_angle(hue, code)
+    upper_hue_angle = hue_to_hue_angle(hue_plus, code_plus)
+
+    phi_plus = np.where(phi_minus - phi_plus > 180, phi_plus + 360, phi_plus)
+
+    lower_hue_angle = np.where(lower_hue_angle == 0, 360, lower_hue_angle)
+
+    wrap = lower_hue_angle > upper_hue_angle
+    hue_angle = np.where(
+        np.logical_and(wrap, lower_hue_angle <= hue_angle), hue_angle - 360,
+        hue_angle)
+    lower_hue_angle = np.where(wrap, lower_hue_angle - 360, lower_hue_angle)
+
+    ASTM_hue = 10 * ((7 - code) % 10) + hue
+    ASTM_hue = np.where(ASTM_hue == 0, 100, ASTM_hue)
+    ASTM_hue_index = np.clip(
+        np.floor(ASTM_hue / 2.5), 0, 39).astype(DEFAULT_INT_DTYPE)
+    radial = methods_table[value.astype(DEFAULT_INT_DTYPE),
+                           (chroma / 2).astype(DEFAULT_INT_DTYPE),
+                           ASTM_hue_index] == 2
+
+    x_linear = _interpolate_linear(hue_angle, lower_hue_angle,
+                                   upper_hue_angle, x_minus, x_plus)
+    y_linear = _interpolate_linear(hue_angle, lower_hue_angle,
+                                   upper_hue_angle, y_minus, y_plus)
+
+    theta = _interpolate_linear(hue_angle, lower_hue_angle, upper_hue_angle,
+                                phi_minus, phi_plus)
+    rho = _interpolate_linear(hue_angle, lower_hue_angle, upper_hue_angle,
+                              rho_minus, rho_plus)
+    x_radial, y_radial = tsplit(
+        polar_to_cartesian(tstack([rho, np.radians(theta)])))
+    x_radial, y_radial = x_radial + x_grey, y_radial + y_grey
+
+    x = np.where(standard, x_minus, np.where(radial, x_radial, x_linear))
+    y = np.where(standard, y_minus, np.where(radial, y_radial, y_linear))
+
+    return x, y
+
+
+def _munsell_specification_to_xy(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *CIE xy* chromaticity
+    coordinates by interpolating over *Munsell Renotation System* data.
+
+    This definition is the array counterpart of
+    :func:`colour.notation.munsell.munsell_specification_to_xy` definition, the
+    specifications with a chroma of 0 are grey.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    tuple
+        *CIE xy* chromaticity coordinates.
+    """
+
+    x_grey, y_grey = CCS_ILLUMINANT_MUNSELL
+
+    grey = chroma == 0
+    chromatic = ~grey
+
+    assert np.all(np.logical_and(0 <= value, value <= 10)[chromatic]), (
+        'Specifications value must be normalised to domain [0, 10]!')
+    assert np.all(is_integer(value)[chromatic]), (
+        'Specifications value must be an integer!')
+
+    value = np.around(value)
+
+    chroma_even = chroma % 2 == 0
+    chroma_minus = np.where(chroma_even, chroma, 2 * np.floor(chroma / 2))
+    chroma_plus = np.where(chroma_even, chroma, chroma_minus + 2)
+
+    # Smallest chroma ovoid collapses to illuminant chromaticity coordinates.
+    grey_minus = np.logical_or(grey, chroma_minus == 0)
+
+    x_minus = np.full(value.shape, x_grey)
+    y_minus = np.full(value.shape, y_grey)
+    x_minus[~grey_minus], y_minus[~grey_minus] = _xy_from_renotation_ovoid(
+        hue[~grey_minus], value[~grey_minus], chroma_minus[~grey_minus],
+        code[~grey_minus])
+
+    x_plus = np.full(value.shape, x_grey)
+    y_plus = np.full(value.shape, y_grey)
+    x_plus[chromatic], y_plus[chromatic] = _xy_from_renotation_ovoid(
+        hue[chromatic], value[chromatic], chroma_plus[chromatic],
+        code[chromatic])
+
+    x = np.where(chroma_even, x_minus,
+                 _interpolate_linear(chroma, chroma_minus, chroma_plus,
+                                     x_minus, x_plus))
+    y = np.where(chroma_even, y_minus,
+                 _interpolate_linear(chroma, chroma_minus, chroma_plus,
+                                     y_minus, y_plus))
+
+    return np.where(grey, x_grey, x), np.where(grey, y_grey, y)
+
+
+def _munsell_specification_to_xy_value_interpolated(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications with real values to
+    *CIE xy* chromaticity coordinates by interpolating over
+    *Munsell Renotation System* data and values.
+
+    This definition is the array counterpart of the *CIE xy* chromaticity
+    coordinates computation of
+    :func:`colour.notation.munsell._munsell_specification_to_xyY` definition,
+    the specifications with a chroma of 0 are grey.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    tuple
+        *CIE xy* chromaticity coordinates.
+    """
+
+    code = np.where(hue == 0, (code + 1) % 10, code)
+    hue = np.where(hue == 0, 10, hue)
+
+    chromatic = chroma != 0
+
+    assert np.all(np.logical_and(0 <= hue, hue <= 10)[chromatic]), (
+        'Specifications hue must be normalised to domain [0, 10]!')
+    assert np.all(np.logical_and(0 <= value, value <= 10)[chromatic]), (
+        'Specifications value must be normalised to domain [0, 10]!')
+
+    with domain_range_scale('ignore'):
+        Y = luminance_ASTMD1535(value)
+
+    integer = is_integer(value)
+    value_minus = np.where(integer, np.around(value), np.floor(value))
+    value_plus = np.where(integer, np.around(value), value_minus + 1)
+
+    x_minus, y_minus = _munsell_specification_to_xy(hue, value_minus, chroma,
+                                                    code)
+    x_plus, y_plus = _munsell_specification_to_xy(
+        hue, value_plus, np.where(value_plus == 10, 0, chroma), code)
+
+    with domain_range_scale('ignore'):
+        Y_minus = luminance_ASTMD1535(value_minus)
+        Y_plus = luminance_ASTMD1535(value_plus)
+
+    x = np.where(value_minus == value_plus, x_minus,
+                 _interpolate_linear(Y, Y_minus, Y_plus, x_minus, x_plus))
+    y = np.where(value_minus == value_plus, y_minus,
+                 _interpolate_linear(Y, Y_minus, Y_plus, y_minus, y_plus))
+
+    return x, y
+
+
+def _maximum_chroma_from_renotation(hue, value, code):
+    """
+    Returns the maximum *Munsell* chromas from *Munsell Renotation System* data
+    using given *Munsell* *Colorlab* specifications hue, value and code.
+
+    This definition is the array counterpart of
+    :func:`colour.notation.munsell.maximum_chroma_from_renotation` definition.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* value code.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        Maximum chromas.
+    """
+
+    _xyY_table, chromas_table, _methods_table = _munsell_renotation_tables()
+
+    # Ideal white, no chroma.
+    white = value >= 9.99
+
+    assert np.all(np.logical_and(1 <= value, value <= 10)[~white]), (
+        'Values must be normalised to domain [1, 10]!')
+
+    value = np.where(white, 9, value)
+
+    integer = value % 1 == 0
+    value_minus = np.where(integer, value, np.floor(value))
+    value_plus = np.where(integer, value, value_minus + 1)
+
+    hue_cw, code_cw, hue_ccw, code_ccw = _bounding_hues_from_renotation(
+        hue, code)
+
+    ma_limit_mcw = chromas_table[_renotation_table_indexes(
+        hue_cw, value_minus, None, code_cw)]
+    ma_limit_mccw = chromas_table[_renotation_table_indexes(
+        hue_ccw, value_minus, None, code_ccw)]
+
+    value_plus_9 = np.minimum(value_plus, 9)
+    ma_limit_pcw = chromas_table[_renotation_table_indexes(
+        hue_cw, value_plus_9, None, code_cw)]
+    ma_limit_pccw = chromas_table[_renotation_table_indexes(
+        hue_ccw, value_plus_9, None, code_ccw)]
+
+    if np.any(
+            np.isnan([ma_limit_mcw, ma_limit_mccw, ma_limit_pcw,
+                      ma_limit_pccw])):
+        raise ValueError('Specifications do not exist in '
+                         '"Munsell Renotation System" data!')
+
+    L = luminance_ASTMD1535(value)
+    L9 = luminance_ASTMD1535(9)
+    L10 = luminance_ASTMD1535(10)
+
+    max_chroma = np.where(
+        value_plus <= 9,
+        np.min([ma_limit_mcw, ma_limit_mccw, ma_limit_pcw, ma_limit_pccw],
+               axis=0),
+        np.minimum(
+            _interpolate_linear(L, L9, L10, ma_limit_mcw, 0),
+            _interpolate_linear(L, L9, L10, ma_limit_mccw, 0)))
+
+    return np.where(white, 0, max_chroma)
+
+
 def _xyY_to_munsell_specification(xyY):
     """
     Converts from *CIE xyY* colourspace to *Munsell* *Colorlab* specification.
 
+    The iterations of the hue and chroma convergence loops are advanced in
+    lockstep for all the *CIE xyY* colourspace arrays, the converged ones are
+    retired from the subsequent iterations.
+
     Parameters
     ----------
-    xyY : array_like
+    xyY : array_like, (n, 3)
         *CIE xyY* colourspace array.
 
     Returns
     -------
-    ndarray
+    ndarray, (n, 4)
         *Munsell* *Colorlab* specification.
 
     Raises
@@ -935,223 +1427,241 @@ def _xyY_to_munsell_specification(xyY):
     x, y, Y = tsplit(xyY)
     Y = to_domain_1(Y)
 
-    if not is_within_macadam_limits(xyY, ILLUMINANT_NAME_MUNSELL):
+    within_macadam_limits = is_within_macadam_limits(
+        xyY, ILLUMINANT_NAME_MUNSELL)
+    if not np.all(within_macadam_limits):
         usage_warning('"{0}" is not within "MacAdam" limits for illuminant '
-                      '"{1}"!'.format(xyY, ILLUMINANT_NAME_MUNSELL))
+                      '"{1}"!'.format(
+                          np.squeeze(xyY[~within_macadam_limits]),
+                          ILLUMINANT_NAME_MUNSELL))
 
     with domain_range_scale('ignore'):
         value = munsell_value_ASTMD1535(Y * 100)
 
-    if is_integer(value):
-        value = round(value)
+    value = np.reshape(
+        np.where(is_integer(value), np.around(value), value), x.shape)
 
-    with domain_range_scale('ignore'):
-        x_center, y_center, Y_center = _munsell_specification_to_xyY(value)
+    x_center, y_center = CCS_ILLUMINANT_MUNSELL
 
-    rho_input, phi_input, _z_input = cartesian_to_cylindrical(
-        (x - x_center, y - y_center, Y_center))
+    rho_input, phi_input = tsplit(
+        cartesian_to_polar(tstack([x - x_center, y - y_center])))
     phi_input = np.degrees(phi_input)
 
+    specification = tstack([
+        np.full(value.shape, np.nan), value,
+        np.full(value.shape, np.nan),
+        np.full(value.shape, np.nan)
+    ])
+
     grey_threshold = 1e-7
-    if rho_input < grey_threshold:
-        return from_range_10(normalize_munsell_specification(value))
+    grey = rho_input < grey_threshold
 
-    X, Y, Z = xyY_to_XYZ([x, y, Y])
+    X, Y, Z = tsplit(xyY_to_XYZ(tstack([x, y, Y])))
     xi, yi = CCS_ILLUMINANT_MUNSELL
-    Xr, Yr, Zr = xyY_to_XYZ([xi, yi, Y])
+    Xr, Yr, Zr = tsplit(
+        xyY_to_XYZ(tstack([np.full(Y.shape, xi),
+                           np.full(Y.shape, yi), Y])))
 
-    XYZ = np.array([X, Y, Z])
-    XYZr = np.array([(1 / Yr) * Xr, 1, (1 / Yr) * Zr])
+    XYZ = tstack([X, Y, Z])
+    XYZr = tstack([(1 / Yr) * Xr, np.ones(Yr.shape), (1 / Yr) * Zr])
 
     Lab = XYZ_to_Lab(XYZ, XYZ_to_xy(XYZr))
     LCHab = Lab_to_LCHab(Lab)
-    hue_initial, _value_initial, chroma_initial, code_initial = (
-        LCHab_to_munsell_specification(LCHab))
-    specification_current = [
-        hue_initial, value, (5 / 5.5) * chroma_initial, code_initial
-    ]
+    hue_initial, _value_initial, chroma_initial, code_initial = tsplit(
+        np.reshape(LCHab_to_munsell_specification(LCHab), value.shape + (4, )))
 
-    convergence_threshold = 1e-7
-    iterations_maximum = 64
-    iterations = 0
+    # Samples still iterating, they are retired once converged.
+    indexes = np.arange(value.shape[0])[~grey]
+    x, y, value = x[indexes], y[indexes], value[indexes]
+    rho_input, phi_input = rho_input[indexes], phi_input[indexes]
+    hue_current = hue_initial[indexes]
+    chroma_current = (5 / 5.5) * chroma_initial[indexes]
+    code_current = code_initial[indexes]
 
-    while iterations <= iterations_maximum:
-        iterations += 1
+    def retire(converged, hue, chroma, code):
+        """
+        Stores the converged specifications and retires them from the
+        iterating samples.
+        """
 
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        hue_angle_current = hue_to_hue_angle(hue_current, code_current)
+        specification[indexes[converged]] = tstack(
+            [hue, value, chroma, code])[converged]
 
-        chroma_maximum = maximum_chroma_from_renotation(
-            hue_current, value, code_current)
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
+        return ~converged
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = _munsell_specification_to_xyY(
-                specification_current)
+    def phi_difference(x_i, y_i):
+        """
+        Returns the hue angle difference in degrees with the input *CIE xy*
+        chromaticity coordinates.
+        """
 
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
-        phi_current = np.degrees(phi_current)
-        phi_current_difference = (360 - phi_input + phi_current) % 360
-        if phi_current_difference > 180:
-            phi_current_difference -= 360
+        phi = np.degrees(np.arctan2(y_i - y_center, x_i - x_center))
+        difference = (360 - phi_input + phi) % 360
 
-        phi_differences = [phi_current_difference]
-        hue_angles = [hue_angle_current]
-        hue_angles_differences = [0]
+        return np.where(difference > 180, difference - 360, difference)
 
-        iterations_maximum_inner = 16
-        iterations_inner = 0
-        extrapolate = False
+    convergence_threshold = 1e-7
+    iterations_maximum = 64
+    iterations = 0
 
-        while np.sign(min(phi_differences)) == np.sign(
-                max(phi_differences)) and extrapolate is False:
-            iterations_inner += 1
+    while iterations <= iterations_maximum and indexes.size:
+        iterations += 1
 
-            if iterations_inner > iterations_maximum_inner:
-                # NOTE: This exception is likely never raised in practice:
-                # 300K iterations with random numbers never reached this code
-                # path, it is kept for consistency with the reference
-                # implementation.
-                raise RuntimeError(  # pragma: no cover
-                    ('Maximum inner iterations count reached without '
-                     'convergence!'))
-
-            hue_angle_inner = ((hue_angle_current + iterations_inner *
-                                (phi_input - phi_current)) % 360)
-            hue_angle_difference_inner = (
-                iterations_inner * (phi_input - phi_current) % 360)
-            if hue_angle_difference_inner > 180:
-                hue_angle_difference_inner -= 360
-
-            hue_inner, code_inner = hue_angle_to_hue(hue_angle_inner)
-
-            with domain_range_scale('ignore'):
-                x_inner, y_inner, _Y_inner = _munsell_specification_to_xyY(
-                    (hue_inner, value, chroma_current, code_inner))
-
-            if len(phi_differences) >= 2:
-                extrapolate = True
-
-            if extrapolate is False:
-                rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                    (x_inner - x_center, y_inner - y_center, Y_center))
-                phi_inner = np.degrees(phi_inner)
-                phi_inner_difference = ((360 - phi_input + phi_inner) % 360)
-                if phi_inner_difference > 180:
-                    phi_inner_difference -= 360
-
-                phi_differences.append(phi_inner_difference)
-                hue_angles.append(hue_angle_inner)
-                hue_angles_differences.append(hue_angle_difference_inner)
-
-        phi_differences = np.array(phi_differences)
-        hue_angles_differences = np.array(hue_angles_differences)
-
-        phi_differences_indexes = phi_differences.argsort()
-
-        phi_differences = phi_differences[phi_differences_indexes]
-        hue_angles_differences = (
-            hue_angles_differences[phi_differences_indexes])
-
-        hue_angle_difference_new = Extrapolator(
-            LinearInterpolator(phi_differences,
-                               hue_angles_differences))(0) % 360
+        hue_angle_current = hue_to_hue_angle(hue_current, code_current)
+
+        chroma_maximum = _maximum_chroma_from_renotation(
+            hue_current, value, code_current)
+        chroma_current = np.minimum(chroma_current, chroma_maximum)
+
+        x_current, y_current = (
+            _munsell_specification_to_xy_value_interpolated(
+                hue_current, value, chroma_current, code_current))
+
+        # The hue angles are bracketed by the current specification and a
+        # specification rotated by the current hue angle difference: the zero
+        # hue angle difference is interpolated or extrapolated between them.
+        phi_current = np.degrees(
+            np.arctan2(y_current - y_center, x_current - x_center))
+        phi_current_difference = phi_difference(x_current, y_current)
+
+        hue_angle_inner = (hue_angle_current + phi_input - phi_current) % 360
+        hue_angle_difference_inner = (phi_input - phi_current) % 360
+        hue_angle_difference_inner = np.where(
+            hue_angle_difference_inner > 180,
+            hue_angle_difference_inner - 360, hue_angle_difference_inner)
+
+        hue_inner, code_inner = tsplit(hue_angle_to_hue(hue_angle_inner))
+
+        x_inner, y_inner = _munsell_specification_to_xy_value_interpolated(
+            hue_inner, value, chroma_current, code_inner)
+        phi_inner_difference = phi_difference(x_inner, y_inner)
+
+        phi_differences_delta = phi_inner_difference - phi_current_difference
+        hue_angle_difference_new = np.where(
+            phi_differences_delta == 0, 0, hue_angle_difference_inner *
+            -phi_current_difference / np.where(phi_differences_delta == 0, 1,
+                                               phi_differences_delta)) % 360
         hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
 
-        hue_new, code_new = hue_angle_to_hue(hue_angle_new)
-        specification_current = [hue_new, value, chroma_current, code_new]
+        hue_current, code_current = tsplit(hue_angle_to_hue(hue_angle_new))
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = _munsell_specification_to_xyY(
-                specification_current)
+        x_current, y_current = (
+            _munsell_specification_to_xy_value_interpolated(
+                hue_current, value, chroma_current, code_current))
 
-        chroma_scale = 50 if get_domain_range_scale() == '1' else 2
+        difference = np.hypot(x - x_current, y - y_current)
+        iterating = retire(difference < convergence_threshold, hue_current,
+                           chroma_current, code_current)
 
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return from_range_10(
-                np.array(specification_current),
-                np.array([10, 10, chroma_scale, 10]))
+        indexes = indexes[iterating]
+        x, y, value = x[iterating], y[iterating], value[iterating]
+        rho_input, phi_input = rho_input[iterating], phi_input[iterating]
+        hue_current = hue_current[iterating]
+        chroma_current = chroma_current[iterating]
+        code_current = code_current[iterating]
 
-        # TODO: Consider refactoring implementation.
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        chroma_maximum = maximum_chroma_from_renotation(
+        chroma_maximum = _maximum_chroma_from_renotation(
             hue_current, value, code_current)
 
         # NOTE: This condition is likely never "True" while producing a valid
         # "Munsell Specification" in practice: 100K iterations with random
         # numbers never reached this code path while producing a valid
         # "Munsell Specification".
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
+        chroma_current = np.minimum(chroma_current, chroma_maximum)
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = _munsell_specification_to_xyY(
-                specification_current)
+        x_current, y_current = (
+            _munsell_specification_to_xy_value_interpolated(
+                hue_current, value, chroma_current, code_current))
 
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
+        rho_current = np.hypot(x_current - x_center, y_current - y_center)
 
-        rho_bounds = [rho_current]
-        chroma_bounds = [chroma_current]
+        # The chroma is bracketed by the closest specifications below and
+        # above the input chroma, i.e. the interpolation points of the
+        # sorted bounds.
+        rho_minimum = rho_maximum = rho_lower = rho_upper = rho_current
+        chroma_lower = chroma_upper = chroma_current
 
         iterations_maximum_inner = 16
         iterations_inner = 0
-        while not (min(rho_bounds) < rho_input < max(rho_bounds)):
+        bracketing = ~np.logical_and(rho_minimum < rho_input,
+                                     rho_input < rho_maximum)
+        while np.any(bracketing):
             iterations_inner += 1
 
             if iterations_inner > iterations_maximum_inner:
                 raise RuntimeError(('Maximum inner iterations count reached '
                                     'without convergence!'))
 
-            chroma_inner = (((rho_input / rho_current) ** iterations_inner) *
-                            chroma_current)
-            if chroma_inner > chroma_maximum:
-                chroma_inner = specification_current[2] = chroma_maximum
-
-            specification_inner = (hue_current, value, chroma_inner,
-                                   code_current)
-
-            with domain_range_scale('ignore'):
-                x_inner, y_inner, _Y_inner = _munsell_specification_to_xyY(
-                    specification_inner)
-
-            rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                (x_inner - x_center, y_inner - y_center, Y_center))
-
-            rho_bounds.append(rho_inner)
-            chroma_bounds.append(chroma_inner)
-
-        rho_bounds = np.array(rho_bounds)
-        chroma_bounds = np.array(chroma_bounds)
-
-        rhos_bounds_indexes = rho_bounds.argsort()
-
-        rho_bounds = rho_bounds[rhos_bounds_indexes]
-        chroma_bounds = chroma_bounds[rhos_bounds_indexes]
-        chroma_new = LinearInterpolator(rho_bounds, chroma_bounds)(rho_input)
-
-        specification_current = [hue_current, value, chroma_new, code_current]
-
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = _munsell_specification_to_xyY(
-                specification_current)
-
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return from_range_10(
-                np.array(specification_current),
-                np.array([10, 10, chroma_scale, 10]))
+            chroma_inner = np.minimum(
+                ((rho_input[bracketing] / rho_current[bracketing]) **
+                 iterations_inner) * chroma_current[bracketing],
+                chroma_maximum[bracketing])
+
+            x_inner, y_inner = (
+                _munsell_specification_to_xy_value_interpolated(
+                    hue_current[bracketing], value[bracketing], chroma_inner,
+                    code_current[bracketing]))
+
+            rho_inner = np.full(rho_current.shape, np.nan)
+            rho_inner[bracketing] = np.hypot(x_inner - x_center,
+                                             y_inner - y_center)
+            chroma_inner_b = np.full(rho_current.shape, np.nan)
+            chroma_inner_b[bracketing] = chroma_inner
+
+            lower = np.logical_and(
+                bracketing,
+                np.logical_and(rho_inner <= rho_input,
+                               np.logical_or(rho_inner > rho_lower,
+                                             rho_lower > rho_input)))
+            rho_lower = np.where(lower, rho_inner, rho_lower)
+            chroma_lower = np.where(lower, chroma_inner_b, chroma_lower)
+
+            upper = np.logical_and(
+                bracketing,
+                np.logical_and(rho_inner > rho_input,
+                               np.logical_or(rho_inner < rho_upper,
+                                             rho_upper <= rho_input)))
+            rho_upper = np.where(upper, rho_inner, rho_upper)
+            chroma_upper = np.where(upper, chroma_inner_b, chroma_upper)
+
+            rho_minimum = np.where(bracketing,
+                                   np.fmin(rho_minimum, rho_inner),
+                                   rho_minimum)
+            rho_maximum = np.where(bracketing,
+                                   np.fmax(rho_maximum, rho_inner),
+                                   rho_maximum)
+
+            bracketing = ~np.logical_and(rho_minimum < rho_input,
+                                         rho_input < rho_maximum)
+
+        chroma_new = _interpolate_linear(rho_input, rho_lower, rho_upper,
+                                         chroma_lower, chroma_upper)
+
+        x_current, y_current = (
+            _munsell_specification_to_xy_value_interpolated(
+                hue_current, value, chroma_new, code_current))
+
+        difference = np.hypot(x - x_current, y - y_current)
+        iterating = retire(difference < convergence_threshold, hue_current,
+                           chroma_new, code_current)
+
+        indexes = indexes[iterating]
+        x, y, value = x[iterating], y[iterating], value[iterating]
+        rho_input, phi_input = rho_input[iterating], phi_input[iterating]
+        hue_current = hue_current[iterating]
+        chroma_current = chroma_new[iterating]
+        code_current = code_current[iterating]
 
     # NOTE: This exception is likely never raised in practice: 300K iterations
     # with random numbers never reached this code path, it is kept for
     # consistency with the reference # implementation
-    raise RuntimeError(  # pragma: no cover
-        'Maximum outside iterations count reached without convergence!')
+    if indexes.size:  # pragma: no cover
+        raise RuntimeError(
+            'Maximum outside iterations count reached without convergence!')
+
+    chroma_scale = 50 if get_domain_range_scale() == '1' else 2
+
+    return from_range_10(specification, np.array([10, 10, chroma_scale, 10]))
 
 
 def xyY_to_munsell_specification(xyY):
@@ -1212,13 +1722,11 @@ def xyY_to_munsell_specification(xyY):
     xyY = as_float_array(xyY)
     shape = list(xyY.shape)
 
-    specification = [
-        _xyY_to_munsell_specification(a) for a in xyY.reshape([-1, 3])
-    ]
+    specification = _xyY_to_munsell_specification(xyY.reshape([-1, 3]))
 
     shape[-1] = 4
 
-    return as_float_array(specification).reshape(shape)
+    return specification.reshape(shape)
 
 
 def xyY_to_munsell_colour(xyY,
@@ -1611,33 +2119,54 @@ def bounding_hues_from_renotation(hue, code):
            [ 10.,   2.]])
     """
 
-    if hue % 2.5 == 0:
-        if hue == 0:
-            hue_cw = 10
-            code_cw = (code + 1) % 10
-        else:
-            hue_cw = hue
-            code_cw = code
-        hue_ccw = hue_cw
-        code_ccw = code_cw
-    else:
-        hue_cw = 2.5 * np.floor(hue / 2.5)
-        hue_ccw = (hue_cw + 2.5) % 10
-        if hue_ccw == 0:
-            hue_ccw = 10
-
-        if hue_cw == 0:
-            hue_cw = 10
-            code_cw = (code + 1) % 10
-            if code_cw == 0:
-                code_cw = 10
-        else:
-            code_cw = code
-        code_ccw = code
+    hue_cw, code_cw, hue_ccw, code_ccw = _bounding_hues_from_renotation(
+        hue, code)
 
     return as_float_array([(hue_cw, code_cw), (hue_ccw, code_ccw)])
 
 
+def _bounding_hues_from_renotation(hue, code):
+    """
+    Returns for given hues the two bounding hues from
+    *Munsell Renotation System* data.
+
+    Parameters
+    ----------
+    hue : numeric or array_like
+        *Munsell* *Colorlab* specification hue.
+    code : numeric or array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    tuple
+        Clockwise bounding hue and code, counter-clockwise bounding hue and
+        code.
+    """
+
+    hue = as_float_array(hue)
+    code = as_float_array(code)
+
+    standard = hue % 2.5 == 0
+
+    hue_cw = 2.5 * np.floor(hue / 2.5)
+    hue_ccw = (hue_cw + 2.5) % 10
+    hue_ccw = np.where(hue_ccw == 0, 10, hue_ccw)
+
+    code_cw = np.where(hue_cw == 0, (code + 1) % 10, code)
+    code_cw = np.where(np.logical_and(hue_cw == 0, code_cw == 0), 10,
+                       code_cw)
+    hue_cw = np.where(hue_cw == 0, 10, hue_cw)
+
+    hue_s = np.where(hue == 0, 10, hue)
+    code_s = np.where(hue == 0, (code + 1) % 10, code)
+
+    return (np.where(standard, hue_s, hue_cw),
+            np.where(standard, code_s, code_cw),
+            np.where(standard, hue_s, hue_ccw),
+            np.where(standard, code_s, code))
+
+
 def hue_to_hue_angle(hue, code):
     """
     Converts from the *Munsell* *Colorlab* specification hue to hue angle in
@@ -1667,9 +2196,8 @@ def hue_to_hue_angle(hue, code):
 
     single_hue = ((17 - code) % 10 + (hue / 10) - 0.5) % 10
 
-    return LinearInterpolator(
-        (0, 2, 3, 4, 5, 6, 8, 9, 10),
-        (0, 45, 70, 135, 160, 225, 255, 315, 360))(single_hue)
+    return np.interp(single_hue, (0, 2, 3, 4, 5, 6, 8, 9, 10),
+                     (0, 45, 70, 135, 160, 225, 255, 315, 360))
 
 
 def hue_angle_to_hue(hue_angle):
@@ -1698,37 +2226,17 @@ def hue_angle_to_hue(hue_angle):
     array([ 3.216,  4.   ])
     """
 
-    single_hue = LinearInterpolator((0, 45, 70, 135, 160, 225, 255, 315, 360),
-                                    (0, 2, 3, 4, 5, 6, 8, 9, 10))(hue_angle)
-
-    if single_hue <= 0.5:
-        code = 7
-    elif single_hue <= 1.5:
-        code = 6
-    elif single_hue <= 2.5:
-        code = 5
-    elif single_hue <= 3.5:
-        code = 4
-    elif single_hue <= 4.5:
-        code = 3
-    elif single_hue <= 5.5:
-        code = 2
-    elif single_hue <= 6.5:
-        code = 1
-    elif single_hue <= 7.5:
-        code = 10
-    elif single_hue <= 8.5:
-        code = 9
-    elif single_hue <= 9.5:
-        code = 8
-    else:
-        code = 7
+    single_hue = np.interp(hue_angle,
+                           (0, 45, 70, 135, 160, 225, 255, 315, 360),
+                           (0, 2, 3, 4, 5, 6, 8, 9, 10))
+
+    code = as_float_array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8, 7])[np.searchsorted(
+        [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5], single_hue)]
 
     hue = (10 * (single_hue % 1) + 5) % 10
-    if hue == 0:
-        hue = 10
+    hue = np.where(hue == 0, 10, hue)
 
-    return as_float_array([hue, code])
+    return tstack([hue, code])
 
 
 def hue_to_ASTM_hue(hue, code):
@@ -2215,37 +2723,17 @@ def LCHab_to_munsell_specification(LCHab):
 
     L, C, Hab = tsplit(LCHab)
 
-    if Hab == 0:
-        code = 8
-    elif Hab <= 36:
-        code = 7
-    elif Hab <= 72:
-        code = 6
-    elif Hab <= 108:
-        code = 5
-    elif Hab <= 144:
-        code = 4
-    elif Hab <= 180:
-        code = 3
-    elif Hab <= 216:
-        code = 2
-    elif Hab <= 252:
-        code = 1
-    elif Hab <= 288:
-        code = 10
-    elif Hab <= 324:
-        code = 9
-    else:
-        code = 8
+    code = as_float_array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8])[np.searchsorted(
+        [36, 72, 108, 144, 180, 216, 252, 288, 324], Hab)]
+    code = np.where(Hab == 0, 8, code)
 
-    hue = LinearInterpolator((0, 36), (0, 10))(Hab % 36)
-    if hue == 0:
-        hue = 10
+    hue = np.interp(Hab % 36, (0, 36), (0, 10))
+    hue = np.where(hue == 0, 10, hue)
 
     value = L / 10
     chroma = C / 5
 
-    return as_float_array([hue, value, chroma, code])
+    return tstack([hue, value, chroma, code])
 
 
 def maximum_chroma_from_renotation(hue, value, code):
@@ -33,8 +33,8 @@ from colour.notation import (
     munsell_value_Priest1920, munsell_value_Munsell1933,
     munsell_value_Moon1943, munsell_value_Saunderson1944,
     munsell_value_Ladd1955, munsell_value_McCamy1987, munsell_value_ASTMD1535)
-from colour.utilities import (as_float_array, domain_range_scale,
-                              ignore_numpy_errors, tstack)
+from colour.utilities import (CACHE_REGISTRY, as_float_array,
+                              domain_range_scale, ignore_numpy_errors, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -1993,6 +1993,18 @@ class TestMaximumChromaFromRenotation(unittest.TestCase):
 
         self.assertEqual(maximum_chroma_from_renotation(6.875, 3.425, 1), 16.0)
 
+        CACHE_REGISTRY.clear_all_caches()
+        self.assertEqual(
+            len(CACHE_REGISTRY.caches[
+                'colour.notation.munsell.'
+                '_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE']), 0)
+
+        self.assertEqual(maximum_chroma_from_renotation(2.5, 5, 5), 14.0)
+        self.assertEqual(
+            len(CACHE_REGISTRY.caches[
+                'colour.notation.munsell.'
+                '_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE']), 1)
+
 
 class TestMunsellSpecification_to_xy(unittest.TestCase):
     """
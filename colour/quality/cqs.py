@@ -8,6 +8,10 @@ Defines *Colour Quality Scale* (CQS) computation objects:
 -   :class:`colour.quality.CQS_Specification`
 -   :func:`colour.colour_quality_scale`
 
+The test spectral distributions are processed in batch: the *VS test colour
+samples* weights are precomputed once per spectral shape and method and every
+test spectral distribution is evaluated at once with array computations.
+
 References
 ----------
 -   :cite:`Davis2010a` : Davis, W., & Ohno, Y. (2010). Color quality scale.
@@ -29,14 +33,17 @@ from collections import namedtuple
 
 from colour.algebra import euclidean_distance
 from colour.colorimetry import (
-    SPECTRAL_SHAPE_DEFAULT, sd_CIE_illuminant_D_series, CCS_ILLUMINANTS,
-    MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody, sd_to_XYZ)
+    CCS_ILLUMINANTS, SPECTRAL_SHAPE_DEFAULT, MSDS_CMFS_STANDARD_OBSERVER,
+    SpectralDistribution, sd_to_XYZ)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.quality.cri import spectral_data_reference, spectral_data_test
 from colour.quality.datasets.vs import INDEXES_TO_NAMES_VS, SDS_VS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
-from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
+from colour.temperature import uv_to_CCT_Ohno2013
 from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import as_float_array, domain_range_scale, tsplit
+from colour.utilities import (CACHE_REGISTRY, as_float_array,
+                              domain_range_scale, tsplit, tstack)
 from colour.utilities.documentation import (DocstringTuple,
                                             is_documentation_building)
 
@@ -54,6 +61,9 @@ __all__ = [
     'scale_conversion', 'delta_E_RMS', 'colour_quality_scales'
 ]
 
+_CACHE_VS_WEIGHTS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_VS_WEIGHTS'.format(__name__))
+
 D65_GAMUT_AREA = 8210
 
 
@@ -173,46 +183,49 @@ def colour_quality_scale(sd_test, additional_data=False,
             SPECTRAL_SHAPE_DEFAULT)
 
     shape = cmfs.shape
-    sd_test = sd_test.copy().align(shape)
-    vs_sds = {
-        sd.name: sd.copy().align(shape)
-        for sd in SDS_VS[method].values()
-    }
+    names, S_t = spectral_data_test(sd_test, shape)
 
-    with domain_range_scale('1'):
-        XYZ = sd_to_XYZ(sd_test, cmfs)
+    XYZ_t, XYZ_vs_t = _vs_tristimulus_values(S_t, cmfs, method)
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ_t))
+    CCT, _D_uv = tsplit(uv_to_CCT_Ohno2013(uv))
 
-    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
-    CCT, _D_uv = uv_to_CCT_Ohno2013(uv)
+    S_r = spectral_data_reference(CCT, shape)
 
-    if CCT < 5000:
-        sd_reference = sd_blackbody(CCT, shape)
-    else:
-        xy = CCT_to_xy_CIE_D(CCT)
-        sd_reference = sd_CIE_illuminant_D_series(xy)
-        sd_reference.align(shape)
+    XYZ_r, XYZ_vs_r = _vs_tristimulus_values(S_r, cmfs, method)
+
+    XYZ_t = XYZ_t / XYZ_t[..., 1:2]
+    XYZ_r = XYZ_r / XYZ_r[..., 1:2]
+    xy_r = XYZ_to_xy(XYZ_r)
+
+    with domain_range_scale('ignore'):
+        XYZ_vs_t = chromatic_adaptation_VonKries(
+            XYZ_vs_t,
+            XYZ_t[..., np.newaxis, :],
+            XYZ_r[..., np.newaxis, :],
+            transform='CMCCAT2000')
 
-    test_vs_colorimetry_data = vs_colorimetry_data(
-        sd_test, sd_reference, vs_sds, cmfs, chromatic_adaptation=True)
+        Lab_t = XYZ_to_Lab(XYZ_vs_t, illuminant=xy_r[..., np.newaxis, :])
+        Lab_r = XYZ_to_Lab(XYZ_vs_r, illuminant=xy_r[..., np.newaxis, :])
 
-    reference_vs_colorimetry_data = vs_colorimetry_data(
-        sd_reference, sd_reference, vs_sds, cmfs)
+        _L_t, C_t, _Hab_t = tsplit(Lab_to_LCHab(Lab_t))
+        _L_r, C_r, _Hab_r = tsplit(Lab_to_LCHab(Lab_r))
 
     if method == 'nist cqs 9.0':
-        CCT_f = 1
+        CCT_f = np.ones(CCT.shape)
         scaling_f = 3.2
     else:
-        XYZ_r = sd_to_XYZ(sd_reference, cmfs)
-        XYZ_r /= XYZ_r[1]
-        CCT_f = CCT_factor(reference_vs_colorimetry_data, XYZ_r)
+        CCT_f = _CCT_factor(XYZ_vs_r, XYZ_r[..., np.newaxis, :])
         scaling_f = 3.104
 
-    Q_as = colour_quality_scales(test_vs_colorimetry_data,
-                                 reference_vs_colorimetry_data, scaling_f,
-                                 CCT_f)
+    D_C_ab = C_t - C_r
+    D_E_ab = euclidean_distance(Lab_t, Lab_r)
+    D_Ep_ab = np.where(D_C_ab > 0, np.sqrt(D_E_ab ** 2 - D_C_ab ** 2),
+                       D_E_ab)
 
-    D_E_RMS = delta_E_RMS(Q_as, 'D_E_ab')
-    D_Ep_RMS = delta_E_RMS(Q_as, 'D_Ep_ab')
+    Q_as = scale_conversion(D_Ep_ab, CCT_f[..., np.newaxis], scaling_f)
+
+    D_E_RMS = np.sqrt(np.average(D_E_ab ** 2, axis=-1))
+    D_Ep_RMS = np.sqrt(np.average(D_Ep_ab ** 2, axis=-1))
 
     Q_a = scale_conversion(D_Ep_RMS, CCT_f, scaling_f)
 
@@ -223,29 +236,105 @@ def colour_quality_scale(sd_test, additional_data=False,
 
     Q_f = scale_conversion(D_E_RMS, CCT_f, scaling_f)
 
-    G_t = gamut_area(
-        [vs_CQS_data.Lab for vs_CQS_data in test_vs_colorimetry_data])
-    G_r = gamut_area(
-        [vs_CQS_data.Lab for vs_CQS_data in reference_vs_colorimetry_data])
+    G_t = gamut_area(Lab_t)
+    G_r = gamut_area(Lab_r)
 
     Q_g = G_t / D65_GAMUT_AREA * 100
 
     if method == 'nist cqs 9.0':
-        Q_d = Q_p = None
+        Q_d = Q_p = [None] * len(names)
     else:
-        p_delta_C = np.average([
-            sample_data.D_C_ab if sample_data.D_C_ab > 0 else 0
-            for sample_data in Q_as.values()
-        ])
+        p_delta_C = np.average(np.where(D_C_ab > 0, D_C_ab, 0), axis=-1)
         Q_p = 100 - 3.6 * (D_Ep_RMS - p_delta_C)
         Q_d = G_t / G_r * CCT_f * 100
 
     if additional_data:
-        return CQS_Specification(
-            sd_test.name, Q_a, Q_f, Q_p, Q_g, Q_d, Q_as,
-            (test_vs_colorimetry_data, reference_vs_colorimetry_data))
+        names_vs = [
+            SDS_VS[method][value].name
+            for _key, value in sorted(INDEXES_TO_NAMES_VS.items())
+        ]
+
+        def vs_data(i, XYZ_vs, Lab_vs, C_vs):
+            """
+            Returns the *VS test colour samples* colorimetry data of given
+            test spectral distribution index.
+            """
+
+            return [
+                VS_ColorimetryData(name, XYZ_vs[i, j], Lab_vs[i, j],
+                                   C_vs[i, j])
+                for j, name in enumerate(names_vs)
+            ]
+
+        specifications = [
+            CQS_Specification(
+                name, Q_a[i], Q_f[i], Q_p[i], Q_g[i], Q_d[i], {
+                    j + 1: VS_ColourQualityScaleData(
+                        name_vs, Q_as[i, j], D_C_ab[i, j], D_E_ab[i, j],
+                        D_Ep_ab[i, j])
+                    for j, name_vs in enumerate(names_vs)
+                }, (vs_data(i, XYZ_vs_t, Lab_t, C_t),
+                    vs_data(i, XYZ_vs_r, Lab_r, C_r)))
+            for i, name in enumerate(names)
+        ]
+
+        if isinstance(sd_test, SpectralDistribution):
+            return specifications[0]
+        else:
+            return specifications
     else:
-        return Q_a
+        if isinstance(sd_test, SpectralDistribution):
+            return Q_a[0]
+        else:
+            return Q_a
+
+
+def _vs_tristimulus_values(S, cmfs, method):
+    """
+    Returns the *CIE XYZ* tristimulus values of given illuminants values and
+    of the *VS test colour samples* illuminated by them.
+
+    The *VS test colour samples* weights, i.e. their spectral reflectances
+    multiplied by the colour matching functions, are computed once for given
+    colour matching functions and method and cached.
+
+    Parameters
+    ----------
+    S : array_like
+        Illuminants values aligned to the colour matching functions shape.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    method : unicode
+        **{'NIST CQS 9.0', 'NIST CQS 7.4'}**,
+        Computation method.
+
+    Returns
+    -------
+    tuple
+        Un-normalised illuminants *CIE XYZ* tristimulus values and *VS test
+        colour samples* *CIE XYZ* tristimulus values in domain [0, 1].
+    """
+
+    hash_key = (hash(cmfs), method, DEFAULT_FLOAT_DTYPE)
+    weights = _CACHE_VS_WEIGHTS.get(hash_key)
+    if weights is None:
+        R = [np.ones(cmfs.shape.range().shape)] + [
+            SDS_VS[method][value].copy().align(cmfs.shape).values
+            for _key, value in sorted(INDEXES_TO_NAMES_VS.items())
+        ]
+        weights = np.transpose(R)[..., np.newaxis] * cmfs.values[
+            :, np.newaxis, :]
+        weights = _CACHE_VS_WEIGHTS[hash_key] = np.reshape(
+            weights, (weights.shape[0], -1))
+
+    S = as_float_array(S)
+
+    XYZ = np.reshape(np.dot(S, weights), S.shape[:-1] + (-1, 3))
+    XYZ_s, XYZ_vs = XYZ[..., 0, :], XYZ[..., 1:, :]
+
+    XYZ_vs = XYZ_vs / XYZ_s[..., np.newaxis, 1:2]
+
+    return XYZ_s, XYZ_vs
 
 
 def gamut_area(Lab):
@@ -287,18 +376,18 @@ def gamut_area(Lab):
     """
 
     Lab = as_float_array(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     _L, a, b = tsplit(Lab)
     _L_s, a_s, b_s = tsplit(Lab_s)
 
     A = np.linalg.norm(Lab[..., 1:3], axis=-1)
     B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack([a_s - a, b_s - b]), axis=-1)
+    C = np.linalg.norm(tstack([a_s - a, b_s - b]), axis=-1)
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(sd_test,
@@ -371,20 +460,43 @@ def CCT_factor(reference_data, XYZ_r):
         Correlated colour temperature factor.
     """
 
+    XYZ = [
+        vs_colorimetry_data_.XYZ for vs_colorimetry_data_ in reference_data
+    ]
+
+    return _CCT_factor(XYZ, XYZ_r)
+
+
+def _CCT_factor(XYZ, XYZ_r):
+    """
+    Returns the correlated colour temperature factor for given reference
+    *VS test colour samples* *CIE XYZ* tristimulus values.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        Reference *VS test colour samples* *CIE XYZ* tristimulus values, the
+        samples being stored along the penultimate axis.
+    XYZ_r : array_like
+        *CIE XYZ* tristimulus values for reference.
+
+    Returns
+    -------
+    numeric or ndarray
+        Correlated colour temperature factor.
+    """
+
     xy_w = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
     XYZ_w = xy_to_XYZ(xy_w)
 
-    Labs = []
-    for vs_colorimetry_data_ in reference_data:
-        _name, XYZ, _Lab, _C = vs_colorimetry_data_
+    with domain_range_scale('ignore'):
         XYZ_a = chromatic_adaptation_VonKries(
             XYZ, XYZ_r, XYZ_w, transform='CMCCAT2000')
 
         Lab = XYZ_to_Lab(XYZ_a, illuminant=xy_w)
-        Labs.append(Lab)
 
-    G_r = gamut_area(Labs) / D65_GAMUT_AREA
-    CCT_f = 1 if G_r > 1 else G_r
+    G_r = gamut_area(Lab) / D65_GAMUT_AREA
+    CCT_f = np.where(G_r > 1, 1, G_r)
 
     return CCT_f
 
@@ -8,6 +8,10 @@ Defines *Colour Rendering Index* (CRI) computation objects:
 -   :class:`colour.quality.CRI_Specification`
 -   :func:`colour.colour_rendering_index`
 
+The test spectral distributions are processed in batch: the *test colour
+samples* weights are precomputed once per spectral shape and every test
+spectral distribution is evaluated at once with array computations.
+
 References
 ----------
 -   :cite:`Ohno2008a` : Ohno, Yoshiro, & Davis, W. (2008). NIST CQS simulation
@@ -21,14 +25,16 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.algebra import euclidean_distance, spow
+from colour.algebra import LinearInterpolator, euclidean_distance, spow
 from colour.colorimetry import (
-    SPECTRAL_SHAPE_DEFAULT, sd_CIE_illuminant_D_series,
-    MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody, sd_to_XYZ)
+    SPECTRAL_SHAPE_DEFAULT, MultiSpectralDistributions,
+    SDS_ILLUMINANTS_D_SERIES, SpectralDistribution,
+    MSDS_CMFS_STANDARD_OBSERVER, planck_law, sds_and_msds_to_sds, sd_to_XYZ)
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.quality.datasets.tcs import INDEXES_TO_NAMES_TCS, SDS_TCS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
-from colour.utilities import domain_range_scale
+from colour.utilities import CACHE_REGISTRY, as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -39,10 +45,13 @@ __status__ = 'Production'
 
 __all__ = [
     'TCS_ColorimetryData', 'TCS_ColourQualityScaleData', 'CRI_Specification',
-    'colour_rendering_index', 'tcs_colorimetry_data',
-    'colour_rendering_indexes'
+    'colour_rendering_index', 'spectral_data_test', 'spectral_data_reference',
+    'tcs_colorimetry_data', 'colour_rendering_indexes'
 ]
 
+_CACHE_TCS_WEIGHTS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TCS_WEIGHTS'.format(__name__))
+
 
 class TCS_ColorimetryData(
         namedtuple('TCS_ColorimetryData', ('name', 'XYZ', 'uv', 'UVW'))):
@@ -89,15 +98,21 @@ def colour_rendering_index(sd_test, additional_data=False):
 
     Parameters
     ----------
-    sd_test : SpectralDistribution
-        Test spectral distribution.
+    sd_test : SpectralDistribution or MultiSpectralDistributions or \
+array_like
+        Test spectral distribution, multi-spectral distributions or list of
+        spectral and multi-spectral distributions, the latter two being
+        processed in batch.
     additional_data : bool, optional
         Whether to output additional data.
 
     Returns
     -------
-    numeric or CRI_Specification
-        *Colour Rendering Index* (CRI).
+    numeric or ndarray or CRI_Specification or list
+        *Colour Rendering Index* (CRI), the *Colour Rendering Index* (CRI)
+        :math:`Q_a` of each test spectral distribution are returned as an
+        ndarray, or a list of :class:`colour.quality.CRI_Specification` class
+        instances if ``additional_data`` is *True*, for a batch.
 
     References
     ----------
@@ -109,6 +124,9 @@ def colour_rendering_index(sd_test, additional_data=False):
     >>> sd = SDS_ILLUMINANTS['FL2']
     >>> colour_rendering_index(sd)  # doctest: +ELLIPSIS
     64.2337241...
+    >>> sds = [SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2']]
+    >>> colour_rendering_index(sds)  # doctest: +ELLIPSIS
+    array([ 75.8528279...,  64.2337241...])
     """
 
     cmfs = MSDS_CMFS_STANDARD_OBSERVER[
@@ -116,40 +134,280 @@ def colour_rendering_index(sd_test, additional_data=False):
             SPECTRAL_SHAPE_DEFAULT)
 
     shape = cmfs.shape
-    sd_test = sd_test.copy().align(shape)
-    tcs_sds = {sd.name: sd.copy().align(shape) for sd in SDS_TCS.values()}
+    names, S_t = spectral_data_test(sd_test, shape)
 
-    with domain_range_scale('1'):
-        XYZ = sd_to_XYZ(sd_test, cmfs)
+    XYZ_t, XYZ_tcs_t = _tcs_tristimulus_values(S_t, cmfs)
+    uv_t = UCS_to_uv(XYZ_to_UCS(XYZ_t))
+    CCT, _D_uv = tsplit(uv_to_CCT_Robertson1968(uv_t))
+
+    S_r = spectral_data_reference(CCT, shape)
 
-    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
-    CCT, _D_uv = uv_to_CCT_Robertson1968(uv)
+    XYZ_r, XYZ_tcs_r = _tcs_tristimulus_values(S_r, cmfs)
+    uv_r = UCS_to_uv(XYZ_to_UCS(XYZ_r))
 
-    if CCT < 5000:
-        sd_reference = sd_blackbody(CCT, shape)
+    uv_tcs_t, UVW_t = _tcs_UVW(XYZ_tcs_t, uv_t, uv_r, True)
+    uv_tcs_r, UVW_r = _tcs_UVW(XYZ_tcs_r, uv_r, uv_r)
+
+    Q_as = 100 - 4.6 * euclidean_distance(UVW_r, UVW_t)
+    Q_a = np.average(Q_as[..., :8], axis=-1)
+
+    if additional_data:
+        names_tcs = [
+            SDS_TCS[value].name
+            for _key, value in sorted(INDEXES_TO_NAMES_TCS.items())
+        ]
+
+        def tcs_data(i, XYZ_tcs, uv_tcs, UVW):
+            """
+            Returns the *test colour samples* colorimetry data of given test
+            spectral distribution index.
+            """
+
+            return [
+                TCS_ColorimetryData(name, XYZ_tcs[i, j], uv_tcs[i, j],
+                                    UVW[i, j])
+                for j, name in enumerate(names_tcs)
+            ]
+
+        specifications = [
+            CRI_Specification(
+                name, Q_a[i], {
+                    j + 1: TCS_ColourQualityScaleData(name_tcs, Q_as[i, j])
+                    for j, name_tcs in enumerate(names_tcs)
+                }, (tcs_data(i, XYZ_tcs_t, uv_tcs_t, UVW_t),
+                    tcs_data(i, XYZ_tcs_r, uv_tcs_r, UVW_r)))
+            for i, name in enumerate(names)
+        ]
+
+        if isinstance(sd_test, SpectralDistribution):
+            return specifications[0]
+        else:
+            return specifications
     else:
-        xy = CCT_to_xy_CIE_D(CCT)
-        sd_reference = sd_CIE_illuminant_D_series(xy)
-        sd_reference.align(shape)
+        if isinstance(sd_test, SpectralDistribution):
+            return Q_a[0]
+        else:
+            return Q_a
+
+
+def spectral_data_test(sd_test, shape):
+    """
+    Returns the names and the values aligned to given spectral shape of given
+    test spectral distributions.
 
-    test_tcs_colorimetry_data = tcs_colorimetry_data(
-        sd_test, sd_reference, tcs_sds, cmfs, chromatic_adaptation=True)
+    Parameters
+    ----------
+    sd_test : SpectralDistribution or MultiSpectralDistributions or \
+array_like
+        Test spectral distribution, multi-spectral distributions or list of
+        spectral and multi-spectral distributions.
+    shape : SpectralShape
+        Spectral shape to align the test spectral distributions to.
 
-    reference_tcs_colorimetry_data = tcs_colorimetry_data(
-        sd_reference, sd_reference, tcs_sds, cmfs)
+    Returns
+    -------
+    tuple
+        Names of the test spectral distributions and their values as an
+        ndarray of shape (n, w), with n the count of test spectral
+        distributions and w the count of wavelengths of the spectral shape.
 
-    Q_as = colour_rendering_indexes(test_tcs_colorimetry_data,
-                                    reference_tcs_colorimetry_data)
+    Examples
+    --------
+    >>> from colour import SDS_ILLUMINANTS, SpectralShape
+    >>> sds = [SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2']]
+    >>> names, values = spectral_data_test(sds, SpectralShape(380, 780, 5))
+    >>> names
+    ['FL1', 'FL2']
+    >>> values.shape
+    (2, 81)
+    """
 
-    Q_a = np.average(
-        [v.Q_a for k, v in Q_as.items() if k in (1, 2, 3, 4, 5, 6, 7, 8)])
+    if isinstance(sd_test, MultiSpectralDistributions):
+        if sd_test.shape != shape:
+            sd_test = sd_test.copy().align(shape)
 
-    if additional_data:
-        return CRI_Specification(
-            sd_test.name, Q_a, Q_as,
-            (test_tcs_colorimetry_data, reference_tcs_colorimetry_data))
+        return list(sd_test.labels), np.transpose(sd_test.values)
+
+    if isinstance(sd_test, SpectralDistribution):
+        sds = [sd_test]
     else:
-        return Q_a
+        sds = sds_and_msds_to_sds(sd_test)
+
+    values = as_float_array([
+        sd.values if sd.shape == shape else sd.copy().align(shape).values
+        for sd in sds
+    ])
+
+    return [sd.name for sd in sds], values
+
+
+def spectral_data_reference(CCT, shape):
+    """
+    Returns the values aligned to given spectral shape of the reference
+    illuminants for given correlated colour temperatures :math:`T_{cp}`.
+
+    The reference illuminant is the planckian radiator below 5000K and the
+    *CIE Illuminant D Series* otherwise.
+
+    Parameters
+    ----------
+    CCT : numeric or array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray
+        Reference illuminants values, the wavelengths being stored along the
+        last axis.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> spectral_data_reference(
+    ...     [4000, 6500], SpectralShape(400, 700, 100))  # doctest: +ELLIPSIS
+    array([[ 1446.3994564...,  2864.7657743...,  3825.2419984...,  \
+4181.5665822...],
+           [   82.7104    ...,   109.3368    ...,    90.0152    ...,    \
+71.632     ...]])
+    """
+
+    CCT = as_float_array(CCT)
+    wavelengths = shape.range()
+
+    values = np.zeros(CCT.shape + wavelengths.shape, DEFAULT_FLOAT_DTYPE)
+
+    is_planckian = CCT < 5000
+    values[is_planckian] = planck_law(
+        wavelengths * 1e-9, CCT[is_planckian][..., np.newaxis]) * 1e-9
+
+    is_daylight = ~is_planckian
+    if np.any(is_daylight):
+        x, y = tsplit(CCT_to_xy_CIE_D(CCT[is_daylight]))
+
+        M = 0.0241 + 0.2562 * x - 0.7341 * y
+        M1 = np.around((-1.3515 - 1.7703 * x + 5.9114 * y) / M, 3)
+        M2 = np.around((0.0300 - 31.4424 * x + 30.0717 * y) / M, 3)
+
+        S0, S1, S2 = [
+            SpectralDistribution(
+                SDS_ILLUMINANTS_D_SERIES[basis],
+                interpolator=LinearInterpolator).align(shape).values
+            for basis in ('S0', 'S1', 'S2')
+        ]
+
+        values[is_daylight] = (S0 + M1[..., np.newaxis] * S1 +
+                               M2[..., np.newaxis] * S2)
+
+    return values
+
+
+def _tcs_tristimulus_values(S, cmfs):
+    """
+    Returns the *CIE XYZ* tristimulus values of given illuminants values and
+    of the *test colour samples* illuminated by them.
+
+    The *test colour samples* weights, i.e. their spectral reflectances
+    multiplied by the colour matching functions, are computed once for given
+    colour matching functions and cached.
+
+    Parameters
+    ----------
+    S : array_like
+        Illuminants values aligned to the colour matching functions shape.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    tuple
+        Un-normalised illuminants *CIE XYZ* tristimulus values and *test
+        colour samples* *CIE XYZ* tristimulus values in domain [0, 100].
+    """
+
+    hash_key = (hash(cmfs), DEFAULT_FLOAT_DTYPE)
+    weights = _CACHE_TCS_WEIGHTS.get(hash_key)
+    if weights is None:
+        R = [np.ones(cmfs.shape.range().shape)] + [
+            SDS_TCS[value].copy().align(cmfs.shape).values
+            for _key, value in sorted(INDEXES_TO_NAMES_TCS.items())
+        ]
+        weights = np.transpose(R)[..., np.newaxis] * cmfs.values[
+            :, np.newaxis, :]
+        weights = _CACHE_TCS_WEIGHTS[hash_key] = np.reshape(
+            weights, (weights.shape[0], -1))
+
+    S = as_float_array(S)
+
+    XYZ = np.reshape(np.dot(S, weights), S.shape[:-1] + (-1, 3))
+    XYZ_s, XYZ_tcs = XYZ[..., 0, :], XYZ[..., 1:, :]
+
+    XYZ_tcs = 100 * XYZ_tcs / XYZ_s[..., np.newaxis, 1:2]
+
+    return XYZ_s, XYZ_tcs
+
+
+def _tcs_UVW(XYZ_tcs, uv_t, uv_r, chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* *CIE 1960 UCS* chromaticity coordinates
+    and *CIE 1964 U\\*V\\*W\\** colourspace values.
+
+    Parameters
+    ----------
+    XYZ_tcs : array_like
+        *Test colour samples* *CIE XYZ* tristimulus values in domain
+        [0, 100].
+    uv_t : array_like
+        Test illuminants *CIE 1960 UCS* chromaticity coordinates.
+    uv_r : array_like
+        Reference illuminants *CIE 1960 UCS* chromaticity coordinates.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    tuple
+        *Test colour samples* *CIE 1960 UCS* chromaticity coordinates and
+        *CIE 1964 U\\*V\\*W\\** colourspace values.
+    """
+
+    uv_tcs = UCS_to_uv(XYZ_to_UCS(XYZ_tcs))
+    u_tcs, v_tcs = tsplit(uv_tcs)
+
+    u_t, v_t = tsplit(uv_t[..., np.newaxis, :])
+    u_r, v_r = tsplit(uv_r[..., np.newaxis, :])
+
+    if chromatic_adaptation:
+
+        def c(x, y):
+            """
+            Computes the :math:`c` term.
+            """
+
+            return (4 - x - 10 * y) / y
+
+        def d(x, y):
+            """
+            Computes the :math:`d` term.
+            """
+
+            return (1.708 * y + 0.404 - 1.481 * x) / y
+
+        c_t, d_t = c(u_t, v_t), d(u_t, v_t)
+        c_r, d_r = c(u_r, v_r), d(u_r, v_r)
+        tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
+        u_tcs = (
+            (10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
+            (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+        v_tcs = (5.52 /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+
+    W_tcs = 25 * spow(XYZ_tcs[..., 1], 1 / 3) - 17
+    U_tcs = 13 * W_tcs * (u_tcs - u_r)
+    V_tcs = 13 * W_tcs * (v_tcs - v_r)
+
+    return uv_tcs, tstack([U_tcs, V_tcs, W_tcs])
 
 
 def tcs_colorimetry_data(sd_t, sd_r, sds_tcs, cmfs,
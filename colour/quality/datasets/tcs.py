@@ -20,8 +20,10 @@ usp=sharing
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import CaseInsensitiveMapping, LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -1440,9 +1442,9 @@ DATA_TCS = {
     }
 }
 
-SDS_TCS = CaseInsensitiveMapping(
-    dict((key, SpectralDistribution(value, name=key))
-         for key, value in DATA_TCS.items()))
+SDS_TCS = LazyCaseInsensitiveMapping(
+    (key, partial(SpectralDistribution, value, name=key))
+    for key, value in DATA_TCS.items())
 """
 Test colour samples spectral distributions.
 
@@ -1450,5 +1452,5 @@ References
 ----------
 :cite:`Ohno2008a`
 
-SDS_TCS : CaseInsensitiveMapping
+SDS_TCS : LazyCaseInsensitiveMapping
 """
@@ -29,8 +29,10 @@ usp=sharing
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import CaseInsensitiveMapping, LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -2971,8 +2973,9 @@ DATA_VS = {
 }
 
 SDS_VS = CaseInsensitiveMapping({
-    key: dict((name, SpectralDistribution(data, name=name))
-              for name, data in value.items())
+    key: LazyCaseInsensitiveMapping(
+        (name, partial(SpectralDistribution, data, name=name))
+        for name, data in value.items())
     for key, value in DATA_VS.items()
 })
 """
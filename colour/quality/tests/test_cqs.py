@@ -673,6 +673,38 @@ class TestColourQualityScale(unittest.TestCase):
             decimal=7,
         )
 
+    def test_batch_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale` definition batch
+        support.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2'],
+            SDS_LIGHT_SOURCES['Neodimium Incandescent'],
+            SDS_LIGHT_SOURCES['H38HT-100 (Mercury)']
+        ]
+
+        for method in ('NIST CQS 9.0', 'NIST CQS 7.4'):
+            Q_a = [colour_quality_scale(sd, method=method) for sd in sds]
+
+            np.testing.assert_almost_equal(
+                colour_quality_scale(sds, method=method), Q_a, decimal=7)
+
+            specifications = colour_quality_scale(
+                sds, additional_data=True, method=method)
+            for sd, specification in zip(sds, specifications):
+                specification_t = colour_quality_scale(
+                    sd, additional_data=True, method=method)
+                self.assertEqual(specification.name, specification_t.name)
+                for attribute in ('Q_a', 'Q_f', 'Q_p', 'Q_g', 'Q_d'):
+                    value = getattr(specification, attribute)
+                    value_t = getattr(specification_t, attribute)
+                    if value_t is None:
+                        self.assertIsNone(value)
+                    else:
+                        self.assertAlmostEqual(value, value_t, places=7)
+
 
 if __name__ == '__main__':
     unittest.main()
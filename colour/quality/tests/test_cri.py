@@ -9,7 +9,8 @@ import numpy as np
 import unittest
 
 from colour.quality import CRI_Specification, colour_rendering_index
-from colour.colorimetry import SDS_ILLUMINANTS, SpectralDistribution
+from colour.colorimetry import (SDS_ILLUMINANTS, MultiSpectralDistributions,
+                                SpectralDistribution)
 from colour.quality.cri import TCS_ColorimetryData, TCS_ColourQualityScaleData
 
 __author__ = 'Colour Developers'
@@ -343,6 +344,44 @@ class TestColourRenderingIndex(unittest.TestCase):
             decimal=7,
         )
 
+    def test_batch_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index` definition
+        batch support.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2'],
+            SDS_ILLUMINANTS['A'],
+            SpectralDistribution(DATA_SAMPLE)
+        ]
+        Q_a = [colour_rendering_index(sd) for sd in sds]
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index(sds), Q_a, decimal=7)
+
+        msds = MultiSpectralDistributions(
+            np.transpose([sd.values for sd in sds[:2]]),
+            SDS_ILLUMINANTS['FL1'].wavelengths,
+            labels=['FL1', 'FL2'],
+            interpolator=SDS_ILLUMINANTS['FL1'].interpolator)
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index(msds), Q_a[:2], decimal=7)
+
+        specifications = colour_rendering_index(sds, additional_data=True)
+        for sd, specification in zip(sds, specifications):
+            specification_t = colour_rendering_index(sd, additional_data=True)
+            self.assertEqual(specification.name, specification_t.name)
+            self.assertAlmostEqual(
+                specification.Q_a, specification_t.Q_a, places=7)
+            for i, data in specification.Q_as.items():
+                self.assertEqual(data.name, specification_t.Q_as[i].name)
+            for data, data_t in zip(specification.colorimetry_data[0],
+                                    specification_t.colorimetry_data[0]):
+                self.assertEqual(data.name, data_t.name)
+                np.testing.assert_almost_equal(data.UVW, data_t.UVW, decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
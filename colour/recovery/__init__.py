@@ -32,7 +32,7 @@ from .jakob2019 import (sd_Jakob2019, find_coefficients_Jakob2019,
                         XYZ_to_sd_Jakob2019, Jakob2019Interpolator)
 from .mallett2019 import (spectral_primary_decomposition_Mallett2019,
                           RGB_to_sd_Mallett2019, sRGB_to_sd_Mallett2019)
-from .meng2015 import XYZ_to_sd_Meng2015
+from .meng2015 import XYZ_to_sd_Meng2015, XYZ_to_msds_Meng2015
 from .smits1999 import RGB_to_sd_Smits1999
 __all__ = []
 __all__ += datasets.__all__
@@ -44,7 +44,7 @@ __all__ += [
     'spectral_primary_decomposition_Mallett2019', 'RGB_to_sd_Mallett2019',
     'sRGB_to_sd_Mallett2019'
 ]
-__all__ += ['XYZ_to_sd_Meng2015']
+__all__ += ['XYZ_to_sd_Meng2015', 'XYZ_to_msds_Meng2015']
 __all__ += ['RGB_to_sd_Smits1999']
 
 XYZ_TO_SD_METHODS = CaseInsensitiveMapping({
@@ -14,9 +14,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
 from colour.algebra import LinearInterpolator
 from colour.colorimetry.spectrum import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -114,35 +115,51 @@ DATA_SMITS1999 = {
     }
 }
 
-SDS_SMITS1999 = CaseInsensitiveMapping({
+# Using linear interpolation to preserve the shape of the basis spectral
+# distributions once combined and interpolated.
+SDS_SMITS1999 = LazyCaseInsensitiveMapping({
     'white':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_SMITS1999['white'],
-            name='white'),
+            name='white',
+            interpolator=LinearInterpolator),
     'cyan':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_SMITS1999['cyan'],
-            name='cyan'),
+            name='cyan',
+            interpolator=LinearInterpolator),
     'magenta':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_SMITS1999['magenta'],
-            name='magenta'),
+            name='magenta',
+            interpolator=LinearInterpolator),
     'yellow':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_SMITS1999['yellow'],
-            name='yellow'),
+            name='yellow',
+            interpolator=LinearInterpolator),
     'red':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_SMITS1999['red'],
-            name='red'),
+            name='red',
+            interpolator=LinearInterpolator),
     'green':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_SMITS1999['green'],
-            name='green'),
+            name='green',
+            interpolator=LinearInterpolator),
     'blue':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_SMITS1999['blue'],
-            name='blue')
+            name='blue',
+            interpolator=LinearInterpolator)
 })  # yapf: disable
 SDS_SMITS1999.__doc__ = """
 *Smits (1999)* spectral distributions.
@@ -151,10 +168,5 @@ References
 ----------
 :cite:`Smits1999a`
 
-SDS_SMITS1999 : CaseInsensitiveMapping
+SDS_SMITS1999 : LazyCaseInsensitiveMapping
 """
-
-# Using linear interpolation to preserve the shape of the basis spectral
-# distributions once combined and interpolated.
-for _sd in SDS_SMITS1999.values():
-    _sd.interpolator = LinearInterpolator
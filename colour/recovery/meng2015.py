@@ -7,6 +7,7 @@ Defines objects for reflectance recovery using *Meng, Simon and Hanika (2015)*
 method:
 
 -   :func:`colour.recovery.XYZ_to_sd_Meng2015`
+-   :func:`colour.recovery.XYZ_to_msds_Meng2015`
 
 References
 ----------
@@ -20,10 +21,13 @@ from __future__ import division, unicode_literals
 import numpy as np
 from scipy.optimize import minimize
 
-from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER,
-                                SpectralDistribution, SpectralShape, sd_ones,
-                                sd_to_XYZ_integration)
-from colour.utilities import to_domain_1, from_range_100, runtime_warning
+from colour.colorimetry import (
+    MSDS_CMFS_STANDARD_OBSERVER, MultiSpectralDistributions,
+    SpectralDistribution, SpectralShape, TristimulusIntegrator, sd_ones)
+from colour.constants import DEFAULT_INT_DTYPE
+from colour.utilities import (as_float_array, batch, from_range_100,
+                              multiprocessing_pool, runtime_warning,
+                              to_domain_1)
 from colour.utilities.deprecation import handle_arguments_deprecation
 
 __author__ = 'Colour Developers'
@@ -33,7 +37,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['DEFAULT_SPECTRAL_SHAPE_MENG_2015', 'XYZ_to_sd_Meng2015']
+__all__ = [
+    'DEFAULT_SPECTRAL_SHAPE_MENG_2015', 'XYZ_to_sd_Meng2015',
+    'XYZ_to_msds_Meng2015'
+]
 
 DEFAULT_SPECTRAL_SHAPE_MENG_2015 = SpectralShape(360, 780, 5)
 """
@@ -93,6 +100,11 @@ def XYZ_to_sd_Meng2015(
         definition because it processes any measurement interval opposed to
         :func:`colour.colorimetry.sd_to_XYZ_ASTME308` definition that
         handles only measurement interval of 1, 5, 10 or 20nm.
+    -   The integration being linear, the constraint is expressed with the
+        integration matrix whose exact Jacobian, along with the objective
+        function gradient, is given to the optimiser.
+    -   Arrays of *CIE XYZ* tristimulus values are recovered with the
+        :func:`colour.recovery.XYZ_to_msds_Meng2015` definition.
 
     References
     ----------
@@ -157,8 +169,9 @@ def XYZ_to_sd_Meng2015(
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
                          extrapolator_kwargs={...})
+    >>> from colour.colorimetry import sd_to_XYZ_integration
     >>> sd_to_XYZ_integration(sd) / 100  # doctest: +ELLIPSIS
-    array([ 0.2065812...,  0.1219752...,  0.0514132...])
+    array([ 0.2065812...,  0.1219752...,  0.0514130...])
     """
 
     optimisation_kwargs = handle_arguments_deprecation({
@@ -168,39 +181,167 @@ def XYZ_to_sd_Meng2015(
 
     XYZ = to_domain_1(XYZ)
 
-    if illuminant.shape != cmfs.shape:
+    W, optimisation_settings = _optimisation_settings_Meng2015(
+        cmfs, illuminant, optimisation_kwargs)
+
+    a, failures = _solve_Meng2015(
+        (XYZ[np.newaxis, ...], W, optimisation_settings))
+
+    if failures:
+        raise RuntimeError(failures[0])
+
+    a = a[0]
+
+    return SpectralDistribution(
+        from_range_100(a * 100),
+        cmfs.wavelengths,
+        name='Meng (2015) - {0}'.format(XYZ))
+
+
+def XYZ_to_msds_Meng2015(
+        XYZ,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(DEFAULT_SPECTRAL_SHAPE_MENG_2015),
+        illuminant=sd_ones(DEFAULT_SPECTRAL_SHAPE_MENG_2015),
+        optimisation_kwargs=None,
+        processes=1):
+    """
+    Recovers the spectral distributions of given array of *CIE XYZ*
+    tristimulus values using *Meng et al. (2015)* method.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral distributions
+        from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    optimisation_kwargs : dict_like, optional
+        Parameters for :func:`scipy.optimize.minimize` definition.
+    processes : int, optional
+        Number of processes to spread the optimisations across, if greater
+        than 1, a :func:`colour.utilities.multiprocessing_pool` definition
+        pool is used.
+
+    Returns
+    -------
+    MultiSpectralDistributions
+        Recovered multi-spectral distributions, with one spectral distribution
+        per *CIE XYZ* tristimulus values in the flattened given array order.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``XYZ``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    -   Identical *CIE XYZ* tristimulus values, e.g. the repeated texels of a
+        texture atlas, are only recovered once.
+    -   The unique *CIE XYZ* tristimulus values are recovered in sorted order,
+        each optimisation being started from the previous solution projected
+        onto the new tristimulus values constraint.
+    -   The spectral distributions of the *CIE XYZ* tristimulus values for
+        which the optimisation fails, e.g. out of the spectral locus, are set
+        to *NaN* and a single warning reporting their count is issued, the
+        other spectral distributions are retained.
+
+    References
+    ----------
+    :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952],
+    ...                 [0.14222010, 0.23042768, 0.10495772]])
+    >>> cmfs = (
+    ...     MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer'].
+    ...     copy().align(SpectralShape(360, 780, 10))
+    ... )
+    >>> msds = XYZ_to_msds_Meng2015(XYZ, cmfs)
+    >>> msds.values.shape
+    (43, 2)
+    >>> from colour.colorimetry import msds_to_XYZ_integration
+    >>> msds_to_XYZ_integration(msds, cmfs) / 100  # doctest: +ELLIPSIS
+    array([[ 0.2065400...,  0.1219722...,  0.0513695...],
+           [ 0.1422201...,  0.2304276...,  0.1049577...]])
+    """
+
+    XYZ = to_domain_1(XYZ)
+
+    XYZ_u, indexes = np.unique(
+        np.reshape(XYZ, (-1, 3)), axis=0, return_inverse=True)
+
+    W, optimisation_settings = _optimisation_settings_Meng2015(
+        cmfs, illuminant, optimisation_kwargs)
+
+    if processes > 1:
+        chunks = list(
+            batch(XYZ_u, DEFAULT_INT_DTYPE(np.ceil(len(XYZ_u) / processes))))
+        with multiprocessing_pool(processes) as pool:
+            results = pool.map(_solve_Meng2015,
+                               [(chunk, W, optimisation_settings)
+                                for chunk in chunks])
+        a = np.vstack([result[0] for result in results])
+    else:
+        a = _solve_Meng2015((XYZ_u, W, optimisation_settings))[0]
+
+    a = a[np.ravel(indexes)]
+
+    failures = np.sum(np.isnan(a[..., 0]))
+    if failures:
         runtime_warning(
-            'Aligning "{0}" illuminant shape to "{1}" colour matching '
-            'functions shape.'.format(illuminant.name, cmfs.name))
-        illuminant = illuminant.copy().align(cmfs.shape)
+            'Optimization failed for {0} out of {1} "CIE XYZ" tristimulus '
+            'values, their spectral distributions were set to NaN.'.format(
+                failures, len(a)))
 
-    sd = sd_ones(cmfs.shape)
+    return MultiSpectralDistributions(
+        from_range_100(np.transpose(a) * 100),
+        cmfs.wavelengths,
+        name='Meng (2015)')
 
-    def objective_function(a):
-        """
-        Objective function.
-        """
 
-        return np.sum(np.diff(a) ** 2)
+def _optimisation_settings_Meng2015(cmfs, illuminant, optimisation_kwargs):
+    """
+    Returns the integration matrix converting the optimised values to *CIE XYZ*
+    tristimulus values and the :func:`scipy.optimize.minimize` definition
+    settings for *Meng et al. (2015)* method.
 
-    def constraint_function(a):
-        """
-        Function defining the constraint.
-        """
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    optimisation_kwargs : dict_like
+        Parameters for :func:`scipy.optimize.minimize` definition.
 
-        sd[:] = a
-        return sd_to_XYZ_integration(
-            sd, cmfs=cmfs, illuminant=illuminant) - XYZ
+    Returns
+    -------
+    tuple
+        Integration matrix and optimisation settings.
+    """
 
-    wavelengths = sd.wavelengths
-    bins = wavelengths.size
+    if illuminant.shape != cmfs.shape:
+        runtime_warning(
+            'Aligning "{0}" illuminant shape to "{1}" colour matching '
+            'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    bins = len(cmfs.wavelengths)
+
+    # The integration is linear, converting the canonical basis yields the
+    # exact integration matrix, i.e. the constraint Jacobian.
+    integrator = TristimulusIntegrator(
+        cmfs.shape, cmfs, illuminant, method='Integration')
+    W = integrator(np.identity(bins))
 
     optimisation_settings = {
         'method': 'SLSQP',
-        'constraints': {
-            'type': 'eq',
-            'fun': constraint_function
-        },
         'bounds': np.tile(np.array([0, 1000]), (bins, 1)),
         'options': {
             'ftol': 1e-10,
@@ -209,14 +350,96 @@ def XYZ_to_sd_Meng2015(
     if optimisation_kwargs is not None:
         optimisation_settings.update(optimisation_kwargs)
 
-    result = minimize(objective_function, sd.values, **optimisation_settings)
+    return W, optimisation_settings
 
-    if not result.success:
-        raise RuntimeError(
-            'Optimization failed for {0} after {1} iterations: "{2}".'.format(
-                XYZ, result.nit, result.message))
 
-    return SpectralDistribution(
-        from_range_100(result.x * 100),
-        wavelengths,
-        name='Meng (2015) - {0}'.format(XYZ))
+def _objective_function_Meng2015(a):
+    """
+    Objective function of *Meng et al. (2015)* method, i.e. the sum of the
+    squared differences of the consecutive values, and its gradient.
+    """
+
+    d = np.diff(a)
+
+    return np.sum(d ** 2), -2 * np.diff(np.hstack([0, d, 0]))
+
+
+def _solve_Meng2015(arguments):
+    """
+    Solves *Meng et al. (2015)* method optimisation for given *CIE XYZ*
+    tristimulus values sequentially, each optimisation being started from the
+    last successful solution.
+
+    Parameters
+    ----------
+    arguments : tuple
+        *CIE XYZ* tristimulus values, integration matrix and optimisation
+        settings.
+
+    Returns
+    -------
+    tuple
+        Optimised values, set to *NaN* for the failed optimisations, and
+        failure messages.
+
+    Notes
+    -----
+    -   The arguments are passed as a tuple so that the definition can be used
+        with :func:`multiprocessing.Pool.map` definition.
+    """
+
+    XYZ, W, optimisation_settings = arguments
+
+    bins = W.shape[0]
+    bounds = optimisation_settings.get('bounds')
+    if bounds is not None:
+        bounds = as_float_array(bounds)
+    # Projection onto the constraint: "a + P (XYZ - a . W)" satisfies it.
+    P = np.dot(W, np.linalg.inv(np.dot(np.transpose(W), W)))
+
+    a = a_s = np.ones(bins)
+    a_o = np.full((len(XYZ), bins), np.nan)
+    failures = []
+    for i, XYZ_i in enumerate(XYZ):
+
+        def constraint_function(a):
+            """
+            Function defining the constraint.
+            """
+
+            return np.dot(a, W) - XYZ_i
+
+        def constraint_jacobian(a):
+            """
+            Jacobian of the function defining the constraint.
+            """
+
+            return np.transpose(W)
+
+        settings = {
+            'jac': True,
+            'constraints': {
+                'type': 'eq',
+                'fun': constraint_function,
+                'jac': constraint_jacobian,
+            },
+        }
+        settings.update(optimisation_settings)
+
+        if i > 0:
+            a = a_s - np.dot(P, constraint_function(a_s))
+            if bounds is not None:
+                a = np.clip(a, bounds[..., 0], bounds[..., 1])
+
+        result = minimize(_objective_function_Meng2015, a, **settings)
+
+        if not result.success:
+            failures.append(
+                'Optimization failed for {0} after {1} iterations: "{2}".'
+                .format(XYZ_i, result.nit, result.message))
+            continue
+
+        # The next optimisation is started from the last successful one.
+        a_s = a_o[i] = result.x
+
+    return a_o, failures
@@ -8,11 +8,11 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
-                                MSDS_CMFS_STANDARD_OBSERVER, SpectralShape,
-                                SDS_ILLUMINANTS, sd_to_XYZ_integration)
-from colour.recovery import XYZ_to_sd_Meng2015
-from colour.utilities import domain_range_scale
+from colour.colorimetry import (
+    SPECTRAL_SHAPE_DEFAULT, MSDS_CMFS_STANDARD_OBSERVER, SpectralShape,
+    SDS_ILLUMINANTS, msds_to_XYZ_integration, sd_to_XYZ_integration)
+from colour.recovery import XYZ_to_sd_Meng2015, XYZ_to_msds_Meng2015
+from colour.utilities import disable_multiprocessing, domain_range_scale
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -21,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_sd_Meng2015']
+__all__ = ['TestXYZ_to_sd_Meng2015', 'TestXYZ_to_msds_Meng2015']
 
 
 class TestXYZ_to_sd_Meng2015(unittest.TestCase):
@@ -118,5 +118,98 @@ class TestXYZ_to_sd_Meng2015(unittest.TestCase):
                     decimal=7)
 
 
+class TestXYZ_to_msds_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.XYZ_to_msds_Meng2015` definition
+    unit tests methods.
+    """
+
+    def test_XYZ_to_msds_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msds_Meng2015` definition.
+        """
+
+        cmfs = (
+            MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+            .copy().align(SpectralShape(360, 780, 10)))
+
+        XYZ = np.array([
+            [0.21781186, 0.12541048, 0.04697113],
+            [0.14222010, 0.23042768, 0.10495772],
+            [0.07818780, 0.06157201, 0.28099326],
+        ])
+        XYZ = np.reshape(XYZ[[0, 1, 2, 1, 0, 0]], (2, 3, 3))
+        msds = XYZ_to_msds_Meng2015(XYZ, cmfs)
+
+        self.assertEqual(msds.values.shape, (43, 6))
+
+        np.testing.assert_almost_equal(
+            msds_to_XYZ_integration(msds, cmfs) / 100,
+            np.reshape(XYZ, (-1, 3)),
+            decimal=7)
+
+        np.testing.assert_equal(msds.values[..., 0], msds.values[..., 4])
+        np.testing.assert_equal(msds.values[..., 1], msds.values[..., 3])
+
+        np.testing.assert_almost_equal(
+            msds.values[..., 1],
+            XYZ_to_sd_Meng2015(XYZ[0, 1], cmfs).values,
+            decimal=2)
+
+        with disable_multiprocessing():
+            np.testing.assert_almost_equal(
+                XYZ_to_msds_Meng2015(XYZ, cmfs, processes=2).values,
+                msds.values,
+                decimal=2)
+
+        np.testing.assert_almost_equal(
+            msds_to_XYZ_integration(
+                XYZ_to_msds_Meng2015(XYZ, cmfs, SDS_ILLUMINANTS['D65']), cmfs,
+                SDS_ILLUMINANTS['D65']) / 100,
+            np.reshape(XYZ, (-1, 3)),
+            decimal=7)
+
+    def test_failures_XYZ_to_msds_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msds_Meng2015`
+        definition failed optimisations handling.
+        """
+
+        cmfs = (
+            MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+            .copy().align(SpectralShape(360, 780, 10)))
+
+        XYZ = np.array([
+            [0.21781186, 0.12541048, 0.04697113],
+            [0.0, 0.0, 1.0],
+            [0.14222010, 0.23042768, 0.10495772],
+        ])
+        msds = XYZ_to_msds_Meng2015(XYZ, cmfs)
+
+        self.assertTrue(np.all(np.isnan(msds.values[..., 1])))
+        np.testing.assert_almost_equal(
+            msds_to_XYZ_integration(msds, cmfs)[[0, 2]] / 100,
+            XYZ[[0, 2]],
+            decimal=7)
+
+    def test_domain_range_scale_XYZ_to_msds_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msds_Meng2015` definition
+        domain and range scale support.
+        """
+
+        XYZ_i = np.array([[0.21781186, 0.12541048, 0.04697113]])
+        XYZ_o = msds_to_XYZ_integration(XYZ_to_msds_Meng2015(XYZ_i))
+
+        d_r = (('reference', 1, 1), (1, 1, 0.01), (100, 100, 1))
+        for scale, factor_a, factor_b in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    msds_to_XYZ_integration(
+                        XYZ_to_msds_Meng2015(XYZ_i * factor_a)),
+                    XYZ_o * factor_b,
+                    decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -25,11 +25,13 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody,
-                                sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER,
+                                TristimulusIntegrator, planck_law)
 from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import as_float_array, runtime_warning, tsplit
+from colour.utilities import (CACHE_REGISTRY, as_float_array,
+                              runtime_warning, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -53,6 +55,145 @@ CCT_MAXIMAL = 100000
 CCT_SAMPLES = 10
 CCT_CALCULATION_ITERATIONS = 6
 
+_PLANCKIAN_LOCUS_CHUNK_SIZE = 16384
+"""
+Count of planckian radiators whose spectral distributions are computed at once
+by :func:`colour.temperature.ohno2013._uv_planckian_locus` definition, it
+bounds the size of the intermediate spectral distributions array.
+
+_PLANCKIAN_LOCUS_CHUNK_SIZE : int
+"""
+
+_CACHE_TRISTIMULUS_INTEGRATORS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TRISTIMULUS_INTEGRATORS'.format(__name__))
+_CACHE_PLANCKIAN_TABLES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_PLANCKIAN_TABLES'.format(__name__))
+
+
+def _uv_planckian_locus(CCT, cmfs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators at given temperatures for given colour matching
+    functions.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Planckian radiators temperatures in kelvins.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+
+    Notes
+    -----
+    -   The spectral distributions of the planckian radiators are converted to
+        *CIE XYZ* tristimulus values with a cached
+        :class:`colour.colorimetry.TristimulusIntegrator` class instance, i.e.
+        a single matrix product per chunk of temperatures.
+    """
+
+    CCT = as_float_array(CCT)
+
+    hash_key = (hash(cmfs), DEFAULT_FLOAT_DTYPE)
+    integrator = _CACHE_TRISTIMULUS_INTEGRATORS.get(hash_key)
+    if integrator is None:
+        cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
+        integrator = _CACHE_TRISTIMULUS_INTEGRATORS[hash_key] = (
+            TristimulusIntegrator(cmfs.shape, cmfs))
+
+    wavelengths = integrator.shape.range() * 1e-9
+
+    T = np.reshape(CCT, (-1, 1))
+    XYZ = np.empty((T.shape[0], 3))
+    for i in range(0, T.shape[0], _PLANCKIAN_LOCUS_CHUNK_SIZE):
+        T_c = T[i:i + _PLANCKIAN_LOCUS_CHUNK_SIZE]
+        XYZ[i:i + _PLANCKIAN_LOCUS_CHUNK_SIZE] = integrator(
+            planck_law(wavelengths, T_c) * 1e-9)
+
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
+
+    return np.reshape(uv, CCT.shape + (2, ))
+
+
+def _planckian_table(uv, cmfs, start, end, count):
+    """
+    Returns a planckian table as an array from given *CIE UCS* colourspace *uv*
+    chromaticity coordinates, colour matching functions and temperature range
+    using *Ohno (2013)* method.
+
+    Parameters
+    ----------
+    uv : array_like
+        *uv* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric or array_like
+        Temperature range start in kelvins.
+    end : numeric or array_like
+        Temperature range end in kelvins.
+    count : int
+        Temperatures count in the planckian table.
+
+    Returns
+    -------
+    ndarray
+        Planckian table, i.e. an array of shape (..., count, 4) storing the
+        :math:`T_i` temperatures, :math:`u_i`, :math:`v_i` chromaticity
+        coordinates and :math:`d_i` distances to given *uv* chromaticity
+        coordinates on its last axis.
+
+    Notes
+    -----
+    -   The temperatures and chromaticity coordinates of the planckian table
+        are cached per colour matching functions when the temperature range
+        is given by scalars, i.e. when it is shared by all the *uv*
+        chromaticity coordinates.
+
+    Examples
+    --------
+    >>> from colour.colorimetry import (
+    ...     SPECTRAL_SHAPE_DEFAULT, MSDS_CMFS_STANDARD_OBSERVER)
+    >>> cmfs = (
+    ...     MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer'].
+    ...     copy().align(SPECTRAL_SHAPE_DEFAULT)
+    ... )
+    >>> uv = np.array([0.1978, 0.3122])
+    >>> _planckian_table(uv, cmfs, 1000, 1010, 10)[[0, -1]]
+    ... # doctest: +ELLIPSIS
+    array([[  1.00000000e+03,   4.4796288...e-01,   3.5462962...e-01,
+              2.5373557...e-01],
+           [  1.01000000e+03,   4.4563515...e-01,   3.5483063...e-01,
+              2.5147492...e-01]])
+    """
+
+    ux, vx = tsplit(uv)
+    start = as_float_array(start)
+    end = as_float_array(end)
+
+    if start.ndim == 0 and end.ndim == 0:
+        hash_key = (hash(cmfs), float(start), float(end), count,
+                    DEFAULT_FLOAT_DTYPE)
+        Tuv = _CACHE_PLANCKIAN_TABLES.get(hash_key)
+        if Tuv is None:
+            Ti = np.linspace(start, end, count)
+            Tuv = _CACHE_PLANCKIAN_TABLES[hash_key] = np.hstack(
+                [Ti[..., np.newaxis],
+                 _uv_planckian_locus(Ti, cmfs)])
+            Tuv.setflags(write=False)
+    else:
+        Ti = np.linspace(start, end, count, axis=-1)
+        Tuv = np.concatenate(
+            [Ti[..., np.newaxis], _uv_planckian_locus(Ti, cmfs)], axis=-1)
+
+    Ti, ui, vi = tsplit(Tuv)
+    di = np.hypot(ux[..., np.newaxis] - ui, vx[..., np.newaxis] - vi)
+
+    return tstack([np.broadcast_to(a, di.shape) for a in (Ti, ui, vi, di)])
+
 
 def planckian_table(uv, cmfs, start, end, count):
     """
@@ -66,9 +207,9 @@ def planckian_table(uv, cmfs, start, end, count):
         *uv* chromaticity coordinates.
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
-    start : numeric
+    start : numeric or array_like
         Temperature range start in kelvins.
-    end : numeric
+    end : numeric or array_like
         Temperature range end in kelvins.
     count : int
         Temperatures count in the planckian table.
@@ -76,7 +217,8 @@ def planckian_table(uv, cmfs, start, end, count):
     Returns
     -------
     list
-        Planckian table.
+        Planckian table, i.e. a list of :attr:`PLANCKIAN_TABLE_TUVD` with
+        array fields when multiple *uv* chromaticity coordinates are given.
 
     Examples
     --------
@@ -112,23 +254,11 @@ ui=0.4458925..., vi=0.3548084..., di=0.2517248...),
 ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
     """
 
-    ux, vx = uv
-
-    cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
-
-    shape = cmfs.shape
+    table = _planckian_table(uv, cmfs, start, end, count)
 
-    table = []
-    for Ti in np.linspace(start, end, count):
-        sd = sd_blackbody(Ti, shape)
-        XYZ = sd_to_XYZ(sd, cmfs)
-        XYZ /= np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        ui, vi = UCS_to_uv(UVW)
-        di = np.hypot(ux - ui, vx - vi)
-        table.append(PLANCKIAN_TABLE_TUVD(Ti, ui, vi, di))
-
-    return table
+    return [
+        PLANCKIAN_TABLE_TUVD(*tsplit(table[..., i, :])) for i in range(count)
+    ]
 
 
 def planckian_table_minimal_distance_index(planckian_table_):
@@ -138,12 +268,14 @@ def planckian_table_minimal_distance_index(planckian_table_):
 
     Parameters
     ----------
-    planckian_table_ : list
-        Planckian table.
+    planckian_table_ : list or ndarray
+        Planckian table, either as returned by
+        :func:`colour.temperature.planckian_table` definition or as an array
+        of shape (..., count, 4).
 
     Returns
     -------
-    int
+    int or ndarray
         Shortest distance index.
 
     Examples
@@ -160,101 +292,12 @@ def planckian_table_minimal_distance_index(planckian_table_):
     9
     """
 
-    distances = [x.di for x in planckian_table_]
-    return distances.index(min(distances))
-
-
-def _uv_to_CCT_Ohno2013(
-        uv,
-        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
-        .copy().trim(SPECTRAL_SHAPE_DEFAULT),
-        start=CCT_MINIMAL,
-        end=CCT_MAXIMAL,
-        count=CCT_SAMPLES,
-        iterations=CCT_CALCULATION_ITERATIONS):
-    """
-    Returns the correlated colour temperature :math:`T_{cp}` and
-    :math:`\\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
-    coordinates, colour matching functions and temperature range using
-    *Ohno (2013)* method.
-
-    The iterations parameter defines the calculations precision: The higher its
-    value, the more planckian tables will be generated through cascade
-    expansion in order to converge to the exact solution.
-
-    Parameters
-    ----------
-    uv : array_like
-        *CIE UCS* colourspace *uv* chromaticity coordinates.
-    cmfs : XYZ_ColourMatchingFunctions, optional
-        Standard observer colour matching functions.
-    start : numeric, optional
-        Temperature range start in kelvins.
-    end : numeric, optional
-        Temperature range end in kelvins.
-    count : int, optional
-        Temperatures count in the planckian tables.
-    iterations : int, optional
-        Number of planckian tables to generate.
-
-    Returns
-    -------
-    ndarray
-        Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
-    """
-
-    # Ensuring we do at least one iteration to initialise variables.
-    iterations = max(iterations, 1)
-
-    # Planckian table creation through cascade expansion.
-    for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
-            runtime_warning(
-                ('Minimal distance index is on lowest planckian table bound, '
-                 'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
-            runtime_warning(
-                ('Minimal distance index is on highest planckian table bound, '
-                 'unpredictable results may occur!'))
-            index -= 1
-
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
-
-    _ux, vx = uv
-
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
-
-    # Triangular solution.
-    l = np.hypot(uin - uip, vin - vip)  # noqa
-    x = (dip ** 2 - din ** 2 + l ** 2) / (2 * l)
-    T = Tip + (Tin - Tip) * (x / l)
-
-    vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
-    D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
+    if isinstance(planckian_table_, np.ndarray):
+        return np.argmin(planckian_table_[..., -1], axis=-1)
 
-    # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
-        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
-        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
-        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
-               (di - dip)) * X ** -1)
-        c = (
-            -(dip * (Tin - Ti) * Ti * Tin + di *
-              (Tip - Tin) * Tip * Tin + din * (Ti - Tip) * Tip * Ti) * X ** -1)
-
-        T = -b / (2 * a)
+    distances = tstack([as_float_array(x.di) for x in planckian_table_])
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
-
-    return np.array([T, D_uv])
+    return np.argmin(distances, axis=-1)
 
 
 def uv_to_CCT_Ohno2013(uv,
@@ -294,6 +337,14 @@ def uv_to_CCT_Ohno2013(uv,
     ndarray
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
 
+    Notes
+    -----
+    -   The cascade expansion is performed on all the *uv* chromaticity
+        coordinates at once: The first planckian table is shared and cached,
+        the subsequent planckian tables are computed for all the *uv*
+        chromaticity coordinates with a single tristimulus integration per
+        iteration.
+
     References
     ----------
     :cite:`Ohno2014a`
@@ -313,66 +364,62 @@ def uv_to_CCT_Ohno2013(uv,
     """
 
     uv = as_float_array(uv)
+    shape = uv.shape
 
-    CCT_D_uv = [
-        _uv_to_CCT_Ohno2013(a, cmfs, start, end, count, iterations)
-        for a in np.reshape(uv, (-1, 2))
-    ]
-
-    return as_float_array(CCT_D_uv).reshape(uv.shape)
-
-
-def _CCT_to_uv_Ohno2013(CCT_D_uv,
-                        cmfs=MSDS_CMFS_STANDARD_OBSERVER[
-                            'CIE 1931 2 Degree Standard Observer']):
-    """
-    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates from given
-    correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}` and
-    colour matching functions using *Ohno (2013)* method.
-
-    Parameters
-    ----------
-    CCT_D_uv : ndarray
-        Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
-    cmfs : XYZ_ColourMatchingFunctions, optional
-        Standard observer colour matching functions.
+    uv = np.reshape(uv, (-1, 2))
+    _ux, vx = tsplit(uv)
+    rows = np.arange(uv.shape[0])
 
-    Returns
-    -------
-    ndarray
-        *CIE UCS* colourspace *uv* chromaticity coordinates.
-    """
+    # Ensuring we do at least one iteration to initialise variables.
+    iterations = max(iterations, 1)
 
-    CCT, D_uv = tsplit(CCT_D_uv)
+    # Planckian tables creation through cascade expansion.
+    for _i in range(iterations):
+        table = _planckian_table(uv, cmfs, start, end, count)
+        index = planckian_table_minimal_distance_index(table)
+        if np.any(index == 0):
+            runtime_warning(
+                ('Minimal distance index is on lowest planckian table bound, '
+                 'unpredictable results may occur!'))
+        if np.any(index == count - 1):
+            runtime_warning(
+                ('Minimal distance index is on highest planckian table bound, '
+                 'unpredictable results may occur!'))
+        index = np.clip(index, 1, count - 2)
 
-    cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
+        start = table[rows, index - 1, 0]
+        end = table[rows, index + 1, 0]
 
-    shape = cmfs.shape
+    Tip, uip, vip, dip = tsplit(table[rows, index - 1])
+    Ti, _ui, _vi, di = tsplit(table[rows, index])
+    Tin, uin, vin, din = tsplit(table[rows, index + 1])
 
-    delta = 0.01
+    # Triangular solution.
+    l = np.hypot(uin - uip, vin - vip)  # noqa
+    x = (dip ** 2 - din ** 2 + l ** 2) / (2 * l)
+    T = Tip + (Tin - Tip) * (x / l)
 
-    sd = sd_blackbody(CCT, shape)
-    XYZ = sd_to_XYZ(sd, cmfs)
-    XYZ *= 1 / np.max(XYZ)
-    UVW = XYZ_to_UCS(XYZ)
-    u0, v0 = UCS_to_uv(UVW)
+    vtx = vip + (vin - vip) * (x / l)
+    sign = np.where(vx - vtx >= 0, 1, -1)
+    D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
-    if D_uv == 0:
-        return np.array([u0, v0])
-    else:
-        sd = sd_blackbody(CCT + delta, shape)
-        XYZ = sd_to_XYZ(sd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        u1, v1 = UCS_to_uv(UVW)
+    # Parabolic solution.
+    parabolic = np.abs(D_uv) >= 0.002
+    if np.any(parabolic):
+        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
+        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
+        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
+               (di - dip)) * X ** -1)
+        c = (
+            -(dip * (Tin - Ti) * Ti * Tin + di *
+              (Tip - Tin) * Tip * Tin + din * (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        du = u0 - u1
-        dv = v0 - v1
+        T_p = -b / (2 * a)
 
-        u = u0 - D_uv * (dv / np.hypot(du, dv))
-        v = v0 + D_uv * (du / np.hypot(du, dv))
+        T = np.where(parabolic, T_p, T)
+        D_uv = np.where(parabolic, sign * (a * T_p ** 2 + b * T_p + c), D_uv)
 
-        return np.array([u, v])
+    return np.reshape(tstack([T, D_uv]), shape)
 
 
 def CCT_to_uv_Ohno2013(CCT_D_uv,
@@ -414,6 +461,19 @@ def CCT_to_uv_Ohno2013(CCT_D_uv,
 
     CCT_D_uv = as_float_array(CCT_D_uv)
 
-    uv = [_CCT_to_uv_Ohno2013(a, cmfs) for a in np.reshape(CCT_D_uv, (-1, 2))]
+    CCT, D_uv = tsplit(np.reshape(CCT_D_uv, (-1, 2)))
+
+    delta = 0.01
+
+    u0, v0 = tsplit(_uv_planckian_locus(CCT, cmfs))
+    u1, v1 = tsplit(_uv_planckian_locus(CCT + delta, cmfs))
+
+    du = u0 - u1
+    dv = v0 - v1
+
+    u = u0 - D_uv * (dv / np.hypot(du, dv))
+    v = v0 + D_uv * (du / np.hypot(du, dv))
+
+    uv = tstack([np.where(D_uv == 0, u0, u), np.where(D_uv == 0, v0, v)])
 
-    return as_float_array(uv).reshape(CCT_D_uv.shape)
+    return np.reshape(uv, CCT_D_uv.shape)
@@ -39,7 +39,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import as_float_array, tsplit
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -115,74 +115,24 @@ ISOTEMPERATURE_LINES_ROBERTSON1968 = [
 ]
 
 
-def _uv_to_CCT_Robertson1968(uv):
-    """
-    Returns the correlated colour temperature :math:`T_{cp}` and
-    :math:`\\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
-    coordinates using *Roberston (1968)* method.
-
-    Parameters
-    ----------
-    uv : array_like
-        *CIE UCS* colourspace *uv* chromaticity coordinates.
-
-    Returns
-    -------
-    ndarray
-        Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
-    """
-
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
-
-    for i in range(1, 31):
-        wr_ruvt = ISOTEMPERATURE_LINES_ROBERTSON1968[i]
-        wr_ruvt_previous = ISOTEMPERATURE_LINES_ROBERTSON1968[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
-
-        length = np.hypot(1, dv)
-
-        du /= length
-        dv /= length
-
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
-
-        dt = -uu * dv + vv * du
-
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
-
-            dt = -dt
-
-            f = 0 if i == 1 else dt / (last_dt + dt)
-
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
-
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
-
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
-
-            length = np.hypot(du, dv)
-
-            du /= length
-            dv /= length
-
-            D_uv = uu * du + vv * dv
+_ISOTEMPERATURE_LINES_ROBERTSON1968 = np.array(
+    DATA_ISOTEMPERATURE_LINES_ROBERTSON1968)
+"""
+*Robertson (1968)* iso-temperature lines as an array, with the reciprocal
+megakelvin, *u*, *v* and slope values on the last axis.
 
-            break
+_ISOTEMPERATURE_LINES_ROBERTSON1968 : ndarray
+"""
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
+_ISOTEMPERATURE_LINES_DIRECTIONS_ROBERTSON1968 = (
+    np.array([np.ones(_ISOTEMPERATURE_LINES_ROBERTSON1968.shape[0]),
+              _ISOTEMPERATURE_LINES_ROBERTSON1968[..., 3]]) /
+    np.hypot(1, _ISOTEMPERATURE_LINES_ROBERTSON1968[..., 3])).T
+"""
+*Robertson (1968)* iso-temperature lines normalised directions.
 
-    return np.array([T, -D_uv])
+_ISOTEMPERATURE_LINES_DIRECTIONS_ROBERTSON1968 : ndarray
+"""
 
 
 def uv_to_CCT_Robertson1968(uv):
@@ -212,68 +162,51 @@ def uv_to_CCT_Robertson1968(uv):
     array([  6.5000162...e+03,   8.3333289...e-03])
     """
 
-    uv = as_float_array(uv)
+    u, v = tsplit(uv)
+    u, v = u[..., np.newaxis], v[..., np.newaxis]
 
-    CCT_D_uv = [_uv_to_CCT_Robertson1968(a) for a in np.reshape(uv, (-1, 2))]
+    r_i, u_i, v_i, _t_i = tsplit(_ISOTEMPERATURE_LINES_ROBERTSON1968)
+    du_i, dv_i = tsplit(_ISOTEMPERATURE_LINES_DIRECTIONS_ROBERTSON1968)
 
-    return as_float_array(CCT_D_uv).reshape(uv.shape)
+    # Signed distances to the iso-temperature lines, the adjacent lines
+    # bracketing the *uv* chromaticity coordinates are found by the first
+    # distance sign change, the last line is used if there is none.
+    dt_i = -(u - u_i) * dv_i + (v - v_i) * du_i
 
+    i = np.argmax(dt_i[..., 1:] <= 0, axis=-1) + 1
+    i = np.where(np.any(dt_i[..., 1:] <= 0, axis=-1), i, 30)
+    i = i[..., np.newaxis]
 
-def _CCT_to_uv_Robertson1968(CCT_D_uv):
-    """
-    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates from given
-    correlated colour temperature :math:`T_{cp}` and :math:`\\Delta_{uv}` using
-    *Roberston (1968)* method.
+    def take(a, index):
+        """
+        Takes the values at given index on the last axis of given array.
+        """
 
-    Parameters
-    ----------
-    CCT_D_uv : ndarray
-        Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
+        return np.take_along_axis(
+            np.broadcast_to(a, dt_i.shape), index, axis=-1)[..., 0]
 
-    Returns
-    -------
-    ndarray
-        *CIE UCS* colourspace *uv* chromaticity coordinates.
-    """
+    dt = -np.minimum(take(dt_i, i), 0)
+    last_dt = take(dt_i, i - 1)
 
-    CCT, D_uv = tsplit(CCT_D_uv)
+    f = np.where(i[..., 0] == 1, 0, dt / (last_dt + dt))
 
-    r = 1.0e6 / CCT
+    r, r_p = take(r_i, i), take(r_i, i - 1)
+    T = 1.0e6 / (r_p * f + r * (1 - f))
 
-    for i in range(30):
-        wr_ruvt = ISOTEMPERATURE_LINES_ROBERTSON1968[i]
-        wr_ruvt_next = ISOTEMPERATURE_LINES_ROBERTSON1968[i + 1]
+    uu = u[..., 0] - (take(u_i, i - 1) * f + take(u_i, i) * (1 - f))
+    vv = v[..., 0] - (take(v_i, i - 1) * f + take(v_i, i) * (1 - f))
 
-        if r < wr_ruvt_next.r or i == 29:
-            f = (wr_ruvt_next.r - r) / (wr_ruvt_next.r - wr_ruvt.r)
+    du = take(du_i, i) * (1 - f) + take(du_i, i - 1) * f
+    dv = take(dv_i, i) * (1 - f) + take(dv_i, i - 1) * f
 
-            u = wr_ruvt.u * f + wr_ruvt_next.u * (1 - f)
-            v = wr_ruvt.v * f + wr_ruvt_next.v * (1 - f)
+    length = np.hypot(du, dv)
 
-            uu1 = uu2 = 1.0
-            vv1, vv2 = wr_ruvt.t, wr_ruvt_next.t
+    du /= length
+    dv /= length
 
-            length1 = np.hypot(1, vv1)
-            length2 = np.hypot(1, vv2)
+    D_uv = uu * du + vv * dv
 
-            uu1 /= length1
-            vv1 /= length1
-
-            uu2 /= length2
-            vv2 /= length2
-
-            uu3 = uu1 * f + uu2 * (1 - f)
-            vv3 = vv1 * f + vv2 * (1 - f)
-
-            len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
-
-            uu3 /= len3
-            vv3 /= len3
-
-            u += uu3 * -D_uv
-            v += vv3 * -D_uv
-
-            return np.array([u, v])
+    return tstack([T, -D_uv])
 
 
 def CCT_to_uv_Robertson1968(CCT_D_uv):
@@ -303,8 +236,31 @@ def CCT_to_uv_Robertson1968(CCT_D_uv):
     array([ 0.1937413...,  0.3152210...])
     """
 
-    CCT_D_uv = as_float_array(CCT_D_uv)
+    CCT, D_uv = tsplit(CCT_D_uv)
+
+    r = 1.0e6 / CCT
+
+    r_i, u_i, v_i, _t_i = tsplit(_ISOTEMPERATURE_LINES_ROBERTSON1968)
+    uu_i, vv_i = tsplit(_ISOTEMPERATURE_LINES_DIRECTIONS_ROBERTSON1968)
+
+    # Index of the iso-temperature lines pair bracketing the reciprocal
+    # temperature, the last pair is used beyond the table.
+    i = np.minimum(np.searchsorted(r_i[1:], r, side='right'), 29)
+
+    f = (r_i[i + 1] - r) / (r_i[i + 1] - r_i[i])
+
+    u = u_i[i] * f + u_i[i + 1] * (1 - f)
+    v = v_i[i] * f + v_i[i + 1] * (1 - f)
+
+    uu3 = uu_i[i] * f + uu_i[i + 1] * (1 - f)
+    vv3 = vv_i[i] * f + vv_i[i + 1] * (1 - f)
+
+    len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
+
+    uu3 /= len3
+    vv3 /= len3
 
-    uv = [_CCT_to_uv_Robertson1968(a) for a in np.reshape(CCT_D_uv, (-1, 2))]
+    u += uu3 * -D_uv
+    v += vv3 * -D_uv
 
-    return as_float_array(uv).reshape(CCT_D_uv.shape)
+    return tstack([u, v])
@@ -12,7 +12,8 @@ from itertools import permutations
 from colour.colorimetry import MSDS_CMFS_STANDARD_OBSERVER
 from colour.temperature import CCT_to_uv_Ohno2013, uv_to_CCT_Ohno2013
 from colour.temperature.ohno2013 import (
-    planckian_table, planckian_table_minimal_distance_index)
+    PLANCKIAN_TABLE_TUVD, planckian_table,
+    planckian_table_minimal_distance_index)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -55,10 +56,23 @@ class TestPlanckianTable(unittest.TestCase):
         cmfs = MSDS_CMFS_STANDARD_OBSERVER[
             'CIE 1931 2 Degree Standard Observer']
 
+        table = planckian_table(
+            np.array([0.1978, 0.3122]), cmfs, 1000, 1010, 10)
+
+        for row in table:
+            self.assertIsInstance(row, PLANCKIAN_TABLE_TUVD)
+
         np.testing.assert_almost_equal(
-            [(x.Ti, x.ui, x.vi, x.di) for x in planckian_table(
-                np.array([0.1978, 0.3122]), cmfs, 1000, 1010, 10)],
-            PLANCKIAN_TABLE)
+            [(x.Ti, x.ui, x.vi, x.di) for x in table], PLANCKIAN_TABLE)
+
+        table = planckian_table(
+            np.array([[0.1978, 0.3122], [0.1978, 0.3122]]), cmfs, 1000, 1010,
+            10)
+
+        self.assertEqual(len(table), 10)
+        np.testing.assert_almost_equal(
+            [(x.Ti, x.ui, x.vi, x.di) for x in table],
+            np.tile(PLANCKIAN_TABLE[..., np.newaxis], (1, 1, 2)))
 
 
 class TestPlanckianTableMinimalDistanceIndex(unittest.TestCase):
@@ -79,6 +93,11 @@ planckian_table_minimal_distance_index` definition.
             planckian_table_minimal_distance_index(
                 planckian_table(
                     np.array([0.1978, 0.3122]), cmfs, 1000, 1010, 10)), 9)
+        np.testing.assert_equal(
+            planckian_table_minimal_distance_index(
+                planckian_table(
+                    np.array([[0.1978, 0.3122], [0.4480, 0.3546]]), cmfs,
+                    1000, 1010, 10)), [9, 0])
 
 
 class Testuv_to_CCT_Ohno2013(unittest.TestCase):
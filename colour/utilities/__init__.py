@@ -4,6 +4,8 @@ from __future__ import absolute_import
 
 from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
                               LazyCaseInsensitiveMapping)
+from .cache import (Cache, CacheRegistry, CACHE_REGISTRY, is_caching_enabled,
+                    set_caching_enable, caching_enable)
 from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
@@ -16,11 +18,11 @@ from .common import (
     from_range_100, from_range_degrees, from_range_int)
 from .array import (
     as_array, as_int_array, as_float_array, as_numeric, as_int, as_float,
-    set_float_precision, set_int_precision, as_namedtuple, closest_indexes,
-    closest, normalise_maximum, interval, is_uniform, in_array, tstack, tsplit,
-    row_as_diagonal, dot_vector, dot_matrix, orient, centroid,
-    linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones, full,
-    index_along_last_axis)
+    set_float_precision, float_precision, set_int_precision, as_namedtuple,
+    closest_indexes, closest, normalise_maximum, interval, is_uniform,
+    in_array, tstack, tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
+    centroid, linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones,
+    full, index_along_last_axis)
 from .metrics import metric_mse, metric_psnr
 from .verbose import (
     ColourWarning, ColourUsageWarning, ColourRuntimeWarning, message_box,
@@ -33,6 +35,10 @@ __all__ = [
     'Lookup', 'Structure', 'CaseInsensitiveMapping',
     'LazyCaseInsensitiveMapping'
 ]
+__all__ += [
+    'Cache', 'CacheRegistry', 'CACHE_REGISTRY', 'is_caching_enabled',
+    'set_caching_enable', 'caching_enable'
+]
 __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
@@ -48,12 +54,12 @@ __all__ += [
 ]
 __all__ += [
     'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
-    'as_float', 'set_float_precision', 'set_int_precision', 'as_namedtuple',
-    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
-    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
-    'dot_vector', 'dot_matrix', 'orient', 'centroid', 'linear_conversion',
-    'fill_nan', 'lerp', 'ndarray_write', 'zeros', 'ones', 'full',
-    'index_along_last_axis'
+    'as_float', 'set_float_precision', 'float_precision', 'set_int_precision',
+    'as_namedtuple', 'closest_indexes', 'closest', 'normalise_maximum',
+    'interval', 'is_uniform', 'in_array', 'tstack', 'tsplit',
+    'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient', 'centroid',
+    'linear_conversion', 'fill_nan', 'lerp', 'ndarray_write', 'zeros', 'ones',
+    'full', 'index_along_last_axis'
 ]
 __all__ += ['metric_mse', 'metric_psnr']
 __all__ += [
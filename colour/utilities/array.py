@@ -38,12 +38,12 @@ __status__ = 'Production'
 
 __all__ = [
     'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
-    'as_float', 'set_float_precision', 'set_int_precision', 'as_namedtuple',
-    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
-    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
-    'dot_vector', 'dot_matrix', 'orient', 'centroid', 'linear_conversion',
-    'lerp', 'fill_nan', 'ndarray_write', 'zeros', 'ones', 'full',
-    'index_along_last_axis'
+    'as_float', 'set_float_precision', 'float_precision', 'set_int_precision',
+    'as_namedtuple', 'closest_indexes', 'closest', 'normalise_maximum',
+    'interval', 'is_uniform', 'in_array', 'tstack', 'tsplit',
+    'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient', 'centroid',
+    'linear_conversion', 'lerp', 'fill_nan', 'ndarray_write', 'zeros', 'ones',
+    'full', 'index_along_last_axis'
 ]
 
 
@@ -141,6 +141,10 @@ def as_float_array(a, dtype=None):
         '"dtype" must be one of the following types: {0}'.format(
             np.sctypes['float']))
 
+    # Fast path: the array is returned as is without any conversion.
+    if type(a) is np.ndarray and a.dtype == dtype:
+        return a
+
     return as_array(a, dtype)
 
 
@@ -310,8 +314,8 @@ def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
     dtype('float64')
     """
 
-    for name, module in sys.modules.items():
-        if not name.startswith(name):
+    for name, module in list(sys.modules.items()):
+        if not name.startswith('colour'):
             continue
 
         if not hasattr(module, 'DEFAULT_FLOAT_DTYPE'):
@@ -320,6 +324,37 @@ def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
         setattr(module, 'DEFAULT_FLOAT_DTYPE', dtype)
 
 
+@contextmanager
+def float_precision(dtype):
+    """
+    A context manager temporarily setting *Colour* float precision with
+    :func:`colour.utilities.set_float_precision` definition, e.g. to process
+    images end-to-end in single precision.
+
+    Parameters
+    ----------
+    dtype : object
+        Type to set :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` with.
+
+    Examples
+    --------
+    >>> with float_precision(np.float32):
+    ...     as_float_array(np.ones(3)).dtype
+    dtype('float32')
+    >>> as_float_array(np.ones(3)).dtype
+    dtype('float64')
+    """
+
+    previous_dtype = DEFAULT_FLOAT_DTYPE
+
+    set_float_precision(dtype)
+
+    try:
+        yield
+    finally:
+        set_float_precision(previous_dtype)
+
+
 def set_int_precision(dtype=DEFAULT_INT_DTYPE):
     """
     Sets *Colour* integer precision by setting
@@ -635,7 +670,7 @@ def in_array(a, b, tolerance=EPSILON):
     return np.any(d <= tolerance, axis=0).reshape(a.shape)
 
 
-def tstack(a, dtype=None):
+def tstack(a, dtype=None, out=None):
     """
     Stacks arrays in sequence along the last axis (tail).
 
@@ -648,6 +683,10 @@ def tstack(a, dtype=None):
     dtype : object
         Type to use for initial conversion to *ndarray*, default to the type
         defined by :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    out : ndarray, optional
+        Array to write the stacked arrays into, it must have the stacked
+        arrays shape. The arrays are written directly without intermediate
+        conversion.
 
     Returns
     -------
@@ -684,6 +723,12 @@ def tstack(a, dtype=None):
              [ 5.,  5.,  5.]]]])
     """
 
+    if out is not None:
+        for i, x in enumerate(a):
+            out[..., i] = x
+
+        return out
+
     if dtype is None:
         dtype = DEFAULT_FLOAT_DTYPE
 
@@ -692,7 +737,7 @@ def tstack(a, dtype=None):
     return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
 
 
-def tsplit(a, dtype=None):
+def tsplit(a, dtype=None, out=None):
     """
     Splits arrays in sequence along the last axis (tail).
 
@@ -703,6 +748,9 @@ def tsplit(a, dtype=None):
     dtype : object
         Type to use for initial conversion to *ndarray*, default to the type
         defined by :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    out : ndarray, optional
+        Array to write the split arrays into, it must have the split arrays
+        shape, i.e. the last axis of given array moved first.
 
     Returns
     -------
@@ -746,6 +794,12 @@ def tsplit(a, dtype=None):
 
     a = as_array(a, dtype)
 
+    if out is not None:
+        for i in range(a.shape[-1]):
+            out[i] = a[..., i]
+
+        return out
+
     return np.array([a[..., x] for x in range(a.shape[-1])])
 
 
@@ -802,7 +856,7 @@ def row_as_diagonal(a):
     return np.eye(a.shape[-1]) * a
 
 
-def dot_vector(m, v):
+def dot_vector(m, v, out=None):
     """
     Convenient wrapper around :func:`np.einsum` with the following subscripts:
     *'...ij,...j->...i'*.
@@ -816,6 +870,9 @@ def dot_vector(m, v):
         Array of 3x3 matrices.
     v : array_like
         Array of vectors.
+    out : ndarray, optional
+        Array to write the dot product into, it can be the array of vectors
+        itself for in-place processing.
 
     Returns
     -------
@@ -843,13 +900,20 @@ def dot_vector(m, v):
     m = as_float_array(m)
     v = as_float_array(v)
 
-    return np.einsum('...ij,...j->...i', m, v)
+    # A single matrix is applied to all the vectors with a matrix product.
+    if m.ndim == 2:
+        return np.matmul(v, np.transpose(m), out=out)
+
+    if out is not None and np.may_share_memory(out, v):
+        v = np.copy(v)
 
+    return np.einsum('...ij,...j->...i', m, v, out=out)
 
-def dot_matrix(a, b):
+
+def dot_matrix(a, b, out=None):
     """
-    Convenient wrapper around :func:`np.einsum` with the following subscripts:
-    *'...ij,...jk->...ik'*.
+    Convenient wrapper around :func:`np.matmul`, equivalent to
+    :func:`np.einsum` with the following subscripts: *'...ij,...jk->...ik'*.
 
     It performs the dot product of two arrays where *a* parameter is expected
     to be an array of 3x3 matrices and parameter *b* another array of of 3x3
@@ -861,6 +925,9 @@ def dot_matrix(a, b):
         Array of 3x3 matrices.
     b : array_like
         Array of 3x3 matrices.
+    out : ndarray, optional
+        Array to write the dot product into, it can be one of the arrays of
+        3x3 matrices for in-place processing.
     dtype : object
         Type to use for conversion, default to the type defined by the
         :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
@@ -907,7 +974,7 @@ def dot_matrix(a, b):
     a = as_float_array(a)
     b = as_float_array(b)
 
-    return np.einsum('...ij,...jk->...ik', a, b)
+    return np.matmul(a, b, out=out)
 
 
 def orient(a, orientation):
@@ -1005,7 +1072,7 @@ def centroid(a):
     return np.array(a_ci).astype(DEFAULT_INT_DTYPE)
 
 
-def linear_conversion(a, old_range, new_range):
+def linear_conversion(a, old_range, new_range, out=None):
     """
     Performs a simple linear conversion of given array between the old and new
     ranges.
@@ -1018,6 +1085,9 @@ def linear_conversion(a, old_range, new_range):
         Old range.
     new_range : array_like
         New range.
+    out : ndarray, optional
+        Array to write the linear conversion result into, it can be given
+        array itself for in-place processing.
 
     Returns
     -------
@@ -1036,7 +1106,16 @@ def linear_conversion(a, old_range, new_range):
     in_min, in_max = tsplit(old_range)
     out_min, out_max = tsplit(new_range)
 
-    return ((a - in_min) / (in_max - in_min)) * (out_max - out_min) + out_min
+    if out is None:
+        return ((a - in_min) /
+                (in_max - in_min)) * (out_max - out_min) + out_min
+
+    np.subtract(a, in_min, out=out)
+    out /= in_max - in_min
+    out *= out_max - out_min
+    out += out_min
+
+    return out
 
 
 def lerp(a, b, c):
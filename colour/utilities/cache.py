@@ -0,0 +1,702 @@
+# -*- coding: utf-8 -*-
+"""
+Caching
+=======
+
+Defines the caching objects:
+
+-   :class:`colour.utilities.Cache`: A bounded, thread-safe, least recently
+    used cache.
+-   :class:`colour.utilities.CacheRegistry`: A registry of named caches.
+-   :attr:`colour.utilities.CACHE_REGISTRY`: The global *Colour* cache
+    registry.
+-   :func:`colour.utilities.is_caching_enabled`
+-   :func:`colour.utilities.set_caching_enable`
+-   :class:`colour.utilities.caching_enable`
+"""
+
+from __future__ import division, unicode_literals
+
+import functools
+import numpy as np
+import sys
+import threading
+from collections import OrderedDict
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'Cache', 'CacheRegistry', 'CACHE_REGISTRY', 'is_caching_enabled',
+    'set_caching_enable', 'caching_enable'
+]
+
+_CACHING_ENABLED = True
+"""
+Global variable storing whether the *Colour* caches are enabled.
+
+_CACHING_ENABLED : bool
+"""
+
+
+def is_caching_enabled():
+    """
+    Returns whether the *Colour* caches are enabled.
+
+    Returns
+    -------
+    bool
+        Whether the *Colour* caches are enabled.
+
+    Examples
+    --------
+    >>> is_caching_enabled()
+    True
+    """
+
+    return _CACHING_ENABLED
+
+
+def set_caching_enable(enable):
+    """
+    Sets the *Colour* caches enabled state. When the caches are disabled,
+    nothing is stored nor retrieved from them, the existing cached values are
+    kept though.
+
+    Parameters
+    ----------
+    enable : bool
+        Whether to enable the *Colour* caches.
+
+    Examples
+    --------
+    >>> set_caching_enable(False)
+    >>> is_caching_enabled()
+    False
+    >>> set_caching_enable(True)
+    >>> is_caching_enabled()
+    True
+    """
+
+    global _CACHING_ENABLED
+
+    _CACHING_ENABLED = bool(enable)
+
+
+class caching_enable(object):
+    """
+    A context manager and decorator temporarily setting the *Colour* caches
+    enabled state.
+
+    Parameters
+    ----------
+    enable : bool
+        Whether to enable the *Colour* caches.
+
+    Examples
+    --------
+    >>> with caching_enable(False):
+    ...     is_caching_enabled()
+    False
+    >>> is_caching_enabled()
+    True
+    """
+
+    def __init__(self, enable):
+        self._enable = enable
+        self._previous_enable = is_caching_enabled()
+
+    def __enter__(self):
+        """
+        Called upon entering the context manager and decorator.
+        """
+
+        set_caching_enable(self._enable)
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Called upon exiting the context manager and decorator.
+        """
+
+        set_caching_enable(self._previous_enable)
+
+    def __call__(self, function):
+        """
+        Calls the wrapped definition.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+_MISSING = object()
+"""
+Sentinel object marking a key missing from a cache.
+
+_MISSING : object
+"""
+
+
+def _nbytes(value):
+    """
+    Returns an estimate of the size in bytes of given value.
+
+    Parameters
+    ----------
+    value : object
+        Value to return the size in bytes of.
+
+    Returns
+    -------
+    int
+        Size in bytes estimate.
+
+    Examples
+    --------
+    >>> _nbytes(np.zeros(8))
+    64
+    >>> import scipy.sparse
+    >>> _nbytes(scipy.sparse.csr_matrix(np.identity(8)))
+    132
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    elif all(
+            isinstance(getattr(value, attribute, None), np.ndarray)
+            for attribute in ('data', 'indices', 'indptr')):
+        # Compressed sparse matrices, e.g. "scipy.sparse.csr_matrix".
+        return (value.data.nbytes + value.indices.nbytes +
+                value.indptr.nbytes)
+    elif isinstance(value, (tuple, list)):
+        return sum(_nbytes(element) for element in value)
+    else:
+        return sys.getsizeof(value)
+
+
+class Cache(object):
+    """
+    Defines a bounded, thread-safe, least recently used cache.
+
+    The cache is bounded by a maximum number of items and optionally by a
+    maximum size in bytes, the least recently used items are evicted when any
+    of those limits is exceeded. The hits, misses and evictions are counted.
+
+    Parameters
+    ----------
+    name : unicode
+        Cache name.
+    maximum_size : int, optional
+        Maximum number of items stored in the cache, *None* for no limit.
+    maximum_bytes : int, optional
+        Maximum size in bytes of the items stored in the cache, *None* for no
+        limit. Sizes are estimated using :attr:`numpy.ndarray.nbytes` for
+        arrays and the underlying arrays of compressed sparse matrices, and
+        :func:`sys.getsizeof` definition otherwise.
+
+    Attributes
+    ----------
+    name
+    maximum_size
+    maximum_bytes
+    hits
+    misses
+    evictions
+    nbytes
+
+    Methods
+    -------
+    __contains__
+    __len__
+    __setitem__
+    get
+    clear
+    statistics
+
+    Examples
+    --------
+    >>> cache = Cache('Example', maximum_size=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> cache.get('b') is None
+    True
+    >>> cache.statistics()['evictions']
+    1
+    """
+
+    def __init__(self, name, maximum_size=None, maximum_bytes=None):
+        self._name = name
+        self._maximum_size = maximum_size
+        self._maximum_bytes = maximum_bytes
+
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def name(self):
+        """
+        Getter property for the cache name.
+
+        Returns
+        -------
+        unicode
+            Cache name.
+        """
+
+        return self._name
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the maximum number of items stored in
+        the cache.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum number of items with.
+
+        Returns
+        -------
+        int
+            Maximum number of items.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for the **self.maximum_size** property.
+        """
+
+        with self._lock:
+            self._maximum_size = value
+            self._evict()
+
+    @property
+    def maximum_bytes(self):
+        """
+        Getter and setter property for the maximum size in bytes of the items
+        stored in the cache.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum size in bytes with.
+
+        Returns
+        -------
+        int
+            Maximum size in bytes.
+        """
+
+        return self._maximum_bytes
+
+    @maximum_bytes.setter
+    def maximum_bytes(self, value):
+        """
+        Setter for the **self.maximum_bytes** property.
+        """
+
+        with self._lock:
+            self._maximum_bytes = value
+            self._evict()
+
+    @property
+    def hits(self):
+        """
+        Getter property for the cache hits count.
+
+        Returns
+        -------
+        int
+            Cache hits count.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Getter property for the cache misses count.
+
+        Returns
+        -------
+        int
+            Cache misses count.
+        """
+
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        Getter property for the cache evictions count.
+
+        Returns
+        -------
+        int
+            Cache evictions count.
+        """
+
+        return self._evictions
+
+    @property
+    def nbytes(self):
+        """
+        Getter property for the estimated size in bytes of the items stored in
+        the cache.
+
+        Returns
+        -------
+        int
+            Size in bytes estimate.
+        """
+
+        return self._nbytes
+
+    def __contains__(self, key):
+        """
+        Returns whether the cache contains given key, the hits and misses
+        counts and the items order are not affected.
+
+        Parameters
+        ----------
+        key : object
+            Key to check the presence of.
+
+        Returns
+        -------
+        bool
+            Whether the cache contains given key.
+        """
+
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        """
+        Returns the items count in the cache.
+
+        Returns
+        -------
+        int
+            Items count.
+        """
+
+        return len(self._data)
+
+    def __setitem__(self, key, value):
+        """
+        Stores given value for given key in the cache and evicts the least
+        recently used items if the cache limits are exceeded. Nothing is stored
+        if the *Colour* caches are disabled.
+
+        Parameters
+        ----------
+        key : object
+            Key.
+        value : object
+            Value.
+        """
+
+        if not is_caching_enabled():
+            return
+
+        nbytes = _nbytes(value)
+
+        with self._lock:
+            if key in self._data:
+                self._discard(key)
+
+            self._data[key] = value
+            self._sizes[key] = nbytes
+            self._nbytes += nbytes
+
+            self._evict()
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the cache.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return ('{0}({1!r}, maximum_size={2!r}, '
+                'maximum_bytes={3!r})'.format(
+                    self.__class__.__name__, self._name, self._maximum_size,
+                    self._maximum_bytes))
+
+    def _discard(self, key):
+        """
+        Removes given key from the cache without counting it as an eviction.
+
+        Parameters
+        ----------
+        key : object
+            Key to remove.
+        """
+
+        del self._data[key]
+        self._nbytes -= self._sizes.pop(key)
+
+    def _evict(self):
+        """
+        Evicts the least recently used items until the cache limits are
+        satisfied.
+        """
+
+        while self._data and (
+            (self._maximum_size is not None and
+             len(self._data) > self._maximum_size) or
+            (self._maximum_bytes is not None and
+             self._nbytes > self._maximum_bytes)):
+            self._discard(next(iter(self._data)))
+            self._evictions += 1
+
+    def get(self, key, default=None):
+        """
+        Returns the value stored for given key in the cache and marks it as
+        the most recently used, or given default value if it is not stored or
+        if the *Colour* caches are disabled.
+
+        Parameters
+        ----------
+        key : object
+            Key.
+        default : object, optional
+            Value returned if the key is not stored in the cache.
+
+        Returns
+        -------
+        object
+            Stored value.
+        """
+
+        if not is_caching_enabled():
+            return default
+
+        with self._lock:
+            value = self._data.pop(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+
+            self._data[key] = value
+            self._hits += 1
+
+            return value
+
+    def clear(self):
+        """
+        Clears the cache, the hits, misses and evictions counts are reset.
+        """
+
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._nbytes = 0
+
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def statistics(self):
+        """
+        Returns the cache statistics.
+
+        Returns
+        -------
+        dict
+            Cache statistics, i.e. the items count, the estimated size in bytes
+            and the hits, misses and evictions counts.
+
+        Examples
+        --------
+        >>> cache = Cache('Example')
+        >>> cache['a'] = 1
+        >>> cache.get('a')
+        1
+        >>> cache.get('b')
+        >>> statistics = cache.statistics()
+        >>> statistics['size'], statistics['hits'], statistics['misses']
+        (1, 1, 1)
+        """
+
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'nbytes': self._nbytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
+
+
+class CacheRegistry(object):
+    """
+    Defines a registry of named caches.
+
+    Attributes
+    ----------
+    caches
+
+    Methods
+    -------
+    register_cache
+    unregister_cache
+    clear_cache
+    clear_all_caches
+    statistics
+
+    Examples
+    --------
+    >>> registry = CacheRegistry()
+    >>> cache = registry.register_cache('Example', maximum_size=8)
+    >>> cache['a'] = 1
+    >>> registry.statistics()['Example']['size']
+    1
+    >>> registry.clear_all_caches()
+    >>> len(cache)
+    0
+    """
+
+    def __init__(self):
+        self._caches = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def caches(self):
+        """
+        Getter property for the registered caches.
+
+        Returns
+        -------
+        OrderedDict
+            Registered caches.
+        """
+
+        with self._lock:
+            return OrderedDict(self._caches)
+
+    def __repr__(self):
+        """
+        Returns a formatted string representation of the registry.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        return '{0}({1})'.format(self.__class__.__name__,
+                                 list(self._caches.keys()))
+
+    def register_cache(self, name, maximum_size=None, maximum_bytes=None):
+        """
+        Registers a new cache with given name and limits, the existing cache
+        is returned if a cache with given name is already registered.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name.
+        maximum_size : int, optional
+            Maximum number of items stored in the cache, *None* for no limit.
+        maximum_bytes : int, optional
+            Maximum size in bytes of the items stored in the cache, *None* for
+            no limit.
+
+        Returns
+        -------
+        Cache
+            Registered cache.
+        """
+
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                cache = self._caches[name] = Cache(name, maximum_size,
+                                                   maximum_bytes)
+
+            return cache
+
+    def unregister_cache(self, name):
+        """
+        Unregisters the cache with given name.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name.
+        """
+
+        with self._lock:
+            del self._caches[name]
+
+    def clear_cache(self, name):
+        """
+        Clears the cache with given name.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name.
+        """
+
+        with self._lock:
+            self._caches[name].clear()
+
+    def clear_all_caches(self):
+        """
+        Clears all the registered caches.
+        """
+
+        with self._lock:
+            for cache in self._caches.values():
+                cache.clear()
+
+    def statistics(self):
+        """
+        Returns the statistics of all the registered caches.
+
+        Returns
+        -------
+        OrderedDict
+            Registered caches statistics.
+        """
+
+        with self._lock:
+            return OrderedDict((name, cache.statistics())
+                               for name, cache in self._caches.items())
+
+
+CACHE_REGISTRY = CacheRegistry()
+"""
+Global *Colour* cache registry.
+
+CACHE_REGISTRY : CacheRegistry
+"""
@@ -30,6 +30,8 @@ structures.py#L37
 
 from __future__ import division, unicode_literals
 
+from collections import OrderedDict
+
 try:  # pragma: no cover
     from collections import Mapping, MutableMapping
 except ImportError:  # pragma: no cover
@@ -156,7 +158,7 @@ class CaseInsensitiveMapping(MutableMapping):
 
     Allows values retrieving from keys while ignoring the key case.
     The keys are expected to be unicode or string-like objects supporting the
-    :meth:`str.lower` method.
+    :meth:`str.lower` method. The items insertion order is preserved.
 
     Parameters
     ----------
@@ -198,7 +200,7 @@ class CaseInsensitiveMapping(MutableMapping):
     """
 
     def __init__(self, data=None, **kwargs):
-        self._data = dict()
+        self._data = OrderedDict()
 
         self.update({} if data is None else data, **kwargs)
 
@@ -407,7 +409,9 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
     The keys are expected to be unicode or string-like objects supporting the
     :meth:`str.lower` method. The lazy retrieval is performed as follows:
     If the value is a callable, then it is evaluated and its return value is
-    stored in place of the current value.
+    stored in place of the current value. The evaluation happens only once,
+    thus the return value can itself be a callable, e.g. a
+    :class:`colour.SpectralDistribution` class instance.
 
     Parameters
     ----------
@@ -421,7 +425,11 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
 
     Methods
     -------
+    __setitem__
     __getitem__
+    __delitem__
+    copy
+    lower_items
 
     Warning
     -------
@@ -439,15 +447,42 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
     >>> methods['hernandez']
     2
     2
+    >>> methods['hernandez']
+    2
     """
 
+    def __init__(self, data=None, **kwargs):
+        self._evaluated = set()
+
+        super(LazyCaseInsensitiveMapping, self).__init__(data, **kwargs)
+
+    def __setitem__(self, item, value):
+        """
+        Sets given item with given value.
+
+        If the value is a callable, it will be evaluated when the item is
+        retrieved for the first time.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+        value : object
+            Value.
+        """
+
+        super(LazyCaseInsensitiveMapping, self).__setitem__(item, value)
+
+        self._evaluated.discard(item.lower())
+
     def __getitem__(self, item):
         """
         Returns the value of given item.
 
         The item value is retrieved using its lower name in the mapping. If
-        the value is a callable, then it is evaluated and its return value is
-        stored in place of the current value.
+        the value is a callable that has not been evaluated yet, then it is
+        evaluated and its return value is stored in place of the current
+        value.
 
         Parameters
         ----------
@@ -460,10 +495,61 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
             Item value.
         """
 
-        value = super(LazyCaseInsensitiveMapping, self).__getitem__(item)
+        item_lower = item.lower()
+        name, value = self._data[item_lower]
 
-        if callable(value):
+        if callable(value) and item_lower not in self._evaluated:
             value = value()
-            super(LazyCaseInsensitiveMapping, self).__setitem__(item, value)
+            self._data[item_lower] = (name, value)
+            self._evaluated.add(item_lower)
 
         return value
+
+    def __delitem__(self, item):
+        """
+        Deletes the item with given name.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+        """
+
+        super(LazyCaseInsensitiveMapping, self).__delitem__(item)
+
+        self._evaluated.discard(item.lower())
+
+    def copy(self):
+        """
+        Returns a copy of the mapping, the values that have not been evaluated
+        yet are not evaluated.
+
+        Returns
+        -------
+        LazyCaseInsensitiveMapping
+            Mapping copy.
+
+        Notes
+        -----
+        -   The :class:`colour.utilities.LazyCaseInsensitiveMapping` class copy
+            returned is a simple *copy* not a *deepcopy*.
+        """
+
+        mapping = LazyCaseInsensitiveMapping()
+        mapping._data = OrderedDict(self._data)
+        mapping._evaluated = set(self._evaluated)
+
+        return mapping
+
+    def lower_items(self):
+        """
+        Iterates over the lower items names, evaluating their values if
+        required.
+
+        Returns
+        -------
+        generator
+            Lower item names.
+        """
+
+        return ((item, self[item]) for item in list(self._data))
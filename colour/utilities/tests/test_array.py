@@ -12,11 +12,11 @@ from collections import namedtuple
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (
     as_array, as_int_array, as_float_array, as_numeric, as_int, as_float,
-    set_float_precision, set_int_precision, as_namedtuple, closest_indexes,
-    closest, normalise_maximum, interval, is_uniform, in_array, tstack, tsplit,
-    row_as_diagonal, dot_vector, dot_matrix, orient, centroid,
-    linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones, full,
-    index_along_last_axis)
+    set_float_precision, float_precision, set_int_precision, as_namedtuple,
+    closest_indexes, closest, normalise_maximum, interval, is_uniform,
+    in_array, tstack, tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
+    centroid, linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones,
+    full, index_along_last_axis)
 from colour.utilities import is_networkx_installed
 
 __author__ = 'Colour Developers'
@@ -28,13 +28,13 @@ __status__ = 'Production'
 
 __all__ = [
     'TestAsArray', 'TestAsIntArray', 'TestAsFloatArray', 'TestAsNumeric',
-    'TestAsInt', 'TestAsFloat', 'TestSetFloatPrecision', 'TestSetIntPrecision',
-    'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
-    'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
-    'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
-    'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
-    'TestLerp', 'TestFillNan', 'TestNdarrayWrite', 'TestZeros', 'TestOnes',
-    'TestFull', 'TestIndexAlongLastAxis'
+    'TestAsInt', 'TestAsFloat', 'TestSetFloatPrecision', 'TestFloatPrecision',
+    'TestSetIntPrecision', 'TestAsNametuple', 'TestClosestIndexes',
+    'TestClosest', 'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform',
+    'TestInArray', 'TestTstack', 'TestTsplit', 'TestRowAsDiagonal',
+    'TestDotVector', 'TestDotMatrix', 'TestOrient', 'TestCentroid',
+    'TestLinearConversion', 'TestLerp', 'TestFillNan', 'TestNdarrayWrite',
+    'TestZeros', 'TestOnes', 'TestFull', 'TestIndexAlongLastAxis'
 ]
 
 
@@ -261,6 +261,36 @@ class TestSetFloatPrecision(unittest.TestCase):
         set_float_precision(np.float64)
 
 
+class TestFloatPrecision(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.float_precision` definition units
+    tests methods.
+    """
+
+    def test_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.float_precision` definition.
+        """
+
+        with float_precision(np.float32):
+            self.assertEqual(as_float_array(np.ones(3)).dtype, np.float32)
+
+            with float_precision(np.float16):
+                self.assertEqual(as_float_array(np.ones(3)).dtype, np.float16)
+
+            self.assertEqual(as_float_array(np.ones(3)).dtype, np.float32)
+
+        self.assertEqual(as_float_array(np.ones(3)).dtype, np.float64)
+
+        try:
+            with float_precision(np.float32):
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+        self.assertEqual(as_float_array(np.ones(3)).dtype, np.float64)
+
+
 class TestSetIntPrecision(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.set_int_precision` definition units
@@ -591,6 +621,17 @@ class TestTstack(unittest.TestCase):
                 [[3, 3, 3], [4, 4, 4], [5, 5, 5]],
             ]]))
 
+    def test_tstack_out(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition with output
+        array.
+        """
+
+        a = np.arange(0, 6, dtype=np.float32)
+        out = np.zeros((6, 3), dtype=np.float32)
+        self.assertIs(tstack([a, a * 2, 0], out=out), out)
+        np.testing.assert_equal(out, tstack([a, a * 2, np.zeros(6)]))
+
 
 class TestTsplit(unittest.TestCase):
     """
@@ -644,6 +685,17 @@ class TestTsplit(unittest.TestCase):
                 [[[0, 1, 2], [3, 4, 5]]],
             ]))
 
+    def test_tsplit_out(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition with output
+        array.
+        """
+
+        a = np.reshape(np.arange(0, 18), (2, 3, 3))
+        out = np.zeros((3, 2, 3))
+        self.assertIs(tsplit(a, out=out), out)
+        np.testing.assert_equal(out, tsplit(a))
+
 
 class TestRowAsDiagonal(unittest.TestCase):
     """
@@ -717,6 +769,34 @@ class TestDotVector(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_dot_vector_out(self):
+        """
+        Tests :func:`colour.utilities.array.dot_vector` definition with output
+        array.
+        """
+
+        m = np.array([
+            [0.7328, 0.4296, -0.1624],
+            [-0.7036, 1.6975, 0.0061],
+            [0.0030, 0.0136, 0.9834],
+        ])
+        v = np.random.RandomState(4).random_sample((6, 3))
+        v_d = dot_vector(m, v)
+
+        np.testing.assert_almost_equal(
+            v_d,
+            np.einsum('...ij,...j->...i', m, v),
+            decimal=12)
+
+        out = np.zeros(v.shape)
+        self.assertIs(dot_vector(m, v, out), out)
+        np.testing.assert_almost_equal(out, v_d, decimal=12)
+
+        for m_i in (m, np.tile(m, (6, 1, 1))):
+            v_i = np.copy(v)
+            self.assertIs(dot_vector(m_i, v_i, v_i), v_i)
+            np.testing.assert_almost_equal(v_i, v_d, decimal=12)
+
 
 class TestDotMatrix(unittest.TestCase):
     """
@@ -762,6 +842,20 @@ class TestDotMatrix(unittest.TestCase):
             ),
             decimal=7)  # yapf: disable
 
+    def test_dot_matrix_out(self):
+        """
+        Tests :func:`colour.utilities.array.dot_matrix` definition with output
+        array.
+        """
+
+        a = np.random.RandomState(4).random_sample((6, 3, 3))
+        b = np.random.RandomState(8).random_sample((3, 3))
+        out = np.zeros(a.shape)
+
+        self.assertIs(dot_matrix(a, b, out), out)
+        np.testing.assert_almost_equal(
+            out, np.einsum('...ij,...jk->...ik', a, b), decimal=12)
+
 
 class TestOrient(unittest.TestCase):
     """
@@ -878,6 +972,16 @@ class TestLinearConversion(unittest.TestCase):
             ]),
             decimal=8)
 
+        a = np.linspace(0, 1, 10)
+        self.assertIs(
+            linear_conversion(a, np.array([0, 1]), np.array([1, np.pi]), a),
+            a)
+        np.testing.assert_almost_equal(
+            a,
+            linear_conversion(
+                np.linspace(0, 1, 10), np.array([0, 1]), np.array([1, np.pi])),
+            decimal=12)
+
 
 class TestLerp(unittest.TestCase):
     """
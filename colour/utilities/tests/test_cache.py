@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.cache` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import scipy.sparse
+import threading
+import unittest
+
+from colour.utilities import (Cache, CacheRegistry, CACHE_REGISTRY,
+                              is_caching_enabled, set_caching_enable,
+                              caching_enable)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'TestIsCachingEnabled', 'TestSetCachingEnable', 'TestCachingEnable',
+    'TestCache', 'TestCacheRegistry'
+]
+
+
+class TestIsCachingEnabled(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.is_caching_enabled` definition unit
+    tests methods.
+    """
+
+    def test_is_caching_enabled(self):
+        """
+        Tests :func:`colour.utilities.cache.is_caching_enabled` definition.
+        """
+
+        with caching_enable(True):
+            self.assertTrue(is_caching_enabled())
+
+        with caching_enable(False):
+            self.assertFalse(is_caching_enabled())
+
+
+class TestSetCachingEnable(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.set_caching_enable` definition unit
+    tests methods.
+    """
+
+    def test_set_caching_enable(self):
+        """
+        Tests :func:`colour.utilities.cache.set_caching_enable` definition.
+        """
+
+        with caching_enable(is_caching_enabled()):
+            set_caching_enable(True)
+            self.assertTrue(is_caching_enabled())
+
+            set_caching_enable(False)
+            self.assertFalse(is_caching_enabled())
+
+
+class TestCachingEnable(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.caching_enable` definition unit
+    tests methods.
+    """
+
+    def test_caching_enable(self):
+        """
+        Tests :func:`colour.utilities.cache.caching_enable` definition.
+        """
+
+        enabled = is_caching_enabled()
+
+        with caching_enable(not enabled):
+            self.assertEqual(is_caching_enabled(), not enabled)
+
+        self.assertEqual(is_caching_enabled(), enabled)
+
+        @caching_enable(False)
+        def fn_a():
+            """
+            Helper definition performing a test.
+            """
+
+            self.assertFalse(is_caching_enabled())
+
+        fn_a()
+
+        self.assertEqual(is_caching_enabled(), enabled)
+
+        cache = Cache('Test')
+        with caching_enable(False):
+            cache['a'] = 1
+            self.assertNotIn('a', cache)
+
+        cache['a'] = 1
+        with caching_enable(False):
+            self.assertIsNone(cache.get('a'))
+
+        self.assertEqual(cache.get('a'), 1)
+
+
+class TestCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.cache.Cache` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name', 'maximum_size', 'maximum_bytes', 'hits',
+                               'misses', 'evictions', 'nbytes')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(Cache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__contains__', '__len__',
+                            '__setitem__', '__repr__', 'get', 'clear',
+                            'statistics')
+
+        for method in required_methods:
+            self.assertIn(method, dir(Cache))
+
+    def test_get(self):
+        """
+        Tests :meth:`colour.utilities.cache.Cache.get` method.
+        """
+
+        cache = Cache('Test')
+        cache['a'] = 1
+        cache['b'] = None
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b', 2))
+        self.assertEqual(cache.get('c', 3), 3)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+
+    def test_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.cache.Cache.maximum_size` attribute.
+        """
+
+        cache = Cache('Test', maximum_size=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a')
+        cache['c'] = 3
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.evictions, 1)
+
+        cache.maximum_size = 1
+        self.assertEqual(len(cache), 1)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_maximum_bytes(self):
+        """
+        Tests :attr:`colour.utilities.cache.Cache.maximum_bytes` attribute.
+        """
+
+        cache = Cache('Test', maximum_bytes=256)
+        cache['a'] = np.zeros(16)
+        cache['b'] = np.zeros(16)
+        self.assertEqual(cache.nbytes, 256)
+
+        cache['c'] = np.zeros(8)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.nbytes, 192)
+
+        cache['d'] = np.zeros(64)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+        cache.maximum_bytes = None
+        cache['d'] = np.zeros(64)
+        cache['d'] = np.zeros(32)
+        self.assertEqual(cache.nbytes, 256)
+
+        cache = Cache('Test', maximum_bytes=256)
+        cache['a'] = scipy.sparse.csr_matrix(np.identity(8))
+        self.assertEqual(cache.nbytes, 64 + 32 + 36)
+        cache['b'] = scipy.sparse.csr_matrix(np.identity(8))
+        self.assertNotIn('a', cache)
+
+    def test_clear(self):
+        """
+        Tests :meth:`colour.utilities.cache.Cache.clear` method.
+        """
+
+        cache = Cache('Test')
+        cache['a'] = np.zeros(4)
+        cache.get('a')
+        cache.get('b')
+        cache.clear()
+
+        self.assertDictEqual(cache.statistics(), {
+            'size': 0,
+            'nbytes': 0,
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        })
+
+    def test_thread_safety(self):
+        """
+        Tests :class:`colour.utilities.cache.Cache` class thread safety.
+        """
+
+        cache = Cache('Test', maximum_size=16)
+
+        def worker(offset):
+            """
+            Helper definition storing and retrieving values.
+            """
+
+            for i in range(1000):
+                cache[(offset, i % 32)] = i
+                cache.get((offset, (i + 1) % 32))
+
+        threads = [
+            threading.Thread(target=worker, args=(i, )) for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 16)
+        self.assertEqual(cache.hits + cache.misses, 8000)
+        self.assertEqual(cache.evictions, 8000 - 16)
+
+
+class TestCacheRegistry(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.cache.CacheRegistry` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('caches', )
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CacheRegistry))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__repr__', 'register_cache',
+                            'unregister_cache', 'clear_cache',
+                            'clear_all_caches', 'statistics')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CacheRegistry))
+
+    def test_register_cache(self):
+        """
+        Tests :meth:`colour.utilities.cache.CacheRegistry.register_cache`
+        method.
+        """
+
+        registry = CacheRegistry()
+        cache = registry.register_cache('Test', maximum_size=4)
+
+        self.assertIs(registry.register_cache('Test'), cache)
+        self.assertEqual(cache.maximum_size, 4)
+        self.assertListEqual(list(registry.caches.keys()), ['Test'])
+
+        registry.unregister_cache('Test')
+        self.assertListEqual(list(registry.caches.keys()), [])
+
+    def test_clear_cache(self):
+        """
+        Tests :meth:`colour.utilities.cache.CacheRegistry.clear_cache` and
+        :meth:`colour.utilities.cache.CacheRegistry.clear_all_caches`
+        methods.
+        """
+
+        registry = CacheRegistry()
+        cache_a = registry.register_cache('A')
+        cache_b = registry.register_cache('B')
+        cache_a['a'] = 1
+        cache_b['b'] = 2
+
+        registry.clear_cache('A')
+        self.assertEqual(len(cache_a), 0)
+        self.assertEqual(len(cache_b), 1)
+
+        registry.clear_all_caches()
+        self.assertEqual(len(cache_b), 0)
+
+    def test_statistics(self):
+        """
+        Tests :meth:`colour.utilities.cache.CacheRegistry.statistics` method.
+        """
+
+        registry = CacheRegistry()
+        cache = registry.register_cache('Test')
+        cache['a'] = 1
+        cache.get('a')
+
+        statistics = registry.statistics()
+        self.assertEqual(statistics['Test']['size'], 1)
+        self.assertEqual(statistics['Test']['hits'], 1)
+
+    def test_CACHE_REGISTRY(self):
+        """
+        Tests :attr:`colour.utilities.cache.CACHE_REGISTRY` attribute.
+        """
+
+        self.assertIn('colour.colorimetry.tristimulus._CACHE_SD_TO_XYZ',
+                      CACHE_REGISTRY.caches)
+
+
+if __name__ == '__main__':
+    unittest.main()
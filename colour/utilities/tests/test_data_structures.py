@@ -9,7 +9,11 @@ import numpy as np
 import operator
 import pickle
 import unittest
+from collections import OrderedDict
 
+from colour.characterisation import SDS_COLOURCHECKERS
+from colour.characterisation.datasets.colour_checkers.sds import (
+    DATA_BABELCOLOR_AVERAGE, DATA_COLORCHECKER_N_OHTA)
 from colour.utilities import (Structure, Lookup, CaseInsensitiveMapping,
                               LazyCaseInsensitiveMapping)
 
@@ -254,6 +258,12 @@ CaseInsensitiveMapping.__iter__` method.
         self.assertListEqual(
             sorted([item for item in mapping]), ['Jane', 'John'])
 
+        keys = ['light skin', 'blue', 'blue flower', 'Dark Skin', 'white 9.5']
+        mapping = CaseInsensitiveMapping(
+            OrderedDict((key, None) for key in keys))
+        self.assertListEqual(list(mapping), keys)
+        self.assertListEqual(list(mapping.copy()), keys)
+
     def test__len__(self):
         """
         Tests :meth:`colour.utilities.data_structures.\
@@ -362,7 +372,7 @@ LazyCaseInsensitiveMapping` class unit tests methods.
                             '__ne__', '__repr__', 'copy', 'lower_items')
 
         for method in required_methods:
-            self.assertIn(method, dir(CaseInsensitiveMapping))
+            self.assertIn(method, dir(LazyCaseInsensitiveMapping))
 
     def test__getitem__(self):
         """
@@ -380,6 +390,91 @@ LazyCaseInsensitiveMapping.__getitem__` method.
 
         self.assertEqual(mapping['jane'], 'Doe')
 
+        self.assertListEqual(sorted(mapping.keys()), ['Jane', 'John'])
+
+        def callable_a():
+            """
+            Callable returning a callable value.
+            """
+
+            return callable_b
+
+        def callable_b():
+            """
+            Callable value.
+            """
+
+            return 'Doe'
+
+        mapping = LazyCaseInsensitiveMapping(John=callable_a)
+
+        self.assertIs(mapping['John'], callable_b)
+
+        self.assertIs(mapping['john'], callable_b)
+
+    def test_copy(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.copy` method.
+        """
+
+        evaluations = []
+
+        def callable_a():
+            """
+            Callable recording its evaluations.
+            """
+
+            evaluations.append(1)
+
+            return 'Doe'
+
+        mapping = LazyCaseInsensitiveMapping(John=callable_a)
+        mapping_c = mapping.copy()
+
+        self.assertIsInstance(mapping_c, LazyCaseInsensitiveMapping)
+        self.assertListEqual(evaluations, [])
+
+        self.assertEqual(mapping_c['John'], 'Doe')
+        self.assertEqual(mapping['John'], 'Doe')
+        self.assertListEqual(evaluations, [1, 1])
+
+        self.assertEqual(mapping.copy()['John'], 'Doe')
+        self.assertListEqual(evaluations, [1, 1])
+
+    def test_lower_items(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.lower_items` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(John='Doe', Jane=lambda: 'Doe')
+
+        self.assertListEqual(
+            sorted(mapping.lower_items()), [('jane', 'Doe'), ('john', 'Doe')])
+
+        self.assertEqual(mapping, {'John': 'Doe', 'Jane': 'Doe'})
+
+    def test_order(self):
+        """
+        Tests :class:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping` class items order.
+        """
+
+        keys = ['light skin', 'blue', 'blue flower', 'Dark Skin', 'white 9.5']
+        mapping = LazyCaseInsensitiveMapping(
+            OrderedDict((key, lambda: None) for key in keys))
+        self.assertListEqual(list(mapping), keys)
+        self.assertListEqual(list(mapping.copy()), keys)
+        self.assertListEqual([item for item, _value in mapping.lower_items()],
+                             [key.lower() for key in keys])
+
+        for name, data in (('ColorChecker N Ohta', DATA_COLORCHECKER_N_OHTA),
+                           ('BabelColor Average', DATA_BABELCOLOR_AVERAGE)):
+            self.assertListEqual(
+                [sd.name for sd in SDS_COLOURCHECKERS[name].values()],
+                list(data.keys()))
+
 
 if __name__ == '__main__':
     unittest.main()
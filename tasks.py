@@ -196,6 +196,32 @@ def quality(ctx, flake8=True, rstlint=True):
         ctx.run('rst-lint README.rst')
 
 
+@task
+def benchmark(ctx, modules=20):
+    """
+    Benchmarks the import time of the package and reports the slowest modules
+    to import.
+
+    Parameters
+    ----------
+    ctx : invoke.context.Context
+        Context.
+    modules : int, optional
+        Count of the slowest modules to report.
+
+    Returns
+    -------
+    bool
+        Task success.
+    """
+
+    message_box('Benchmarking "{0}" import time...'.format(
+        PYTHON_PACKAGE_NAME))
+    ctx.run('python -X importtime -c "import {0}" 2>&1 | '
+            'sort -t "|" -k 2 -n | tail -n {1}'.format(
+                PYTHON_PACKAGE_NAME, modules))
+
+
 @task
 def examples(ctx, plots=False):
     """